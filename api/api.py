@@ -1,47 +1,288 @@
 import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Body
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import sys
-import threading
-import time
 import os
 import json
 from pathlib import Path
-from utils.log import get_global_log_buffer, Logos
+from utils.log import get_global_log_buffer, get_global_log_pipeline, read_log_lines, setup_global_redirect
 
 # 添加项目根目录到Python路径
 sys.path.append(str(Path(__file__).parent.parent))
-from core.core import conf, log
-from drawer.meme_draw import CertificateGenerator
+from core.core import conf, log, SERVING_WORKERS, RUN_DIR, primary_lock, is_primary_process, log_rotation
+from utils.conf import changed_keys, thaw
+from drawer.meme_draw import remove_resource_files, supported_output_formats, OUTPUT_FORMATS
+from drawer.render_pool import RenderPool, RENDER_CACHE_LOOKUPS
+from drawer.template_store import TemplateStore
+from utils.expiry import ExpiryScheduler
+from utils.metrics import metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from utils.access_log import AccessLogMiddleware
+from utils.profiling import (ProfilingMiddleware, PROFILE_NAME_PATTERN, list_profiles,
+                             summarize_profile)
 
 import hashlib
+import hmac
 import secrets
+import zipfile
+import io
+import time
 
+# 多进程服务时各服务进程由uvicorn按导入字符串加载本模块，不经过main.py的启动流程，在此设置本进程的输出重定向
+if SERVING_WORKERS > 1:
+    setup_global_redirect()
 
-shyeri_meme_app = FastAPI()
 bg_paths: dict[str, str] = conf.get()["resource"]["resource_paths"]
 chinese_font_path = conf.get()["resource"]["chinese_font_path"]
 english_font_path = conf.get()["resource"]["english_font_path"]
 # 获取过期时间配置
 IMAGE_EXPIRY_TIME = conf.get().get("storage", {}).get("image_expiry_time", 300)
 
-ShyeriMemeDrawer = CertificateGenerator(
-    log=log,
-    resource_paths=bg_paths,
-    output_folder="data/memes",
-    chinese_font_path=chinese_font_path,
-    english_font_path=english_font_path
+
+def build_render_options(config: dict) -> dict:
+    """根据配置生成渲染子进程的初始化参数"""
+    return {
+        # 渲染进程的日志随调用结果回传，由本进程写入日志缓冲区和日志文件
+        "log": {
+            "name": config["name"],
+            "level": config["log"]["log_level"].upper(),
+        },
+        "drawer": {
+            "resource_paths": config["resource"]["resource_paths"],
+            "output_folder": "data/memes",
+            "chinese_font_path": config["resource"]["chinese_font_path"],
+            "english_font_path": config["resource"]["english_font_path"],
+            "stroke_mode": config.get("render", {}).get("stroke_mode", "dilate"),
+            "render_cache_bytes": int(config.get("storage", {}).get("render_cache_mb", 64) * 1024 * 1024),
+            "text_layer_cache_bytes": int(config.get("render", {}).get("text_layer_cache_mb", 32) * 1024 * 1024),
+            "template_cache_dir": TEMPLATE_CACHE_DIR,
+        },
+    }
+
+
+def negotiate_output_format(accept: str) -> str | None:
+    """根据Accept头选择输出格式，只考虑明确列出的图片类型，按q值和压缩效率优先级选择"""
+    preference = ["avif", "webp", "jpeg", "png"]
+    mime_to_format = {OUTPUT_FORMATS[name][2]: name for name in supported_output_formats()}
+    candidates = []
+    for part in accept.split(","):
+        fields = [field.strip() for field in part.split(";")]
+        mime = fields[0].lower()
+        if mime not in mime_to_format:
+            continue
+        q = 1.0
+        for param in fields[1:]:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            candidates.append((q, -preference.index(mime_to_format[mime]), mime_to_format[mime]))
+    return max(candidates)[2] if candidates else None
+
+
+def resolve_output_encoding(form_data: dict, accept: str) -> tuple[str, int]:
+    """确定输出格式和质量：请求参数优先，其次Accept头，最后使用storage配置
+    Raises:
+        ValueError: 格式不受支持或质量不在1-100之间
+    """
+    storage = conf.get().get("storage", {})
+    output_format = form_data.get("format") or negotiate_output_format(accept) \
+        or storage.get("output_format", "jpeg")
+    if output_format == "jpg":
+        output_format = "jpeg"
+    if output_format not in supported_output_formats():
+        raise ValueError(f"不支持的输出格式{output_format}，可选值为{supported_output_formats()}")
+    quality = form_data.get("quality", storage.get("output_quality", 95))
+    if isinstance(quality, bool) or not isinstance(quality, int) or not 1 <= quality <= 100:
+        raise ValueError("quality字段必须是1到100之间的整数")
+    return output_format, quality
+
+
+def render_workers(config: dict) -> int:
+    """每个服务进程的渲染进程数：配置为0时使用CPU核数，多进程服务时由各服务进程平分"""
+    workers = config.get("render", {}).get("workers", 0)
+    if workers > 0:
+        return workers
+    return max(1, (os.cpu_count() or 1) // SERVING_WORKERS)
+
+
+# 渲染进程共享的背景模板存储：模板在主进程中转换一次，各渲染进程映射同一份像素
+TEMPLATE_CACHE_DIR = RUN_DIR + "templates"
+template_store = TemplateStore(TEMPLATE_CACHE_DIR)
+
+
+def prepare_templates(resource_paths: dict):
+    """在启动渲染进程或下发新模板路径前生成模板缓存文件，渲染进程启动时只需映射，无需解码"""
+    for resource, background_path in resource_paths.items():
+        try:
+            template_store.prepare(background_path)
+        except Exception as e:
+            log.error(f"生成背景模板{resource}({background_path})的共享缓存失败: {e}")
+
+
+prepare_templates(conf.get()["resource"]["resource_paths"])
+
+# 渲染进程池，每个子进程持有独立的CertificateGenerator
+render_pool = RenderPool(
+    workers=render_workers(conf.get()),
+    options=build_render_options(conf.get())
 )
 
+
+# HTTP及运行状态指标，运行状态类指标在抓取/metrics时更新
+HTTP_REQUESTS = metrics.counter(
+    "shyeri_http_requests_total", "HTTP requests by route, method and status", ("route", "method", "status"))
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "shyeri_http_request_duration_seconds", "HTTP request latency by route", ("route", "method"))
+RENDER_CACHE_HIT_RATIO = metrics.gauge(
+    "shyeri_render_cache_hit_ratio", "Render cache hit ratio since start", ("cache",))
+EXPIRY_PENDING = metrics.gauge("shyeri_expiry_pending_files", "Generated images waiting for expiry")
+MEMES_DIR_BYTES = metrics.gauge("shyeri_memes_dir_bytes", "Total size of files in data/memes")
+MEMES_DIR_FILES = metrics.gauge("shyeri_memes_dir_files", "Number of files in data/memes")
+LOG_BUFFER_LINES = metrics.gauge("shyeri_log_buffer_lines", "Lines held in the in-memory log buffer")
+
+# 图片过期删除调度器，单线程处理所有生成图片的过期删除
+expiry_scheduler = ExpiryScheduler(log)
+
+# 多进程服务时检查主服务进程锁的间隔(秒)：非主服务进程据此尝试接管，主服务进程据此重新扫描图片目录
+PRIMARY_CHECK_INTERVAL = 10.0
+
+
+def run_primary_duties():
+    """只应由一个进程执行的清理：删除已过期的图片，其余尚未调度的图片按修改时间加入本进程的调度，
+    并删除不再使用的模板缓存"""
+    expiry_scheduler.sweep(IMAGE_FOLDER, IMAGE_EXPIRY_TIME)
+    template_store.prune(conf.get()["resource"]["resource_paths"].values())
+
+
+def become_primary() -> bool:
+    """尝试成为主服务进程，获得锁后由本进程滚动日志文件"""
+    if not primary_lock.acquire():
+        return False
+    reconfigure_log(conf.get())
+    log.info(f"进程{os.getpid()}成为主服务进程")
+    return True
+
+
+async def watch_primary():
+    """多进程服务时定期检查主服务进程锁
+
+    非主服务进程尝试获得锁，主服务进程退出后由获得锁的进程接管日志滚动和图片清理；
+    主服务进程定期重新扫描图片目录，接管已退出的服务进程调度的图片。
+    """
+    while True:
+        await asyncio.sleep(PRIMARY_CHECK_INTERVAL)
+        try:
+            if primary_lock.held or become_primary():
+                await asyncio.to_thread(run_primary_duties)
+        except Exception as e:
+            log.error(f"主服务进程检查失败: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 多进程服务时竞争主服务进程；清理上次运行遗留的图片和模板缓存，多进程服务时只由主服务进程执行
+    if SERVING_WORKERS > 1:
+        become_primary()
+    if is_primary_process():
+        run_primary_duties()
+    expiry_scheduler.start()
+    primary_watch = asyncio.create_task(watch_primary()) if SERVING_WORKERS > 1 else None
+    # 监视配置文件，外部修改后回到事件循环中热加载
+    loop = asyncio.get_running_loop()
+    conf.subscribe(lambda old, new: loop.call_soon_threadsafe(reload_config_from_file, old))
+    conf.watch()
+    yield
+    if primary_watch is not None:
+        primary_watch.cancel()
+    conf.stop_watch()
+    expiry_scheduler.stop()
+    render_pool.shutdown()
+    primary_lock.release()
+
+
+shyeri_meme_app = FastAPI(lifespan=lifespan)
+
 file = os.path.dirname(os.path.abspath(__file__))
 path = os.path.join(file, "../")
 IMAGE_FOLDER = path + "data/memes"
+# 按需性能分析结果目录及保留的记录数
+PROFILE_FOLDER = path + "data/profiles"
+PROFILE_KEEP = 50
+# 渲染在子进程中进行，主进程需自行确保图片目录存在以便挂载
+os.makedirs(IMAGE_FOLDER, exist_ok=True)
 # 定义Vue构建后的静态文件目录
 WEBUI_DIST_PATH = os.path.join(path, "webui/dist")
 DOMAIN = conf.get()["api"]["domain"]
 PORT = conf.get()["api"]["port"]
 
+# 管理员会话：令牌 -> 过期时间，与前端cookie的24小时有效期一致
+ADMIN_SESSION_TTL = 24 * 3600
+
+
+# 管理员令牌签名密钥，只保存在服务端，不出现在配置中；多进程服务时各进程读取同一个文件
+ADMIN_TOKEN_KEY_FILE = RUN_DIR + "admin_token.key"
+_admin_token_key: bytes | None = None
+
+
+def admin_token_key() -> bytes:
+    """读取令牌签名密钥，不存在时生成；先写临时文件再硬链接到目标路径，多个进程同时生成时只有一个生效"""
+    global _admin_token_key
+    if _admin_token_key is not None:
+        return _admin_token_key
+    os.makedirs(RUN_DIR, exist_ok=True)
+    if not os.path.exists(ADMIN_TOKEN_KEY_FILE):
+        tmp_path = f"{ADMIN_TOKEN_KEY_FILE}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(secrets.token_bytes(32))
+            os.link(tmp_path, ADMIN_TOKEN_KEY_FILE)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_path)
+    with open(ADMIN_TOKEN_KEY_FILE, "rb") as f:
+        _admin_token_key = f.read()
+    return _admin_token_key
+
+
+def admin_token_signature(payload: str) -> str | None:
+    """用服务端密钥对令牌内容签名，未设置密码时返回None
+
+    签名密钥混入当前密码哈希，重置密码后旧令牌的签名随之失效；密码哈希本身不足以伪造令牌。
+    """
+    admin = conf.get().get("admin", {})
+    if "password_hash" not in admin:
+        return None
+    key = hmac.new(admin_token_key(), admin["password_hash"].encode(), hashlib.sha256).digest()
+    return hmac.new(key, payload.encode(), hashlib.sha256).hexdigest()
+
+
+def issue_admin_token() -> str:
+    """生成管理员会话令牌：过期时间.随机串.签名
+
+    令牌自带过期时间和签名，不在进程内记录，多进程服务时任一进程都能验证。
+    """
+    payload = f"{int(time.time() + ADMIN_SESSION_TTL)}.{secrets.token_hex(16)}"
+    return f"{payload}.{admin_token_signature(payload)}"
+
+
+def is_admin_request(request: Request) -> bool:
+    """请求是否携带有效的管理员令牌(X-Admin-Token头或admin_token cookie)"""
+    token = request.headers.get("x-admin-token") or request.cookies.get("admin_token")
+    if not token or token.count(".") != 2:
+        return False
+    payload, _, signature = token.rpartition(".")
+    expected = admin_token_signature(payload)
+    expires = payload.split(".", 1)[0]
+    return expected is not None and hmac.compare_digest(signature, expected) \
+        and expires.isdigit() and int(expires) > time.time()
+
+
 # 定义所有API路由
 @shyeri_meme_app.post("/")
 async def shyeri_meme_deal(request: Request):
@@ -83,12 +324,36 @@ async def shyeri_meme_deal(request: Request):
                 "data": {}
             }
         )
+    # 返回方式：url(默认)返回图片链接；image直接返回图片内容且不写入磁盘；both返回图片内容并在响应头中附带链接
+    response_mode = form_data.get("response", "url")
+    if response_mode not in ("url", "image", "both"):
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": "response字段可选值为url、image或both",
+                "data": {}
+            }
+        )
     try:
-        # 调用generate_meme并获取哈希后的文件名
-        image_name = ShyeriMemeDrawer.generate_meme(
-            resource=background,
-            text=text,
+        output_format, quality = resolve_output_encoding(form_data, request.headers.get("accept", ""))
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": str(e),
+                "data": {}
+            }
         )
+    try:
+        if response_mode == "url":
+            # 在渲染进程中调用generate_meme并获取哈希后的文件名
+            image_name = await render_pool.generate_meme(background, text, output_format, quality)
+        else:
+            image_name, image_data = await render_pool.generate_meme_bytes(
+                background, text, response_mode == "both", output_format, quality
+            )
     except Exception as e:
         log.error(f"生成表情包{background}_{text}时出错: {e}")
         return JSONResponse(
@@ -99,7 +364,16 @@ async def shyeri_meme_deal(request: Request):
                 "data": {}
             }
         )
+    media_type = OUTPUT_FORMATS[output_format][2]
+    if response_mode == "image":
+        return Response(content=image_data, media_type=media_type, headers={"Vary": "Accept"})
     create_image_and_start_deletion(image_name)
+    if response_mode == "both":
+        return Response(
+            content=image_data,
+            media_type=media_type,
+            headers={"X-Image-Url": f"{DOMAIN}/images/{image_name}", "Vary": "Accept"}
+        )
     return JSONResponse(
     status_code=200,
     content={
@@ -111,6 +385,200 @@ async def shyeri_meme_deal(request: Request):
     })
 
 
+# 批量生成表情包的接口
+@shyeri_meme_app.post("/batch")
+async def shyeri_meme_batch(request: Request):
+    """批量生成表情包，单项出错不影响整批
+
+    请求体：
+        items: [{"background": 背景名称, "text": 文字}, ...]
+        output: "urls"(默认，返回每项的图片URL) 或 "zip"(返回包含全部图片和manifest.json的zip包)
+    """
+    try:
+        form_data = await request.json()
+    except json.JSONDecodeError:
+        log.error("请求体不包含有效的JSON数据")
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": "请求体必须包含有效的JSON数据",
+                "data": {}
+            }
+        )
+
+    items = form_data.get("items") if isinstance(form_data, dict) else None
+    output = form_data.get("output", "urls") if isinstance(form_data, dict) else "urls"
+    max_items = conf.get().get("render", {}).get("batch_max_items", 100)
+    if not isinstance(items, list) or not items:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": "请求必须包含非空的items列表",
+                "data": {}
+            }
+        )
+    if len(items) > max_items:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": f"单次批量请求最多{max_items}项",
+                "data": {}
+            }
+        )
+    if output not in ("urls", "zip"):
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": "output字段可选值为urls或zip",
+                "data": {}
+            }
+        )
+
+    try:
+        output_format, quality = resolve_output_encoding(form_data, request.headers.get("accept", ""))
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": str(e),
+                "data": {}
+            }
+        )
+
+    # 逐项校验，无效项直接记录错误，有效项统一提交渲染
+    results: list[dict] = []
+    valid_indexes = []
+    for index, item in enumerate(items):
+        result = {"index": index}
+        if not isinstance(item, dict) or not isinstance(item.get("background"), str) or not isinstance(item.get("text"), str):
+            result["error"] = "每项必须包含字符串类型的background和text字段"
+        elif item["background"] not in bg_paths:
+            result["background"] = item["background"]
+            result["text"] = item["text"]
+            result["error"] = f"无效的background字段，可选值为{list(bg_paths.keys())}"
+        else:
+            result["background"] = item["background"]
+            result["text"] = item["text"]
+            valid_indexes.append(index)
+        results.append(result)
+
+    render_items = [(results[index]["background"], results[index]["text"]) for index in valid_indexes]
+    if output == "zip":
+        # zip包边渲染边输出，已完成的图片逐个写入响应，内存占用与批量大小无关
+        return StreamingResponse(
+            stream_batch_archive(results, valid_indexes, render_items, output_format, quality),
+            media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="shyeri_memes.zip"'}
+        )
+
+    try:
+        rendered = await render_pool.generate_batch(render_items, output_format, quality)
+    except Exception as e:
+        log.error(f"批量生成表情包时出错: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "code": 500,
+                "message": f"请求出错：{e}",
+                "data": {}
+            }
+        )
+    for index, outcome in zip(valid_indexes, rendered):
+        apply_batch_outcome(results[index], outcome)
+    failed = sum(1 for result in results if "error" in result)
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "code": 200,
+            "message": "success",
+            "data": {
+                "results": [{key: value for key, value in result.items() if key != "image_name"} for result in results],
+                "total": len(results),
+                "failed": failed
+            }
+        }
+    )
+
+
+# 低分辨率实时预览接口
+@shyeri_meme_app.post("/preview")
+async def shyeri_meme_preview(request: Request):
+    """在缩小的模板上渲染低质量预览并直接返回图片内容，不写入磁盘，供webui输入时实时预览
+
+    请求体：
+        background: 背景名称
+        text: 文字，可以为空
+        format / quality: 可选，默认使用webp和render.preview_quality
+    """
+    try:
+        form_data = await request.json()
+    except json.JSONDecodeError:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": "请求体必须包含有效的JSON数据",
+                "data": {}
+            }
+        )
+    background = form_data.get("background") if isinstance(form_data, dict) else None
+    text = form_data.get("text", "") if isinstance(form_data, dict) else ""
+    if background not in bg_paths or not isinstance(text, str):
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": f"请求必须包含有效的background字段，可选值为{list(bg_paths.keys())}",
+                "data": {}
+            }
+        )
+    render_config = conf.get().get("render", {})
+    default_format = "webp" if "webp" in supported_output_formats() else "jpeg"
+    try:
+        output_format, quality = resolve_output_encoding(
+            {
+                "format": form_data.get("format") or negotiate_output_format(request.headers.get("accept", ""))
+                          or default_format,
+                "quality": form_data.get("quality", render_config.get("preview_quality", 60)),
+            },
+            ""
+        )
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": str(e),
+                "data": {}
+            }
+        )
+    try:
+        image_data = await render_pool.render_preview(
+            background, text, render_config.get("preview_scale", 0.4), output_format, quality
+        )
+    except Exception as e:
+        log.debug(f"生成预览{background}_{text}时出错: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "code": 500,
+                "message": f"请求出错：{e}",
+                "data": {}
+            }
+        )
+    return Response(
+        content=image_data,
+        media_type=OUTPUT_FORMATS[output_format][2],
+        headers={"Cache-Control": "no-store", "Vary": "Accept"}
+    )
+
+
 # 添加获取可用背景关键字列表的接口
 @shyeri_meme_app.get("/list")
 async def get_background_list():
@@ -155,27 +623,81 @@ async def get_background_list():
 # 添加获取配置的接口
 @shyeri_meme_app.get("/config")
 async def get_config():
-    return conf.get()
+    """当前配置，管理员密码哈希和盐值不返回，只返回是否已设置密码"""
+    config = thaw(conf.get())
+    config["admin"] = {"password_set": "password_hash" in config.get("admin", {})}
+    return config
+
+# 对比新旧配置快照，只更新变化的部分：全局变量、日志参数、渲染子进程参数和受影响的已生成图片
+def apply_config(old_config: dict) -> set[str]:
+    global bg_paths, chinese_font_path, english_font_path, IMAGE_EXPIRY_TIME, DOMAIN, PORT
+    config = conf.get()
+    changes = changed_keys(old_config, config)
+    if not changes:
+        return changes
+    # 热更新全局变量
+    bg_paths = config["resource"]["resource_paths"]
+    chinese_font_path = config["resource"]["chinese_font_path"]
+    english_font_path = config["resource"]["english_font_path"]
+    IMAGE_EXPIRY_TIME = config.get("storage", {}).get("image_expiry_time", 300)
+    DOMAIN = config["api"]["domain"]
+    PORT = config["api"]["port"]
+    if "api.port" in changes or "api.host" in changes:
+        log.warning("监听地址和端口的修改需要重启服务后生效")
+    # 就地调整日志级别和日志文件参数，不创建新的Logos
+    if any(key == "name" or key == "work_dir" or key.startswith("log.") for key in changes):
+        reconfigure_log(config)
+    if any(key.startswith("resource.resource_paths") for key in changes):
+        prepare_templates(bg_paths)
+        if is_primary_process():
+            template_store.prune(bg_paths.values())
+    # 进程数变化时才重建渲染进程池，其余参数由各子进程在下一次调用时就地应用
+    workers = render_workers(config)
+    render_options = build_render_options(config)
+    if workers != render_pool.workers:
+        render_pool.restart(workers, render_options)
+    elif render_options != render_pool.options:
+        render_pool.update_options(render_options)
+    # 字体或描边方式变化时所有已生成的图片都已过时，否则只删除路径变化的背景模板生成的图片；
+    # 多进程服务时各进程应用新配置的时间不同，尚未应用的进程仍可能按旧配置生成图片，
+    # 因此每个进程在切换到新参数之后都删除一次，最后一个应用新配置的进程删除后不会再留下旧图片
+    old_resources = old_config["resource"]["resource_paths"]
+    if {"resource.chinese_font_path", "resource.english_font_path", "render.stroke_mode"} & changes:
+        stale_resources = set(old_resources) | set(bg_paths)
+    else:
+        stale_resources = {resource for resource in set(old_resources) | set(bg_paths)
+                           if old_resources.get(resource) != bg_paths.get(resource)}
+    for resource in stale_resources:
+        remove_resource_files(IMAGE_FOLDER, resource, log)
+    return changes
+
+# 按配置就地更新日志参数
+def reconfigure_log(config: dict):
+    log.reconfigure(name=config["name"], level=config["log"]["log_level"].upper(),
+                    output_path=config["work_dir"] + config["log"]["output_path"],
+                    output_file=config["log"]["output_file"],
+                    rotation=log_rotation(config["log"]))
+
+# 配置文件被外部修改并重新加载后，在事件循环中应用新配置
+def reload_config_from_file(old_config: dict):
+    try:
+        changes = apply_config(old_config)
+        log.info(f"检测到配置文件修改，已热加载: {', '.join(sorted(changes))}")
+    except Exception as e:
+        log.error(f"热加载配置失败: {e}")
 
 # 添加更新配置的接口
 @shyeri_meme_app.post("/config")
 async def update_config(new_config: dict = Body(...)):
     try:
+        old_config = conf.get()
+        # 管理员密码只能通过密码接口修改，保留当前的admin配置
+        new_config = {key: value for key, value in new_config.items() if key != "admin"}
+        if "admin" in old_config:
+            new_config["admin"] = old_config["admin"]
         conf.set(new_config)
-        # 热更新全局变量
-        global bg_paths, chinese_font_path, english_font_path, IMAGE_EXPIRY_TIME, DOMAIN, PORT
-        bg_paths = conf.get()["resource"]["resource_paths"]
-        chinese_font_path = conf.get()["resource"]["chinese_font_path"]
-        english_font_path = conf.get()["resource"]["english_font_path"]
-        IMAGE_EXPIRY_TIME = conf.get().get("storage", {}).get("image_expiry_time", 300)
-        DOMAIN = conf.get()["api"]["domain"]
-        PORT = conf.get()["api"]["port"]
-        # 重新初始化日志
-        global log
-        log = Logos(name=conf.get()["name"], level=conf.get()["log"]["log_level"].upper(),
-                  output_path=conf.get()["work_dir"]+conf.get()["log"]["output_path"],
-                  output_file=conf.get()["log"]["output_file"])
-        log.info("配置已更新并热加载")
+        changes = apply_config(old_config)
+        log.info(f"配置已更新并热加载: {', '.join(sorted(changes)) or '无变化'}")
         return {"status": "success"}
     except Exception as e:
         log.error(f"更新配置失败: {e}")
@@ -224,6 +746,36 @@ async def get_background_image(background_name: str):
             }
         )
 
+# 静态目录挂载点，用于给未匹配到路由的请求归类
+STATIC_MOUNTS = ("/images", "/assets", "/resource")
+
+
+def route_label(request: Request) -> str:
+    """取匹配到的路由模板作为指标标签，避免路径参数导致标签数量无限增长"""
+    route = request.scope.get("route")
+    if route is not None and hasattr(route, "path"):
+        return route.path
+    for mount in STATIC_MOUNTS:
+        if request.url.path.startswith(mount + "/"):
+            return mount
+    return "unmatched"
+
+
+# 请求计数和耗时指标中间件
+@shyeri_meme_app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = route_label(request)
+        HTTP_REQUESTS.inc(route=route, method=request.method, status=str(status))
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, route=route, method=request.method)
+
+
 # 添加全局异常处理中间件
 @shyeri_meme_app.middleware("http")
 async def timeout_middleware(request: Request, call_next):
@@ -233,6 +785,21 @@ async def timeout_middleware(request: Request, call_next):
     except asyncio.TimeoutError:
         return JSONResponse({"error": "请求超时"}, status_code=504)
 
+# 按需性能分析：管理员请求带X-Profile头或profile=1查询参数时分析该请求
+shyeri_meme_app.add_middleware(ProfilingMiddleware, folder=PROFILE_FOLDER, authorize=is_admin_request,
+                               keep=PROFILE_KEEP)
+
+# 写一行访问日志到日志目录下的log.access_log_file，为空时不记录；由日志管道的后台线程写入文件
+def write_access_log(line: str):
+    log_config = conf.get()["log"]
+    if not log_config.get("access_log_file"):
+        return
+    access_log_path = os.path.join(conf.get()["work_dir"], log_config["output_path"], log_config["access_log_file"])
+    get_global_log_pipeline().submit_line(access_log_path, line, **log_rotation(log_config))
+
+# 请求ID和结构化访问日志，添加在最后以位于最外层，覆盖包括性能分析在内的全部处理
+shyeri_meme_app.add_middleware(AccessLogMiddleware, write=write_access_log, route_label=route_label)
+
 # 挂载图片静态目录
 shyeri_meme_app.mount("/images", StaticFiles(directory=IMAGE_FOLDER), name="images")
 
@@ -266,59 +833,140 @@ if os.path.exists(WEBUI_DIST_PATH):
 shyeri_meme_app.mount("/resource", StaticFiles(directory=os.path.join(path, "resource")), name="resource")
 
 # 工具函数
-# 启动定时删除线程
-def delete_file(path):
-    time.sleep(IMAGE_EXPIRY_TIME)  # 使用配置中的过期时间
+# 生成或再次请求图片时安排(顺延)过期删除
+def create_image_and_start_deletion(image_name):
+    image_path = os.path.join(IMAGE_FOLDER, image_name)
+    expiry_scheduler.schedule(image_path, IMAGE_EXPIRY_TIME)
+
+# 将批量生成的图片打包为zip，manifest.json记录每项结果
+# 将批量渲染的单项结果记入result，成功项加入过期删除调度
+def apply_batch_outcome(result: dict, outcome: dict):
+    if "error" in outcome:
+        result["error"] = outcome["error"]
+    else:
+        result["image_name"] = outcome["image_name"]
+        result["img_url"] = f"{DOMAIN}/images/{outcome['image_name']}"
+        create_image_and_start_deletion(outcome["image_name"])
+
+
+# 流式zip包每次提交渲染的条目数，越小首个图片越早输出
+BATCH_STREAM_CHUNK = 4
+
+
+class ArchiveSink(io.RawIOBase):
+    """不可定位的写入目标，zipfile写入的字节暂存在此，由流式响应逐段取出"""
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def write_batch_entry(archive: zipfile.ZipFile, result: dict):
+    """将一项生成的图片写入zip包，读取失败时记录到该项的错误中"""
+    image_path = os.path.join(IMAGE_FOLDER, result["image_name"])
+    archive_name = f"{result['index']:03d}_{result['image_name']}"
     try:
-        if os.path.exists(path):
-            os.remove(path)
-            log.info(f"已删除图片: {path}")
+        archive.write(image_path, archive_name)
+        result["file"] = archive_name
+    except OSError as e:
+        result["error"] = f"读取生成的图片失败: {e}"
+
+
+async def stream_batch_archive(results: list[dict], valid_indexes: list[int], render_items: list[tuple[str, str]],
+                               output_format: str, quality: int):
+    """边渲染边生成zip包：每个分片完成后立即写入其中的图片并输出，最后写入manifest.json
+
+    zip包写入不可定位的目标，条目大小记录在各条目之后的数据描述符中，无需回写文件头。
+    响应头已发出后无法再返回错误状态码，渲染出错的条目记录在manifest.json中。
+    """
+    sink = ArchiveSink()
+    archive = zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED)
+    try:
+        async for start, outcomes in render_pool.iter_batch(render_items, output_format, quality,
+                                                            chunk_size=BATCH_STREAM_CHUNK):
+            for index, outcome in zip(valid_indexes[start:start + len(outcomes)], outcomes):
+                apply_batch_outcome(results[index], outcome)
+                if "image_name" in results[index]:
+                    await asyncio.to_thread(write_batch_entry, archive, results[index])
+            yield sink.drain()
     except Exception as e:
-        log.error(f"删除图片失败: {e}")
+        log.error(f"批量生成表情包时出错: {e}")
+        for index in valid_indexes:
+            if "file" not in results[index] and "error" not in results[index]:
+                results[index]["error"] = f"请求出错：{e}"
+    manifest = [{key: value for key, value in result.items() if key not in ("image_name", "img_url")}
+                for result in results]
+    archive.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+    archive.close()
+    yield sink.drain()
 
-# 模拟文件创建时启动删除线程
-def create_image_and_start_deletion(image_name):
-    image_path = os.path.join(IMAGE_FOLDER, image_name)
-    threading.Thread(target=delete_file, args=(image_path,)).start()
+# 单次获取日志的最大条数
+LOGS_MAX_LIMIT = 2000
+
+# 获取当前日志文件路径
+def current_log_path() -> str:
+    return os.path.join(conf.get()["work_dir"], conf.get()["log"]["output_path"], conf.get()["log"]["output_file"])
+
+# 计算缓冲区最早记录之前的文件游标：缓冲区中的记录都按顺序写入日志文件，从文件末尾跳过相同行数即可；
+# 其他进程写入的行会造成少量重叠，刚加入缓冲区尚未写入文件的几行会使游标略微偏前
+def buffer_file_cursor(buffered: int) -> str | None:
+    if buffered <= 0:
+        return None
+    _, cursor = read_log_lines(current_log_path(), buffered)
+    return cursor
 
 # 修改获取日志的API接口
 @shyeri_meme_app.get("/logs")
-async def get_logs():
-    """高效获取日志内容，优先从全局缓冲区获取，失败时从文件读取备份
+async def get_logs(since: int | None = None, level: str | None = None, limit: int = 200,
+                   before: str | None = None):
+    """获取日志，优先从全局缓冲区获取，缓冲区为空时从日志文件读取
+
+    参数：
+        since: 只返回序号大于since的记录，用于增量获取；不指定时返回最近的limit条
+        level: 最低日志级别，只作用于缓冲区中的记录
+        limit: 最多返回的条数
+        before: 日志文件游标，指定时从文件(包括滚动后的文件)向前读取该位置之前的limit行
     
     返回值：
-        JSONResponse: 包含日志内容的响应
+        JSONResponse: logs为格式化后的日志文本，records为结构化记录，last_seq为缓冲区最新序号，
+        before为继续向前读取日志文件的游标，已无更早的日志时为null
     """
     try:
-        # 优先从全局缓冲区获取日志
+        limit = max(0, min(limit, LOGS_MAX_LIMIT))
         log_buffer = get_global_log_buffer()
-        logs_content = log_buffer.get_last_n(200)
-        
-        # 如果缓冲区为空，则尝试从文件读取
-        if not logs_content.strip():
-            # 从配置中获取日志文件路径
-            log_path = os.path.join(conf.get()["work_dir"], 
-                                  conf.get()["log"]["output_path"], 
-                                  conf.get()["log"]["output_file"])
-            
-            # 检查日志文件是否存在
-            if os.path.exists(log_path):
-                # 高效读取文件最后200行
-                try:
-                    with open(log_path, 'r', encoding='utf-8') as f:
-                        # 移动到文件末尾
-                        f.seek(0, os.SEEK_END)
-                        # 尝试读取文件的最后约10KB数据（假设每行平均50字节，约200行）
-                        buffer_size = 10240
-                        f.seek(max(0, f.tell() - buffer_size), os.SEEK_SET)
-                        lines = f.readlines()
-                        # 如果读取到的行数超过200行，则只保留最后200行
-                        if len(lines) > 200:
-                            logs_content = ''.join(lines[-200:])
-                        else:
-                            logs_content = ''.join(lines)
-                except Exception as e:
-                    log.warning(f"读取日志文件失败: {e}")
+        missed = False
+        cursor = None
+        last_seq = log_buffer.last_seq
+        if before:
+            records = []
+            lines, cursor = await asyncio.to_thread(read_log_lines, current_log_path(), limit, before)
+            logs_content = '\n'.join(lines)
+        else:
+            if since is None:
+                records = log_buffer.get_records(limit, level)
+            else:
+                records, missed, last_seq = log_buffer.get_since(since, limit, level)
+            logs_content = '\n'.join(record.format() for record in records)
+
+            if since is None:
+                if len(log_buffer):
+                    # 级别过滤后没有匹配的记录时返回空结果，不退回到未过滤的日志文件
+                    cursor = await asyncio.to_thread(buffer_file_cursor, len(log_buffer))
+                else:
+                    # 缓冲区为空时从日志文件末尾读取
+                    lines, cursor = await asyncio.to_thread(read_log_lines, current_log_path(), limit)
+                    logs_content = '\n'.join(lines)
         
         # 记录日志
         log.debug("获取日志成功")
@@ -330,7 +978,11 @@ async def get_logs():
                 "code": 200,
                 "message": "success",
                 "data": {
-                    "logs": logs_content
+                    "logs": logs_content,
+                    "records": [record.to_dict() for record in records],
+                    "last_seq": last_seq,
+                    "missed": missed,
+                    "before": cursor
                 }
             }
         )
@@ -348,6 +1000,94 @@ async def get_logs():
             }
         )
 
+# 推送日志的SSE心跳间隔(秒)，避免代理因长时间无数据断开连接
+LOGS_STREAM_HEARTBEAT = 15.0
+
+# 以Server-Sent Events推送新日志
+@shyeri_meme_app.get("/logs/stream")
+async def stream_logs(request: Request, since: int | None = None, level: str | None = None):
+    """有新日志时推送，每条记录为一个log事件，id为记录序号
+
+    参数：
+        since: 从序号大于since的记录开始推送；断线重连时浏览器通过Last-Event-ID自动续传，
+               都不指定时只推送之后产生的记录
+        level: 最低日志级别
+    """
+    log_buffer = get_global_log_buffer()
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.lstrip("-").isdigit():
+        since = int(last_event_id)
+    if since is None:
+        since = log_buffer.last_seq
+
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+
+    def notify():
+        loop.call_soon_threadsafe(wakeup.set)
+
+    # 多进程服务时其他进程写入的日志不会触发回调，按缓冲区的轮询间隔检查
+    poll_interval = log_buffer.poll_interval or LOGS_STREAM_HEARTBEAT
+
+    async def events():
+        cursor = since
+        log_buffer.subscribe(notify)
+        last_sent = loop.time()
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                wakeup.clear()
+                records, missed, scanned = log_buffer.get_since(cursor, LOGS_MAX_LIMIT, level)
+                if missed:
+                    yield "event: missed\ndata: {}\n\n"
+                for record in records:
+                    yield f"id: {record.seq}\nevent: log\ndata: {json.dumps(record.to_dict(), ensure_ascii=False)}\n\n"
+                if missed or records:
+                    last_sent = loop.time()
+                cursor = scanned
+                if len(records) >= LOGS_MAX_LIMIT:
+                    continue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=poll_interval)
+                except asyncio.TimeoutError:
+                    if loop.time() - last_sent >= LOGS_STREAM_HEARTBEAT:
+                        last_sent = loop.time()
+                        yield ": heartbeat\n\n"
+        finally:
+            log_buffer.unsubscribe(notify)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+# 统计图片目录中的文件数和总大小
+def scan_image_folder() -> tuple[int, int]:
+    files = 0
+    total = 0
+    with os.scandir(IMAGE_FOLDER) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    files += 1
+                    total += entry.stat().st_size
+            except OSError:
+                continue
+    return files, total
+
+# Prometheus指标接口
+@shyeri_meme_app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """以Prometheus文本格式输出各路由请求数和耗时、渲染各阶段耗时及运行状态"""
+    for cache in ("render", "text_layer"):
+        hits = RENDER_CACHE_LOOKUPS.get(cache=cache, result="hit")
+        total = hits + RENDER_CACHE_LOOKUPS.get(cache=cache, result="miss")
+        RENDER_CACHE_HIT_RATIO.set(hits / total if total else 0, cache=cache)
+    EXPIRY_PENDING.set(expiry_scheduler.pending())
+    files, total_bytes = await asyncio.to_thread(scan_image_folder)
+    MEMES_DIR_FILES.set(files)
+    MEMES_DIR_BYTES.set(total_bytes)
+    LOG_BUFFER_LINES.set(len(get_global_log_buffer()))
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
 # 添加密码相关接口
 @shyeri_meme_app.post("/admin/password/set")
 async def set_admin_password(password: str = Body(..., embed=True)):
@@ -370,11 +1110,7 @@ async def set_admin_password(password: str = Body(..., embed=True)):
         password_hash = hashlib.sha256((salt + password).encode()).hexdigest()
         
         # 更新配置
-        if "admin" not in current_config:
-            current_config["admin"] = {}
-        current_config["admin"]["password_hash"] = password_hash
-        current_config["admin"]["salt"] = salt
-        conf.set(current_config)
+        conf.update({"admin": {"password_hash": password_hash, "salt": salt}})
         
         log.info("管理员密码已设置")
         return JSONResponse(
@@ -382,7 +1118,7 @@ async def set_admin_password(password: str = Body(..., embed=True)):
             content={
                 "code": 200,
                 "message": "密码设置成功",
-                "data": {}
+                "data": {"token": issue_admin_token()}
             }
         )
     except Exception as e:
@@ -419,8 +1155,7 @@ async def verify_admin_password(password: str = Body(..., embed=True)):
         
         if password_hash == current_config["admin"]["password_hash"]:
             # 生成会话令牌
-            token = secrets.token_hex(32)
-            # 这里简化处理，实际应用中应该使用更安全的会话管理
+            token = issue_admin_token()
             return JSONResponse(
                 status_code=200,
                 content={
@@ -496,9 +1231,8 @@ async def reset_admin_password(data: dict = Body(...)):
         new_salt = secrets.token_hex(16)
         new_password_hash = hashlib.sha256((new_salt + new_password).encode()).hexdigest()
         
-        current_config["admin"]["password_hash"] = new_password_hash
-        current_config["admin"]["salt"] = new_salt
-        conf.set(current_config)
+        # 令牌以密码哈希签名，重置密码后原有会话全部失效
+        conf.update({"admin": {"password_hash": new_password_hash, "salt": new_salt}})
         
         log.info("管理员密码已重置")
         return JSONResponse(
@@ -518,4 +1252,84 @@ async def reset_admin_password(data: dict = Body(...)):
                 "message": f"重置密码失败: {e}",
                 "data": {}
             }
-        )
\ No newline at end of file
+        )
+# 管理员权限不足时的统一响应
+def admin_required_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=401,
+        content={
+            "code": 401,
+            "message": "需要管理员登录",
+            "data": {}
+        }
+    )
+
+# 性能分析记录列表
+@shyeri_meme_app.get("/admin/profiles")
+async def get_profiles(request: Request):
+    """列出按需性能分析的记录（需要管理员权限）"""
+    if not is_admin_request(request):
+        return admin_required_response()
+    profiles = await asyncio.to_thread(list_profiles, PROFILE_FOLDER)
+    return JSONResponse(
+        status_code=200,
+        content={
+            "code": 200,
+            "message": "success",
+            "data": {"profiles": profiles}
+        }
+    )
+
+# 下载pstats格式的分析文件，可用python -m pstats或snakeviz等工具查看
+@shyeri_meme_app.get("/admin/profiles/{file_name}")
+async def download_profile(file_name: str, request: Request):
+    if not is_admin_request(request):
+        return admin_required_response()
+    file_path = os.path.join(PROFILE_FOLDER, file_name)
+    if not PROFILE_NAME_PATTERN.match(file_name) or not file_name.endswith(".prof") \
+            or not os.path.isfile(file_path):
+        return JSONResponse(
+            status_code=404,
+            content={
+                "code": 404,
+                "message": "分析文件不存在",
+                "data": {}
+            }
+        )
+    return FileResponse(file_path, media_type="application/octet-stream", filename=file_name)
+
+# 分析文件的文本摘要，按累计耗时排序
+@shyeri_meme_app.get("/admin/profiles/{file_name}/summary")
+async def get_profile_summary(file_name: str, request: Request, limit: int = 40, sort: str = "cumulative"):
+    if not is_admin_request(request):
+        return admin_required_response()
+    file_path = os.path.join(PROFILE_FOLDER, file_name)
+    if not PROFILE_NAME_PATTERN.match(file_name) or not file_name.endswith(".prof") \
+            or not os.path.isfile(file_path):
+        return JSONResponse(
+            status_code=404,
+            content={
+                "code": 404,
+                "message": "分析文件不存在",
+                "data": {}
+            }
+        )
+    try:
+        summary = await asyncio.to_thread(summarize_profile, file_path, limit, sort)
+    except Exception as e:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "code": 400,
+                "message": f"读取分析文件失败: {e}",
+                "data": {}
+            }
+        )
+    return JSONResponse(
+        status_code=200,
+        content={
+            "code": 200,
+            "message": "success",
+            "data": {"summary": summary}
+        }
+    )
@@ -0,0 +1,264 @@
+"""表情包绘制流程的微基准测试
+
+只使用仓库自带的资源，离线运行。按阶段（解码、字体加载、排版、描边、合成、编码、保存）
+分别计时，并对全部模板、不同长度的中英文文字和每种输出格式测量端到端耗时，结果保存为JSON，
+可用 --compare 与之前的结果对比。同时记录各描边方式与旧版逐次绘制(loop)的像素差异(stroke_parity)，
+用于审核描边方式带来的视觉变化。
+
+用法：
+    python bench/bench_drawer.py [--repeat 5] [--output data/bench/xxx.json] [--compare old.json]
+                                 [--templates 哭 得意] [--formats jpeg webp]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.append(str(Path(__file__).parent.parent))
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+
+from core.core import conf, log
+from drawer.meme_draw import (CertificateGenerator, MIN_FONT_SIZE, STROKE_MODES, TEXT_LAYOUT, get_font,
+                              supported_output_formats, write_file_atomic, _measure_draw)
+from drawer.template_store import TemplateStore
+
+# 测试文字：(名称, 文字)，覆盖短文本、需要缩小字号的长文本和超出最小字号的超长文本
+CAPTIONS = [
+    ("latin_short", "Hello"),
+    ("latin_long", "I can knock you out with one finger"),
+    ("latin_overflow", "I can knock you out with one finger " * 6),
+    ("cjk_short", "你好"),
+    ("cjk_long", "我一根手指就能扣晕你，你信不信"),
+    ("cjk_overflow", "我一根手指就能扣晕你" * 8),
+]
+
+
+def measure(func, repeat: int) -> dict:
+    """重复执行func并统计耗时(毫秒)，func抛出ValueError时同样计时（超长文本的预期结果）"""
+    samples = []
+    error = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func()
+        except ValueError as e:
+            error = str(e)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    result = {
+        "runs": repeat,
+        "mean_ms": statistics.fmean(samples),
+        "min_ms": samples[0],
+        "p50_ms": samples[len(samples) // 2],
+        "max_ms": samples[-1],
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+def font_paths() -> dict:
+    """可用的字体：配置中的中文字体(存在时)、自带的英文字体和Pillow默认字体"""
+    fonts = {}
+    resource = conf.get()["resource"]
+    for name in ("chinese_font_path", "english_font_path"):
+        path = resource[name]
+        if os.path.exists(path):
+            fonts[os.path.basename(path)] = path
+    fonts["pillow_default"] = None
+    return fonts
+
+
+def run(repeat: int, templates: list[str] = None, formats: list[str] = None) -> dict:
+    resource_paths = conf.get()["resource"]["resource_paths"]
+    if templates:
+        resource_paths = {name: path for name, path in resource_paths.items() if name in templates}
+    formats = [name for name in supported_output_formats() if not formats or name in formats]
+    x_range, y_pos, fill, stroke_width, stroke_fill = TEXT_LAYOUT
+    results = []
+
+    def record(stage: str, stats: dict, **labels):
+        results.append({"stage": stage, **labels, **stats})
+
+    output_folder = tempfile.mkdtemp(prefix="shyeri_bench_")
+    try:
+        drawer = CertificateGenerator(log=log, resource_paths=resource_paths, output_folder=output_folder,
+                                      chinese_font_path=conf.get()["resource"]["chinese_font_path"],
+                                      english_font_path=conf.get()["resource"]["english_font_path"])
+
+        # 解码：从磁盘解码并转换为RGB，映射共享内存模板存储中已转换的像素，以及从模板缓存复制
+        template_store = TemplateStore(os.path.join(output_folder, "templates"))
+        for resource, path in resource_paths.items():
+            record("decode", measure(lambda: CertificateGenerator._decode_image(path), repeat),
+                   template=resource)
+            template_store.prepare(path)
+            record("template_map", measure(lambda: template_store.load(path), repeat), template=resource)
+            record("template_copy", measure(lambda: drawer._get_template(resource, path), repeat),
+                   template=resource)
+
+        for font_name, path in font_paths().items():
+            # 字体加载：直接解析字体文件与进程级字体缓存
+            if path is not None:
+                record("font_load", measure(lambda: ImageFont.truetype(path, 90), repeat), font=font_name)
+            record("font_load_cached", measure(lambda: get_font(path, 90), repeat), font=font_name)
+            font = get_font(path, 90)
+
+            for caption_name, caption in CAPTIONS:
+                labels = {"font": font_name, "caption": caption_name}
+                record("fit", measure(lambda: CertificateGenerator._fit_text(
+                    _measure_draw, x_range, y_pos, caption, font), repeat), **labels)
+                try:
+                    fitted, x_pos, fitted_y = CertificateGenerator._fit_text(
+                        _measure_draw, x_range, y_pos, caption, font)
+                except ValueError:
+                    continue
+                canvas = Image.new("RGB", (800, 800))
+                draw = ImageDraw.Draw(canvas)
+                for stroke_mode in STROKE_MODES:
+                    record("stroke", measure(lambda: CertificateGenerator._draw_stroke(
+                        draw, (x_pos, fitted_y), caption, fitted, stroke_width, stroke_fill, stroke_mode),
+                        repeat), stroke_mode=stroke_mode, **labels)
+                    record("draw_centered_text", measure(lambda: CertificateGenerator._draw_centered_text(
+                        draw, x_range, y_pos, caption, font, fill=fill, stroke_width=stroke_width,
+                        stroke_fill=stroke_fill, stroke_mode=stroke_mode), repeat),
+                        stroke_mode=stroke_mode, **labels)
+                    record("text_layer", measure(lambda: CertificateGenerator._render_text_layer(
+                        x_range, y_pos, caption, font, fill=fill, stroke_width=stroke_width,
+                        stroke_fill=stroke_fill, stroke_mode=stroke_mode, min_size=MIN_FONT_SIZE),
+                        repeat), stroke_mode=stroke_mode, **labels)
+
+        # 合成、编码、保存和端到端：所有模板 x 文字 x 输出格式，使用实例配置的字体和描边方式
+        for resource, path in resource_paths.items():
+            for caption_name, caption in CAPTIONS:
+                labels = {"template": resource, "caption": caption_name}
+                try:
+                    layer, position = drawer._get_text_layer(caption, drawer._load_font(resource, caption),
+                                                             drawer.stroke_mode)
+                except ValueError as e:
+                    record("composite", {"runs": 0, "error": str(e)}, **labels)
+                    continue
+
+                def composite():
+                    background = drawer._get_template(resource, path)
+                    background.paste(layer, position, layer)
+                    return background
+                record("composite", measure(composite, repeat), **labels)
+                image = composite()
+                for output_format in formats:
+                    data = CertificateGenerator._encode_image(image, output_format)
+                    record("encode", measure(lambda: CertificateGenerator._encode_image(image, output_format),
+                                             repeat), format=output_format, bytes=len(data), **labels)
+                    target = os.path.join(output_folder, f"bench.{output_format}")
+                    record("save", measure(lambda: write_file_atomic(target, data), repeat),
+                           format=output_format, bytes=len(data), **labels)
+
+                    def end_to_end():
+                        # 清空结果缓存和文字图层缓存，测量完整的冷渲染
+                        drawer.render_cache.clear()
+                        drawer.text_layer_cache.clear()
+                        for name in os.listdir(output_folder):
+                            if name.startswith("shyeri_meme_"):
+                                os.remove(os.path.join(output_folder, name))
+                        drawer.generate_meme(resource, caption, output_format)
+                    record("generate_meme", measure(end_to_end, repeat), format=output_format, **labels)
+
+                # 描边方式与loop的像素差异，不计时
+                for stroke_mode in STROKE_MODES:
+                    if stroke_mode == "loop":
+                        continue
+                    try:
+                        parity = drawer.compare_stroke_mode(resource, caption, stroke_mode)
+                    except ValueError as e:
+                        record("stroke_parity", {"error": str(e)}, **labels, stroke_mode=stroke_mode)
+                        continue
+                    record("stroke_parity", {key: value for key, value in parity.items() if key != "stroke_mode"},
+                           stroke_mode=stroke_mode, **labels)
+    finally:
+        shutil.rmtree(output_folder, ignore_errors=True)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "stroke_mode": drawer.stroke_mode,
+            "text_layout": TEXT_LAYOUT,
+            "formats": formats,
+        },
+        "results": results,
+    }
+
+
+def result_key(result: dict) -> tuple:
+    """用于对比的结果标识：阶段和除统计值以外的标签"""
+    stats = {"runs", "mean_ms", "min_ms", "p50_ms", "max_ms", "error", "bytes", "max_diff", "mean_diff", "diff_ratio"}
+    return tuple(sorted((key, str(value)) for key, value in result.items() if key not in stats))
+
+
+def compare(current: dict, baseline: dict):
+    """按p50对比两次运行，打印变化超过10%的条目"""
+    baseline_results = {result_key(result): result for result in baseline["results"]}
+    changed = 0
+    for result in current["results"]:
+        old = baseline_results.get(result_key(result))
+        if not old or "p50_ms" not in result or "p50_ms" not in old or old["p50_ms"] <= 0:
+            continue
+        ratio = result["p50_ms"] / old["p50_ms"]
+        if abs(ratio - 1) >= 0.1:
+            changed += 1
+            labels = ", ".join(f"{key}={value}" for key, value in result_key(result))
+            print(f"{ratio:6.2f}x  {old['p50_ms']:9.3f}ms -> {result['p50_ms']:9.3f}ms  {labels}")
+    print(f"共{changed}项p50变化超过10%")
+
+
+def summarize(report: dict):
+    """按阶段汇总打印p50的平均值"""
+    stages: dict[str, list[float]] = {}
+    for result in report["results"]:
+        if "p50_ms" in result:
+            stages.setdefault(result["stage"], []).append(result["p50_ms"])
+    for stage, values in stages.items():
+        print(f"{stage:20s} {len(values):5d}项  平均p50 {statistics.fmean(values):9.3f}ms")
+    parity: dict[str, list[dict]] = {}
+    for result in report["results"]:
+        if result["stage"] == "stroke_parity" and "max_diff" in result:
+            parity.setdefault(result["stroke_mode"], []).append(result)
+    for stroke_mode, values in parity.items():
+        print(f"stroke_parity {stroke_mode:6s} {len(values):5d}项  最大差值 {max(v['max_diff'] for v in values):3d}  "
+              f"平均差异像素占比 {statistics.fmean(v['diff_ratio'] for v in values):.4%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="表情包绘制流程微基准测试")
+    parser.add_argument("--repeat", type=int, default=5, help="每项重复次数")
+    parser.add_argument("--output", default=None, help="结果JSON路径，默认data/bench/bench_<时间>.json")
+    parser.add_argument("--compare", default=None, help="与之前保存的结果JSON对比")
+    parser.add_argument("--templates", nargs="*", default=None, help="只测试指定的模板，默认全部")
+    parser.add_argument("--formats", nargs="*", default=None, help="只测试指定的输出格式，默认全部可用格式")
+    args = parser.parse_args()
+
+    report = run(max(1, args.repeat), args.templates, args.formats)
+    output = args.output or os.path.join("data", "bench", f"bench_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    summarize(report)
+    print(f"结果已保存到 {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
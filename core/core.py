@@ -1,5 +1,8 @@
+import sys
+
 from utils.conf import Config
-from utils.log import Logos
+from utils.log import Logos, rotation_options, use_shared_log_buffer
+from utils.process_lock import ProcessLock, fcntl
 
 DEFAULT_CONFIG = {
     "name":"ShyeriMeme",
@@ -7,14 +10,20 @@ DEFAULT_CONFIG = {
     "log":{
         "log_level":"info",
         "output_path":"data/",
-        "output_file":"log.txt"
+        "output_file":"log.txt",
+        "max_file_mb": 10,
+        "backup_count": 7,
+        "rotate_interval_hours": 24,
+        "compress_rotated": True,
+        "access_log_file": "access.log"
     },
     "api":{
         "route_root":"/",
         "port":7210,
         "host":"0.0.0.0",
         "token":"",
-        "domain":"127.0.0.1:7210"
+        "domain":"127.0.0.1:7210",
+        "workers": 1
     },
     "resource":{
         "resource_paths":{
@@ -34,10 +43,47 @@ DEFAULT_CONFIG = {
         "chinese_font_path":"resource/fonts/STHeitiMedium.ttc",
         "english_font_path":"resource/fonts/Times New Roman.ttf"
     },
+    "render":{
+        "workers": 0,
+        "stroke_mode": "dilate",
+        "batch_max_items": 100,
+        "text_layer_cache_mb": 32,
+        "preview_scale": 0.4,
+        "preview_quality": 60
+    },
     "storage":{
-        "image_expiry_time": 300
+        "image_expiry_time": 300,
+        "render_cache_mb": 64,
+        "output_format": "jpeg",
+        "output_quality": 95
     }
 }
 
 conf = Config(default=DEFAULT_CONFIG)
-log = Logos(name=conf.get()["name"], level=conf.get()["log"]["log_level"].upper(),output_path= conf.get()["work_dir"]+conf.get()["log"]["output_path"],output_file=conf.get()["log"]["output_file"])
\ No newline at end of file
+
+# 服务进程数，大于1时为多进程服务：各进程共享日志缓冲区，日志文件只由主服务进程滚动
+SERVING_WORKERS = max(1, int(conf.get()["api"].get("workers", 1)))
+if SERVING_WORKERS > 1 and fcntl is None:
+    print("[WARNING] 当前平台不支持多进程服务，使用单进程运行", file=sys.stderr)
+    SERVING_WORKERS = 1
+RUN_DIR = conf.get()["work_dir"] + "data/run/"
+# 多进程服务时由持有该锁的服务进程承担只应执行一次的工作(日志文件滚动、启动时清理过期图片)
+primary_lock = ProcessLock(RUN_DIR + "primary.lock")
+
+
+def is_primary_process() -> bool:
+    """本进程是否负责只应由一个进程执行的工作，单进程服务时总是True"""
+    return SERVING_WORKERS == 1 or primary_lock.held
+
+
+def log_rotation(log_config: dict) -> dict:
+    """本进程写日志文件时使用的滚动参数，多进程服务时只有主服务进程滚动"""
+    options = rotation_options(log_config)
+    if SERVING_WORKERS > 1:
+        options.update(shared=True, rotate=is_primary_process())
+    return options
+
+
+if SERVING_WORKERS > 1:
+    use_shared_log_buffer(RUN_DIR + "log_buffer.bin")
+log = Logos(name=conf.get()["name"], level=conf.get()["log"]["log_level"].upper(),output_path= conf.get()["work_dir"]+conf.get()["log"]["output_path"],output_file=conf.get()["log"]["output_file"],rotation=log_rotation(conf.get()["log"]))
\ No newline at end of file
@@ -1,19 +1,287 @@
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
+import math
 import os
+import threading
 
 from utils.log import Logos
+from drawer.render_cache import RenderCache, normalize_text
+from drawer.template_store import TemplateStore
+import glob
 import hashlib
+import io
+import tempfile
+import time
+from contextlib import contextmanager
+
+# 最小字体大小，文本缩小到该字号仍放不下时报错
+MIN_FONT_SIZE = 24
+
+# 描边绘制方式：
+#   loop   逐像素偏移重复绘制文字，(2w+1)^2次光栅化，与旧版输出一致
+#   dilate 文字只光栅化一次，对蒙版做(2w+1)x(2w+1)方形最大值膨胀后按描边色填充。描边覆盖范围与loop相同，
+#          但外缘的抗锯齿像素取各偏移中的最大覆盖率，loop则是多次半透明叠加，外缘更实；
+#          两者只在描边外缘的少量像素(通常不足1%)上存在差异，可用bench/bench_drawer.py的stroke_parity结果审核
+#   native 使用Pillow自带的stroke_width，圆角描边，速度最快，描边形状与loop不同
+STROKE_MODES = ("loop", "dilate", "native")
+DEFAULT_STROKE_MODE = "dilate"
+
+# 预览图默认缩放比例和编码质量
+PREVIEW_SCALE = 0.4
+PREVIEW_QUALITY = 60
+
+# 文字排版参数：(水平区域, 起始y坐标, 文字颜色, 描边宽度, 描边颜色)，所有模板相同
+TEXT_LAYOUT = ((50, 750), 650, (255, 255, 255), 6, (0, 0, 0))
+
+# 输出格式：格式名 -> (Pillow格式, 扩展名, MIME类型)
+OUTPUT_FORMATS = {
+    "jpeg": ("JPEG", "jpg", "image/jpeg"),
+    "webp": ("WEBP", "webp", "image/webp"),
+    "avif": ("AVIF", "avif", "image/avif"),
+    "png": ("PNG", "png", "image/png"),
+}
+DEFAULT_OUTPUT_FORMAT = "jpeg"
+DEFAULT_OUTPUT_QUALITY = 95
+
+
+def supported_output_formats() -> list[str]:
+    """当前Pillow可编码的输出格式（AVIF需要Pillow编译时支持或安装插件）"""
+    Image.init()
+    return [name for name, (pil_format, _, _) in OUTPUT_FORMATS.items() if pil_format in Image.SAVE]
+
+
+# 进程级字体缓存：(字体路径, 字号) -> 字体对象，路径为None表示Pillow默认字体
+_font_cache: dict[tuple[str | None, int], ImageFont.FreeTypeFont] = {}
+_font_cache_lock = threading.Lock()
+
+
+def get_font(font_path: str | None, size: int) -> ImageFont.FreeTypeFont:
+    """按(路径, 字号)获取字体对象，同一字体文件在进程内只解析一次
+    Args:
+        font_path: 字体文件路径，为None时使用Pillow默认字体
+        size: 字号
+    """
+    key = (font_path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        if font_path is None:
+            font = ImageFont.load_default(size=size)
+        else:
+            font = ImageFont.truetype(font_path, size)
+        with _font_cache_lock:
+            font = _font_cache.setdefault(key, font)
+    return font
+
+
+def _font_variant(font: ImageFont.FreeTypeFont, size: int) -> ImageFont.FreeTypeFont:
+    """获取同一字体的其他字号，默认字体(从内存加载)的path不是文件路径"""
+    font_path = font.path if isinstance(font.path, (str, bytes, os.PathLike)) else None
+    return get_font(font_path, size)
+
+
+# 仅用于测量文字宽度的画布
+_measure_draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+def resource_file_prefix(resource: str) -> str:
+    """背景模板生成文件名的公共前缀"""
+    return f"shyeri_meme_{hashlib.md5(resource.encode('utf-8')).hexdigest()}_"
+
+
+def remove_resource_files(output_folder: str, resource: str, log: Logos):
+    """删除输出目录中指定背景模板已生成的图片"""
+    for stale_path in glob.glob(os.path.join(output_folder, resource_file_prefix(resource) + "*")):
+        try:
+            os.remove(stale_path)
+        except FileNotFoundError:
+            # 多进程服务时可能已被其他进程删除
+            pass
+        except OSError as e:
+            log.warning(f"删除过期缓存图片{stale_path}失败: {e}")
+
+
+def write_file_atomic(path: str, data: bytes):
+    """先写入同目录临时文件再重命名，读取方不会看到写了一半的文件"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=os.path.splitext(path)[1])
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 class CertificateGenerator:
-    def __init__(self, log:Logos, resource_paths:dict[str, str], output_folder:str, chinese_font_path:str = "resource/fonts/FangSong.ttf", english_font_path:str = "resource/fonts/Times New Roman.ttf"):
+    def __init__(self, log:Logos, resource_paths:dict[str, str], output_folder:str, chinese_font_path:str = "resource/fonts/FangSong.ttf", english_font_path:str = "resource/fonts/Times New Roman.ttf", stroke_mode:str = DEFAULT_STROKE_MODE,
+                 render_cache_bytes:int = 64 * 1024 * 1024, output_format:str = DEFAULT_OUTPUT_FORMAT,
+                 output_quality:int = DEFAULT_OUTPUT_QUALITY, text_layer_cache_bytes:int = 32 * 1024 * 1024,
+                 template_cache_dir:str = None):
+        if stroke_mode not in STROKE_MODES:
+            raise ValueError(f"不支持的描边方式{stroke_mode}，可选值为{list(STROKE_MODES)}")
         self.resource_paths = resource_paths
+        self.stroke_mode = stroke_mode
+        self.output_format = output_format
+        self.output_quality = output_quality
         self.chinese_font_path = chinese_font_path
         self.english_font_path = english_font_path
         self.output_folder = output_folder
         self.log = log
+        # 已编码表情包的内存缓存，键为输出文件名
+        self.render_cache = RenderCache(render_cache_bytes)
+        # 最近若干次绘制的分阶段耗时(阶段名, 秒)，由drain_stage_timings取出
+        self.stage_timings: list[tuple[str, float]] = []
+        # 文字图层缓存，键为文字、字体和描边参数，按图层像素字节数计入预算
+        self.text_layer_cache = RenderCache(text_layer_cache_bytes,
+                                            sizeof=lambda entry: entry[0].width * entry[0].height * 4)
+        # 共享内存模板存储，为None时各自解码模板
+        self.template_store = TemplateStore(template_cache_dir) if template_cache_dir else None
+        # 已解码的背景模板缓存：资源名 -> (图片路径, 图像, 像素缓冲区)
+        # 使用共享内存模板存储时图像是映射缓存文件的只读RGBX图像，缓冲区为映射的像素；否则为RGB图像，缓冲区为None
+        self._template_cache: dict[str, tuple[str, Image.Image, memoryview | None]] = {}
+        # 预览用的缩小模板缓存：(资源名, 缩放比例) -> (图片路径, RGB图像)
+        self._preview_cache: dict[tuple[str, float], tuple[str, Image.Image]] = {}
+        self._template_lock = threading.Lock()
         if not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder)
+        self._load_templates()
+
+    @contextmanager
+    def _stage(self, name:str):
+        """记录一个绘制阶段的耗时"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings.append((name, time.perf_counter() - start))
+
+    def drain_stage_timings(self) -> list[tuple[str, float]]:
+        """取出并清空已记录的分阶段耗时"""
+        timings, self.stage_timings = self.stage_timings, []
+        return timings
+
+    def _load_templates(self):
+        """预先解码resource_paths中的全部背景模板，失败的条目留待首次使用时再加载"""
+        cache = {}
+        for resource, background_path in self.resource_paths.items():
+            try:
+                cache[resource] = (background_path, *self._decode_template(background_path))
+            except Exception as e:
+                self.log.error(f"预加载背景模板{resource}({background_path})失败: {e}")
+        with self._template_lock:
+            self._template_cache = cache
+            self._preview_cache = {}
+
+    @staticmethod
+    def _decode_image(background_path:str) -> Image.Image:
+        """打开背景图片并转换为RGB模式"""
+        with Image.open(background_path) as image:
+            return image.convert('RGB')
+
+    def _decode_template(self, background_path:str) -> tuple[Image.Image, memoryview | None]:
+        """加载背景模板：优先映射共享内存模板存储中的像素，无法使用时直接解码背景图片
+        Returns:
+            (图像, 像素缓冲区)，直接解码时缓冲区为None
+        """
+        if self.template_store is not None:
+            try:
+                return self.template_store.load(background_path)
+            except (OSError, ValueError) as e:
+                self.log.warning(f"映射背景模板{background_path}失败，改为直接解码: {e}")
+        return self._decode_image(background_path), None
+
+    def _get_template(self, resource:str, background_path:str, copy:bool = True) -> Image.Image:
+        """获取背景模板的RGB副本，缓存未命中或路径变化时重新加载；copy为False时返回只读的缓存对象"""
+        with self._template_lock:
+            cached = self._template_cache.get(resource)
+        if cached is None or cached[0] != background_path:
+            cached = (background_path, *self._decode_template(background_path))
+            with self._template_lock:
+                self._template_cache[resource] = cached
+        _, template, pixels = cached
+        if not copy:
+            return template
+        if pixels is not None:
+            # 直接从映射的像素构建RGB图像，RGBX与Pillow内部布局一致，比convert更快
+            return Image.frombytes('RGB', template.size, pixels, 'raw', 'RGBX')
+        return template.copy()
+
+    def _get_preview_template(self, resource:str, background_path:str, scale:float) -> Image.Image:
+        """获取按比例缩小的背景模板副本，缩小结果按(模板, 比例)缓存"""
+        key = (resource, scale)
+        with self._template_lock:
+            cached = self._preview_cache.get(key)
+        if cached is None or cached[0] != background_path:
+            template = self._get_template(resource, background_path, copy=False)
+            size = (max(1, round(template.width * scale)), max(1, round(template.height * scale)))
+            preview = template.resize(size, Image.LANCZOS, reducing_gap=2.0)
+            cached = (background_path, preview if preview.mode == 'RGB' else preview.convert('RGB'))
+            with self._template_lock:
+                self._preview_cache[key] = cached
+        return cached[1].copy()
+
+    def update_resource_paths(self, resource_paths:dict[str, str], remove_files:bool = True) -> set[str]:
+        """更新背景模板映射，只重新解码路径变化或新增的模板，这些模板对应的渲染缓存(及文件)一并失效
+        Returns:
+            路径发生变化(含新增和删除)的资源名
+        """
+        changed = {resource for resource in set(self.resource_paths) | set(resource_paths)
+                   if resource_paths.get(resource) != self.resource_paths.get(resource)}
+        self.resource_paths = resource_paths
+        with self._template_lock:
+            for resource in changed:
+                self._template_cache.pop(resource, None)
+            self._preview_cache = {key: cached for key, cached in self._preview_cache.items()
+                                   if key[0] not in changed}
+        for resource in changed:
+            self.invalidate_resource(resource, remove_files)
+            background_path = resource_paths.get(resource)
+            if background_path:
+                try:
+                    self._get_template(resource, background_path, copy=False)
+                except Exception as e:
+                    self.log.error(f"预加载背景模板{resource}({background_path})失败: {e}")
+        return changed
+
+    def invalidate_resource(self, resource:str, remove_files:bool = True):
+        """删除指定背景模板已生成的缓存和文件"""
+        self.render_cache.discard_prefix(resource_file_prefix(resource))
+        if remove_files:
+            remove_resource_files(self.output_folder, resource, self.log)
+
+    def reconfigure(self, resource_paths:dict[str, str], output_folder:str, chinese_font_path:str,
+                    english_font_path:str, stroke_mode:str, render_cache_bytes:int, text_layer_cache_bytes:int,
+                    template_cache_dir:str = None):
+        """按新参数就地更新绘制器，只重建变化的部分，参数与构造函数相同
+
+        已生成的文件由调用方统一清理，这里只处理本进程的内存状态：模板只重新解码路径变化的条目；
+        字体或描边方式变化时清空渲染结果缓存，文字图层缓存的键已包含字体路径和描边方式，无需清空。
+        """
+        if stroke_mode not in STROKE_MODES:
+            raise ValueError(f"不支持的描边方式{stroke_mode}，可选值为{list(STROKE_MODES)}")
+        if output_folder != self.output_folder:
+            os.makedirs(output_folder, exist_ok=True)
+            self.output_folder = output_folder
+        if (chinese_font_path, english_font_path, stroke_mode) != \
+                (self.chinese_font_path, self.english_font_path, self.stroke_mode):
+            self.chinese_font_path = chinese_font_path
+            self.english_font_path = english_font_path
+            self.stroke_mode = stroke_mode
+            self.render_cache.clear()
+        if template_cache_dir != (self.template_store.cache_dir if self.template_store else None):
+            # 模板存储位置变化时重新加载全部模板，模板内容不变，已生成的结果仍然有效
+            self.template_store = TemplateStore(template_cache_dir) if template_cache_dir else None
+            self.resource_paths = resource_paths
+            self._load_templates()
+        elif resource_paths != self.resource_paths:
+            self.update_resource_paths(resource_paths, remove_files=False)
+        if render_cache_bytes != self.render_cache.max_bytes:
+            self.render_cache.resize(render_cache_bytes)
+        if text_layer_cache_bytes != self.text_layer_cache.max_bytes:
+            self.text_layer_cache.resize(text_layer_cache_bytes)
 
     @staticmethod
     def _draw_bold_text(draw, position, text, font, fill=(0, 0, 0), bold_level=2):
@@ -31,78 +299,365 @@ class CertificateGenerator:
             draw.text((x+offset, y+offset), text, fill=fill, font=font)
         draw.text((x, y), text, fill=fill, font=font)
 
+    @staticmethod
+    def _draw_stroke(draw, position, text, font, stroke_width, stroke_fill, stroke_mode=DEFAULT_STROKE_MODE):
+        """绘制文字的方形描边
+        Args:
+            draw: ImageDraw对象
+            position: (x, y) 文字位置，可以是小数
+            stroke_width: 描边宽度
+            stroke_fill: 描边颜色
+            stroke_mode: 描边绘制方式，见STROKE_MODES
+        """
+        x_pos, y_pos = position
+        if stroke_mode == "loop":
+            for offset_x in range(-stroke_width, stroke_width + 1):
+                for offset_y in range(-stroke_width, stroke_width + 1):
+                    draw.text((x_pos + offset_x, y_pos + offset_y), text, fill=stroke_fill, font=font)
+        elif stroke_mode == "native":
+            draw.text((x_pos, y_pos), text, fill=stroke_fill, font=font,
+                      stroke_width=stroke_width, stroke_fill=stroke_fill)
+        elif stroke_mode == "dilate":
+            # 在独立蒙版上只光栅化一次文字，保留小数坐标以与逐次绘制的亚像素位置一致
+            left, top, right, bottom = font.getbbox(text)
+            offset_x = stroke_width - min(0, left)
+            offset_y = stroke_width - min(0, top)
+            mask = Image.new("L", (int(right) + offset_x + stroke_width + 1,
+                                   int(bottom) + offset_y + stroke_width + 1), 0)
+            frac_x, int_x = math.modf(x_pos)
+            frac_y, int_y = math.modf(y_pos)
+            ImageDraw.Draw(mask).text((offset_x + frac_x, offset_y + frac_y), text, fill=255, font=font)
+            # 重复3x3最大值滤波等价于(2w+1)x(2w+1)的方形膨胀
+            for _ in range(stroke_width):
+                mask = mask.filter(ImageFilter.MaxFilter(3))
+            draw.bitmap((int(int_x) - offset_x, int(int_y) - offset_y), mask, fill=stroke_fill)
+        else:
+            raise ValueError(f"不支持的描边方式{stroke_mode}，可选值为{list(STROKE_MODES)}")
+
+    @staticmethod
+    def _fit_text(draw, x_range, y_pos, text, font, min_size=MIN_FONT_SIZE):
+        """计算文字在区域内水平居中时使用的字体和位置，放不下时缩小字号
+        Returns:
+            (字体, x坐标, y坐标)
+        Raises:
+            ValueError: 当文本过长且字体小于min_size时抛出
+        """
+        left, right = x_range
+        box_width = right - left
+        text_width = draw.textlength(text, font=font)
+        if text_width > box_width:
+            # 二分查找能放下文本的最大字号，每缩小1px文字下移1px
+            if font.size - 1 < min_size:
+                raise ValueError(f"文本过长无法适应区域: '{text}' (最小字体{min_size}px)")
+            low, high = min_size, font.size - 1
+            best = None
+            while low <= high:
+                mid = (low + high) // 2
+                candidate = _font_variant(font, mid)
+                candidate_width = draw.textlength(text, font=candidate)
+                if candidate_width <= box_width:
+                    best = (candidate, candidate_width)
+                    low = mid + 1
+                else:
+                    high = mid - 1
+            if best is None:
+                raise ValueError(f"文本过长无法适应区域: '{text}' (最小字体{min_size}px)")
+            y_pos = y_pos + (font.size - best[0].size)
+            font, text_width = best
+        x_pos = left + (box_width - text_width) // 2
+        return font, x_pos, y_pos
+
     @staticmethod
     def _draw_centered_text(draw, x_range, y_pos, text, font, fill=(0, 0, 0),
-                            bold=False, stroke_width=2, stroke_fill=(0, 0, 0)):
+                            bold=False, stroke_width=2, stroke_fill=(0, 0, 0),
+                            stroke_mode=DEFAULT_STROKE_MODE):
         """绘制居中对齐文字
         Args:
             x_range: (left, right) 左右边界坐标
             bold: 是否加粗
             stroke_width: 描边宽度
             stroke_fill: 描边颜色
+            stroke_mode: 描边绘制方式，见STROKE_MODES
         Raises:
             ValueError: 当文本过长且字体小于24时抛出
         """
-        while True:
-            text_width = draw.textlength(text, font=font)
-            left, right = x_range
-            x_pos = left + (right - left - text_width) // 2
-            if text_width <= right - left:
-                break
-            # 缩小字体大小
-            font_size = font.size - 1
-            if font_size < 24:  # 添加最小字体检查
-                raise ValueError(f"文本过长无法适应区域: '{text}' (最小字体24px)")
-            font = ImageFont.truetype(font.path, font_size)
-            y_pos = y_pos + 1
+        font, x_pos, y_pos = CertificateGenerator._fit_text(draw, x_range, y_pos, text, font)
 
         # 绘制黑色描边
         if stroke_width > 0:
-            for offset_x in range(-stroke_width, stroke_width + 1):
-                for offset_y in range(-stroke_width, stroke_width + 1):
-                    draw.text((x_pos + offset_x, y_pos + offset_y), text, fill=stroke_fill, font=font)
-        
+            CertificateGenerator._draw_stroke(draw, (x_pos, y_pos), text, font,
+                                              stroke_width, stroke_fill, stroke_mode)
+
         if bold:
             for offset in range(1, 3):
                 draw.text((x_pos + offset, y_pos + offset), text, fill=fill, font=font)
         draw.text((x_pos, y_pos), text, fill=fill, font=font)
 
+    @staticmethod
+    def _render_text_layer(x_range, y_pos, text, font, fill=(0, 0, 0), bold=False, stroke_width=2,
+                           stroke_fill=(0, 0, 0), stroke_mode=DEFAULT_STROKE_MODE, min_size=MIN_FONT_SIZE):
+        """将居中文字及其描边渲染为与背景无关的RGBA图层
+        Returns:
+            (RGBA图层, 粘贴位置)，用图层自身作为蒙版粘贴即可得到与_draw_centered_text相同的效果
+        """
+        font, x_pos, y_pos = CertificateGenerator._fit_text(_measure_draw, x_range, y_pos, text, font, min_size)
+        left, top, right, bottom = font.getbbox(text)
+        pad = stroke_width + (2 if bold else 0)
+        offset_x = pad - min(0, left)
+        offset_y = pad - min(0, top)
+        size = (int(right) + offset_x + pad + 1, int(bottom) + offset_y + pad + 1)
+        frac_x, int_x = math.modf(x_pos)
+        frac_y, int_y = math.modf(y_pos)
+        origin = (offset_x + frac_x, offset_y + frac_y)
+
+        # 分别光栅化描边和文字的覆盖度蒙版
+        stroke_mask = Image.new("L", size, 0)
+        if stroke_width > 0:
+            CertificateGenerator._draw_stroke(ImageDraw.Draw(stroke_mask), origin, text, font,
+                                              stroke_width, 255, stroke_mode)
+        fill_mask = Image.new("L", size, 0)
+        fill_draw = ImageDraw.Draw(fill_mask)
+        if bold:
+            for offset in range(1, 3):
+                fill_draw.text((origin[0] + offset, origin[1] + offset), text, fill=255, font=font)
+        fill_draw.text(origin, text, fill=255, font=font)
+
+        # 描边完全覆盖文字区域，颜色按文字覆盖度混合，透明度为两者叠加后的覆盖度
+        layer = Image.new("RGB", size, stroke_fill)
+        layer.paste(fill, (0, 0) + size, fill_mask)
+        layer = layer.convert("RGBA")
+        layer.putalpha(ImageChops.screen(stroke_mask, fill_mask))
+        return layer, (int(int_x) - offset_x, int(int_y) - offset_y)
+
+    def _get_text_layer(self, text:str, font, stroke_mode:str, layout:tuple = TEXT_LAYOUT,
+                        min_size:int = MIN_FONT_SIZE):
+        """获取文字图层，相同文字、字体和描边参数的图层在不同背景间复用"""
+        font_key = font.path if isinstance(font.path, str) else None
+        key = (text, font_key, font.size, stroke_mode, min_size) + layout
+        cached = self.text_layer_cache.get(key)
+        if cached is None:
+            self.text_layer_cache.record_miss()
+            x_range, y_pos, fill, stroke_width, stroke_fill = layout
+            with self._stage("text_layer"):
+                cached = self._render_text_layer(x_range, y_pos, text, font, fill=fill, bold=False,
+                                                 stroke_width=stroke_width, stroke_fill=stroke_fill,
+                                                 stroke_mode=stroke_mode, min_size=min_size)
+            self.text_layer_cache.put(key, cached)
+        return cached
+
     @staticmethod
     def _draw_text(draw, position, text, font, fill=(0, 0, 0), bold=False):
         x, y = position
         draw.text((x, y), text, fill=fill, font=font)
 
-    def generate_meme(self, resource:str , text:str):
-        # 对resource和text字段进行MD5哈希处理
-        resource_hash = hashlib.md5(resource.encode('utf-8')).hexdigest()
-        text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
-        # 使用哈希值作为文件名
-        output_path = os.path.join(self.output_folder, f"shyeri_meme_{resource_hash}_{text_hash}.jpg")
-        background_path = self.resource_paths.get(resource)
-        if not background_path:
-            self.log.error(f"资源{resource}不存在")
-            raise ValueError(f"资源{resource}不存在")
-        # 打开背景图片并转换为RGB模式
-        background = Image.open(background_path).convert('RGB')
-        draw = ImageDraw.Draw(background)
-
-        # 修改字体设置
+    def _load_font(self, resource:str, text:str, size:int = 90):
+        """加载绘制用的字体，失败时使用默认字体"""
         try:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             script_dir= os.path.dirname(script_dir)
             font_path = os.path.join(script_dir, self.chinese_font_path)
-            font = ImageFont.truetype(font_path, size=90)
+            return get_font(font_path, size)
         except Exception as e:
             self.log.error(f"绘制meme {resource}_{text} 时加载字体失败: {e}; 使用默认字体")
-            font = ImageFont.load_default(size=90)
-        try:
-            # 使用白色文字带黑色描边
-            self._draw_centered_text(draw, (50, 750), 650, text, font, fill=(255, 255, 255), bold=False, stroke_width=6, stroke_fill=(0, 0, 0))
-        except Exception as e:
-            raise e
+            return get_font(None, size)
+
+    def render_meme(self, resource:str, text:str, stroke_mode:str = None) -> Image.Image:
+        """在内存中绘制表情包，不写入文件
+        Args:
+            resource: 背景模板名称
+            text: 要绘制的文字
+            stroke_mode: 描边绘制方式，默认使用实例配置
+        Returns:
+            绘制完成的RGB图像
+        """
+        background_path = self.resource_paths.get(resource)
+        if not background_path:
+            self.log.error(f"资源{resource}不存在")
+            raise ValueError(f"资源{resource}不存在")
+        # 从模板缓存中获取已解码背景的副本
+        with self._stage("template"):
+            background = self._get_template(resource, background_path)
+        with self._stage("font"):
+            font = self._load_font(resource, text)
+        # 使用白色文字带黑色描边，文字图层与背景无关，可跨模板复用
+        layer, position = self._get_text_layer(text, font, stroke_mode or self.stroke_mode)
+        with self._stage("composite"):
+            background.paste(layer, position, layer)
+        return background
+
+    def render_preview(self, resource:str, text:str, scale:float = PREVIEW_SCALE,
+                       output_format:str = None, quality:int = PREVIEW_QUALITY) -> bytes:
+        """在缩小的模板上按比例缩放字号和描边绘制低分辨率预览，只在内存中编码，不写入任何文件
+        Returns:
+            编码后的预览图片字节
+        """
+        if not 0 < scale <= 1:
+            raise ValueError(f"预览缩放比例必须在0到1之间: {scale}")
+        output_format, quality = self._resolve_encoding(output_format, quality)
+        text = normalize_text(text)
+        background_path = self.resource_paths.get(resource)
+        if not background_path:
+            raise ValueError(f"资源{resource}不存在")
+        with self._stage("template"):
+            background = self._get_preview_template(resource, background_path, scale)
+        if text:
+            (left, right), y_pos, fill, stroke_width, stroke_fill = TEXT_LAYOUT
+            layout = ((round(left * scale), round(right * scale)), round(y_pos * scale), fill,
+                      max(1, round(stroke_width * scale)), stroke_fill)
+            with self._stage("font"):
+                font = self._load_font(resource, text, max(1, round(90 * scale)))
+            layer, position = self._get_text_layer(text, font, self.stroke_mode, layout,
+                                                   max(1, round(MIN_FONT_SIZE * scale)))
+            with self._stage("composite"):
+                background.paste(layer, position, layer)
+        with self._stage("encode"):
+            return self._encode_image(background, output_format, quality)
 
-        # 保存为JPEG格式
-        background.save(output_path, format='JPEG', quality=95)
+    def _render_direct(self, resource:str, text:str, stroke_mode:str) -> Image.Image:
+        """直接在背景上逐步绘制文字(不使用图层缓存)，作为对比基准"""
+        background_path = self.resource_paths.get(resource)
+        if not background_path:
+            raise ValueError(f"资源{resource}不存在")
+        background = self._get_template(resource, background_path)
+        draw = ImageDraw.Draw(background)
+        font = self._load_font(resource, text)
+        x_range, y_pos, fill, stroke_width, stroke_fill = TEXT_LAYOUT
+        self._draw_centered_text(draw, x_range, y_pos, text, font, fill=fill, bold=False,
+                                 stroke_width=stroke_width, stroke_fill=stroke_fill, stroke_mode=stroke_mode)
+        return background
+
+    def compare_stroke_mode(self, resource:str, text:str, stroke_mode:str = None) -> dict:
+        """对比当前渲染结果与旧版逐次直接绘制(loop)的像素差异，用于审核视觉变化
+        Args:
+            resource: 背景模板名称
+            text: 要绘制的文字
+            stroke_mode: 待对比的描边方式，默认使用实例配置
+        Returns:
+            dict: max_diff为单通道最大差值(0-255)，mean_diff为平均差值，
+                  diff_ratio为存在差异的像素占比
+        """
+        stroke_mode = stroke_mode or self.stroke_mode
+        reference = self._render_direct(resource, text, stroke_mode="loop")
+        candidate = self.render_meme(resource, text, stroke_mode=stroke_mode)
+        diff = ImageChops.difference(reference, candidate)
+        gray = diff.convert("L")
+        histogram = gray.histogram()
+        total = reference.width * reference.height
+        channel_sum = sum(sum(i * count for i, count in enumerate(diff.histogram()[band * 256:(band + 1) * 256]))
+                          for band in range(3))
+        return {
+            "stroke_mode": stroke_mode,
+            "max_diff": max(high for _, high in diff.getextrema()),
+            "mean_diff": channel_sum / (total * 3),
+            "diff_ratio": (total - histogram[0]) / total,
+        }
+
+    @staticmethod
+    def meme_name(resource:str, text:str, output_format:str = DEFAULT_OUTPUT_FORMAT,
+                  quality:int = DEFAULT_OUTPUT_QUALITY) -> str:
+        """根据背景名称、已规范化的文字和编码参数生成确定的文件名"""
+        # 对resource和text字段进行MD5哈希处理
+        resource_hash = hashlib.md5(resource.encode('utf-8')).hexdigest()
+        text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
+        extension = OUTPUT_FORMATS[output_format][1]
+        # 使用哈希值作为文件名，PNG为无损格式，文件名中不含质量
+        if output_format == "png":
+            return f"shyeri_meme_{resource_hash}_{text_hash}.{extension}"
+        return f"shyeri_meme_{resource_hash}_{text_hash}_q{quality}.{extension}"
+
+    def _resolve_encoding(self, output_format:str | None, quality:int | None) -> tuple[str, int]:
+        """补全默认编码参数并检查格式是否可用"""
+        output_format = output_format or self.output_format
+        quality = quality or self.output_quality
+        if output_format not in supported_output_formats():
+            raise ValueError(f"不支持的输出格式{output_format}，可选值为{supported_output_formats()}")
+        if not 1 <= quality <= 100:
+            raise ValueError(f"输出质量必须在1到100之间: {quality}")
+        return output_format, quality
+
+    @staticmethod
+    def _encode_image(image:Image.Image, output_format:str = DEFAULT_OUTPUT_FORMAT,
+                      quality:int = DEFAULT_OUTPUT_QUALITY) -> bytes:
+        """将图像编码为指定格式的字节"""
+        buffer = io.BytesIO()
+        pil_format = OUTPUT_FORMATS[output_format][0]
+        if output_format == "jpeg":
+            # 渐进式并优化哈夫曼表，体积更小且加载时可逐步显示
+            image.save(buffer, format=pil_format, quality=quality, optimize=True, progressive=True)
+        elif output_format == "png":
+            image.save(buffer, format=pil_format, optimize=True)
+        else:
+            image.save(buffer, format=pil_format, quality=quality)
+        return buffer.getvalue()
+
+    def generate_meme(self, resource:str , text:str, output_format:str = None, quality:int = None):
+        output_format, quality = self._resolve_encoding(output_format, quality)
+        text = normalize_text(text)
+        image_name = self.meme_name(resource, text, output_format, quality)
+        output_path = os.path.join(self.output_folder, image_name)
+
+        # 内存缓存命中时直接返回，文件已被清理则用缓存字节补写
+        data = self.render_cache.get(image_name)
+        if data is not None:
+            if not os.path.exists(output_path):
+                write_file_atomic(output_path, data)
+            return image_name
+        # 磁盘上仍存在相同内容的文件
+        if os.path.exists(output_path):
+            self.render_cache.record_hit()
+            return image_name
+
+        self.render_cache.record_miss()
+        image = self.render_meme(resource, text)
+        with self._stage("encode"):
+            data = self._encode_image(image, output_format, quality)
+        self.render_cache.put(image_name, data)
+        with self._stage("save"):
+            write_file_atomic(output_path, data)
 
         # 返回生成的文件名，以便在API中使用
-        return f"shyeri_meme_{resource_hash}_{text_hash}.jpg"
\ No newline at end of file
+        return image_name
+
+    def generate_meme_bytes(self, resource:str, text:str, save:bool = False,
+                            output_format:str = None, quality:int = None) -> tuple[str, bytes]:
+        """生成表情包并返回编码后的图片字节
+        Args:
+            save: 是否同时写入输出目录，为False时只使用内存缓存，不读写任何文件
+        Returns:
+            (文件名, 图片字节)
+        """
+        output_format, quality = self._resolve_encoding(output_format, quality)
+        text = normalize_text(text)
+        image_name = self.meme_name(resource, text, output_format, quality)
+        output_path = os.path.join(self.output_folder, image_name)
+
+        data = self.render_cache.get(image_name)
+        if data is None:
+            self.render_cache.record_miss()
+            image = self.render_meme(resource, text)
+            with self._stage("encode"):
+                data = self._encode_image(image, output_format, quality)
+            self.render_cache.put(image_name, data)
+        if save and not os.path.exists(output_path):
+            with self._stage("save"):
+                write_file_atomic(output_path, data)
+        return image_name, data
+
+    def generate_batch(self, items:list[tuple[str, str]], output_format:str = None,
+                       quality:int = None) -> list[dict]:
+        """批量生成表情包，复用本进程已解码的模板和已加载的字体，单项失败不影响其他项
+        Args:
+            items: (背景模板名称, 文字)列表
+            output_format: 输出格式，默认使用实例配置
+            quality: 输出质量，默认使用实例配置
+        Returns:
+            与items顺序一致的结果列表，成功项为{"image_name": 文件名}，失败项为{"error": 错误信息}
+        """
+        results = []
+        for resource, text in items:
+            try:
+                results.append({"image_name": self.generate_meme(resource, text, output_format, quality)})
+            except Exception as e:
+                self.log.error(f"批量生成表情包{resource}_{text}时出错: {e}")
+                results.append({"error": str(e)})
+        return results
@@ -0,0 +1,100 @@
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# 不做兼容分解的字符：CJK符号和标点、竖排及小型标点、全角标点和全角符号。
+# NFKC会把，！？：等全角标点折叠为ASCII，改变中文文字的排版，这些字符保持原样
+_CJK_PUNCTUATION = re.compile(
+    "[\u3000-\u303f\ufe10-\ufe1f\ufe30-\ufe6f\uff01-\uff0f\uff1a-\uff20"
+    "\uff3b-\uff40\uff5b-\uff65\uffe0-\uffee]+")
+
+
+def normalize_text(text: str) -> str:
+    """规范化表情包文字：去除首尾空白，并对全角字母数字、连字等做Unicode NFKC兼容折叠，
+    使细微差别的输入共享同一缓存条目；中文标点不折叠"""
+    parts = []
+    position = 0
+    for match in _CJK_PUNCTUATION.finditer(text):
+        parts.append(unicodedata.normalize("NFKC", text[position:match.start()]))
+        parts.append(match.group())
+        position = match.end()
+    parts.append(unicodedata.normalize("NFKC", text[position:]))
+    return "".join(parts).strip()
+
+
+class RenderCache:
+    """按字节预算淘汰的LRU渲染结果缓存，默认保存已编码的图片字节"""
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, sizeof=len):
+        """
+        Args:
+            max_bytes: 字节预算
+            sizeof: 计算条目占用字节数的函数，默认len适用于bytes
+        """
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """读取缓存并标记为最近使用，未命中返回None（未命中由调用方在实际渲染时记录）"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def record_hit(self):
+        """记录一次缓存外的命中（如磁盘上仍存在的文件）"""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        """记录一次需要实际渲染的未命中"""
+        with self._lock:
+            self.misses += 1
+
+    def put(self, key, data):
+        """写入缓存，超出字节预算时淘汰最久未使用的条目；单个条目超过预算时不缓存"""
+        size = self.sizeof(data)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= self.sizeof(old)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = data
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= self.sizeof(evicted)
+
+    def discard_prefix(self, prefix: str) -> int:
+        """删除键以prefix开头的全部条目，返回删除数量"""
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self.current_bytes -= self.sizeof(self._entries.pop(key))
+            return len(keys)
+
+    def resize(self, max_bytes: int):
+        """调整字节预算，必要时立即淘汰"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._entries and self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= self.sizeof(evicted)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
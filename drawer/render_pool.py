@@ -0,0 +1,240 @@
+import asyncio
+import cProfile
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from drawer.meme_draw import CertificateGenerator
+from drawer.render_cache import normalize_text
+from utils.access_log import record_render
+from utils.log import ForwardingLogos, forward_log_records
+from utils.metrics import metrics
+from utils.profiling import profile_target
+
+# 渲染相关指标，子进程的耗时和缓存统计随每次调用结果回传到主进程记录
+RENDER_STAGE_SECONDS = metrics.histogram(
+    "shyeri_render_stage_seconds", "Time spent in each render stage inside the render workers", ("stage",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+RENDER_CALL_SECONDS = metrics.histogram(
+    "shyeri_render_call_seconds", "Time spent executing a render call inside a worker", ("method",))
+RENDER_QUEUE_SECONDS = metrics.histogram(
+    "shyeri_render_queue_seconds", "Time a render call waited for a free worker plus IPC", ("method",))
+RENDER_CACHE_LOOKUPS = metrics.counter(
+    "shyeri_render_cache_lookups_total", "Render cache lookups by cache and result", ("cache", "result"))
+RENDER_COALESCED = metrics.counter(
+    "shyeri_render_coalesced_total", "Render requests served by an identical in-flight render", ("method",))
+
+# 子进程内的日志和绘制器，由_init_worker在进程启动时创建一次
+_worker_log: ForwardingLogos | None = None
+_worker_drawer: CertificateGenerator | None = None
+# 子进程已应用的参数版本，进程池更新参数后随调用下发新版本
+_worker_options_version = 0
+
+
+def _init_worker(options: dict):
+    """渲染子进程初始化：创建本进程专用的日志和CertificateGenerator
+
+    子进程的日志只暂存在本进程，随每次调用的结果回传到主进程，出现在主进程的/logs和日志文件中
+    """
+    global _worker_log, _worker_drawer
+    _worker_log = ForwardingLogos(name=options["log"]["name"], level=options["log"]["level"])
+    _worker_drawer = CertificateGenerator(log=_worker_log, **options["drawer"])
+
+
+def _apply_options(version: int, options: dict):
+    """在子进程中就地应用新参数，只更新变化的部分"""
+    global _worker_options_version
+    _worker_log.reconfigure(name=options["log"]["name"], level=options["log"]["level"])
+    _worker_drawer.reconfigure(**options["drawer"])
+    _worker_options_version = version
+
+
+def _call_worker(method: str, args: tuple, profile_prefix: str = None, update: tuple = None):
+    """在子进程中调用绘制器的方法，连同本次调用的分阶段耗时、缓存命中变化和产生的日志一起返回
+
+    调用抛出异常时，日志附在异常的worker_logs属性上随异常回传
+
+    Args:
+        profile_prefix: 不为None时用cProfile分析本次调用，结果写入以该路径为前缀的.prof文件
+        update: 进程池参数更新过时为(版本, 参数)，本进程尚未应用该版本时先应用
+    """
+    if update is not None and update[0] != _worker_options_version:
+        _apply_options(*update)
+    caches = {"render": _worker_drawer.render_cache, "text_layer": _worker_drawer.text_layer_cache}
+    before = {name: (cache.hits, cache.misses) for name, cache in caches.items()}
+    _worker_drawer.drain_stage_timings()
+    start = time.perf_counter()
+    try:
+        if profile_prefix is None:
+            result = getattr(_worker_drawer, method)(*args)
+        else:
+            profiler = cProfile.Profile()
+            try:
+                result = profiler.runcall(getattr(_worker_drawer, method), *args)
+            finally:
+                profiler.dump_stats(f"{profile_prefix}_worker_{method}_{os.getpid()}_{time.perf_counter_ns()}.prof")
+    except Exception as e:
+        e.worker_logs = _worker_log.drain()
+        raise
+    stats = {
+        "elapsed": time.perf_counter() - start,
+        "stages": _worker_drawer.drain_stage_timings(),
+        "cache": {name: (cache.hits - before[name][0], cache.misses - before[name][1])
+                  for name, cache in caches.items()},
+        # 包括进程启动以来尚未回传的日志(如初始化时加载字体失败)
+        "logs": _worker_log.drain(),
+    }
+    return result, stats
+
+
+def _record_stats(method: str, stats: dict, total: float):
+    """在主进程中记录子进程回传的统计和日志"""
+    forward_log_records(stats["logs"])
+    RENDER_CALL_SECONDS.observe(stats["elapsed"], method=method)
+    RENDER_QUEUE_SECONDS.observe(max(0.0, total - stats["elapsed"]), method=method)
+    for stage, seconds in stats["stages"]:
+        RENDER_STAGE_SECONDS.observe(seconds, stage=stage)
+    for cache, (hits, misses) in stats["cache"].items():
+        if hits:
+            RENDER_CACHE_LOOKUPS.inc(hits, cache=cache, result="hit")
+        if misses:
+            RENDER_CACHE_LOOKUPS.inc(misses, cache=cache, result="miss")
+
+
+class RenderPool:
+    """渲染进程池，将CPU密集的表情包绘制移出事件循环"""
+    def __init__(self, workers: int, options: dict):
+        """
+        Args:
+            workers: 进程数，小于等于0时使用CPU核数
+            options: 子进程初始化参数，包含log(日志参数)和drawer(CertificateGenerator参数)
+        """
+        self.workers = self.resolve_workers(workers)
+        self.options = options
+        # 参数版本，进程池创建后每次就地更新参数加一；为0时子进程使用的就是创建时的参数
+        self._options_version = 0
+        self._executor = self._create_executor()
+        # 正在进行的渲染任务，相同键的并发请求共享同一个结果
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    @staticmethod
+    def resolve_workers(workers: int) -> int:
+        """将配置的进程数转换为实际进程数，小于等于0时使用CPU核数"""
+        return workers if workers > 0 else (os.cpu_count() or 1)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # 使用spawn避免fork时继承父进程中的线程和锁状态
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(self.options,))
+
+    async def _submit(self, method: str, args: tuple) -> tuple:
+        """提交到渲染进程并记录指标，返回(结果, 子进程统计, 总耗时)"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        update = (self._options_version, self.options) if self._options_version else None
+        try:
+            result, stats = await loop.run_in_executor(self._executor, _call_worker, method, args,
+                                                       profile_target.get(), update)
+        except Exception as e:
+            forward_log_records(getattr(e, "worker_logs", ()))
+            raise
+        total = time.perf_counter() - start
+        _record_stats(method, stats, total)
+        return result, stats, total
+
+    async def call(self, method: str, *args):
+        """在渲染进程中执行CertificateGenerator的方法并等待结果"""
+        result, stats, total = await self._submit(method, args)
+        record_render(method, args, stats, total)
+        return result
+
+    async def _single_flight(self, key: tuple, method: str, *args):
+        """合并相同键的并发调用：只提交一次渲染，所有等待者获得同一结果"""
+        future = self._inflight.get(key)
+        coalesced = future is not None
+        if coalesced:
+            RENDER_COALESCED.inc(method=method)
+        else:
+            future = asyncio.ensure_future(self._submit(method, args))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish_inflight(key, done))
+        # shield避免某个等待者超时取消时连带取消共享的渲染任务
+        result, stats, total = await asyncio.shield(future)
+        # 每个等待者各自记录到自己请求的访问日志中
+        record_render(method, args, stats, total, coalesced)
+        return result
+
+    def _finish_inflight(self, key: tuple, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 标记异常已读取，所有等待者都已取消时避免告警
+        if not future.cancelled():
+            future.exception()
+
+    async def generate_meme(self, resource: str, text: str, output_format: str = None,
+                            quality: int = None) -> str:
+        key = ("generate_meme", resource, normalize_text(text), output_format, quality)
+        return await self._single_flight(key, "generate_meme", resource, text, output_format, quality)
+
+    async def generate_meme_bytes(self, resource: str, text: str, save: bool = False,
+                                  output_format: str = None, quality: int = None) -> tuple[str, bytes]:
+        key = ("generate_meme_bytes", resource, normalize_text(text), save, output_format, quality)
+        return await self._single_flight(key, "generate_meme_bytes", resource, text, save, output_format, quality)
+
+    async def render_preview(self, resource: str, text: str, scale: float, output_format: str,
+                             quality: int) -> bytes:
+        key = ("render_preview", resource, normalize_text(text), scale, output_format, quality)
+        return await self._single_flight(key, "render_preview", resource, text, scale, output_format, quality)
+
+    async def generate_batch(self, items: list[tuple[str, str]], output_format: str = None,
+                             quality: int = None) -> list[dict]:
+        """将批量任务按进程数切分为连续的分片并行渲染，结果保持原顺序"""
+        results: list[dict] = [{}] * len(items)
+        async for start, chunk_results in self.iter_batch(items, output_format, quality):
+            results[start:start + len(chunk_results)] = chunk_results
+        return results
+
+    async def iter_batch(self, items: list[tuple[str, str]], output_format: str = None, quality: int = None,
+                         chunk_size: int = None):
+        """将批量任务切分为连续的分片并行渲染，按完成顺序逐个产出(分片起始下标, 分片结果)
+
+        Args:
+            chunk_size: 分片大小，默认按进程数平分；流式返回时使用较小的分片以便尽早产出结果
+        """
+        if not items:
+            return
+        chunk_size = chunk_size or -(-len(items) // self.workers)
+
+        async def render_chunk(start: int):
+            return start, await self.call("generate_batch", items[start:start + chunk_size], output_format, quality)
+
+        tasks = [asyncio.ensure_future(render_chunk(start)) for start in range(0, len(items), chunk_size)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 调用方中途退出(如客户端断开或某个分片出错)时取消未完成的分片，并标记已完成分片的异常已读取
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    def update_options(self, options: dict):
+        """就地更新子进程参数，不重建进程池；各子进程在下一次调用时应用新参数"""
+        self.options = options
+        self._options_version += 1
+
+    def restart(self, workers: int, options: dict):
+        """使用新参数重建进程池，旧进程池处理完已提交的任务后退出"""
+        old_executor = self._executor
+        self.workers = self.resolve_workers(workers)
+        self.options = options
+        self._options_version = 0
+        self._executor = self._create_executor()
+        old_executor.shutdown(wait=False)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,113 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+from PIL import Image
+
+# 缓存文件格式：文件头(魔数, 宽, 高)后紧跟按行排列的RGBX像素，与Pillow内部的RGB图像布局一致
+HEADER = struct.Struct("<4sII")
+MAGIC = b"SMT1"
+SUFFIX = ".rgbx"
+
+
+class TemplateStore:
+    """背景模板的共享内存存储
+
+    模板图片只解码一次，转换为原始RGBX像素写入缓存目录，各渲染进程以只读方式内存映射同一个文件，
+    所有进程共用操作系统页缓存中的同一份像素，常驻内存不随渲染进程数增加，进程启动时也无需解码。
+    缓存文件名包含模板的路径、修改时间和大小，模板图片被替换后自动生成新的缓存文件。
+    """
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def cache_path(self, background_path: str) -> str:
+        """模板对应的缓存文件路径，模板图片不存在时抛出OSError"""
+        stat = os.stat(background_path)
+        key = f"{os.path.abspath(background_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + SUFFIX)
+
+    def prepare(self, background_path: str) -> str:
+        """确保模板的缓存文件存在，不存在时解码模板并原子写入，返回缓存文件路径"""
+        path = self.cache_path(background_path)
+        if os.path.exists(path):
+            return path
+        with Image.open(background_path) as image:
+            image = image.convert("RGBX")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # 多个进程可能同时生成同一个缓存文件，内容相同，先写临时文件再重命名，读取方不会看到写了一半的文件
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp_", suffix=SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER.pack(MAGIC, image.width, image.height))
+                f.write(image.tobytes())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return path
+
+    def load(self, background_path: str) -> tuple[Image.Image, memoryview]:
+        """内存映射模板的缓存文件
+
+        Returns:
+            (只读的RGBX图像, 像素缓冲区)，图像直接引用映射的内存，不复制像素；
+            需要可修改的副本时用Image.frombytes("RGB", size, 缓冲区, "raw", "RGBX")从缓冲区构建
+        """
+        path = self.prepare(background_path)
+        mapped = self._map_checked(path)
+        if mapped is None:
+            # 缓存文件损坏(如写入时磁盘已满)时删除后重新生成一次
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            path = self.prepare(background_path)
+            mapped = self._map_checked(path)
+            if mapped is None:
+                raise ValueError(f"模板缓存文件{path}已损坏")
+        magic, width, height = HEADER.unpack_from(mapped)
+        # 映射随缓冲区和图像的引用一起保留，引用全部释放后由垃圾回收解除映射
+        pixels = memoryview(mapped)[HEADER.size:]
+        image = Image.frombuffer("RGBX", (width, height), pixels, "raw", "RGBX", 0, 1)
+        return image, pixels
+
+    @staticmethod
+    def _map_checked(path: str) -> mmap.mmap | None:
+        """以只读方式映射缓存文件并检查文件头和大小，文件损坏时解除映射并返回None"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width, height = HEADER.unpack_from(mapped)
+        if magic != MAGIC or len(mapped) != HEADER.size + width * height * 4:
+            mapped.close()
+            return None
+        return mapped
+
+    def prune(self, background_paths) -> int:
+        """删除不再对应任何模板的缓存文件，已映射这些文件的进程不受影响，返回删除的文件数"""
+        keep = set()
+        for background_path in background_paths:
+            try:
+                keep.add(os.path.basename(self.cache_path(background_path)))
+            except OSError:
+                pass
+        removed = 0
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            # 跳过其他进程正在写入的临时文件
+            if entry.name.endswith(SUFFIX) and not entry.name.startswith(".tmp_") and entry.name not in keep:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
@@ -1,12 +1,8 @@
-from api.api import shyeri_meme_app
-import uvicorn
 import socket
-import requests
 import time
-from core.core import conf
-from utils.log import setup_global_redirect
 
-PORT = conf.get()["api"]["port"]
+# 渲染进程以spawn方式启动，会重新导入本模块；应用、配置和输出重定向都在__main__中加载，
+# 避免每个渲染进程都构建一遍FastAPI应用、日志文件和进程池
 
 def is_port_occupied(port):
     """检查端口是否被占用"""
@@ -15,6 +11,7 @@ def is_port_occupied(port):
 
 def is_self_process_running(port):
     """检查占用端口的是否是本项目进程"""
+    import requests
     try:
         # 等待一下，确保服务已经启动
         time.sleep(0.5)
@@ -30,14 +27,20 @@ def is_self_process_running(port):
     return False
 
 
-# 在应用启动时设置全局输出重定向
-try:
-    original_stdout, original_stderr = setup_global_redirect()
-    print("全局日志重定向已设置")
-except Exception as e:
-    print(f"设置日志重定向失败: {e}")
-
 if __name__ == '__main__':
+    import uvicorn
+    from core.core import conf, SERVING_WORKERS
+    from utils.log import setup_global_redirect
+
+    PORT = conf.get()["api"]["port"]
+
+    # 在应用启动时设置全局输出重定向；多进程服务时各服务进程在加载应用时各自设置
+    try:
+        original_stdout, original_stderr = setup_global_redirect()
+        print("全局日志重定向已设置")
+    except Exception as e:
+        print(f"设置日志重定向失败: {e}")
+
     print(f"尝试启动服务在端口 {PORT}")
     
     # 检查端口是否被占用
@@ -57,7 +60,13 @@ if __name__ == '__main__':
     # 端口可用，启动服务
     print(f"服务启动中... 端口: {PORT}")
     try:
-        uvicorn.run(shyeri_meme_app, host='0.0.0.0', port=PORT)
+        if SERVING_WORKERS > 1:
+            # 多进程模式下uvicorn需要以导入字符串的形式加载应用
+            print(f"多进程模式，服务进程数: {SERVING_WORKERS}")
+            uvicorn.run("api.api:shyeri_meme_app", host='0.0.0.0', port=PORT, workers=SERVING_WORKERS)
+        else:
+            from api.api import shyeri_meme_app
+            uvicorn.run(shyeri_meme_app, host='0.0.0.0', port=PORT)
     except Exception as e:
         print(f"启动服务时发生错误: {e}")
         exit(1)
\ No newline at end of file
@@ -0,0 +1,122 @@
+import contextvars
+import json
+import re
+import secrets
+import time
+
+from starlette.requests import Request
+
+# 当前请求的访问日志统计，由AccessLogMiddleware在请求开始时设置，渲染进程池把渲染耗时和缓存结果累加到其中
+request_stats: contextvars.ContextVar[dict | None] = contextvars.ContextVar("request_stats", default=None)
+
+# 沿用上游传入的请求ID时只接受这些字符，避免日志注入
+REQUEST_ID_PATTERN = re.compile(r"^[0-9A-Za-z_.:-]{1,64}$")
+
+# 按顺序取第一个有查询记录的缓存作为请求的缓存结果：先看整图缓存，未经过整图缓存时看文字图层缓存
+CACHE_PRIORITY = ("render", "text_layer")
+
+
+def new_request_id() -> str:
+    return secrets.token_hex(8)
+
+
+def record_render(method: str, args: tuple, stats: dict, total: float, coalesced: bool = False):
+    """将一次渲染调用的统计累加到当前请求，不在请求上下文中时忽略
+
+    Args:
+        method: 渲染方法名
+        args: 渲染参数，记录背景和文字以便将慢请求与渲染参数对应
+        stats: 渲染子进程回传的统计(elapsed、stages、cache)
+        total: 主进程中从提交到拿到结果的耗时
+        coalesced: 是否复用了相同参数的进行中渲染
+    """
+    current = request_stats.get()
+    if current is None:
+        return
+    encode = sum(seconds for stage, seconds in stats["stages"] if stage == "encode")
+    current["queue_ms"] += max(0.0, total - stats["elapsed"]) * 1000
+    current["render_ms"] += max(0.0, stats["elapsed"] - encode) * 1000
+    current["encode_ms"] += encode * 1000
+    if current["cache"] != "miss":
+        for cache in CACHE_PRIORITY:
+            hits, misses = stats["cache"].get(cache, (0, 0))
+            if hits or misses:
+                current["cache"] = "miss" if misses else "hit"
+                break
+    if coalesced:
+        current["coalesced"] = True
+    if method == "generate_batch":
+        current["render"].append({"method": method, "items": len(args[0])})
+    else:
+        current["render"].append({"method": method, "background": args[0], "text": args[1]})
+
+
+class AccessLogMiddleware:
+    """为每个请求分配请求ID并写一行JSON格式访问日志的ASGI中间件
+
+    请求ID优先沿用请求头中的X-Request-ID，并通过同名响应头返回。访问日志包含路由、状态码、
+    总耗时、渲染排队/绘制/编码耗时、响应字节数和缓存命中情况，由write写出。
+    """
+    def __init__(self, app, write, route_label):
+        """
+        Args:
+            write: 接收一行JSON文本的函数
+            route_label: 接收Request并返回路由模板的函数
+        """
+        self.app = app
+        self.write = write
+        self.route_label = route_label
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                value = value.decode("latin-1")
+                if REQUEST_ID_PATTERN.match(value):
+                    request_id = value
+                break
+        request_id = request_id or new_request_id()
+        stats = {"queue_ms": 0.0, "render_ms": 0.0, "encode_ms": 0.0, "cache": None, "render": []}
+        status = None
+        bytes_out = 0
+
+        async def send_with_request_id(message):
+            nonlocal status, bytes_out
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {**message, "headers": [*message.get("headers", []),
+                                                  (b"x-request-id", request_id.encode())]}
+            elif message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
+
+        token = request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration = time.perf_counter() - start
+            request_stats.reset(token)
+            entry = {
+                "ts": round(time.time(), 3),
+                "request_id": request_id,
+                "method": scope["method"],
+                "route": self.route_label(Request(scope)),
+                "path": scope["path"],
+                "status": status if status is not None else 500,
+                "duration_ms": round(duration * 1000, 3),
+                "queue_ms": round(stats["queue_ms"], 3),
+                "render_ms": round(stats["render_ms"], 3),
+                "encode_ms": round(stats["encode_ms"], 3),
+                "bytes_out": bytes_out,
+                "cache": stats["cache"],
+            }
+            if stats.get("coalesced"):
+                entry["coalesced"] = True
+            if stats["render"]:
+                entry["render"] = stats["render"]
+            self.write(json.dumps(entry, ensure_ascii=False))
@@ -1,7 +1,68 @@
 import json
 import os
+import sys
+import threading
+
+
+class FrozenDict(dict):
+    """只读字典，用作配置快照；仍是dict的子类，可直接序列化为JSON或传给渲染子进程"""
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("配置快照是只读的，请通过Config.set或Config.update修改配置")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value):
+    """递归地将dict/list转换为只读的FrozenDict/tuple"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """递归地将配置快照转换回可修改的dict/list"""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def deep_merge(target: dict, source: dict) -> dict:
+    """深度合并两个字典，source中的值会覆盖target中的同名值，直接修改并返回target"""
+    for key, value in source.items():
+        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+            deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def changed_keys(old, new, prefix: str = "") -> set[str]:
+    """比较两份配置，返回值不同的叶子项路径，如 log.log_level、resource.resource_paths.哭"""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return set() if old == new else {prefix}
+    keys = set()
+    for key in old.keys() | new.keys():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if key not in old or key not in new:
+            keys.add(path)
+        else:
+            keys |= changed_keys(old[key], new[key], path)
+    return keys
+
 
 class Config:
+    """配置管理
+
+    get返回的是只读的配置快照，修改配置时生成新快照并整体替换，读取方无需加锁，也不会读到写了一半的配置。
+    配置文件通过临时文件加重命名原子写入；watch启动后台线程按修改时间检测配置文件的外部修改并重新加载。
+    """
     PATH = "./data/conf"
     FILE = "conf.json"
     def __init__(self, path:str=PATH, file:str=FILE, default:dict=None):
@@ -10,50 +71,126 @@ class Config:
         self.path = path
         self.file = file
         self.default = default  # 保存默认配置
-        self.conf = default.copy()  # 初始化为默认配置的副本
+        self.file_path = os.path.join(path, file)
+        self._snapshot: FrozenDict = freeze(default)
+        # 只用于串行化写入和重新加载，读取不加锁
+        self._write_lock = threading.Lock()
+        # 最近一次读取或写入时配置文件的(修改时间, 大小)，用于检测外部修改
+        self._file_stat = None
+        # 配置文件被外部修改并重新加载后调用的回调，参数为(旧快照, 新快照)
+        self._listeners: list = []
+        self._watch_thread: threading.Thread | None = None
+        self._watch_stop = threading.Event()
         self.load()
-    
-    def _deep_merge(self, target, source):
-        """深度合并两个字典，source中的值会覆盖target中的同名值"""
-        if isinstance(target, dict) and isinstance(source, dict):
-            for key, value in source.items():
-                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                    self._deep_merge(target[key], value)
-                else:
-                    target[key] = value
-        return target
-    
-    def load(self):
-        if not os.path.exists(self.path):
-            os.makedirs(self.path)
-        
-        file_path = os.path.join(self.path, self.file)
-        
-        if not os.path.exists(file_path):
-            # 如果配置文件不存在，保存默认配置
-            with open(file_path, "w") as f:
-                json.dump(self.default, f, indent=2, ensure_ascii=False)
-            self.conf = self.default.copy()
-        else:
-            # 如果配置文件存在，读取并与默认配置合并
-            with open(file_path) as f:
-                file_config = json.load(f)
-            
-            # 深度合并默认配置和文件配置（文件配置优先级高）
-            merged_config = self._deep_merge(self.default.copy(), file_config)
-            self.conf = merged_config
-            
-            # 将合并后的完整配置写回文件
-            with open(file_path, "w") as f:
-                json.dump(merged_config, f, indent=2, ensure_ascii=False)
-    
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _merged(self, file_config: dict) -> FrozenDict:
+        # 深度合并默认配置和文件配置（文件配置优先级高）
+        return freeze(deep_merge(thaw(self.default), file_config))
+
+    def load(self) -> bool:
+        """读取配置文件并替换快照，配置文件不存在时生成默认配置文件
+
+        与默认配置合并后的结果只保存在内存中，不再写回文件。
+
+        Returns:
+            快照是否发生了变化
+        """
+        with self._write_lock:
+            os.makedirs(self.path, exist_ok=True)
+            if not os.path.exists(self.file_path):
+                # 首次运行时保存默认配置，便于手动编辑
+                snapshot = freeze(self.default)
+                self._write(snapshot)
+            else:
+                stat = self._stat()
+                with open(self.file_path, encoding="utf-8") as f:
+                    file_config = json.load(f)
+                snapshot = self._merged(file_config)
+                self._file_stat = stat
+            changed = snapshot != self._snapshot
+            self._snapshot = snapshot
+            return changed
+
+    def _write(self, snapshot: FrozenDict):
+        """原子写入配置文件：先写同目录下的临时文件，再重命名覆盖，调用方需持有写锁"""
+        tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._file_stat = self._stat()
+
     def save(self):
-        with open(os.path.join(self.path, self.file), "w") as f:
-            json.dump(self.conf, f, indent=2, ensure_ascii=False)
-    
-    def get(self):
-        return self.conf
-    
+        with self._write_lock:
+            self._write(self._snapshot)
+
+    def get(self) -> FrozenDict:
+        """当前配置快照，只读"""
+        return self._snapshot
+
+    def to_dict(self) -> dict:
+        """当前配置的可修改副本"""
+        return thaw(self._snapshot)
+
     def set(self, conf:dict):
-        self.conf = conf
-        self.save()
\ No newline at end of file
+        """用完整配置替换当前配置并写入文件"""
+        snapshot = freeze(conf)
+        with self._write_lock:
+            self._write(snapshot)
+            self._snapshot = snapshot
+
+    def update(self, changes:dict):
+        """将changes深度合并到当前配置并写入文件，读取-修改-写入在写锁内完成"""
+        with self._write_lock:
+            snapshot = freeze(deep_merge(thaw(self._snapshot), changes))
+            self._write(snapshot)
+            self._snapshot = snapshot
+
+    def subscribe(self, listener):
+        """注册配置文件被外部修改后的回调，回调在监视线程中执行"""
+        self._listeners.append(listener)
+
+    def watch(self, interval: float = 1.0):
+        """启动后台线程，每隔interval秒检查配置文件的修改时间，变化时重新加载"""
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(target=self._watch_loop, args=(interval,),
+                                              name="config-watch", daemon=True)
+        self._watch_thread.start()
+
+    def stop_watch(self):
+        self._watch_stop.set()
+
+    def _watch_loop(self, interval: float):
+        while not self._watch_stop.wait(interval):
+            stat = self._stat()
+            if stat is None or stat == self._file_stat:
+                continue
+            old = self._snapshot
+            try:
+                changed = self.load()
+            except (OSError, ValueError) as e:
+                # 文件可能正在被编辑器写入，记下本次状态，等下一次修改后再试
+                self._file_stat = stat
+                print(f"[ERROR] 重新加载配置文件失败: {e}", file=sys.stderr)
+                continue
+            if not changed:
+                continue
+            for listener in list(self._listeners):
+                try:
+                    listener(old, self._snapshot)
+                except Exception as e:
+                    print(f"[ERROR] 配置重新加载回调失败: {e}", file=sys.stderr)
@@ -0,0 +1,156 @@
+import heapq
+import os
+import threading
+import time
+
+from utils.log import Logos
+
+
+class ExpiryScheduler:
+    """单线程文件过期删除调度器，使用最小堆按到期时间批量删除文件
+
+    文件的修改时间加有效期是唯一的到期依据：顺延时更新修改时间，删除前重新检查修改时间，
+    多个服务进程各自调度同一目录时，任一进程顺延的文件都不会被其他进程按旧的到期时间删除。
+    """
+    def __init__(self, log: Logos):
+        self.log = log
+        # 文件路径 -> 当前有效的到期时间
+        self._deadlines: dict[str, float] = {}
+        # 文件路径 -> 该文件在堆中的有效条目的到期时间，每个文件只有一个有效条目，其余条目弹出时丢弃
+        self._queued: dict[str, float] = {}
+        # 文件路径 -> 有效期，删除前按修改时间重新计算到期时间
+        self._ttls: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self.running = False
+
+    def start(self):
+        """启动调度线程，重复调用无副作用"""
+        with self._condition:
+            if self.running:
+                return
+            self.running = True
+            self._thread = threading.Thread(target=self._run, name="expiry-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def schedule(self, path: str, ttl: float):
+        """安排文件在ttl秒后删除；已在等待删除的文件会顺延到期时间"""
+        # 同步更新修改时间，其他进程和重启后的扫描按顺延后的时间计算
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        deadline = time.time() + ttl
+        with self._condition:
+            self._push(path, deadline, ttl)
+
+    def _push(self, path: str, deadline: float, ttl: float):
+        """加入调度或更新到期时间，调用方需持有锁
+
+        到期时间推后时只更新记录，堆中的条目弹出时再按新的到期时间放回，堆的大小不随同一文件的重复请求增长；
+        只有到期时间提前(有效期缩短)时才加入新条目。
+        """
+        self._deadlines[path] = deadline
+        self._ttls[path] = ttl
+        queued = self._queued.get(path)
+        if queued is not None and queued <= deadline:
+            return
+        self._queued[path] = deadline
+        heapq.heappush(self._heap, (deadline, path))
+        # 新的到期时间早于当前等待目标时唤醒调度线程
+        if self._heap[0][1] == path:
+            self._condition.notify()
+
+    def sweep(self, folder: str, ttl: float):
+        """扫描目录：按修改时间删除已过期的文件，其余尚未调度的文件加入调度
+
+        已在本调度器中的文件保持不变，可重复调用，用于启动时以及接管其他进程(已退出)调度的文件。
+        """
+        if not os.path.isdir(folder):
+            return
+        now = time.time()
+        expired = []
+        with self._condition:
+            for entry in os.scandir(folder):
+                if not entry.is_file() or entry.path in self._deadlines:
+                    continue
+                try:
+                    deadline = entry.stat().st_mtime + ttl
+                except OSError:
+                    continue
+                if deadline <= now:
+                    expired.append((entry.path, ttl))
+                else:
+                    self._push(entry.path, deadline, ttl)
+            self._condition.notify()
+        self._remove_batch(expired)
+
+    def pending(self) -> int:
+        """等待删除的文件数"""
+        with self._condition:
+            return len(self._deadlines)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self.running:
+                    return
+                now = time.time()
+                due = []
+                # 一次取出所有已到期的文件
+                while self._heap and self._heap[0][0] <= now:
+                    queued, path = heapq.heappop(self._heap)
+                    if self._queued.get(path) != queued:
+                        continue
+                    deadline = self._deadlines[path]
+                    if deadline > queued:
+                        # 到期时间已被顺延，按新的到期时间放回
+                        self._queued[path] = deadline
+                        heapq.heappush(self._heap, (deadline, path))
+                        continue
+                    del self._queued[path], self._deadlines[path]
+                    due.append((path, self._ttls.pop(path)))
+                if not due:
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._condition.wait(timeout)
+                    continue
+            self._remove_batch(due)
+
+    def _remove_batch(self, paths: list[tuple[str, float]]):
+        removed = 0
+        now = time.time()
+        for path, ttl in paths:
+            with self._condition:
+                # 取出后又被重新请求的文件不再删除
+                if path in self._deadlines:
+                    continue
+            try:
+                deadline = os.stat(path).st_mtime + ttl
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                self.log.error(f"删除图片失败: {e}")
+                continue
+            if deadline > now:
+                # 已被其他进程顺延，按新的到期时间重新调度
+                with self._condition:
+                    if path not in self._deadlines:
+                        self._push(path, deadline, ttl)
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.log.error(f"删除图片失败: {e}")
+        if removed:
+            self.log.info(f"已删除{removed}张过期图片")
@@ -3,12 +3,23 @@ import os
 import sys
 import threading
 import time
-import signal
+import atexit
+import re
+import gzip
+import queue
+import shutil
+import struct
+import mmap
+import zlib
+from collections import deque
+from itertools import islice
 from io import StringIO
 from typing import List, Optional
 
-# 添加配置导入
-from utils.conf import Config
+try:
+    import fcntl
+except ImportError:  # Windows下不支持多进程服务
+    fcntl = None
 
 # 日志级别优先级映射（数值越大，级别越高）
 LOG_LEVEL_PRIORITY = {
@@ -21,529 +32,984 @@ LOG_LEVEL_PRIORITY = {
     'FATAL': 5  # 别名
 }
 
-class LogBuffer:
-    """全局日志缓冲区，用于收集所有输出"""
-    def __init__(self, max_lines: int = 1000, log_file: str = None, flush_interval: float = 5.0):
-        self.buffer: List[str] = []
-        self.max_lines = max_lines
-        self.lock = threading.RLock()
-        self.last_write_time = time.time()
-        # 添加需要过滤的模式
-        self.filter_pattern = '"GET /logs HTTP/1.1" 200 OK'
-        
-        # 文件持久化相关配置
-        self.log_file = log_file
-        self.flush_interval = flush_interval
-        self.running = True
-        self.unwritten_lines = 0  # 记录未写入文件的行数
-        self.rolled_over = False  # 添加滚动标志
-        self.max_file_lines = 10000  # 最大文件行数
-        
-        # 初始化日志优先级属性
-        config_level = self._get_config_log_level()
-        self.current_priority = LOG_LEVEL_PRIORITY.get(config_level.upper(), 2)
-        
-        # 如果指定了日志文件路径，则启动异步写入线程
-        if self.log_file:
-            # 确保日志目录存在
-            log_dir = os.path.dirname(self.log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-            
-            # 启动异步写入线程
-            self.flush_thread = threading.Thread(target=self._async_flush_loop, daemon=True)
-            self.flush_thread.start()
-    
-    def _check_and_roll_over(self):
-        """检查文件行数并在需要时进行滚动"""
-        if self.rolled_over or not self.log_file or not os.path.exists(self.log_file):
-            return False
-        
-        try:
-            # 计算当前文件的行数
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                line_count = sum(1 for _ in f)
-            
-            # 如果行数超过阈值，执行滚动
-            if line_count >= self.max_file_lines:
-                # 生成带时间戳的新文件名
-                timestamp = time.strftime('%Y%m%d_%H%M%S')
-                base_name, ext = os.path.splitext(self.log_file)
-                rolled_filename = f"{base_name}_{timestamp}{ext}"
-                
-                # 重命名文件
-                os.rename(self.log_file, rolled_filename)
-                self.rolled_over = True  # 标记已滚动
-                return True
-        except Exception as e:
-            # 记录错误但不影响程序运行
-            print(f"[ERROR] Failed to roll over log file in LogBuffer: {e}", file=sys.stderr)
-        return False
-    
-    def _flush_to_file_safe(self):
-        """安全地将日志写入文件"""
-        if not self.log_file or self.rolled_over:
+# 行首的时间戳，如 2024-01-01 12:00:00 或 2024-01-01 12:00:00,123，可带 " | " 分隔符
+TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:[.,]\d+)?\s*(?:\|\s*)?')
+# 行首(时间戳之后)的日志级别标记，如 "INFO:"、"[ERROR]"、"WARNING -"
+LEVEL_PATTERN = re.compile(r'^\[?(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\]?(?:[\s:\-]+|$)')
+# 级别别名
+LEVEL_ALIASES = {'WARN': 'WARNING', 'FATAL': 'CRITICAL'}
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+
+class LogRecord:
+    """结构化的日志记录"""
+    __slots__ = ('seq', 'timestamp', 'level', 'source', 'message')
+
+    def __init__(self, seq: int, timestamp: float, level: str, source: str, message: str):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.level = level
+        self.source = source
+        self.message = message
+
+    def format(self) -> str:
+        """格式化为单行文本：时间 [级别] 内容"""
+        return f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.timestamp))} [{self.level}] {self.message}"
+
+    def to_dict(self) -> dict:
+        return {
+            'seq': self.seq,
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'source': self.source,
+            'message': self.message,
+        }
+
+
+class RotatingLogWriter:
+    """保持文件句柄打开的日志文件写入器
+
+    通过累计写入的字节数判断是否需要滚动，不再重新读取文件；超过大小或到达滚动周期时将当前文件
+    重命名为 <名称>_<时间><扩展名>，保留最近backup_count个滚动文件，并在后台线程中gzip压缩。
+    rotate为False时不主动滚动(如多进程服务时的非主进程)，只在发现文件已被其他进程滚动后重新打开。
+    """
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 7,
+                 rotate_interval: float = 24 * 3600, compress: bool = True, rotate: bool = True,
+                 shared: bool = False):
+        """
+        Args:
+            path: 日志文件路径
+            max_bytes: 单个文件的最大字节数，小于等于0表示不按大小滚动
+            backup_count: 保留的滚动文件数
+            rotate_interval: 滚动周期(秒)，小于等于0表示不按时间滚动
+            compress: 是否压缩滚动后的文件
+            rotate: 是否由本写入器负责滚动
+            shared: 是否有其他进程同时写入该文件(多进程服务)，为True时按文件实际大小判断是否滚动
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.rotate = rotate
+        self.shared = shared
+        self.lock = threading.Lock()
+        base_name, self._ext = os.path.splitext(os.path.basename(path))
+        self._dir = os.path.dirname(path) or "."
+        self._base_name = base_name
+        self._compress_queue: queue.Queue[str] = queue.Queue()
+        self._compress_thread: Optional[threading.Thread] = None
+        self._file = None
+        self._open()
+        if self.rotate:
+            # 压缩上次运行遗留的未压缩滚动文件并清理超出保留数的文件
+            for name in self.rotated_files():
+                if not name.endswith('.gz'):
+                    self._enqueue_rotated(os.path.join(self._dir, name))
+            self._prune()
+
+    def _open(self):
+        os.makedirs(self._dir, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        stat = os.fstat(self._file.fileno())
+        self.bytes_written = stat.st_size
+        self._inode = stat.st_ino
+        self._opened_at = time.time()
+
+    def write_lines(self, lines: List[str]):
+        """追加写入多行日志"""
+        if not lines:
             return
-            
-        try:
-            if self.lock.acquire(timeout=0.5):
-                try:
-                    if self.unwritten_lines <= 0:
-                        return
-                    
-                    # 检查是否需要滚动文件
-                    self._check_and_roll_over()
-                    
-                    # 如果文件已滚动，不再写入
-                    if self.rolled_over:
-                        self.unwritten_lines = 0
-                        return
-                    
-                    # 获取需要写入的日志行
-                    lines_to_write = self.buffer[-self.unwritten_lines:]
-                    
-                    # 将日志写入文件
-                    with open(self.log_file, 'a', encoding='utf-8') as f:
-                        for line in lines_to_write:
-                            f.write(line + '\n')
-                    
-                    # 重置未写入行数
-                    self.unwritten_lines = 0
-                finally:
-                    self.lock.release()
-        except Exception as e:
-            # 记录错误但不影响程序运行
-            print(f"[ERROR] Failed to write logs to file: {e}", file=sys.stderr)
-
-    def _get_config_log_level(self) -> str:
-        """从配置文件读取日志级别"""
-        try:
-            config = Config()
-            conf_data = config.get()
-            if 'log' in conf_data and 'log_level' in conf_data['log']:
-                return conf_data['log']['log_level']
-        except Exception as e:
-            # 配置读取失败时使用默认值
-            print(f"[ERROR] Failed to read log level from config: {e}", file=sys.stderr)
-        return 'INFO'  # 默认日志级别
-    
-    def add(self, message: str):
-        """添加日志到缓冲区，过滤特定模式和低于配置级别的日志，并为非格式化日志添加时间戳"""
+        data = ''.join(line + '\n' for line in lines).encode('utf-8')
         with self.lock:
-            # 按行分割消息
-            lines = message.split('\n')
-            new_lines_added = 0
-            for line in lines:
-                line = line.strip()
-                # 过滤含有指定模式的日志行
-                if line and self.filter_pattern not in line:
-                    # 检查是否已经包含时间戳格式 (YYYY-MM-DD HH:MM:SS)
-                    if not self._has_timestamp(line):
-                        # 为没有时间戳的日志行添加时间戳
-                        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-                        # 尝试检测日志级别并添加合适的格式
-                        level = self._detect_log_level(line)
-                        line = f"{timestamp}  | {line}"
-                    
-                    # 检查日志级别是否大于等于配置的级别
-                    log_level = self._detect_log_level(line)
-                    log_priority = LOG_LEVEL_PRIORITY.get(log_level.upper(), 2)
-                    
-                    # 只添加大于等于配置级别的日志
-                    if log_priority >= self.current_priority:
-                        self.buffer.append(line)
-                        new_lines_added += 1
-            
-            # 保持缓冲区大小在限制内
-            if len(self.buffer) > self.max_lines:
-                self.buffer = self.buffer[-self.max_lines:]
-            
-            # 更新未写入行数
-            self.unwritten_lines += new_lines_added
-            self.last_write_time = time.time()
-            
-            # 如果未写入行数达到一定阈值，立即触发写入
-            if self.log_file and self.unwritten_lines >= 50:  # 阈值可以根据需要调整
-                self._flush_to_file_safe()
-    
-    def _has_timestamp(self, line: str) -> bool:
-        """检查日志行是否已经包含时间戳格式"""
-        import re
-        # 简单的时间戳格式检测: YYYY-MM-DD HH:MM:SS
-        timestamp_pattern = r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'
-        return bool(re.match(timestamp_pattern, line))
-    
-    def _detect_log_level(self, line: str) -> str:
-        """尝试从日志行中检测日志级别"""
-        line_upper = line.upper()
-        if 'ERROR' in line_upper:
-            return 'ERROR'
-        elif 'WARNING' in line_upper or 'WARN' in line_upper:
-            return 'WARNING'
-        elif 'INFO' in line_upper:
-            return 'INFO'
-        elif 'DEBUG' in line_upper:
-            return 'DEBUG'
-        elif 'CRITICAL' in line_upper or 'FATAL' in line_upper:
-            return 'CRITICAL'
-        else:
-            return 'INFO'  # 默认级别
-    
-    def _flush_to_file_safe(self):
-        """安全地将日志写入文件"""
-        if not self.log_file:
-            return
-            
+            if self.rotate:
+                if self._should_rotate(len(data)):
+                    self._do_rotate()
+            else:
+                self._reopen_if_moved()
+            self._file.write(data)
+            self._file.flush()
+            self.bytes_written += len(data)
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self.shared:
+            # 其他进程也在追加写入，按文件的实际大小判断
+            self.bytes_written = os.fstat(self._file.fileno()).st_size
+        if self.max_bytes > 0 and self.bytes_written > 0 and self.bytes_written + incoming > self.max_bytes:
+            return True
+        return self.rotate_interval > 0 and time.time() - self._opened_at >= self.rotate_interval \
+            and self.bytes_written > 0
+
+    def _do_rotate(self):
+        """重命名当前文件并打开新文件，调用方需持有锁"""
+        self._file.close()
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        target = os.path.join(self._dir, f"{self._base_name}_{timestamp}{self._ext}")
+        suffix = 1
+        while os.path.exists(target) or os.path.exists(target + '.gz'):
+            target = os.path.join(self._dir, f"{self._base_name}_{timestamp}_{suffix}{self._ext}")
+            suffix += 1
+        try:
+            os.replace(self.path, target)
+        except OSError as e:
+            print(f"[ERROR] Failed to rotate log file: {e}", file=sys.__stderr__)
+            target = None
+        self._open()
+        if target:
+            self._enqueue_rotated(target)
+
+    def _reopen_if_moved(self):
+        """文件被其他进程滚动后重新打开，调用方需持有锁"""
         try:
-            if self.lock.acquire(timeout=0.5):
+            moved = os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            moved = True
+        if moved:
+            self._file.close()
+            self._open()
+
+    def _enqueue_rotated(self, rotated_path: str):
+        """交给后台线程压缩并清理旧文件"""
+        self._compress_queue.put(rotated_path)
+        if self._compress_thread is None or not self._compress_thread.is_alive():
+            self._compress_thread = threading.Thread(target=self._compress_loop, name="log-compress", daemon=True)
+            self._compress_thread.start()
+
+    def _compress_loop(self):
+        while True:
+            try:
+                rotated_path = self._compress_queue.get(timeout=5.0)
+            except queue.Empty:
+                return
+            if self.compress and not rotated_path.endswith('.gz'):
                 try:
-                    if self.unwritten_lines <= 0:
-                        return
-                        
-                    # 获取需要写入的日志行
-                    lines_to_write = self.buffer[-self.unwritten_lines:]
-                    
-                    # 将日志写入文件
-                    with open(self.log_file, 'a', encoding='utf-8') as f:
-                        for line in lines_to_write:
-                            f.write(line + '\n')
-                    
-                    # 重置未写入行数
-                    self.unwritten_lines = 0
-                finally:
-                    self.lock.release()
-        except Exception as e:
-            # 记录错误但不影响程序运行
-            # 注意：这里不能使用log.error，避免循环引用
-            print(f"[ERROR] Failed to write logs to file: {e}", file=sys.stderr)
-    
-    def _async_flush_loop(self):
-        """异步写入循环"""
-        while self.running:
-            time.sleep(self.flush_interval)
-            self._flush_to_file_safe()
-    
-    def flush_now(self):
-        """立即将所有日志写入文件"""
-        self._flush_to_file_safe()
-    
+                    with open(rotated_path, 'rb') as src, gzip.open(rotated_path + '.gz', 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    os.remove(rotated_path)
+                except OSError as e:
+                    print(f"[ERROR] Failed to compress rotated log {rotated_path}: {e}", file=sys.__stderr__)
+            self._prune()
+
+    def rotated_files(self) -> List[str]:
+        """滚动后的文件名，从新到旧排列"""
+        return rotated_log_files(self.path)
+
+    def _prune(self):
+        """删除超出保留数的滚动文件；同一文件压缩前后的两个版本只计一次"""
+        seen = []
+        for name in self.rotated_files():
+            key = name[:-3] if name.endswith('.gz') else name
+            if key not in seen:
+                seen.append(key)
+            if len(seen) > self.backup_count:
+                try:
+                    os.remove(os.path.join(self._dir, name))
+                except OSError:
+                    pass
+
+    def configure(self, **options):
+        """更新滚动参数"""
+        with self.lock:
+            for key, value in options.items():
+                setattr(self, key, value)
+
     def close(self):
-        """关闭日志缓冲区，确保所有日志都被写入"""
-        # 设置运行标志为False
-        self.running = False
-        
-        # 尝试关闭线程
+        with self.lock:
+            if self._file and not self._file.closed:
+                self._file.close()
+
+
+# 日志文件路径 -> 写入器，同一文件的多个写入方共享一个写入器，避免各自滚动
+_log_writers: dict[str, RotatingLogWriter] = {}
+_log_writers_lock = threading.Lock()
+
+
+def get_log_writer(path: str, **options) -> RotatingLogWriter:
+    """获取指定日志文件的共享写入器，已存在时用options更新其滚动参数"""
+    key = os.path.abspath(path)
+    with _log_writers_lock:
+        writer = _log_writers.get(key)
+        if writer is None:
+            writer = _log_writers[key] = RotatingLogWriter(key, **options)
+        elif options:
+            writer.configure(**options)
+        return writer
+
+
+def rotated_log_files(path: str) -> List[str]:
+    """日志文件滚动后的文件名(<名称>_<时间><扩展名>[.gz])，从新到旧排列"""
+    directory = os.path.dirname(path) or "."
+    base_name, ext = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(re.escape(base_name) + r'_\d{8}_\d{6}(?:_\d+)?' + re.escape(ext) + r'(?:\.gz)?$')
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return sorted((name for name in names if pattern.match(name)), reverse=True)
+
+
+def log_file_chain(path: str) -> List[str]:
+    """当前日志文件及其滚动文件的文件名，从新到旧排列
+
+    压缩过程中同一滚动文件的两个版本同时存在时只取未压缩的版本，压缩文件此时可能尚未写完。
+    """
+    chain = [os.path.basename(path)] if os.path.exists(path) else []
+    rotated = rotated_log_files(path)
+    chain.extend(name for name in rotated if not (name.endswith('.gz') and name[:-3] in rotated))
+    return chain
+
+
+# 日志游标记录文件开头最多这么多字节的长度和校验值，用于识别翻页期间被滚动或替换的文件；
+# 日志文件只追加写入，开头的内容不会改变，滚动文件压缩后解压的内容也相同
+CURSOR_IDENTITY_BYTES = 256
+
+
+def _head_identity(head: bytes) -> str:
+    return f"{len(head)}-{zlib.crc32(head):08x}"
+
+
+def _file_identity(file_path: str, length: int) -> Optional[str]:
+    """文件(解压后)开头length字节的标识，与游标中记录的标识比较，无法读取时返回None"""
+    opener = gzip.open if file_path.endswith('.gz') else open
+    try:
+        with opener(file_path, 'rb') as f:
+            return _head_identity(f.read(length))
+    except (OSError, EOFError):
+        return None
+
+
+def _locate_cursor_file(directory: str, chain: List[str], name: str, identity: str) -> Optional[int]:
+    """游标所指文件在chain中的下标
+
+    优先按文件名查找(滚动文件可能已被压缩)；文件开头与游标记录的不一致时(如当前日志文件在两次翻页之间被滚动)，
+    按开头内容在其余文件中查找，都不一致时返回None。
+    """
+    length, _, _ = identity.partition('-')
+    if not length.isdigit():
+        return None
+    names = [candidate for candidate in (name, name + '.gz') if candidate in chain]
+    # 开头为空的标识与任何文件都一致，只能按文件名查找
+    if int(length) > 0:
+        names.extend(candidate for candidate in chain if candidate not in names)
+    for candidate in names:
+        if _file_identity(os.path.join(directory, candidate), int(length)) == identity:
+            return chain.index(candidate)
+    return None
+
+
+def _tail_plain(file_path: str, end: Optional[int], limit: int, block_size: int) -> tuple[List[str], int, str]:
+    """从end向前按块读取未压缩文件，返回(end之前最多limit个完整行，从旧到新, 最旧一行的起始偏移, 文件标识)
+
+    缓冲区只保存尚未拆出的字节，内存占用不超过一个块加一行。
+    """
+    lines = []
+    with open(file_path, 'rb') as f:
+        if end is None:
+            end = f.seek(0, os.SEEK_END)
+        pos = end
+        buf = b''
+        while len(lines) < limit and end > 0:
+            # buf为[pos, end)，其末尾是一行的结尾；在末尾之前找到换行符即得到完整的一行
+            newline = buf.rfind(b'\n', 0, len(buf) - 1)
+            if newline < 0 and pos > 0:
+                size = min(block_size, pos)
+                pos -= size
+                f.seek(pos)
+                buf = f.read(size) + buf
+                continue
+            line = buf[newline + 1:].rstrip(b'\r\n')
+            end = pos + newline + 1
+            buf = buf[:newline + 1]
+            if line.strip():
+                lines.append(line.decode('utf-8', errors='replace'))
+        # 在同一个文件句柄上计算标识，读取期间文件被滚动也不会取到新文件的开头
+        f.seek(0)
+        identity = _head_identity(f.read(CURSOR_IDENTITY_BYTES))
+    lines.reverse()
+    return lines, end, identity
+
+
+def _tail_gzip(file_path: str, end: Optional[int], limit: int) -> tuple[List[str], int, str]:
+    """读取压缩文件中end(解压后的偏移)之前最多limit个完整行，返回值同_tail_plain
+
+    gzip文件无法向前定位，只能从头顺序解压；只保留最近的limit行，内存占用与页大小成正比。
+    """
+    tail: deque = deque(maxlen=limit)
+    offset = 0
+    with gzip.open(file_path, 'rb') as f:
+        identity = _head_identity(f.read(CURSOR_IDENTITY_BYTES))
+        f.seek(0)
+        for raw in f:
+            if end is not None and offset >= end:
+                break
+            if raw.strip():
+                tail.append((offset, raw.rstrip(b'\r\n').decode('utf-8', errors='replace')))
+            offset += len(raw)
+    if not tail:
+        return [], 0, identity
+    return [line for _, line in tail], tail[0][0], identity
+
+
+def read_log_lines(path: str, limit: int = 200, before: Optional[str] = None,
+                   block_size: int = 64 * 1024) -> tuple[List[str], Optional[str]]:
+    """从日志文件末尾向前读取恰好limit个完整行(文件不足时除外)，当前文件读完后继续读取滚动文件
+
+    Args:
+        path: 当前日志文件路径
+        limit: 读取的行数
+        before: 上一页返回的游标，格式为 <文件名>:<字节偏移>:<文件标识>，只读取该位置之前的行；为None时从当前文件末尾开始
+        block_size: 向前读取的块大小
+
+    Returns:
+        (日志行，从旧到新, 下一页的游标)，已读到最早的滚动文件开头时游标为None。
+        压缩文件的偏移为解压后的偏移，游标所指的文件在两次翻页之间被滚动或压缩后游标仍然有效；
+        游标无效或所指的文件已被清理时返回([], None)。
+    """
+    chain = log_file_chain(path)
+    directory = os.path.dirname(path) or "."
+    index, end = 0, None
+    if before:
+        parts = before.rsplit(':', 2)
+        if len(parts) != 3 or not parts[1].isdigit():
+            return [], None
+        name, offset, identity = parts
+        located = _locate_cursor_file(directory, chain, name, identity)
+        if located is None:
+            return [], None
+        index, end = located, int(offset)
+        if end == 0:
+            index, end = index + 1, None
+
+    pages = []
+    remaining = limit
+    cursor = None
+    while index < len(chain) and remaining > 0:
+        name = chain[index]
+        file_path = os.path.join(directory, name)
         try:
-            if hasattr(self, 'flush_thread') and self.flush_thread.is_alive():
-                # 使用join，但设置超时避免无限等待
-                self.flush_thread.join(timeout=1.0)
-        except Exception:
-            pass
+            if name.endswith('.gz'):
+                lines, start, identity = _tail_gzip(file_path, end, remaining)
+            else:
+                lines, start, identity = _tail_plain(file_path, end, remaining, block_size)
+        except (OSError, EOFError):
+            # 读取期间被清理或压缩文件不完整，跳过该文件
+            lines, start, identity = [], 0, _head_identity(b'')
+        pages.append(lines)
+        remaining -= len(lines)
+        cursor = f"{name}:{start}:{identity}" if start > 0 or index + 1 < len(chain) else None
+        index, end = index + 1, None
+    return [line for lines in reversed(pages) for line in lines], cursor
+
+
+class LogBuffer:
+    """全局日志缓冲区，用于收集所有输出
+
+    使用固定大小的环形数组保存结构化日志记录，每条记录带有递增的序号；
+    另外为每个级别维护序号索引，按级别读取时无需扫描整个缓冲区。
+    记录由日志管道的后台线程写入，文件持久化也由日志管道负责。
+    """
+    def __init__(self, max_lines: int = 1000):
+        self.max_lines = max_lines
+        # 环形数组，序号为seq的记录位于 seq % max_lines
+        self._ring: List[Optional[LogRecord]] = [None] * max_lines
+        # 下一条记录的序号，也是累计写入的记录数
+        self._next_seq = 0
+        # 仍有效的最早序号，清空缓冲区时前移
+        self._first_seq = 0
+        # 级别 -> 该级别记录的序号，超出环形数组范围的序号在读取时跳过
+        self._level_index: dict[str, deque] = {level: deque(maxlen=max_lines) for level in LOG_LEVELS}
+        self.lock = threading.RLock()
+        self.last_write_time = time.time()
+        # 有新记录时调用的回调(如推送日志的SSE连接)，在日志管道线程中调用
+        self._listeners: list = []
+        # 其他进程写入的记录不会触发回调，需要轮询时的间隔(秒)；None表示回调即可覆盖所有记录
+        self.poll_interval: Optional[float] = None
         
-        # 最后一次刷新，确保所有日志都被写入
-        self._flush_to_file_safe()
+        # 最低记录级别，由Logos按配置的日志级别设置
+        self.current_priority = LOG_LEVEL_PRIORITY['INFO']
+
+    def set_level(self, level: str):
+        """设置缓冲区记录的最低日志级别"""
+        self.current_priority = LOG_LEVEL_PRIORITY.get(level.upper(), LOG_LEVEL_PRIORITY['INFO'])
     
+    def add(self, message: str, level: str = None, source: str = 'stdout',
+            timestamp: float = None) -> List[LogRecord]:
+        """添加日志到缓冲区：按行拆分，去掉行首的时间戳和级别标记，丢弃空行和低于配置级别的日志
+
+        Args:
+            message: 日志内容，多行内容按行拆分为多条记录
+            level: 日志级别，为None时从行首的级别标记解析；没有标记的行沿用同一消息中上一行的级别
+            source: 日志来源，如stdout、stderr或日志器名称
+            timestamp: 日志产生的时间，默认为当前时间
+
+        Returns:
+            实际加入缓冲区的记录
+        """
+        now = timestamp or time.time()
+        lines = self._parse(message, level)
+        if not lines:
+            return []
+
+        records = []
+        with self.lock:
+            for record_level, line in lines:
+                seq = self._next_seq
+                record = LogRecord(seq, now, record_level, source, line)
+                self._ring[seq % self.max_lines] = record
+                self._level_index[record_level].append(seq)
+                self._next_seq = seq + 1
+                records.append(record)
+            self.last_write_time = now
+        self._notify()
+        return records
+
+    def _parse(self, message: str, level: Optional[str]) -> List[tuple[str, str]]:
+        """将消息拆分为(级别, 内容)行，去掉行首的时间戳和级别标记，丢弃低于配置级别的行"""
+        lines = []
+        current_level = level or 'INFO'
+        for line in message.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if level is None:
+                # 去掉已有的时间戳，统一由记录的timestamp表示
+                match = TIMESTAMP_PATTERN.match(line)
+                if match:
+                    line = line[match.end():]
+                match = LEVEL_PATTERN.match(line)
+                if match:
+                    current_level = LEVEL_ALIASES.get(match.group(1), match.group(1))
+                    line = line[match.end():] or line
+            # 只添加大于等于配置级别的日志
+            if LOG_LEVEL_PRIORITY[current_level] >= self.current_priority:
+                lines.append((current_level, line))
+        return lines
+
+    def _notify(self):
+        with self.lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener()
+            except Exception:
+                pass
+
+    def subscribe(self, listener):
+        """注册有新记录时调用的无参回调；回调在日志管道线程中执行，不能阻塞"""
+        with self.lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        with self.lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    @property
+    def last_seq(self) -> int:
+        """最新一条记录的序号，没有记录时为-1"""
+        with self.lock:
+            return self._next_seq - 1
+
+    def get_since(self, since: int, limit: int, min_level: str = None) -> tuple[List[LogRecord], bool, int]:
+        """按时间顺序获取序号大于since的记录，最多limit条
+
+        Returns:
+            (记录列表, 是否有记录已被环形数组覆盖而缺失, 已检查到的序号)；
+            下次增量读取应以已检查到的序号作为since，级别过滤掉的记录不会被重复检查
+        """
+        with self.lock:
+            oldest = self._oldest_seq()
+            start = max(since + 1, oldest)
+            missed = since + 1 < oldest
+            scanned = self._next_seq - 1
+            if limit <= 0 or start >= self._next_seq:
+                return [], missed, max(since, scanned)
+            if min_level is None or LOG_LEVEL_PRIORITY.get(min_level.upper(), 0) <= LOG_LEVEL_PRIORITY['DEBUG']:
+                end = min(self._next_seq, start + limit)
+                return [self._ring[seq % self.max_lines] for seq in range(start, end)], missed, end - 1
+
+            priority = LOG_LEVEL_PRIORITY.get(min_level.upper(), 2)
+            # 增量读取时新记录通常很少，从各级别索引的尾部向前取到start为止
+            seqs = []
+            for level in LOG_LEVELS:
+                if LOG_LEVEL_PRIORITY[level] < priority:
+                    continue
+                for seq in reversed(self._level_index[level]):
+                    if seq < start:
+                        break
+                    seqs.append(seq)
+            seqs.sort()
+            if len(seqs) > limit:
+                del seqs[limit:]
+                scanned = seqs[-1]
+            return [self._ring[seq % self.max_lines] for seq in seqs], missed, scanned
+
+    def get_records(self, limit: int = None, min_level: str = None) -> List[LogRecord]:
+        """按时间顺序获取最近的日志记录
+
+        Args:
+            limit: 最多返回的记录数，None表示缓冲区内全部记录
+            min_level: 只返回大于等于该级别的记录，通过级别索引读取
+        """
+        with self.lock:
+            oldest = self._oldest_seq()
+            available = self._next_seq - oldest
+            limit = available if limit is None else max(0, min(limit, available))
+            if not limit:
+                return []
+            if min_level is None or LOG_LEVEL_PRIORITY.get(min_level.upper(), 0) <= LOG_LEVEL_PRIORITY['DEBUG']:
+                return [self._ring[seq % self.max_lines] for seq in range(self._next_seq - limit, self._next_seq)]
+
+            priority = LOG_LEVEL_PRIORITY.get(min_level.upper(), 2)
+            # 从各级别索引的尾部取最近的序号，合并后取最新的limit条
+            seqs = []
+            for level in LOG_LEVELS:
+                if LOG_LEVEL_PRIORITY[level] < priority:
+                    continue
+                for seq in islice(reversed(self._level_index[level]), limit):
+                    if seq < oldest:
+                        break
+                    seqs.append(seq)
+            seqs.sort(reverse=True)
+            del seqs[limit:]
+            return [self._ring[seq % self.max_lines] for seq in reversed(seqs)]
+
+    def _oldest_seq(self) -> int:
+        """环形数组中仍有效的最早序号，调用方需持有锁"""
+        return max(self._first_seq, self._next_seq - self.max_lines)
+
     def get_all(self) -> str:
         """获取缓冲区所有内容"""
-        with self.lock:
-            return '\n'.join(self.buffer)
+        return '\n'.join(record.format() for record in self.get_records())
     
-    def get_last_n(self, n: int) -> str:
+    def get_last_n(self, n: int, min_level: str = None) -> str:
         """获取缓冲区最后n行"""
-        with self.lock:
-            return '\n'.join(self.buffer[-n:])
+        return '\n'.join(record.format() for record in self.get_records(n, min_level))
     
     def clear(self):
         """清空缓冲区"""
         with self.lock:
-            self.buffer = []
+            self._ring = [None] * self.max_lines
+            for index in self._level_index.values():
+                index.clear()
+            # 序号保持递增
+            self._first_seq = self._next_seq
+
+    def __len__(self):
+        with self.lock:
+            return self._next_seq - self._oldest_seq()
+
+
+class SharedLogBuffer(LogBuffer):
+    """多个进程共享的日志缓冲区，多进程服务时替代LogBuffer，接口相同
+
+    环形数组保存在内存映射的文件中，所有进程写入同一组槽位并共用递增的序号，任一进程的/logs
+    都能读到全部进程的日志，增量读取的序号在各进程间一致。写入通过文件锁串行化；读取不加锁，
+    每个槽位先写序号-1再写内容最后写回序号，读取前后序号一致才采用，被覆盖的槽位视为已缺失。
+    文件布局：头部(魔数, 槽位数, 槽位大小, 下一个序号, 最早有效序号)，随后为定长槽位
+    (序号, 时间戳, 级别, 来源长度, 内容长度, 来源, 内容)，过长的内容会被截断。
+    """
+    MAGIC = b"SHYLOG1\0"
+    HEADER = struct.Struct("<8sIIqq")
+    HEADER_SIZE = 64
+    SLOT_HEADER = struct.Struct("<qdBBH")
+    SEQ = struct.Struct("<q")
+    SOURCE_MAX = 32
+
+    def __init__(self, path: str, max_lines: int = 1000, slot_size: int = 512):
+        """
+        Args:
+            path: 共享缓冲区文件路径，所有进程使用同一路径
+            max_lines: 槽位数
+            slot_size: 每个槽位的字节数
+        """
+        super().__init__(max_lines=0)
+        self.max_lines = max_lines
+        self.slot_size = slot_size
+        self.path = path
+        self.poll_interval = 0.5
+        # 文件锁在同一进程的线程之间不互斥，另用线程锁
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        size = self.HEADER_SIZE + max_lines * slot_size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(self._fd, self.HEADER.size, 0)
+            valid = os.fstat(self._fd).st_size == size and len(header) == self.HEADER.size and \
+                self.HEADER.unpack(header)[:3] == (self.MAGIC, max_lines, slot_size)
+            if not valid:
+                # 新建或参数变化时重新初始化，所有槽位的序号置为-1
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                empty = self.SEQ.pack(-1)
+                for index in range(max_lines):
+                    os.pwrite(self._fd, empty, self.HEADER_SIZE + index * slot_size)
+                os.pwrite(self._fd, self.HEADER.pack(self.MAGIC, max_lines, slot_size, 0, 0), 0)
+            self._map = mmap.mmap(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _counters(self) -> tuple[int, int]:
+        """(下一个序号, 最早有效序号)"""
+        return self.HEADER.unpack_from(self._map, 0)[3:]
+
+    def _write_counters(self, next_seq: int, first_seq: int):
+        self.HEADER.pack_into(self._map, 0, self.MAGIC, self.max_lines, self.slot_size, next_seq, first_seq)
+
+    def _offset(self, seq: int) -> int:
+        return self.HEADER_SIZE + (seq % self.max_lines) * self.slot_size
+
+    def add(self, message: str, level: str = None, source: str = 'stdout',
+            timestamp: float = None) -> List[LogRecord]:
+        now = timestamp or time.time()
+        lines = self._parse(message, level)
+        if not lines:
+            return []
+        source_bytes = source.encode('utf-8')[:self.SOURCE_MAX]
+        message_max = self.slot_size - self.SLOT_HEADER.size - len(source_bytes)
+        records = []
+        with self._write_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                next_seq, first_seq = self._counters()
+                for record_level, line in lines:
+                    seq = next_seq
+                    message_bytes = line.encode('utf-8')
+                    if len(message_bytes) > message_max:
+                        message_bytes = message_bytes[:message_max]
+                        line = message_bytes.decode('utf-8', errors='ignore')
+                    offset = self._offset(seq)
+                    self.SEQ.pack_into(self._map, offset, -1)
+                    body = offset + self.SLOT_HEADER.size
+                    self._map[body:body + len(source_bytes)] = source_bytes
+                    body += len(source_bytes)
+                    self._map[body:body + len(message_bytes)] = message_bytes
+                    self.SLOT_HEADER.pack_into(self._map, offset, seq, now, LOG_LEVELS.index(record_level),
+                                               len(source_bytes), len(message_bytes))
+                    next_seq = seq + 1
+                    records.append(LogRecord(seq, now, record_level, source, line))
+                self._write_counters(next_seq, first_seq)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self.last_write_time = now
+        self._notify()
+        return records
+
+    def _read(self, seq: int) -> Optional[LogRecord]:
+        """读取指定序号的记录，槽位已被覆盖或正在写入时返回None"""
+        offset = self._offset(seq)
+        slot_seq, timestamp, level, source_len, message_len = self.SLOT_HEADER.unpack_from(self._map, offset)
+        if slot_seq != seq:
+            return None
+        body = offset + self.SLOT_HEADER.size
+        source = self._map[body:body + source_len].decode('utf-8', errors='replace')
+        body += source_len
+        message = self._map[body:body + message_len].decode('utf-8', errors='replace')
+        if self.SEQ.unpack_from(self._map, offset)[0] != seq:
+            return None
+        return LogRecord(seq, timestamp, LOG_LEVELS[level], source, message)
+
+    def _level_at(self, seq: int) -> Optional[str]:
+        slot_seq, _, level, _, _ = self.SLOT_HEADER.unpack_from(self._map, self._offset(seq))
+        return LOG_LEVELS[level] if slot_seq == seq else None
+
+    def _range(self) -> tuple[int, int]:
+        """(最早有效序号, 下一个序号)"""
+        next_seq, first_seq = self._counters()
+        return max(first_seq, next_seq - self.max_lines), next_seq
+
+    @property
+    def last_seq(self) -> int:
+        return self._counters()[0] - 1
+
+    def get_since(self, since: int, limit: int, min_level: str = None) -> tuple[List[LogRecord], bool, int]:
+        oldest, next_seq = self._range()
+        start = max(since + 1, oldest)
+        missed = since + 1 < oldest
+        if limit <= 0 or start >= next_seq:
+            return [], missed, max(since, next_seq - 1)
+        priority = LOG_LEVEL_PRIORITY.get(min_level.upper(), 0) if min_level else 0
+        records = []
+        scanned = next_seq - 1
+        for seq in range(start, next_seq):
+            level = self._level_at(seq)
+            if level is None:
+                missed = True
+                continue
+            if LOG_LEVEL_PRIORITY[level] < priority:
+                continue
+            record = self._read(seq)
+            if record is None:
+                missed = True
+                continue
+            records.append(record)
+            if len(records) >= limit:
+                scanned = seq
+                break
+        return records, missed, scanned
+
+    def get_records(self, limit: int = None, min_level: str = None) -> List[LogRecord]:
+        oldest, next_seq = self._range()
+        limit = next_seq - oldest if limit is None else max(0, limit)
+        priority = LOG_LEVEL_PRIORITY.get(min_level.upper(), 0) if min_level else 0
+        records = []
+        # 从最新的记录向前取，直到取满limit条
+        for seq in range(next_seq - 1, oldest - 1, -1):
+            if len(records) >= limit:
+                break
+            level = self._level_at(seq)
+            if level is None or LOG_LEVEL_PRIORITY[level] < priority:
+                continue
+            record = self._read(seq)
+            if record is not None:
+                records.append(record)
+        records.reverse()
+        return records
+
+    def clear(self):
+        with self._write_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                next_seq, _ = self._counters()
+                # 序号保持递增
+                self._write_counters(next_seq, next_seq)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def __len__(self):
+        oldest, next_seq = self._range()
+        return next_seq - oldest
+
+
+# 日志管道的结束标记
+_STOP = object()
+
+
+class LogPipeline:
+    """单一的日志处理管道
+
+    调用方(包括事件循环中的接口处理函数)只把原始消息放入队列，由一个后台线程依次处理：
+    解析为结构化记录并加入内存缓冲区，写到控制台，再批量写入日志文件。每条消息只处理一次。
+    """
+    def __init__(self, buffer: LogBuffer, console=None):
+        """
+        Args:
+            buffer: 内存日志缓冲区
+            console: 控制台输出流，默认为未重定向的标准错误
+        """
+        self.buffer = buffer
+        self.console = console or sys.__stderr__
+        self.writer: Optional[RotatingLogWriter] = None
+        # 日志文件设置之前产生的行，设置后一次写入
+        self._pending_lines: List[str] = []
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-pipeline", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def set_log_file(self, log_file: str, **writer_options):
+        """设置日志文件，已设置时只更新滚动参数"""
+        self._queue.put(('file', log_file, writer_options))
+
+    def submit(self, message: str, level: str = None, source: str = 'stdout', echo=None,
+               timestamp: float = None):
+        """提交一条消息，不阻塞调用方
+
+        Args:
+            level: 日志级别，为None时从消息中解析
+            source: 日志来源
+            echo: 原样回显消息的输出流(用于重定向的stdout/stderr)，为None时按格式化后的记录写到控制台
+            timestamp: 消息产生的时间，默认为当前时间；转交其他进程的日志时保留原始时间
+        """
+        self._queue.put((timestamp or time.time(), message, level, source, echo))
+
+    def submit_line(self, log_file: str, line: str, **writer_options):
+        """把一行文本原样追加到指定文件(如访问日志)，不进入内存缓冲区和控制台
+
+        Args:
+            log_file: 目标文件，与其他写入方共享同一个滚动写入器
+            writer_options: 目标文件的滚动参数
+        """
+        self._queue.put(('line', log_file, line, writer_options))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # 一次取出队列中已有的全部消息，合并写入控制台和文件
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            try:
+                stop = self._process(batch)
+            except Exception as e:
+                print(f"[ERROR] Log pipeline failed: {e}", file=sys.__stderr__)
+            if stop:
+                return
+
+    def _process(self, batch: list) -> bool:
+        """处理一批消息，遇到结束标记时返回True"""
+        file_lines = []
+        # 按提交顺序输出到控制台：(输出流, 文本)
+        outputs = []
+        # 原样追加到其他文件的行：文件路径 -> (滚动参数, 行)
+        raw_lines: dict[str, tuple[dict, List[str]]] = {}
+        stop = False
+        for item in batch:
+            if item is _STOP:
+                stop = True
+                break
+            if item[0] == 'line':
+                _, log_file, line, writer_options = item
+                raw_lines.setdefault(log_file, (writer_options, []))[1].append(line)
+                continue
+            if item[0] == 'file':
+                self._write(file_lines)
+                file_lines = []
+                _, log_file, writer_options = item
+                self.writer = get_log_writer(log_file, **writer_options)
+                continue
+            timestamp, message, level, source, echo = item
+            records = self.buffer.add(message, level, source, timestamp)
+            lines = [record.format() for record in records]
+            file_lines.extend(lines)
+            # 重定向的输出按原样回显到原始流，其余记录格式化后写到控制台
+            if echo is not None:
+                outputs.append((echo, message))
+            elif lines and self.console is not None:
+                outputs.append((self.console, '\n'.join(lines) + '\n'))
+        streams = []
+        for stream, text in outputs:
+            stream.write(text)
+            if stream not in streams:
+                streams.append(stream)
+        for stream in streams:
+            stream.flush()
+        self._write(file_lines)
+        for log_file, (writer_options, lines) in raw_lines.items():
+            get_log_writer(log_file, **writer_options).write_lines(lines)
+        return stop
+
+    def _write(self, lines: List[str]):
+        if self.writer is None:
+            self._pending_lines.extend(lines)
+            return
+        if self._pending_lines:
+            lines = self._pending_lines + lines
+            self._pending_lines = []
+        self.writer.write_lines(lines)
+
+    def close(self, timeout: float = 2.0):
+        """处理完队列中剩余的消息后停止后台线程"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=timeout)
 
 
 class RedirectedStdout(StringIO):
-    """重定向标准输出到日志缓冲区"""
-    def __init__(self, buffer: LogBuffer, original_stdout):
+    """重定向标准输出到日志管道，控制台输出由管道原样回显"""
+    def __init__(self, pipeline: LogPipeline, original_stdout):
         super().__init__()
-        self.buffer = buffer
+        self.pipeline = pipeline
         self.original_stdout = original_stdout
     
     def write(self, s: str):
-        self.buffer.add(s)
-        self.original_stdout.write(s)
+        self.pipeline.submit(s, source='stdout', echo=self.original_stdout)
         return len(s)
     
     def flush(self):
-        self.original_stdout.flush()
+        pass
 
 
 class RedirectedStderr(StringIO):
-    """重定向标准错误到日志缓冲区"""
-    def __init__(self, buffer: LogBuffer, original_stderr):
+    """重定向标准错误到日志管道，控制台输出由管道原样回显"""
+    def __init__(self, pipeline: LogPipeline, original_stderr):
         super().__init__()
-        self.buffer = buffer
+        self.pipeline = pipeline
         self.original_stderr = original_stderr
     
     def write(self, s: str):
-        self.buffer.add(s)
-        self.original_stderr.write(s)
+        self.pipeline.submit(s, source='stderr', echo=self.original_stderr)
         return len(s)
     
     def flush(self):
-        self.original_stderr.flush()
+        pass
 
 
-class BufferedFileHandler(logging.Handler):
-    """带缓冲区的文件处理器"""
-    def __init__(self, filename: str, flush_interval: float = 5.0):  # 修改为5秒
-        super().__init__()
-        self.filename = filename
-        self.flush_interval = flush_interval
-        self.buffer = []
-        # 使用RLock替代Lock，避免在同一线程内的死锁问题
-        self.lock = threading.RLock()
-        self.last_flush = time.time()
-        self.running = True
-        self.rolled_over = False  # 添加滚动标志，标记文件是否已滚动
-        self.max_lines = 10000  # 设置最大行数阈值
-        
-        # 确保目录存在
-        log_dir = os.path.dirname(filename)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # 设置标准的日志格式化器，确保时间戳格式一致
-        self.formatter = logging.Formatter('%(asctime)s  | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        
-        # 启动异步写入线程
-        self.flush_thread = threading.Thread(target=self._async_flush_loop, daemon=True)
-        self.flush_thread.start()
-        
-        # 注册信号处理
-        self._register_signal_handlers()
-    
-    def _check_and_roll_over(self):
-        """检查文件行数并在需要时进行滚动"""
-        if self.rolled_over or not os.path.exists(self.filename):
-            return False
-        
-        try:
-            # 计算当前文件的行数
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                line_count = sum(1 for _ in f)
-            
-            # 如果行数超过阈值，执行滚动
-            if line_count >= self.max_lines:
-                # 生成带时间戳的新文件名
-                timestamp = time.strftime('%Y%m%d_%H%M%S')
-                base_name, ext = os.path.splitext(self.filename)
-                rolled_filename = f"{base_name}_{timestamp}{ext}"
-                
-                # 重命名文件
-                os.rename(self.filename, rolled_filename)
-                self.rolled_over = True  # 标记已滚动
-                return True
-        except Exception as e:
-            # 记录错误但不影响程序运行
-            error_msg = f"[ERROR] Failed to roll over log file: {e}"
-            print(error_msg, file=sys.stderr)
-        return False
-    
-    def emit(self, record):
-        # 如果文件已滚动，不再添加新的日志到缓冲区
-        if self.rolled_over:
-            return
-            
-        try:
-            with self.lock:
-                msg = self.format(record)
-                self.buffer.append(msg)
-                
-                # 如果距离上次刷新超过指定时间，立即刷新
-                current_time = time.time()
-                if current_time - self.last_flush > self.flush_interval:
-                    self._flush_to_file_safe()
-        except Exception:
-            # 即使发生异常，也不能影响程序运行
-            pass
-    
-    def _flush_to_file_safe(self):
-        """安全版本的文件刷新方法，添加异常处理和文件滚动检查"""
-        # 如果文件已滚动，不再写入
-        if self.rolled_over:
-            self.buffer = []  # 清空缓冲区
-            return
-            
-        try:
-            # 尝试获取锁，如果失败则跳过
-            if self.lock.acquire(timeout=0.5):
-                try:
-                    if not self.buffer:
-                        return
-                    
-                    # 写入前检查是否需要滚动文件
-                    self._check_and_roll_over()
-                    
-                    # 如果文件已滚动，不再写入
-                    if self.rolled_over:
-                        self.buffer = []  # 清空缓冲区
-                        return
-                    
-                    # 将缓冲区内容写入文件
-                    try:
-                        with open(self.filename, 'a', encoding='utf-8') as f:
-                            for line in self.buffer:
-                                # 确保每条日志都包含时间戳
-                                formatted_line = self._ensure_timestamp(line)
-                                f.write(formatted_line + '\n')
-                        self.buffer = []
-                        self.last_flush = time.time()
-                    except Exception as e:
-                        # 如果写入失败，重新添加到缓冲区
-                        if hasattr(self, 'buffer'):
-                            error_msg = f"[ERROR] Failed to write log: {e}"
-                            # 为错误信息添加时间戳
-                            error_msg = self._ensure_timestamp(error_msg)
-                            self.buffer.insert(0, error_msg)
-                finally:
-                    self.lock.release()
-        except Exception:
-            # 如果锁操作失败，记录错误但不崩溃
-            pass
-    
-    def _register_signal_handlers(self):
-        """注册信号处理器"""
-        try:
-            # 为优雅退出信号注册处理函数
-            signal.signal(signal.SIGINT, self._signal_handler)
-            signal.signal(signal.SIGTERM, self._signal_handler)
-        except (ValueError, OSError):
-            # 在非主线程中可能无法设置信号处理器
-            pass
-    
-    def _signal_handler(self, signum, frame):
-        """信号处理函数"""
-        # 安全刷新缓冲区到文件
-        self._flush_to_file_safe()
-        # 继续传递信号，允许程序正常退出
-        signal.signal(signum, signal.SIG_DFL)
-        os.kill(os.getpid(), signum)
-    
-    def _ensure_timestamp(self, line: str) -> str:
-        """确保日志行包含时间戳"""
-        import re
-        # 简单的时间戳格式检测: YYYY-MM-DD HH:MM:SS
-        timestamp_pattern = r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'
-        if not re.match(timestamp_pattern, line):
-            # 如果没有时间戳，添加当前时间
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            # 尝试检测日志级别
-            level = 'INFO'
-            line_upper = line.upper()
-            for lvl in ['ERROR', 'WARNING', 'WARN', 'INFO', 'DEBUG', 'CRITICAL', 'FATAL']:
-                if lvl in line_upper:
-                    level = lvl if lvl != 'WARN' else 'WARNING'
-                    level = level if lvl != 'FATAL' else 'CRITICAL'
-                    break
-            line = f"{timestamp} - app - {level} - {line}"
-        return line
-    
-    def _flush_to_file(self):
-        """原始的刷新方法，已改为调用安全版本"""
-        self._flush_to_file_safe()
-    
-    def _async_flush_loop(self):
-        """异步刷新循环"""
-        while self.running:
-            time.sleep(self.flush_interval)
-            self._flush_to_file_safe()
-    
-    def close(self):
-        # 设置运行标志为False
-        if hasattr(self, 'running'):
-            self.running = False
-        
-        # 尝试关闭线程
-        try:
-            if hasattr(self, 'flush_thread') and self.flush_thread.is_alive():
-                # 使用join，但设置超时避免无限等待
-                self.flush_thread.join(timeout=1.0)
-        except Exception:
-            pass
-        
-        # 安全地刷新缓冲区
-        self._flush_to_file_safe()
-        
-        # 调用父类的close方法
-        try:
-            super().close()
-        except Exception:
-            pass
+# 创建全局日志缓冲区和日志管道，日志文件及滚动参数由第一个Logos设置
+global_log_buffer = LogBuffer(max_lines=2000)
+global_log_pipeline = LogPipeline(global_log_buffer)
 
 
-# 创建全局日志缓冲区实例，指定日志文件路径
-log_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/log.txt")
-global_log_buffer = LogBuffer(max_lines=2000, log_file=log_file_path, flush_interval=5.0)
+def rotation_options(log_config: dict) -> dict:
+    """将配置中的log项转换为RotatingLogWriter的滚动参数"""
+    return {
+        "max_bytes": int(log_config.get("max_file_mb", 10) * 1024 * 1024),
+        "backup_count": int(log_config.get("backup_count", 7)),
+        "rotate_interval": float(log_config.get("rotate_interval_hours", 24)) * 3600,
+        "compress": bool(log_config.get("compress_rotated", True)),
+    }
 
 
 class Logos:
+    """日志接口，各级别方法只把消息放入全局日志管道"""
     def __init__(self, name: str = "logos", output_path: str = "./data/",
-                 output_file: str = "log.txt", level: int = logging.INFO):
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
+                 output_file: str = "log.txt", level: int | str = logging.INFO, rotation: Optional[dict] = None):
+        """
+        Args:
+            level: 最低日志级别，可以是logging的级别数值或级别名称
+            rotation: 日志文件的滚动参数(见rotation_options)，可额外包含rotate=False表示不由本进程滚动
+        """
+        self.name = name
         self.output_path = output_path
         self.output_file = output_file
+        self.rotation = rotation or {}
+        self.set_level(level)
         
-        # 正确拼接文件路径
-        log_file_path = os.path.join(output_path, output_file)
-        
-        # 如果全局日志缓冲区还没有指定日志文件，则设置它
-        global global_log_buffer
-        if not hasattr(global_log_buffer, 'log_file') or not global_log_buffer.log_file:
-            global_log_buffer.log_file = log_file_path
-        
-        self.formatter = logging.Formatter('%(asctime)s  | %(message)s')
-        
-        # 清除已存在的处理器（避免重复添加）
-        if self.logger.handlers:
-            self.logger.handlers.clear()
-        
-        # 检查输出目录是否存在，如果不存在则创建
-        log_dir = os.path.dirname(log_file_path)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # 添加带缓冲的文件处理器
-        self.file_handler = BufferedFileHandler(log_file_path)
-        self.file_handler.setLevel(level)
-        self.formatter = logging.Formatter('%(asctime)s  | %(message)s')
-        self.file_handler.setFormatter(self.formatter)
-        self.logger.addHandler(self.file_handler)
-        
-        # 添加控制台处理器，方便调试
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        console_handler.setFormatter(self.formatter)
-        self.logger.addHandler(console_handler)
+        # 正确拼接文件路径，同一文件的多个Logos共享写入器
+        global_log_pipeline.set_log_file(os.path.join(output_path, output_file), **self.rotation)
+
+    def set_level(self, level: int | str):
+        """就地调整最低日志级别，缓冲区按同一级别过滤重定向的标准输出/错误"""
+        level_name = logging.getLevelName(level) if isinstance(level, int) else str(level).upper()
+        self.priority = LOG_LEVEL_PRIORITY.get(level_name, 2)
+        global_log_buffer.set_level(level_name)
+
+    def reconfigure(self, name: str, level: int | str, output_path: str, output_file: str,
+                    rotation: Optional[dict] = None):
+        """就地更新日志参数，只在日志文件或滚动参数变化时通知日志管道，参数与构造函数相同"""
+        self.name = name
+        self.set_level(level)
+        rotation = rotation or {}
+        if (output_path, output_file, rotation) != (self.output_path, self.output_file, self.rotation):
+            self.output_path = output_path
+            self.output_file = output_file
+            self.rotation = rotation
+            global_log_pipeline.set_log_file(os.path.join(output_path, output_file), **rotation)
+
+    def _submit(self, level: str, message: str):
+        # 低于最低级别的消息在调用方直接丢弃
+        if LOG_LEVEL_PRIORITY[level] >= self.priority:
+            global_log_pipeline.submit(str(message), level=level, source=self.name)
 
-    # 修改向global_log_buffer添加日志的方法
     def info(self, message: str):
-        self.logger.info(message)
-        global_log_buffer.add(f"INFO: {message}")
+        self._submit("INFO", message)
     
     def error(self, message: str):
-        self.logger.error(message)
-        global_log_buffer.add(f"ERROR: {message}")
+        self._submit("ERROR", message)
     
     def warning(self, message: str):
-        self.logger.warning(message)
-        global_log_buffer.add(f"WARNING: {message}")
+        self._submit("WARNING", message)
     
     def debug(self, message: str):
-        self.logger.debug(message)
-        global_log_buffer.add(f"DEBUG: {message}")
+        self._submit("DEBUG", message)
     
     def critical(self, message: str):
-        self.logger.critical(message)
-        global_log_buffer.add(f"CRITICAL: {message}")
+        self._submit("CRITICAL", message)
     
     def get_buffer_content(self, last_n: Optional[int] = None) -> str:
         """获取全局日志缓冲区内容"""
@@ -552,12 +1018,43 @@ class Logos:
         return global_log_buffer.get_all()
     
     def close(self):
-        """关闭日志处理器"""
-        if hasattr(self, 'file_handler'):
-            self.file_handler.close()
-        for handler in self.logger.handlers[:]:
-            handler.close()
-            self.logger.removeHandler(handler)
+        """等待日志管道写完已提交的日志"""
+        global_log_pipeline.close()
+
+
+class ForwardingLogos(Logos):
+    """只在本进程暂存消息的日志接口
+
+    用于渲染子进程：子进程不写日志文件也不使用自己的缓冲区，消息由调用方通过drain取出，
+    随调用结果回传到主进程，再用forward_log_records交给主进程的日志管道。
+    """
+    def __init__(self, name: str = "logos", level: int | str = logging.INFO):
+        self.name = name
+        self.set_level(level)
+        self._pending: List[tuple] = []
+
+    def reconfigure(self, name: str, level: int | str):
+        """就地更新日志名称和最低级别"""
+        self.name = name
+        self.set_level(level)
+
+    def _submit(self, level: str, message: str):
+        if LOG_LEVEL_PRIORITY[level] >= self.priority:
+            self._pending.append((time.time(), str(message), level, self.name))
+
+    def drain(self) -> List[tuple]:
+        """取出暂存的消息：[(时间, 内容, 级别, 来源)]"""
+        records, self._pending = self._pending, []
+        return records
+
+    def close(self):
+        pass
+
+
+def forward_log_records(records: List[tuple]):
+    """把ForwardingLogos.drain取出的消息交给本进程的日志管道，写入缓冲区、控制台和日志文件"""
+    for timestamp, message, level, source in records:
+        global_log_pipeline.submit(message, level=level, source=source, timestamp=timestamp)
 
 
 def setup_global_redirect():
@@ -567,9 +1064,18 @@ def setup_global_redirect():
     original_stderr = sys.stderr
     
     # 创建重定向器
-    sys.stdout = RedirectedStdout(global_log_buffer, original_stdout)
-    sys.stderr = RedirectedStderr(global_log_buffer, original_stderr)
-    
+    sys.stdout = RedirectedStdout(global_log_pipeline, original_stdout)
+    sys.stderr = RedirectedStderr(global_log_pipeline, original_stderr)
+
+    # 已创建的日志处理器(如多进程服务时uvicorn在加载应用前配置的处理器)仍指向原始输出，一并改为重定向器
+    streams = {id(original_stdout): sys.stdout, id(original_stderr): sys.stderr}
+    loggers = [logging.getLogger()] + [logger for logger in logging.Logger.manager.loggerDict.values()
+                                       if isinstance(logger, logging.Logger)]
+    for logger in loggers:
+        for handler in logger.handlers:
+            if isinstance(handler, logging.StreamHandler) and id(handler.stream) in streams:
+                handler.setStream(streams[id(handler.stream)])
+
     return original_stdout, original_stderr
 
 
@@ -581,4 +1087,18 @@ def restore_redirect(original_stdout, original_stderr):
 
 def get_global_log_buffer() -> LogBuffer:
     """获取全局日志缓冲区"""
-    return global_log_buffer
\ No newline at end of file
+    return global_log_buffer
+
+
+def use_shared_log_buffer(path: str):
+    """多进程服务时改用各进程共享的日志缓冲区，需在处理请求之前调用"""
+    global global_log_buffer
+    shared = SharedLogBuffer(path, max_lines=global_log_buffer.max_lines)
+    shared.current_priority = global_log_buffer.current_priority
+    global_log_pipeline.buffer = shared
+    global_log_buffer = shared
+
+
+def get_global_log_pipeline() -> LogPipeline:
+    """获取全局日志管道"""
+    return global_log_pipeline
@@ -0,0 +1,45 @@
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows下不支持多进程服务
+    fcntl = None
+
+
+class ProcessLock:
+    """跨进程的非阻塞文件锁，用于在多个服务进程中选出唯一负责某项工作的进程
+
+    锁随文件描述符一起释放，持有锁的进程退出后其他进程(或重启的进程)可以重新获得。
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """尝试获得锁，已被其他进程持有时立即返回False"""
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            return False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        # 记录持有者的进程号，便于排查
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, str(os.getpid()).encode(), 0)
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
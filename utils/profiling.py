@@ -0,0 +1,138 @@
+import asyncio
+import contextvars
+import cProfile
+import json
+import os
+import pstats
+import re
+import secrets
+import time
+from io import StringIO
+
+from starlette.requests import Request
+
+# 当前请求的性能分析文件前缀，未请求分析时为None；渲染进程池据此决定是否在子进程内分析
+profile_target: contextvars.ContextVar[str | None] = contextvars.ContextVar("profile_target", default=None)
+
+# 性能分析文件名只允许由new_profile_id生成的字符
+PROFILE_NAME_PATTERN = re.compile(r"^[0-9A-Za-z_.-]+$")
+
+
+def new_profile_id(method: str, path: str) -> str:
+    """生成分析记录ID：时间_方法_路径_随机串，可直接用作文件名"""
+    slug = re.sub(r"[^0-9A-Za-z]+", "-", path).strip("-") or "root"
+    return f"{time.strftime('%Y%m%d_%H%M%S')}_{method.lower()}_{slug[:40]}_{secrets.token_hex(3)}"
+
+
+def write_profile_meta(folder: str, profile_id: str, meta: dict):
+    """写入分析记录的元数据(请求方法、路径、状态码、耗时等)"""
+    with open(os.path.join(folder, f"{profile_id}.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+def list_profiles(folder: str) -> list[dict]:
+    """列出分析记录，最新的在前；每条记录包含元数据和属于它的.prof文件"""
+    if not os.path.isdir(folder):
+        return []
+    names = os.listdir(folder)
+    profiles = []
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        profile_id = name[:-len(".json")]
+        try:
+            with open(os.path.join(folder, name), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        meta["id"] = profile_id
+        meta["files"] = sorted(file for file in names if file.startswith(profile_id) and file.endswith(".prof"))
+        profiles.append(meta)
+    profiles.sort(key=lambda meta: meta.get("created", 0), reverse=True)
+    return profiles
+
+
+def prune_profiles(folder: str, keep: int):
+    """只保留最新的keep条分析记录"""
+    for meta in list_profiles(folder)[keep:]:
+        for name in meta["files"] + [f"{meta['id']}.json"]:
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                pass
+
+
+def summarize_profile(file_path: str, limit: int = 40, sort: str = "cumulative") -> str:
+    """将pstats文件按sort排序输出前limit个函数的文本摘要"""
+    output = StringIO()
+    stats = pstats.Stats(file_path, stream=output)
+    stats.sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+
+class ProfilingMiddleware:
+    """按需对单个请求进行性能分析的ASGI中间件
+
+    请求带有X-Profile头或profile查询参数且authorize通过时，用cProfile分析主进程中的请求处理，
+    同时通过profile_target让渲染进程池在子进程内分析对应的渲染调用；结果以pstats格式保存到folder。
+    未请求分析的请求只做一次头部和查询串检查后直接交给下游。
+    cProfile按线程统计，分析期间事件循环上并发执行的其他请求也会计入主进程的分析结果，
+    因此同一时间只分析一个请求。
+    """
+    def __init__(self, app, folder: str, authorize, keep: int = 50):
+        """
+        Args:
+            folder: 分析结果目录
+            authorize: 接收Request并返回是否允许分析的函数
+            keep: 保留的分析记录数
+        """
+        self.app = app
+        self.folder = folder
+        self.authorize = authorize
+        self.keep = keep
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _requested(scope) -> bool:
+        if b"profile" in scope.get("query_string", b""):
+            return Request(scope).query_params.get("profile") not in (None, "", "0", "false")
+        return any(name == b"x-profile" and value not in (b"", b"0", b"false") for name, value in scope["headers"])
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope) or not self.authorize(Request(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id(scope["method"], scope["path"])
+        prefix = os.path.join(self.folder, profile_id)
+        status = None
+
+        async def send_with_profile_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {**message, "headers": [*message.get("headers", []),
+                                                  (b"x-profile-id", profile_id.encode())]}
+            await send(message)
+
+        async with self._lock:
+            os.makedirs(self.folder, exist_ok=True)
+            token = profile_target.set(prefix)
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.disable()
+                duration = time.perf_counter() - start
+                profile_target.reset(token)
+                profiler.dump_stats(f"{prefix}_main.prof")
+                write_profile_meta(self.folder, profile_id, {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round(duration * 1000, 3),
+                    "created": time.time(),
+                })
+                prune_profiles(self.folder, self.keep)
@@ -1,2 +1,2 @@
-(function(){let e=document.createElement(`link`).relList;if(e&&e.supports&&e.supports(`modulepreload`))return;for(let e of document.querySelectorAll(`link[rel="modulepreload"]`))n(e);new MutationObserver(e=>{for(let t of e)if(t.type===`childList`)for(let e of t.addedNodes)e.tagName===`LINK`&&e.rel===`modulepreload`&&n(e)}).observe(document,{childList:!0,subtree:!0});function t(e){let t={};return e.integrity&&(t.integrity=e.integrity),e.referrerPolicy&&(t.referrerPolicy=e.referrerPolicy),e.crossOrigin===`use-credentials`?t.credentials=`include`:e.crossOrigin===`anonymous`?t.credentials=`omit`:t.credentials=`same-origin`,t}function n(e){if(e.ep)return;e.ep=!0;let n=t(e);fetch(e.href,n)}})();function e(e){let t=Object.create(null);for(let n of e.split(`,`))t[n]=1;return e=>e in t}var t={},n=[],r=()=>{},i=()=>!1,a=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&(e.charCodeAt(2)>122||e.charCodeAt(2)<97),o=e=>e.startsWith(`onUpdate:`),s=Object.assign,c=(e,t)=>{let n=e.indexOf(t);n>-1&&e.splice(n,1)},l=Object.prototype.hasOwnProperty,u=(e,t)=>l.call(e,t),d=Array.isArray,f=e=>x(e)===`[object Map]`,p=e=>x(e)===`[object Set]`,m=e=>x(e)===`[object Date]`,h=e=>typeof e==`function`,g=e=>typeof e==`string`,_=e=>typeof e==`symbol`,v=e=>typeof e==`object`&&!!e,y=e=>(v(e)||h(e))&&h(e.then)&&h(e.catch),b=Object.prototype.toString,x=e=>b.call(e),S=e=>x(e).slice(8,-1),C=e=>x(e)===`[object Object]`,w=e=>g(e)&&e!==`NaN`&&e[0]!==`-`&&``+parseInt(e,10)===e,T=e(`,key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted`),ee=e=>{let t=Object.create(null);return(n=>t[n]||(t[n]=e(n)))},te=/-\w/g,E=ee(e=>e.replace(te,e=>e.slice(1).toUpperCase())),ne=/\B([A-Z])/g,D=ee(e=>e.replace(ne,`-$1`).toLowerCase()),O=ee(e=>e.charAt(0).toUpperCase()+e.slice(1)),re=ee(e=>e?`on${O(e)}`:``),k=(e,t)=>!Object.is(e,t),ie=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},A=(e,t,n,r=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:r,value:n})},ae=e=>{let t=parseFloat(e);return isNaN(t)?e:t},oe,se=()=>oe||=typeof globalThis<`u`?globalThis:typeof self<`u`?self:typeof window<`u`?window:typeof global<`u`?global:{};function ce(e){if(d(e)){let t={};for(let n=0;n<e.length;n++){let r=e[n],i=g(r)?de(r):ce(r);if(i)for(let e in i)t[e]=i[e]}return t}else if(g(e)||v(e))return e}var le=/;(?![^(]*\))/g,ue=/:([^]+)/,j=/\/\*[^]*?\*\//g;function de(e){let t={};return e.replace(j,``).split(le).forEach(e=>{if(e){let n=e.split(ue);n.length>1&&(t[n[0].trim()]=n[1].trim())}}),t}function M(e){let t=``;if(g(e))t=e;else if(d(e))for(let n=0;n<e.length;n++){let r=M(e[n]);r&&(t+=r+` `)}else if(v(e))for(let n in e)e[n]&&(t+=n+` `);return t.trim()}var fe=`itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly`,pe=e(fe);fe+``;function me(e){return!!e||e===``}function he(e,t){if(e.length!==t.length)return!1;let n=!0;for(let r=0;n&&r<e.length;r++)n=ge(e[r],t[r]);return n}function ge(e,t){if(e===t)return!0;let n=m(e),r=m(t);if(n||r)return n&&r?e.getTime()===t.getTime():!1;if(n=_(e),r=_(t),n||r)return e===t;if(n=d(e),r=d(t),n||r)return n&&r?he(e,t):!1;if(n=v(e),r=v(t),n||r){if(!n||!r||Object.keys(e).length!==Object.keys(t).length)return!1;for(let n in e){let r=e.hasOwnProperty(n),i=t.hasOwnProperty(n);if(r&&!i||!r&&i||!ge(e[n],t[n]))return!1}}return String(e)===String(t)}function _e(e,t){return e.findIndex(e=>ge(e,t))}var ve=e=>!!(e&&e.__v_isRef===!0),N=e=>g(e)?e:e==null?``:d(e)||v(e)&&(e.toString===b||!h(e.toString))?ve(e)?N(e.value):JSON.stringify(e,ye,2):String(e),ye=(e,t)=>ve(t)?ye(e,t.value):f(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((e,[t,n],r)=>(e[be(t,r)+` =>`]=n,e),{})}:p(t)?{[`Set(${t.size})`]:[...t.values()].map(e=>be(e))}:_(t)?be(t):v(t)&&!d(t)&&!C(t)?String(t):t,be=(e,t=``)=>_(e)?`Symbol(${e.description??t})`:e,P,xe=class{constructor(e=!1){this.detached=e,this._active=!0,this._on=0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=P,!e&&P&&(this.index=(P.scopes||=[]).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let e,t;if(this.scopes)for(e=0,t=this.scopes.length;e<t;e++)this.scopes[e].pause();for(e=0,t=this.effects.length;e<t;e++)this.effects[e].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let e,t;if(this.scopes)for(e=0,t=this.scopes.length;e<t;e++)this.scopes[e].resume();for(e=0,t=this.effects.length;e<t;e++)this.effects[e].resume()}}run(e){if(this._active){let t=P;try{return P=this,e()}finally{P=t}}}on(){++this._on===1&&(this.prevScope=P,P=this)}off(){this._on>0&&--this._on===0&&(P=this.prevScope,this.prevScope=void 0)}stop(e){if(this._active){this._active=!1;let t,n;for(t=0,n=this.effects.length;t<n;t++)this.effects[t].stop();for(this.effects.length=0,t=0,n=this.cleanups.length;t<n;t++)this.cleanups[t]();if(this.cleanups.length=0,this.scopes){for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!e){let e=this.parent.scopes.pop();e&&e!==this&&(this.parent.scopes[this.index]=e,e.index=this.index)}this.parent=void 0}}};function Se(){return P}var F,Ce=new WeakSet,we=class{constructor(e){this.fn=e,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,P&&P.active&&P.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,Ce.has(this)&&(Ce.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||Oe(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,Ve(this),je(this);let e=F,t=Le;F=this,Le=!0;try{return this.fn()}finally{Me(this),F=e,Le=t,this.flags&=-3}}stop(){if(this.flags&1){for(let e=this.deps;e;e=e.nextDep)Fe(e);this.deps=this.depsTail=void 0,Ve(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?Ce.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){Ne(this)&&this.run()}get dirty(){return Ne(this)}},Te=0,Ee,De;function Oe(e,t=!1){if(e.flags|=8,t){e.next=De,De=e;return}e.next=Ee,Ee=e}function ke(){Te++}function Ae(){if(--Te>0)return;if(De){let e=De;for(De=void 0;e;){let t=e.next;e.next=void 0,e.flags&=-9,e=t}}let e;for(;Ee;){let t=Ee;for(Ee=void 0;t;){let n=t.next;if(t.next=void 0,t.flags&=-9,t.flags&1)try{t.trigger()}catch(t){e||=t}t=n}}if(e)throw e}function je(e){for(let t=e.deps;t;t=t.nextDep)t.version=-1,t.prevActiveLink=t.dep.activeLink,t.dep.activeLink=t}function Me(e){let t,n=e.depsTail,r=n;for(;r;){let e=r.prevDep;r.version===-1?(r===n&&(n=e),Fe(r),Ie(r)):t=r,r.dep.activeLink=r.prevActiveLink,r.prevActiveLink=void 0,r=e}e.deps=t,e.depsTail=n}function Ne(e){for(let t=e.deps;t;t=t.nextDep)if(t.dep.version!==t.version||t.dep.computed&&(Pe(t.dep.computed)||t.dep.version!==t.version))return!0;return!!e._dirty}function Pe(e){if(e.flags&4&&!(e.flags&16)||(e.flags&=-17,e.globalVersion===He)||(e.globalVersion=He,!e.isSSR&&e.flags&128&&(!e.deps&&!e._dirty||!Ne(e))))return;e.flags|=2;let t=e.dep,n=F,r=Le;F=e,Le=!0;try{je(e);let n=e.fn(e._value);(t.version===0||k(n,e._value))&&(e.flags|=128,e._value=n,t.version++)}catch(e){throw t.version++,e}finally{F=n,Le=r,Me(e),e.flags&=-3}}function Fe(e,t=!1){let{dep:n,prevSub:r,nextSub:i}=e;if(r&&(r.nextSub=i,e.prevSub=void 0),i&&(i.prevSub=r,e.nextSub=void 0),n.subs===e&&(n.subs=r,!r&&n.computed)){n.computed.flags&=-5;for(let e=n.computed.deps;e;e=e.nextDep)Fe(e,!0)}!t&&!--n.sc&&n.map&&n.map.delete(n.key)}function Ie(e){let{prevDep:t,nextDep:n}=e;t&&(t.nextDep=n,e.prevDep=void 0),n&&(n.prevDep=t,e.nextDep=void 0)}var Le=!0,Re=[];function ze(){Re.push(Le),Le=!1}function Be(){let e=Re.pop();Le=e===void 0?!0:e}function Ve(e){let{cleanup:t}=e;if(e.cleanup=void 0,t){let e=F;F=void 0;try{t()}finally{F=e}}}var He=0,Ue=class{constructor(e,t){this.sub=e,this.dep=t,this.version=t.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}},We=class{constructor(e){this.computed=e,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0,this.__v_skip=!0}track(e){if(!F||!Le||F===this.computed)return;let t=this.activeLink;if(t===void 0||t.sub!==F)t=this.activeLink=new Ue(F,this),F.deps?(t.prevDep=F.depsTail,F.depsTail.nextDep=t,F.depsTail=t):F.deps=F.depsTail=t,Ge(t);else if(t.version===-1&&(t.version=this.version,t.nextDep)){let e=t.nextDep;e.prevDep=t.prevDep,t.prevDep&&(t.prevDep.nextDep=e),t.prevDep=F.depsTail,t.nextDep=void 0,F.depsTail.nextDep=t,F.depsTail=t,F.deps===t&&(F.deps=e)}return t}trigger(e){this.version++,He++,this.notify(e)}notify(e){ke();try{for(let e=this.subs;e;e=e.prevSub)e.sub.notify()&&e.sub.dep.notify()}finally{Ae()}}};function Ge(e){if(e.dep.sc++,e.sub.flags&4){let t=e.dep.computed;if(t&&!e.dep.subs){t.flags|=20;for(let e=t.deps;e;e=e.nextDep)Ge(e)}let n=e.dep.subs;n!==e&&(e.prevSub=n,n&&(n.nextSub=e)),e.dep.subs=e}}var Ke=new WeakMap,qe=Symbol(``),Je=Symbol(``),Ye=Symbol(``);function I(e,t,n){if(Le&&F){let t=Ke.get(e);t||Ke.set(e,t=new Map);let r=t.get(n);r||(t.set(n,r=new We),r.map=t,r.key=n),r.track()}}function Xe(e,t,n,r,i,a){let o=Ke.get(e);if(!o){He++;return}let s=e=>{e&&e.trigger()};if(ke(),t===`clear`)o.forEach(s);else{let i=d(e),a=i&&w(n);if(i&&n===`length`){let e=Number(r);o.forEach((t,n)=>{(n===`length`||n===Ye||!_(n)&&n>=e)&&s(t)})}else switch((n!==void 0||o.has(void 0))&&s(o.get(n)),a&&s(o.get(Ye)),t){case`add`:i?a&&s(o.get(`length`)):(s(o.get(qe)),f(e)&&s(o.get(Je)));break;case`delete`:i||(s(o.get(qe)),f(e)&&s(o.get(Je)));break;case`set`:f(e)&&s(o.get(qe));break}}Ae()}function Ze(e){let t=L(e);return t===e?t:(I(t,`iterate`,Ye),Lt(e)?t:t.map(Bt))}function Qe(e){return I(e=L(e),`iterate`,Ye),e}function $e(e,t){return It(e)?Ft(e)?Vt(Bt(t)):Vt(t):Bt(t)}var et={__proto__:null,[Symbol.iterator](){return tt(this,Symbol.iterator,e=>$e(this,e))},concat(...e){return Ze(this).concat(...e.map(e=>d(e)?Ze(e):e))},entries(){return tt(this,`entries`,e=>(e[1]=$e(this,e[1]),e))},every(e,t){return rt(this,`every`,e,t,void 0,arguments)},filter(e,t){return rt(this,`filter`,e,t,e=>e.map(e=>$e(this,e)),arguments)},find(e,t){return rt(this,`find`,e,t,e=>$e(this,e),arguments)},findIndex(e,t){return rt(this,`findIndex`,e,t,void 0,arguments)},findLast(e,t){return rt(this,`findLast`,e,t,e=>$e(this,e),arguments)},findLastIndex(e,t){return rt(this,`findLastIndex`,e,t,void 0,arguments)},forEach(e,t){return rt(this,`forEach`,e,t,void 0,arguments)},includes(...e){return at(this,`includes`,e)},indexOf(...e){return at(this,`indexOf`,e)},join(e){return Ze(this).join(e)},lastIndexOf(...e){return at(this,`lastIndexOf`,e)},map(e,t){return rt(this,`map`,e,t,void 0,arguments)},pop(){return ot(this,`pop`)},push(...e){return ot(this,`push`,e)},reduce(e,...t){return it(this,`reduce`,e,t)},reduceRight(e,...t){return it(this,`reduceRight`,e,t)},shift(){return ot(this,`shift`)},some(e,t){return rt(this,`some`,e,t,void 0,arguments)},splice(...e){return ot(this,`splice`,e)},toReversed(){return Ze(this).toReversed()},toSorted(e){return Ze(this).toSorted(e)},toSpliced(...e){return Ze(this).toSpliced(...e)},unshift(...e){return ot(this,`unshift`,e)},values(){return tt(this,`values`,e=>$e(this,e))}};function tt(e,t,n){let r=Qe(e),i=r[t]();return r!==e&&!Lt(e)&&(i._next=i.next,i.next=()=>{let e=i._next();return e.done||(e.value=n(e.value)),e}),i}var nt=Array.prototype;function rt(e,t,n,r,i,a){let o=Qe(e),s=o!==e&&!Lt(e),c=o[t];if(c!==nt[t]){let t=c.apply(e,a);return s?Bt(t):t}let l=n;o!==e&&(s?l=function(t,r){return n.call(this,$e(e,t),r,e)}:n.length>2&&(l=function(t,r){return n.call(this,t,r,e)}));let u=c.call(o,l,r);return s&&i?i(u):u}function it(e,t,n,r){let i=Qe(e),a=n;return i!==e&&(Lt(e)?n.length>3&&(a=function(t,r,i){return n.call(this,t,r,i,e)}):a=function(t,r,i){return n.call(this,t,$e(e,r),i,e)}),i[t](a,...r)}function at(e,t,n){let r=L(e);I(r,`iterate`,Ye);let i=r[t](...n);return(i===-1||i===!1)&&Rt(n[0])?(n[0]=L(n[0]),r[t](...n)):i}function ot(e,t,n=[]){ze(),ke();let r=L(e)[t].apply(e,n);return Ae(),Be(),r}var st=e(`__proto__,__v_isRef,__isVue`),ct=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>e!==`arguments`&&e!==`caller`).map(e=>Symbol[e]).filter(_));function lt(e){_(e)||(e=String(e));let t=L(this);return I(t,`has`,e),t.hasOwnProperty(e)}var ut=class{constructor(e=!1,t=!1){this._isReadonly=e,this._isShallow=t}get(e,t,n){if(t===`__v_skip`)return e.__v_skip;let r=this._isReadonly,i=this._isShallow;if(t===`__v_isReactive`)return!r;if(t===`__v_isReadonly`)return r;if(t===`__v_isShallow`)return i;if(t===`__v_raw`)return n===(r?i?Ot:Dt:i?Et:Tt).get(e)||Object.getPrototypeOf(e)===Object.getPrototypeOf(n)?e:void 0;let a=d(e);if(!r){let e;if(a&&(e=et[t]))return e;if(t===`hasOwnProperty`)return lt}let o=Reflect.get(e,t,R(e)?e:n);if((_(t)?ct.has(t):st(t))||(r||I(e,`get`,t),i))return o;if(R(o)){let e=a&&w(t)?o:o.value;return r&&v(e)?Nt(e):e}return v(o)?r?Nt(o):jt(o):o}},dt=class extends ut{constructor(e=!1){super(!1,e)}set(e,t,n,r){let i=e[t],a=d(e)&&w(t);if(!this._isShallow){let e=It(i);if(!Lt(n)&&!It(n)&&(i=L(i),n=L(n)),!a&&R(i)&&!R(n))return e||(i.value=n),!0}let o=a?Number(t)<e.length:u(e,t),s=Reflect.set(e,t,n,R(e)?e:r);return e===L(r)&&(o?k(n,i)&&Xe(e,`set`,t,n,i):Xe(e,`add`,t,n)),s}deleteProperty(e,t){let n=u(e,t),r=e[t],i=Reflect.deleteProperty(e,t);return i&&n&&Xe(e,`delete`,t,void 0,r),i}has(e,t){let n=Reflect.has(e,t);return(!_(t)||!ct.has(t))&&I(e,`has`,t),n}ownKeys(e){return I(e,`iterate`,d(e)?`length`:qe),Reflect.ownKeys(e)}},ft=class extends ut{constructor(e=!1){super(!0,e)}set(e,t){return!0}deleteProperty(e,t){return!0}},pt=new dt,mt=new ft,ht=new dt(!0),gt=e=>e,_t=e=>Reflect.getPrototypeOf(e);function vt(e,t,n){return function(...r){let i=this.__v_raw,a=L(i),o=f(a),s=e===`entries`||e===Symbol.iterator&&o,c=e===`keys`&&o,l=i[e](...r),u=n?gt:t?Vt:Bt;return!t&&I(a,`iterate`,c?Je:qe),{next(){let{value:e,done:t}=l.next();return t?{value:e,done:t}:{value:s?[u(e[0]),u(e[1])]:u(e),done:t}},[Symbol.iterator](){return this}}}}function yt(e){return function(...t){return e===`delete`?!1:e===`clear`?void 0:this}}function bt(e,t){let n={get(n){let r=this.__v_raw,i=L(r),a=L(n);e||(k(n,a)&&I(i,`get`,n),I(i,`get`,a));let{has:o}=_t(i),s=t?gt:e?Vt:Bt;if(o.call(i,n))return s(r.get(n));if(o.call(i,a))return s(r.get(a));r!==i&&r.get(n)},get size(){let t=this.__v_raw;return!e&&I(L(t),`iterate`,qe),t.size},has(t){let n=this.__v_raw,r=L(n),i=L(t);return e||(k(t,i)&&I(r,`has`,t),I(r,`has`,i)),t===i?n.has(t):n.has(t)||n.has(i)},forEach(n,r){let i=this,a=i.__v_raw,o=L(a),s=t?gt:e?Vt:Bt;return!e&&I(o,`iterate`,qe),a.forEach((e,t)=>n.call(r,s(e),s(t),i))}};return s(n,e?{add:yt(`add`),set:yt(`set`),delete:yt(`delete`),clear:yt(`clear`)}:{add(e){!t&&!Lt(e)&&!It(e)&&(e=L(e));let n=L(this);return _t(n).has.call(n,e)||(n.add(e),Xe(n,`add`,e,e)),this},set(e,n){!t&&!Lt(n)&&!It(n)&&(n=L(n));let r=L(this),{has:i,get:a}=_t(r),o=i.call(r,e);o||=(e=L(e),i.call(r,e));let s=a.call(r,e);return r.set(e,n),o?k(n,s)&&Xe(r,`set`,e,n,s):Xe(r,`add`,e,n),this},delete(e){let t=L(this),{has:n,get:r}=_t(t),i=n.call(t,e);i||=(e=L(e),n.call(t,e));let a=r?r.call(t,e):void 0,o=t.delete(e);return i&&Xe(t,`delete`,e,void 0,a),o},clear(){let e=L(this),t=e.size!==0,n=e.clear();return t&&Xe(e,`clear`,void 0,void 0,void 0),n}}),[`keys`,`values`,`entries`,Symbol.iterator].forEach(r=>{n[r]=vt(r,e,t)}),n}function xt(e,t){let n=bt(e,t);return(t,r,i)=>r===`__v_isReactive`?!e:r===`__v_isReadonly`?e:r===`__v_raw`?t:Reflect.get(u(n,r)&&r in t?n:t,r,i)}var St={get:xt(!1,!1)},Ct={get:xt(!1,!0)},wt={get:xt(!0,!1)},Tt=new WeakMap,Et=new WeakMap,Dt=new WeakMap,Ot=new WeakMap;function kt(e){switch(e){case`Object`:case`Array`:return 1;case`Map`:case`Set`:case`WeakMap`:case`WeakSet`:return 2;default:return 0}}function At(e){return e.__v_skip||!Object.isExtensible(e)?0:kt(S(e))}function jt(e){return It(e)?e:Pt(e,!1,pt,St,Tt)}function Mt(e){return Pt(e,!1,ht,Ct,Et)}function Nt(e){return Pt(e,!0,mt,wt,Dt)}function Pt(e,t,n,r,i){if(!v(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;let a=At(e);if(a===0)return e;let o=i.get(e);if(o)return o;let s=new Proxy(e,a===2?r:n);return i.set(e,s),s}function Ft(e){return It(e)?Ft(e.__v_raw):!!(e&&e.__v_isReactive)}function It(e){return!!(e&&e.__v_isReadonly)}function Lt(e){return!!(e&&e.__v_isShallow)}function Rt(e){return e?!!e.__v_raw:!1}function L(e){let t=e&&e.__v_raw;return t?L(t):e}function zt(e){return!u(e,`__v_skip`)&&Object.isExtensible(e)&&A(e,`__v_skip`,!0),e}var Bt=e=>v(e)?jt(e):e,Vt=e=>v(e)?Nt(e):e;function R(e){return e?e.__v_isRef===!0:!1}function z(e){return Ut(e,!1)}function Ht(e){return Ut(e,!0)}function Ut(e,t){return R(e)?e:new Wt(e,t)}var Wt=class{constructor(e,t){this.dep=new We,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=t?e:L(e),this._value=t?e:Bt(e),this.__v_isShallow=t}get value(){return this.dep.track(),this._value}set value(e){let t=this._rawValue,n=this.__v_isShallow||Lt(e)||It(e);e=n?e:L(e),k(e,t)&&(this._rawValue=e,this._value=n?e:Bt(e),this.dep.trigger())}};function Gt(e){return R(e)?e.value:e}var Kt={get:(e,t,n)=>t===`__v_raw`?e:Gt(Reflect.get(e,t,n)),set:(e,t,n,r)=>{let i=e[t];return R(i)&&!R(n)?(i.value=n,!0):Reflect.set(e,t,n,r)}};function qt(e){return Ft(e)?e:new Proxy(e,Kt)}var Jt=class{constructor(e,t,n){this.fn=e,this.setter=t,this._value=void 0,this.dep=new We(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=He-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!t,this.isSSR=n}notify(){if(this.flags|=16,!(this.flags&8)&&F!==this)return Oe(this,!0),!0}get value(){let e=this.dep.track();return Pe(this),e&&(e.version=this.dep.version),this._value}set value(e){this.setter&&this.setter(e)}};function Yt(e,t,n=!1){let r,i;return h(e)?r=e:(r=e.get,i=e.set),new Jt(r,i,n)}var Xt={},Zt=new WeakMap,Qt=void 0;function $t(e,t=!1,n=Qt){if(n){let t=Zt.get(n);t||Zt.set(n,t=[]),t.push(e)}}function en(e,n,i=t){let{immediate:a,deep:o,once:s,scheduler:l,augmentJob:u,call:f}=i,p=e=>o?e:Lt(e)||o===!1||o===0?tn(e,1):tn(e),m,g,_,v,y=!1,b=!1;if(R(e)?(g=()=>e.value,y=Lt(e)):Ft(e)?(g=()=>p(e),y=!0):d(e)?(b=!0,y=e.some(e=>Ft(e)||Lt(e)),g=()=>e.map(e=>{if(R(e))return e.value;if(Ft(e))return p(e);if(h(e))return f?f(e,2):e()})):g=h(e)?n?f?()=>f(e,2):e:()=>{if(_){ze();try{_()}finally{Be()}}let t=Qt;Qt=m;try{return f?f(e,3,[v]):e(v)}finally{Qt=t}}:r,n&&o){let e=g,t=o===!0?1/0:o;g=()=>tn(e(),t)}let x=Se(),S=()=>{m.stop(),x&&x.active&&c(x.effects,m)};if(s&&n){let e=n;n=(...t)=>{e(...t),S()}}let C=b?Array(e.length).fill(Xt):Xt,w=e=>{if(!(!(m.flags&1)||!m.dirty&&!e))if(n){let e=m.run();if(o||y||(b?e.some((e,t)=>k(e,C[t])):k(e,C))){_&&_();let t=Qt;Qt=m;try{let t=[e,C===Xt?void 0:b&&C[0]===Xt?[]:C,v];C=e,f?f(n,3,t):n(...t)}finally{Qt=t}}}else m.run()};return u&&u(w),m=new we(g),m.scheduler=l?()=>l(w,!1):w,v=e=>$t(e,!1,m),_=m.onStop=()=>{let e=Zt.get(m);if(e){if(f)f(e,4);else for(let t of e)t();Zt.delete(m)}},n?a?w(!0):C=m.run():l?l(w.bind(null,!0),!0):m.run(),S.pause=m.pause.bind(m),S.resume=m.resume.bind(m),S.stop=S,S}function tn(e,t=1/0,n){if(t<=0||!v(e)||e.__v_skip||(n||=new Map,(n.get(e)||0)>=t))return e;if(n.set(e,t),t--,R(e))tn(e.value,t,n);else if(d(e))for(let r=0;r<e.length;r++)tn(e[r],t,n);else if(p(e)||f(e))e.forEach(e=>{tn(e,t,n)});else if(C(e)){for(let r in e)tn(e[r],t,n);for(let r of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,r)&&tn(e[r],t,n)}return e}function nn(e,t,n,r){try{return r?e(...r):e()}catch(e){an(e,t,n)}}function rn(e,t,n,r){if(h(e)){let i=nn(e,t,n,r);return i&&y(i)&&i.catch(e=>{an(e,t,n)}),i}if(d(e)){let i=[];for(let a=0;a<e.length;a++)i.push(rn(e[a],t,n,r));return i}}function an(e,n,r,i=!0){let a=n?n.vnode:null,{errorHandler:o,throwUnhandledErrorInProduction:s}=n&&n.appContext.config||t;if(n){let t=n.parent,i=n.proxy,a=`https://vuejs.org/error-reference/#runtime-${r}`;for(;t;){let n=t.ec;if(n){for(let t=0;t<n.length;t++)if(n[t](e,i,a)===!1)return}t=t.parent}if(o){ze(),nn(o,null,10,[e,i,a]),Be();return}}on(e,r,a,i,s)}function on(e,t,n,r=!0,i=!1){if(i)throw e;console.error(e)}var B=[],sn=-1,cn=[],ln=null,un=0,dn=Promise.resolve(),fn=null;function pn(e){let t=fn||dn;return e?t.then(this?e.bind(this):e):t}function mn(e){let t=sn+1,n=B.length;for(;t<n;){let r=t+n>>>1,i=B[r],a=bn(i);a<e||a===e&&i.flags&2?t=r+1:n=r}return t}function hn(e){if(!(e.flags&1)){let t=bn(e),n=B[B.length-1];!n||!(e.flags&2)&&t>=bn(n)?B.push(e):B.splice(mn(t),0,e),e.flags|=1,gn()}}function gn(){fn||=dn.then(xn)}function _n(e){d(e)?cn.push(...e):ln&&e.id===-1?ln.splice(un+1,0,e):e.flags&1||(cn.push(e),e.flags|=1),gn()}function vn(e,t,n=sn+1){for(;n<B.length;n++){let t=B[n];if(t&&t.flags&2){if(e&&t.id!==e.uid)continue;B.splice(n,1),n--,t.flags&4&&(t.flags&=-2),t(),t.flags&4||(t.flags&=-2)}}}function yn(e){if(cn.length){let e=[...new Set(cn)].sort((e,t)=>bn(e)-bn(t));if(cn.length=0,ln){ln.push(...e);return}for(ln=e,un=0;un<ln.length;un++){let e=ln[un];e.flags&4&&(e.flags&=-2),e.flags&8||e(),e.flags&=-2}ln=null,un=0}}var bn=e=>e.id==null?e.flags&2?-1:1/0:e.id;function xn(e){try{for(sn=0;sn<B.length;sn++){let e=B[sn];e&&!(e.flags&8)&&(e.flags&4&&(e.flags&=-2),nn(e,e.i,e.i?15:14),e.flags&4||(e.flags&=-2))}}finally{for(;sn<B.length;sn++){let e=B[sn];e&&(e.flags&=-2)}sn=-1,B.length=0,yn(e),fn=null,(B.length||cn.length)&&xn(e)}}var Sn=null,Cn=null;function wn(e){let t=Sn;return Sn=e,Cn=e&&e.type.__scopeId||null,t}function Tn(e,t=Sn,n){if(!t||e._n)return e;let r=(...n)=>{r._d&&ji(-1);let i=wn(t),a;try{a=e(...n)}finally{wn(i),r._d&&ji(1)}return a};return r._n=!0,r._c=!0,r._d=!0,r}function En(e,n){if(Sn===null)return e;let r=fa(Sn),i=e.dirs||=[];for(let e=0;e<n.length;e++){let[a,o,s,c=t]=n[e];a&&(h(a)&&(a={mounted:a,updated:a}),a.deep&&tn(o),i.push({dir:a,instance:r,value:o,oldValue:void 0,arg:s,modifiers:c}))}return e}function Dn(e,t,n,r){let i=e.dirs,a=t&&t.dirs;for(let o=0;o<i.length;o++){let s=i[o];a&&(s.oldValue=a[o].value);let c=s.dir[r];c&&(ze(),rn(c,n,8,[e.el,s,e,t]),Be())}}var On=Symbol(`_vte`),kn=e=>e.__isTeleport,An=Symbol(`_leaveCb`);function jn(e,t){e.shapeFlag&6&&e.component?(e.transition=t,jn(e.component.subTree,t)):e.shapeFlag&128?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function Mn(e,t){return h(e)?(()=>s({name:e.name},t,{setup:e}))():e}function Nn(e){e.ids=[e.ids[0]+ e.ids[2]+++`-`,0,0]}var Pn=new WeakMap;function Fn(e,n,r,a,o=!1){if(d(e)){e.forEach((e,t)=>Fn(e,n&&(d(n)?n[t]:n),r,a,o));return}if(Ln(a)&&!o){a.shapeFlag&512&&a.type.__asyncResolved&&a.component.subTree.component&&Fn(e,n,r,a.component.subTree);return}let s=a.shapeFlag&4?fa(a.component):a.el,l=o?null:s,{i:f,r:p}=e,m=n&&n.r,_=f.refs===t?f.refs={}:f.refs,v=f.setupState,y=L(v),b=v===t?i:e=>u(y,e),x=e=>!0;if(m!=null&&m!==p){if(In(n),g(m))_[m]=null,b(m)&&(v[m]=null);else if(R(m)){x(m)&&(m.value=null);let e=n;e.k&&(_[e.k]=null)}}if(h(p))nn(p,f,12,[l,_]);else{let t=g(p),n=R(p);if(t||n){let i=()=>{if(e.f){let n=t?b(p)?v[p]:_[p]:x(p)||!e.k?p.value:_[e.k];if(o)d(n)&&c(n,s);else if(d(n))n.includes(s)||n.push(s);else if(t)_[p]=[s],b(p)&&(v[p]=_[p]);else{let t=[s];x(p)&&(p.value=t),e.k&&(_[e.k]=t)}}else t?(_[p]=l,b(p)&&(v[p]=l)):n&&(x(p)&&(p.value=l),e.k&&(_[e.k]=l))};if(l){let t=()=>{i(),Pn.delete(e)};t.id=-1,Pn.set(e,t),pi(t,r)}else In(e),i()}}}function In(e){let t=Pn.get(e);t&&(t.flags|=8,Pn.delete(e))}se().requestIdleCallback,se().cancelIdleCallback;var Ln=e=>!!e.type.__asyncLoader,Rn=e=>e.type.__isKeepAlive;function zn(e,t){Vn(e,`a`,t)}function Bn(e,t){Vn(e,`da`,t)}function Vn(e,t,n=Y){let r=e.__wdc||=()=>{let t=n;for(;t;){if(t.isDeactivated)return;t=t.parent}return e()};if(Un(t,r,n),n){let e=n.parent;for(;e&&e.parent;)Rn(e.parent.vnode)&&Hn(r,t,n,e),e=e.parent}}function Hn(e,t,n,r){let i=Un(t,e,r,!0);Xn(()=>{c(r[t],i)},n)}function Un(e,t,n=Y,r=!1){if(n){let i=n[e]||(n[e]=[]),a=t.__weh||=(...r)=>{ze();let i=ea(n),a=rn(t,n,e,r);return i(),Be(),a};return r?i.unshift(a):i.push(a),a}}var Wn=e=>(t,n=Y)=>{(!ra||e===`sp`)&&Un(e,(...e)=>t(...e),n)},Gn=Wn(`bm`),Kn=Wn(`m`),qn=Wn(`bu`),Jn=Wn(`u`),Yn=Wn(`bum`),Xn=Wn(`um`),Zn=Wn(`sp`),Qn=Wn(`rtg`),$n=Wn(`rtc`);function er(e,t=Y){Un(`ec`,e,t)}var tr=`components`;function nr(e,t){return ir(tr,e,!0,t)||e}var rr=Symbol.for(`v-ndc`);function ir(e,t,n=!0,r=!1){let i=Sn||Y;if(i){let n=i.type;if(e===tr){let e=pa(n,!1);if(e&&(e===t||e===E(t)||e===O(E(t))))return n}let a=ar(i[e]||n[e],t)||ar(i.appContext[e],t);return!a&&r?n:a}}function ar(e,t){return e&&(e[t]||e[E(t)]||e[O(E(t))])}function or(e,t,n,r){let i,a=n&&n[r],o=d(e);if(o||g(e)){let n=o&&Ft(e),r=!1,s=!1;n&&(r=!Lt(e),s=It(e),e=Qe(e)),i=Array(e.length);for(let n=0,o=e.length;n<o;n++)i[n]=t(r?s?Vt(Bt(e[n])):Bt(e[n]):e[n],n,void 0,a&&a[n])}else if(typeof e==`number`){i=Array(e);for(let n=0;n<e;n++)i[n]=t(n+1,n,void 0,a&&a[n])}else if(v(e))if(e[Symbol.iterator])i=Array.from(e,(e,n)=>t(e,n,void 0,a&&a[n]));else{let n=Object.keys(e);i=Array(n.length);for(let r=0,o=n.length;r<o;r++){let o=n[r];i[r]=t(e[o],o,r,a&&a[r])}}else i=[];return n&&(n[r]=i),i}var sr=e=>e?na(e)?fa(e):sr(e.parent):null,cr=s(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>sr(e.parent),$root:e=>sr(e.root),$host:e=>e.ce,$emit:e=>e.emit,$options:e=>_r(e),$forceUpdate:e=>e.f||=()=>{hn(e.update)},$nextTick:e=>e.n||=pn.bind(e.proxy),$watch:e=>Ir.bind(e)}),lr=(e,n)=>e!==t&&!e.__isScriptSetup&&u(e,n),ur={get({_:e},n){if(n===`__v_skip`)return!0;let{ctx:r,setupState:i,data:a,props:o,accessCache:s,type:c,appContext:l}=e;if(n[0]!==`$`){let e=s[n];if(e!==void 0)switch(e){case 1:return i[n];case 2:return a[n];case 4:return r[n];case 3:return o[n]}else if(lr(i,n))return s[n]=1,i[n];else if(a!==t&&u(a,n))return s[n]=2,a[n];else if(u(o,n))return s[n]=3,o[n];else if(r!==t&&u(r,n))return s[n]=4,r[n];else fr&&(s[n]=0)}let d=cr[n],f,p;if(d)return n===`$attrs`&&I(e.attrs,`get`,``),d(e);if((f=c.__cssModules)&&(f=f[n]))return f;if(r!==t&&u(r,n))return s[n]=4,r[n];if(p=l.config.globalProperties,u(p,n))return p[n]},set({_:e},n,r){let{data:i,setupState:a,ctx:o}=e;return lr(a,n)?(a[n]=r,!0):i!==t&&u(i,n)?(i[n]=r,!0):u(e.props,n)||n[0]===`$`&&n.slice(1)in e?!1:(o[n]=r,!0)},has({_:{data:e,setupState:n,accessCache:r,ctx:i,appContext:a,props:o,type:s}},c){let l;return!!(r[c]||e!==t&&c[0]!==`$`&&u(e,c)||lr(n,c)||u(o,c)||u(i,c)||u(cr,c)||u(a.config.globalProperties,c)||(l=s.__cssModules)&&l[c])},defineProperty(e,t,n){return n.get==null?u(n,`value`)&&this.set(e,t,n.value,null):e._.accessCache[t]=0,Reflect.defineProperty(e,t,n)}};function dr(e){return d(e)?e.reduce((e,t)=>(e[t]=null,e),{}):e}var fr=!0;function pr(e){let t=_r(e),n=e.proxy,i=e.ctx;fr=!1,t.beforeCreate&&hr(t.beforeCreate,e,`bc`);let{data:a,computed:o,methods:s,watch:c,provide:l,inject:u,created:f,beforeMount:p,mounted:m,beforeUpdate:g,updated:_,activated:y,deactivated:b,beforeDestroy:x,beforeUnmount:S,destroyed:C,unmounted:w,render:T,renderTracked:ee,renderTriggered:te,errorCaptured:E,serverPrefetch:ne,expose:D,inheritAttrs:O,components:re,directives:k,filters:ie}=t;if(u&&mr(u,i,null),s)for(let e in s){let t=s[e];h(t)&&(i[e]=t.bind(n))}if(a){let t=a.call(n,n);v(t)&&(e.data=jt(t))}if(fr=!0,o)for(let e in o){let t=o[e],a=ha({get:h(t)?t.bind(n,n):h(t.get)?t.get.bind(n,n):r,set:!h(t)&&h(t.set)?t.set.bind(n):r});Object.defineProperty(i,e,{enumerable:!0,configurable:!0,get:()=>a.value,set:e=>a.value=e})}if(c)for(let e in c)gr(c[e],i,n,e);if(l){let e=h(l)?l.call(n):l;Reflect.ownKeys(e).forEach(t=>{Ar(t,e[t])})}f&&hr(f,e,`c`);function A(e,t){d(t)?t.forEach(t=>e(t.bind(n))):t&&e(t.bind(n))}if(A(Gn,p),A(Kn,m),A(qn,g),A(Jn,_),A(zn,y),A(Bn,b),A(er,E),A($n,ee),A(Qn,te),A(Yn,S),A(Xn,w),A(Zn,ne),d(D))if(D.length){let t=e.exposed||={};D.forEach(e=>{Object.defineProperty(t,e,{get:()=>n[e],set:t=>n[e]=t,enumerable:!0})})}else e.exposed||={};T&&e.render===r&&(e.render=T),O!=null&&(e.inheritAttrs=O),re&&(e.components=re),k&&(e.directives=k),ne&&Nn(e)}function mr(e,t,n=r){for(let n in d(e)&&(e=Sr(e)),e){let r=e[n],i;i=v(r)?`default`in r?jr(r.from||n,r.default,!0):jr(r.from||n):jr(r),R(i)?Object.defineProperty(t,n,{enumerable:!0,configurable:!0,get:()=>i.value,set:e=>i.value=e}):t[n]=i}}function hr(e,t,n){rn(d(e)?e.map(e=>e.bind(t.proxy)):e.bind(t.proxy),t,n)}function gr(e,t,n,r){let i=r.includes(`.`)?Lr(n,r):()=>n[r];if(g(e)){let n=t[e];h(n)&&Pr(i,n)}else if(h(e))Pr(i,e.bind(n));else if(v(e))if(d(e))e.forEach(e=>gr(e,t,n,r));else{let r=h(e.handler)?e.handler.bind(n):t[e.handler];h(r)&&Pr(i,r,e)}}function _r(e){let t=e.type,{mixins:n,extends:r}=t,{mixins:i,optionsCache:a,config:{optionMergeStrategies:o}}=e.appContext,s=a.get(t),c;return s?c=s:!i.length&&!n&&!r?c=t:(c={},i.length&&i.forEach(e=>vr(c,e,o,!0)),vr(c,t,o)),v(t)&&a.set(t,c),c}function vr(e,t,n,r=!1){let{mixins:i,extends:a}=t;for(let o in a&&vr(e,a,n,!0),i&&i.forEach(t=>vr(e,t,n,!0)),t)if(!(r&&o===`expose`)){let r=yr[o]||n&&n[o];e[o]=r?r(e[o],t[o]):t[o]}return e}var yr={data:br,props:wr,emits:wr,methods:Cr,computed:Cr,beforeCreate:V,created:V,beforeMount:V,mounted:V,beforeUpdate:V,updated:V,beforeDestroy:V,beforeUnmount:V,destroyed:V,unmounted:V,activated:V,deactivated:V,errorCaptured:V,serverPrefetch:V,components:Cr,directives:Cr,watch:Tr,provide:br,inject:xr};function br(e,t){return t?e?function(){return s(h(e)?e.call(this,this):e,h(t)?t.call(this,this):t)}:t:e}function xr(e,t){return Cr(Sr(e),Sr(t))}function Sr(e){if(d(e)){let t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function V(e,t){return e?[...new Set([].concat(e,t))]:t}function Cr(e,t){return e?s(Object.create(null),e,t):t}function wr(e,t){return e?d(e)&&d(t)?[...new Set([...e,...t])]:s(Object.create(null),dr(e),dr(t??{})):t}function Tr(e,t){if(!e)return t;if(!t)return e;let n=s(Object.create(null),e);for(let r in t)n[r]=V(e[r],t[r]);return n}function Er(){return{app:null,config:{isNativeTag:i,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}var Dr=0;function Or(e,t){return function(n,r=null){h(n)||(n=s({},n)),r!=null&&!v(r)&&(r=null);let i=Er(),a=new WeakSet,o=[],c=!1,l=i.app={_uid:Dr++,_component:n,_props:r,_container:null,_context:i,_instance:null,version:va,get config(){return i.config},set config(e){},use(e,...t){return a.has(e)||(e&&h(e.install)?(a.add(e),e.install(l,...t)):h(e)&&(a.add(e),e(l,...t))),l},mixin(e){return i.mixins.includes(e)||i.mixins.push(e),l},component(e,t){return t?(i.components[e]=t,l):i.components[e]},directive(e,t){return t?(i.directives[e]=t,l):i.directives[e]},mount(a,o,s){if(!c){let u=l._ceVNode||q(n,r);return u.appContext=i,s===!0?s=`svg`:s===!1&&(s=void 0),o&&t?t(u,a):e(u,a,s),c=!0,l._container=a,a.__vue_app__=l,fa(u.component)}},onUnmount(e){o.push(e)},unmount(){c&&(rn(o,l._instance,16),e(null,l._container),delete l._container.__vue_app__)},provide(e,t){return i.provides[e]=t,l},runWithContext(e){let t=kr;kr=l;try{return e()}finally{kr=t}}};return l}}var kr=null;function Ar(e,t){if(Y){let n=Y.provides,r=Y.parent&&Y.parent.provides;r===n&&(n=Y.provides=Object.create(r)),n[e]=t}}function jr(e,t,n=!1){let r=Zi();if(r||kr){let i=kr?kr._context.provides:r?r.parent==null||r.ce?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides:void 0;if(i&&e in i)return i[e];if(arguments.length>1)return n&&h(t)?t.call(r&&r.proxy):t}}var Mr=Symbol.for(`v-scx`),Nr=()=>jr(Mr);function Pr(e,t,n){return Fr(e,t,n)}function Fr(e,n,i=t){let{immediate:a,deep:o,flush:c,once:l}=i,u=s({},i),d=n&&a||!n&&c!==`post`,f;if(ra){if(c===`sync`){let e=Nr();f=e.__watcherHandles||=[]}else if(!d){let e=()=>{};return e.stop=r,e.resume=r,e.pause=r,e}}let p=Y;u.call=(e,t,n)=>rn(e,p,t,n);let m=!1;c===`post`?u.scheduler=e=>{pi(e,p&&p.suspense)}:c!==`sync`&&(m=!0,u.scheduler=(e,t)=>{t?e():hn(e)}),u.augmentJob=e=>{n&&(e.flags|=4),m&&(e.flags|=2,p&&(e.id=p.uid,e.i=p))};let h=en(e,n,u);return ra&&(f?f.push(h):d&&h()),h}function Ir(e,t,n){let r=this.proxy,i=g(e)?e.includes(`.`)?Lr(r,e):()=>r[e]:e.bind(r,r),a;h(t)?a=t:(a=t.handler,n=t);let o=ea(this),s=Fr(i,a.bind(r),n);return o(),s}function Lr(e,t){let n=t.split(`.`);return()=>{let t=e;for(let e=0;e<n.length&&t;e++)t=t[n[e]];return t}}var Rr=(e,t)=>t===`modelValue`||t===`model-value`?e.modelModifiers:e[`${t}Modifiers`]||e[`${E(t)}Modifiers`]||e[`${D(t)}Modifiers`];function zr(e,n,...r){if(e.isUnmounted)return;let i=e.vnode.props||t,a=r,o=n.startsWith(`update:`),s=o&&Rr(i,n.slice(7));s&&(s.trim&&(a=r.map(e=>g(e)?e.trim():e)),s.number&&(a=r.map(ae)));let c,l=i[c=re(n)]||i[c=re(E(n))];!l&&o&&(l=i[c=re(D(n))]),l&&rn(l,e,6,a);let u=i[c+`Once`];if(u){if(!e.emitted)e.emitted={};else if(e.emitted[c])return;e.emitted[c]=!0,rn(u,e,6,a)}}var Br=new WeakMap;function Vr(e,t,n=!1){let r=n?Br:t.emitsCache,i=r.get(e);if(i!==void 0)return i;let a=e.emits,o={},c=!1;if(!h(e)){let r=e=>{let n=Vr(e,t,!0);n&&(c=!0,s(o,n))};!n&&t.mixins.length&&t.mixins.forEach(r),e.extends&&r(e.extends),e.mixins&&e.mixins.forEach(r)}return!a&&!c?(v(e)&&r.set(e,null),null):(d(a)?a.forEach(e=>o[e]=null):s(o,a),v(e)&&r.set(e,o),o)}function Hr(e,t){return!e||!a(t)?!1:(t=t.slice(2).replace(/Once$/,``),u(e,t[0].toLowerCase()+t.slice(1))||u(e,D(t))||u(e,t))}function Ur(e){let{type:t,vnode:n,proxy:r,withProxy:i,propsOptions:[a],slots:s,attrs:c,emit:l,render:u,renderCache:d,props:f,data:p,setupState:m,ctx:h,inheritAttrs:g}=e,_=wn(e),v,y;try{if(n.shapeFlag&4){let e=i||r,t=e;v=Ui(u.call(t,e,d,f,m,p,h)),y=c}else{let e=t;v=Ui(e.length>1?e(f,{attrs:c,slots:s,emit:l}):e(f,null)),y=t.props?c:Wr(c)}}catch(t){Oi.length=0,an(t,e,1),v=q(Ei)}let b=v;if(y&&g!==!1){let e=Object.keys(y),{shapeFlag:t}=b;e.length&&t&7&&(a&&e.some(o)&&(y=Gr(y,a)),b=Bi(b,y,!1,!0))}return n.dirs&&(b=Bi(b,null,!1,!0),b.dirs=b.dirs?b.dirs.concat(n.dirs):n.dirs),n.transition&&jn(b,n.transition),v=b,wn(_),v}var Wr=e=>{let t;for(let n in e)(n===`class`||n===`style`||a(n))&&((t||={})[n]=e[n]);return t},Gr=(e,t)=>{let n={};for(let r in e)(!o(r)||!(r.slice(9)in t))&&(n[r]=e[r]);return n};function Kr(e,t,n){let{props:r,children:i,component:a}=e,{props:o,children:s,patchFlag:c}=t,l=a.emitsOptions;if(t.dirs||t.transition)return!0;if(n&&c>=0){if(c&1024)return!0;if(c&16)return r?qr(r,o,l):!!o;if(c&8){let e=t.dynamicProps;for(let t=0;t<e.length;t++){let n=e[t];if(o[n]!==r[n]&&!Hr(l,n))return!0}}}else return(i||s)&&(!s||!s.$stable)?!0:r===o?!1:r?o?qr(r,o,l):!0:!!o;return!1}function qr(e,t,n){let r=Object.keys(t);if(r.length!==Object.keys(e).length)return!0;for(let i=0;i<r.length;i++){let a=r[i];if(t[a]!==e[a]&&!Hr(n,a))return!0}return!1}function Jr({vnode:e,parent:t},n){for(;t;){let r=t.subTree;if(r.suspense&&r.suspense.activeBranch===e&&(r.el=e.el),r===e)(e=t.vnode).el=n,t=t.parent;else break}}var Yr={},Xr=()=>Object.create(Yr),Zr=e=>Object.getPrototypeOf(e)===Yr;function Qr(e,t,n,r=!1){let i={},a=Xr();for(let n in e.propsDefaults=Object.create(null),ei(e,t,i,a),e.propsOptions[0])n in i||(i[n]=void 0);n?e.props=r?i:Mt(i):e.type.props?e.props=i:e.props=a,e.attrs=a}function $r(e,t,n,r){let{props:i,attrs:a,vnode:{patchFlag:o}}=e,s=L(i),[c]=e.propsOptions,l=!1;if((r||o>0)&&!(o&16)){if(o&8){let n=e.vnode.dynamicProps;for(let r=0;r<n.length;r++){let o=n[r];if(Hr(e.emitsOptions,o))continue;let d=t[o];if(c)if(u(a,o))d!==a[o]&&(a[o]=d,l=!0);else{let t=E(o);i[t]=ti(c,s,t,d,e,!1)}else d!==a[o]&&(a[o]=d,l=!0)}}}else{ei(e,t,i,a)&&(l=!0);let r;for(let a in s)(!t||!u(t,a)&&((r=D(a))===a||!u(t,r)))&&(c?n&&(n[a]!==void 0||n[r]!==void 0)&&(i[a]=ti(c,s,a,void 0,e,!0)):delete i[a]);if(a!==s)for(let e in a)(!t||!u(t,e))&&(delete a[e],l=!0)}l&&Xe(e.attrs,`set`,``)}function ei(e,n,r,i){let[a,o]=e.propsOptions,s=!1,c;if(n)for(let t in n){if(T(t))continue;let l=n[t],d;a&&u(a,d=E(t))?!o||!o.includes(d)?r[d]=l:(c||={})[d]=l:Hr(e.emitsOptions,t)||(!(t in i)||l!==i[t])&&(i[t]=l,s=!0)}if(o){let n=L(r),i=c||t;for(let t=0;t<o.length;t++){let s=o[t];r[s]=ti(a,n,s,i[s],e,!u(i,s))}}return s}function ti(e,t,n,r,i,a){let o=e[n];if(o!=null){let e=u(o,`default`);if(e&&r===void 0){let e=o.default;if(o.type!==Function&&!o.skipFactory&&h(e)){let{propsDefaults:a}=i;if(n in a)r=a[n];else{let o=ea(i);r=a[n]=e.call(null,t),o()}}else r=e;i.ce&&i.ce._setProp(n,r)}o[0]&&(a&&!e?r=!1:o[1]&&(r===``||r===D(n))&&(r=!0))}return r}var ni=new WeakMap;function ri(e,r,i=!1){let a=i?ni:r.propsCache,o=a.get(e);if(o)return o;let c=e.props,l={},f=[],p=!1;if(!h(e)){let t=e=>{p=!0;let[t,n]=ri(e,r,!0);s(l,t),n&&f.push(...n)};!i&&r.mixins.length&&r.mixins.forEach(t),e.extends&&t(e.extends),e.mixins&&e.mixins.forEach(t)}if(!c&&!p)return v(e)&&a.set(e,n),n;if(d(c))for(let e=0;e<c.length;e++){let n=E(c[e]);ii(n)&&(l[n]=t)}else if(c)for(let e in c){let t=E(e);if(ii(t)){let n=c[e],r=l[t]=d(n)||h(n)?{type:n}:s({},n),i=r.type,a=!1,o=!0;if(d(i))for(let e=0;e<i.length;++e){let t=i[e],n=h(t)&&t.name;if(n===`Boolean`){a=!0;break}else n===`String`&&(o=!1)}else a=h(i)&&i.name===`Boolean`;r[0]=a,r[1]=o,(a||u(r,`default`))&&f.push(t)}}let m=[l,f];return v(e)&&a.set(e,m),m}function ii(e){return e[0]!==`$`&&!T(e)}var ai=e=>e===`_`||e===`_ctx`||e===`$stable`,oi=e=>d(e)?e.map(Ui):[Ui(e)],si=(e,t,n)=>{if(t._n)return t;let r=Tn((...e)=>oi(t(...e)),n);return r._c=!1,r},ci=(e,t,n)=>{let r=e._ctx;for(let n in e){if(ai(n))continue;let i=e[n];if(h(i))t[n]=si(n,i,r);else if(i!=null){let e=oi(i);t[n]=()=>e}}},li=(e,t)=>{let n=oi(t);e.slots.default=()=>n},ui=(e,t,n)=>{for(let r in t)(n||!ai(r))&&(e[r]=t[r])},di=(e,t,n)=>{let r=e.slots=Xr();if(e.vnode.shapeFlag&32){let e=t._;e?(ui(r,t,n),n&&A(r,`_`,e,!0)):ci(t,r)}else t&&li(e,t)},fi=(e,n,r)=>{let{vnode:i,slots:a}=e,o=!0,s=t;if(i.shapeFlag&32){let e=n._;e?r&&e===1?o=!1:ui(a,n,r):(o=!n.$stable,ci(n,a)),s=n}else n&&(li(e,n),s={default:1});if(o)for(let e in a)!ai(e)&&s[e]==null&&delete a[e]},pi=wi;function mi(e){return hi(e)}function hi(e,i){let a=se();a.__VUE__=!0;let{insert:o,remove:s,patchProp:c,createElement:l,createText:u,createComment:d,setText:f,setElementText:p,parentNode:m,nextSibling:h,setScopeId:g=r,insertStaticContent:_}=e,v=(e,t,n,r=null,i=null,a=null,o=void 0,s=null,c=!!t.dynamicChildren)=>{if(e===t)return;e&&!Fi(e,t)&&(r=ge(e),M(e,i,a,!0),e=null),t.patchFlag===-2&&(c=!1,t.dynamicChildren=null);let{type:l,ref:u,shapeFlag:d}=t;switch(l){case Ti:y(e,t,n,r);break;case Ei:b(e,t,n,r);break;case Di:e??x(t,n,r,o);break;case H:re(e,t,n,r,i,a,o,s,c);break;default:d&1?w(e,t,n,r,i,a,o,s,c):d&6?k(e,t,n,r,i,a,o,s,c):(d&64||d&128)&&l.process(e,t,n,r,i,a,o,s,c,N)}u!=null&&i?Fn(u,e&&e.ref,a,t||e,!t):u==null&&e&&e.ref!=null&&Fn(e.ref,null,a,e,!0)},y=(e,t,n,r)=>{if(e==null)o(t.el=u(t.children),n,r);else{let n=t.el=e.el;t.children!==e.children&&f(n,t.children)}},b=(e,t,n,r)=>{e==null?o(t.el=d(t.children||``),n,r):t.el=e.el},x=(e,t,n,r)=>{[e.el,e.anchor]=_(e.children,t,n,r,e.el,e.anchor)},S=({el:e,anchor:t},n,r)=>{let i;for(;e&&e!==t;)i=h(e),o(e,n,r),e=i;o(t,n,r)},C=({el:e,anchor:t})=>{let n;for(;e&&e!==t;)n=h(e),s(e),e=n;s(t)},w=(e,t,n,r,i,a,o,s,c)=>{if(t.type===`svg`?o=`svg`:t.type===`math`&&(o=`mathml`),e==null)ee(t,n,r,i,a,o,s,c);else{let n=e.el&&e.el._isVueCE?e.el:null;try{n&&n._beginPatch(),ne(e,t,i,a,o,s,c)}finally{n&&n._endPatch()}}},ee=(e,t,n,r,i,a,s,u)=>{let d,f,{props:m,shapeFlag:h,transition:g,dirs:_}=e;if(d=e.el=l(e.type,a,m&&m.is,m),h&8?p(d,e.children):h&16&&E(e.children,d,null,r,i,gi(e,a),s,u),_&&Dn(e,null,r,`created`),te(d,e,e.scopeId,s,r),m){for(let e in m)e!==`value`&&!T(e)&&c(d,e,null,m[e],a,r);`value`in m&&c(d,`value`,null,m.value,a),(f=m.onVnodeBeforeMount)&&qi(f,r,e)}_&&Dn(e,null,r,`beforeMount`);let v=vi(i,g);v&&g.beforeEnter(d),o(d,t,n),((f=m&&m.onVnodeMounted)||v||_)&&pi(()=>{f&&qi(f,r,e),v&&g.enter(d),_&&Dn(e,null,r,`mounted`)},i)},te=(e,t,n,r,i)=>{if(n&&g(e,n),r)for(let t=0;t<r.length;t++)g(e,r[t]);if(i){let n=i.subTree;if(t===n||Ci(n.type)&&(n.ssContent===t||n.ssFallback===t)){let t=i.vnode;te(e,t,t.scopeId,t.slotScopeIds,i.parent)}}},E=(e,t,n,r,i,a,o,s,c=0)=>{for(let l=c;l<e.length;l++)v(null,e[l]=s?Wi(e[l]):Ui(e[l]),t,n,r,i,a,o,s)},ne=(e,n,r,i,a,o,s)=>{let l=n.el=e.el,{patchFlag:u,dynamicChildren:d,dirs:f}=n;u|=e.patchFlag&16;let m=e.props||t,h=n.props||t,g;if(r&&_i(r,!1),(g=h.onVnodeBeforeUpdate)&&qi(g,r,n,e),f&&Dn(n,e,r,`beforeUpdate`),r&&_i(r,!0),(m.innerHTML&&h.innerHTML==null||m.textContent&&h.textContent==null)&&p(l,``),d?D(e.dynamicChildren,d,l,r,i,gi(n,a),o):s||le(e,n,l,null,r,i,gi(n,a),o,!1),u>0){if(u&16)O(l,m,h,r,a);else if(u&2&&m.class!==h.class&&c(l,`class`,null,h.class,a),u&4&&c(l,`style`,m.style,h.style,a),u&8){let e=n.dynamicProps;for(let t=0;t<e.length;t++){let n=e[t],i=m[n],o=h[n];(o!==i||n===`value`)&&c(l,n,i,o,a,r)}}u&1&&e.children!==n.children&&p(l,n.children)}else !s&&d==null&&O(l,m,h,r,a);((g=h.onVnodeUpdated)||f)&&pi(()=>{g&&qi(g,r,n,e),f&&Dn(n,e,r,`updated`)},i)},D=(e,t,n,r,i,a,o)=>{for(let s=0;s<t.length;s++){let c=e[s],l=t[s];v(c,l,c.el&&(c.type===H||!Fi(c,l)||c.shapeFlag&198)?m(c.el):n,null,r,i,a,o,!0)}},O=(e,n,r,i,a)=>{if(n!==r){if(n!==t)for(let t in n)!T(t)&&!(t in r)&&c(e,t,n[t],null,a,i);for(let t in r){if(T(t))continue;let o=r[t],s=n[t];o!==s&&t!==`value`&&c(e,t,s,o,a,i)}`value`in r&&c(e,`value`,n.value,r.value,a)}},re=(e,t,n,r,i,a,s,c,l)=>{let d=t.el=e?e.el:u(``),f=t.anchor=e?e.anchor:u(``),{patchFlag:p,dynamicChildren:m,slotScopeIds:h}=t;h&&(c=c?c.concat(h):h),e==null?(o(d,n,r),o(f,n,r),E(t.children||[],n,f,i,a,s,c,l)):p>0&&p&64&&m&&e.dynamicChildren?(D(e.dynamicChildren,m,n,i,a,s,c),(t.key!=null||i&&t===i.subTree)&&yi(e,t,!0)):le(e,t,n,f,i,a,s,c,l)},k=(e,t,n,r,i,a,o,s,c)=>{t.slotScopeIds=s,e==null?t.shapeFlag&512?i.ctx.activate(t,n,r,o,c):A(t,n,r,i,a,o,c):ae(e,t,c)},A=(e,t,n,r,i,a,o)=>{let s=e.component=Xi(e,r,i);if(Rn(e)&&(s.ctx.renderer=N),ia(s,!1,o),s.asyncDep){if(i&&i.registerDep(s,oe,o),!e.el){let r=s.subTree=q(Ei);b(null,r,t,n),e.placeholder=r.el}}else oe(s,e,t,n,i,a,o)},ae=(e,t,n)=>{let r=t.component=e.component;if(Kr(e,t,n))if(r.asyncDep&&!r.asyncResolved){ce(r,t,n);return}else r.next=t,r.update();else t.el=e.el,r.vnode=t},oe=(e,t,n,r,i,a,o)=>{let s=()=>{if(e.isMounted){let{next:t,bu:n,u:r,parent:c,vnode:l}=e;{let n=xi(e);if(n){t&&(t.el=l.el,ce(e,t,o)),n.asyncDep.then(()=>{e.isUnmounted||s()});return}}let u=t,d;_i(e,!1),t?(t.el=l.el,ce(e,t,o)):t=l,n&&ie(n),(d=t.props&&t.props.onVnodeBeforeUpdate)&&qi(d,c,t,l),_i(e,!0);let f=Ur(e),p=e.subTree;e.subTree=f,v(p,f,m(p.el),ge(p),e,i,a),t.el=f.el,u===null&&Jr(e,f.el),r&&pi(r,i),(d=t.props&&t.props.onVnodeUpdated)&&pi(()=>qi(d,c,t,l),i)}else{let o,{el:s,props:c}=t,{bm:l,m:u,parent:d,root:f,type:p}=e,m=Ln(t);if(_i(e,!1),l&&ie(l),!m&&(o=c&&c.onVnodeBeforeMount)&&qi(o,d,t),_i(e,!0),s&&be){let t=()=>{e.subTree=Ur(e),be(s,e.subTree,e,i,null)};m&&p.__asyncHydrate?p.__asyncHydrate(s,e,t):t()}else{f.ce&&f.ce._def.shadowRoot!==!1&&f.ce._injectChildStyle(p);let o=e.subTree=Ur(e);v(null,o,n,r,e,i,a),t.el=o.el}if(u&&pi(u,i),!m&&(o=c&&c.onVnodeMounted)){let e=t;pi(()=>qi(o,d,e),i)}(t.shapeFlag&256||d&&Ln(d.vnode)&&d.vnode.shapeFlag&256)&&e.a&&pi(e.a,i),e.isMounted=!0,t=n=r=null}};e.scope.on();let c=e.effect=new we(s);e.scope.off();let l=e.update=c.run.bind(c),u=e.job=c.runIfDirty.bind(c);u.i=e,u.id=e.uid,c.scheduler=()=>hn(u),_i(e,!0),l()},ce=(e,t,n)=>{t.component=e;let r=e.vnode.props;e.vnode=t,e.next=null,$r(e,t.props,r,n),fi(e,t.children,n),ze(),vn(e),Be()},le=(e,t,n,r,i,a,o,s,c=!1)=>{let l=e&&e.children,u=e?e.shapeFlag:0,d=t.children,{patchFlag:f,shapeFlag:m}=t;if(f>0){if(f&128){j(l,d,n,r,i,a,o,s,c);return}else if(f&256){ue(l,d,n,r,i,a,o,s,c);return}}m&8?(u&16&&he(l,i,a),d!==l&&p(n,d)):u&16?m&16?j(l,d,n,r,i,a,o,s,c):he(l,i,a,!0):(u&8&&p(n,``),m&16&&E(d,n,r,i,a,o,s,c))},ue=(e,t,r,i,a,o,s,c,l)=>{e||=n,t||=n;let u=e.length,d=t.length,f=Math.min(u,d),p;for(p=0;p<f;p++){let n=t[p]=l?Wi(t[p]):Ui(t[p]);v(e[p],n,r,null,a,o,s,c,l)}u>d?he(e,a,o,!0,!1,f):E(t,r,i,a,o,s,c,l,f)},j=(e,t,r,i,a,o,s,c,l)=>{let u=0,d=t.length,f=e.length-1,p=d-1;for(;u<=f&&u<=p;){let n=e[u],i=t[u]=l?Wi(t[u]):Ui(t[u]);if(Fi(n,i))v(n,i,r,null,a,o,s,c,l);else break;u++}for(;u<=f&&u<=p;){let n=e[f],i=t[p]=l?Wi(t[p]):Ui(t[p]);if(Fi(n,i))v(n,i,r,null,a,o,s,c,l);else break;f--,p--}if(u>f){if(u<=p){let e=p+1,n=e<d?t[e].el:i;for(;u<=p;)v(null,t[u]=l?Wi(t[u]):Ui(t[u]),r,n,a,o,s,c,l),u++}}else if(u>p)for(;u<=f;)M(e[u],a,o,!0),u++;else{let m=u,h=u,g=new Map;for(u=h;u<=p;u++){let e=t[u]=l?Wi(t[u]):Ui(t[u]);e.key!=null&&g.set(e.key,u)}let _,y=0,b=p-h+1,x=!1,S=0,C=Array(b);for(u=0;u<b;u++)C[u]=0;for(u=m;u<=f;u++){let n=e[u];if(y>=b){M(n,a,o,!0);continue}let i;if(n.key!=null)i=g.get(n.key);else for(_=h;_<=p;_++)if(C[_-h]===0&&Fi(n,t[_])){i=_;break}i===void 0?M(n,a,o,!0):(C[i-h]=u+1,i>=S?S=i:x=!0,v(n,t[i],r,null,a,o,s,c,l),y++)}let w=x?bi(C):n;for(_=w.length-1,u=b-1;u>=0;u--){let e=h+u,n=t[e],f=t[e+1],p=e+1<d?f.el||f.placeholder:i;C[u]===0?v(null,n,r,p,a,o,s,c,l):x&&(_<0||u!==w[_]?de(n,r,p,2):_--)}}},de=(e,t,n,r,i=null)=>{let{el:a,type:c,transition:l,children:u,shapeFlag:d}=e;if(d&6){de(e.component.subTree,t,n,r);return}if(d&128){e.suspense.move(t,n,r);return}if(d&64){c.move(e,t,n,N);return}if(c===H){o(a,t,n);for(let e=0;e<u.length;e++)de(u[e],t,n,r);o(e.anchor,t,n);return}if(c===Di){S(e,t,n);return}if(r!==2&&d&1&&l)if(r===0)l.beforeEnter(a),o(a,t,n),pi(()=>l.enter(a),i);else{let{leave:r,delayLeave:i,afterLeave:c}=l,u=()=>{e.ctx.isUnmounted?s(a):o(a,t,n)},d=()=>{a._isLeaving&&a[An](!0),r(a,()=>{u(),c&&c()})};i?i(a,u,d):d()}else o(a,t,n)},M=(e,t,n,r=!1,i=!1)=>{let{type:a,props:o,ref:s,children:c,dynamicChildren:l,shapeFlag:u,patchFlag:d,dirs:f,cacheIndex:p}=e;if(d===-2&&(i=!1),s!=null&&(ze(),Fn(s,null,n,e,!0),Be()),p!=null&&(t.renderCache[p]=void 0),u&256){t.ctx.deactivate(e);return}let m=u&1&&f,h=!Ln(e),g;if(h&&(g=o&&o.onVnodeBeforeUnmount)&&qi(g,t,e),u&6)me(e.component,n,r);else{if(u&128){e.suspense.unmount(n,r);return}m&&Dn(e,null,t,`beforeUnmount`),u&64?e.type.remove(e,t,n,N,r):l&&!l.hasOnce&&(a!==H||d>0&&d&64)?he(l,t,n,!1,!0):(a===H&&d&384||!i&&u&16)&&he(c,t,n),r&&fe(e)}(h&&(g=o&&o.onVnodeUnmounted)||m)&&pi(()=>{g&&qi(g,t,e),m&&Dn(e,null,t,`unmounted`)},n)},fe=e=>{let{type:t,el:n,anchor:r,transition:i}=e;if(t===H){pe(n,r);return}if(t===Di){C(e);return}let a=()=>{s(n),i&&!i.persisted&&i.afterLeave&&i.afterLeave()};if(e.shapeFlag&1&&i&&!i.persisted){let{leave:t,delayLeave:r}=i,o=()=>t(n,a);r?r(e.el,a,o):o()}else a()},pe=(e,t)=>{let n;for(;e!==t;)n=h(e),s(e),e=n;s(t)},me=(e,t,n)=>{let{bum:r,scope:i,job:a,subTree:o,um:s,m:c,a:l}=e;Si(c),Si(l),r&&ie(r),i.stop(),a&&(a.flags|=8,M(o,e,t,n)),s&&pi(s,t),pi(()=>{e.isUnmounted=!0},t)},he=(e,t,n,r=!1,i=!1,a=0)=>{for(let o=a;o<e.length;o++)M(e[o],t,n,r,i)},ge=e=>{if(e.shapeFlag&6)return ge(e.component.subTree);if(e.shapeFlag&128)return e.suspense.next();let t=h(e.anchor||e.el),n=t&&t[On];return n?h(n):t},_e=!1,ve=(e,t,n)=>{e==null?t._vnode&&M(t._vnode,null,null,!0):v(t._vnode||null,e,t,null,null,null,n),t._vnode=e,_e||=(_e=!0,vn(),yn(),!1)},N={p:v,um:M,m:de,r:fe,mt:A,mc:E,pc:le,pbc:D,n:ge,o:e},ye,be;return i&&([ye,be]=i(N)),{render:ve,hydrate:ye,createApp:Or(ve,ye)}}function gi({type:e,props:t},n){return n===`svg`&&e===`foreignObject`||n===`mathml`&&e===`annotation-xml`&&t&&t.encoding&&t.encoding.includes(`html`)?void 0:n}function _i({effect:e,job:t},n){n?(e.flags|=32,t.flags|=4):(e.flags&=-33,t.flags&=-5)}function vi(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function yi(e,t,n=!1){let r=e.children,i=t.children;if(d(r)&&d(i))for(let e=0;e<r.length;e++){let t=r[e],a=i[e];a.shapeFlag&1&&!a.dynamicChildren&&((a.patchFlag<=0||a.patchFlag===32)&&(a=i[e]=Wi(i[e]),a.el=t.el),!n&&a.patchFlag!==-2&&yi(t,a)),a.type===Ti&&a.patchFlag!==-1&&(a.el=t.el),a.type===Ei&&!a.el&&(a.el=t.el)}}function bi(e){let t=e.slice(),n=[0],r,i,a,o,s,c=e.length;for(r=0;r<c;r++){let c=e[r];if(c!==0){if(i=n[n.length-1],e[i]<c){t[r]=i,n.push(r);continue}for(a=0,o=n.length-1;a<o;)s=a+o>>1,e[n[s]]<c?a=s+1:o=s;c<e[n[a]]&&(a>0&&(t[r]=n[a-1]),n[a]=r)}}for(a=n.length,o=n[a-1];a-- >0;)n[a]=o,o=t[o];return n}function xi(e){let t=e.subTree.component;if(t)return t.asyncDep&&!t.asyncResolved?t:xi(t)}function Si(e){if(e)for(let t=0;t<e.length;t++)e[t].flags|=8}var Ci=e=>e.__isSuspense;function wi(e,t){t&&t.pendingBranch?d(e)?t.effects.push(...e):t.effects.push(e):_n(e)}var H=Symbol.for(`v-fgt`),Ti=Symbol.for(`v-txt`),Ei=Symbol.for(`v-cmt`),Di=Symbol.for(`v-stc`),Oi=[],U=null;function W(e=!1){Oi.push(U=e?null:[])}function ki(){Oi.pop(),U=Oi[Oi.length-1]||null}var Ai=1;function ji(e,t=!1){Ai+=e,e<0&&U&&t&&(U.hasOnce=!0)}function Mi(e){return e.dynamicChildren=Ai>0?U||n:null,ki(),Ai>0&&U&&U.push(e),e}function G(e,t,n,r,i,a){return Mi(K(e,t,n,r,i,a,!0))}function Ni(e,t,n,r,i){return Mi(q(e,t,n,r,i,!0))}function Pi(e){return e?e.__v_isVNode===!0:!1}function Fi(e,t){return e.type===t.type&&e.key===t.key}var Ii=({key:e})=>e??null,Li=({ref:e,ref_key:t,ref_for:n})=>(typeof e==`number`&&(e=``+e),e==null?null:g(e)||R(e)||h(e)?{i:Sn,r:e,k:t,f:!!n}:e);function K(e,t=null,n=null,r=0,i=null,a=e===H?0:1,o=!1,s=!1){let c={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&Ii(t),ref:t&&Li(t),scopeId:Cn,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:a,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null,ctx:Sn};return s?(Gi(c,n),a&128&&e.normalize(c)):n&&(c.shapeFlag|=g(n)?8:16),Ai>0&&!o&&U&&(c.patchFlag>0||a&6)&&c.patchFlag!==32&&U.push(c),c}var q=Ri;function Ri(e,t=null,n=null,r=0,i=null,a=!1){if((!e||e===rr)&&(e=Ei),Pi(e)){let r=Bi(e,t,!0);return n&&Gi(r,n),Ai>0&&!a&&U&&(r.shapeFlag&6?U[U.indexOf(e)]=r:U.push(r)),r.patchFlag=-2,r}if(ma(e)&&(e=e.__vccOpts),t){t=zi(t);let{class:e,style:n}=t;e&&!g(e)&&(t.class=M(e)),v(n)&&(Rt(n)&&!d(n)&&(n=s({},n)),t.style=ce(n))}let o=g(e)?1:Ci(e)?128:kn(e)?64:v(e)?4:h(e)?2:0;return K(e,t,n,r,i,o,a,!0)}function zi(e){return e?Rt(e)||Zr(e)?s({},e):e:null}function Bi(e,t,n=!1,r=!1){let{props:i,ref:a,patchFlag:o,children:s,transition:c}=e,l=t?Ki(i||{},t):i,u={__v_isVNode:!0,__v_skip:!0,type:e.type,props:l,key:l&&Ii(l),ref:t&&t.ref?n&&a?d(a)?a.concat(Li(t)):[a,Li(t)]:Li(t):a,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:s,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==H?o===-1?16:o|16:o,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:c,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&Bi(e.ssContent),ssFallback:e.ssFallback&&Bi(e.ssFallback),placeholder:e.placeholder,el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return c&&r&&jn(u,c.clone(u)),u}function Vi(e=` `,t=0){return q(Ti,null,e,t)}function Hi(e,t){let n=q(Di,null,e);return n.staticCount=t,n}function J(e=``,t=!1){return t?(W(),Ni(Ei,null,e)):q(Ei,null,e)}function Ui(e){return e==null||typeof e==`boolean`?q(Ei):d(e)?q(H,null,e.slice()):Pi(e)?Wi(e):q(Ti,null,String(e))}function Wi(e){return e.el===null&&e.patchFlag!==-1||e.memo?e:Bi(e)}function Gi(e,t){let n=0,{shapeFlag:r}=e;if(t==null)t=null;else if(d(t))n=16;else if(typeof t==`object`)if(r&65){let n=t.default;n&&(n._c&&(n._d=!1),Gi(e,n()),n._c&&(n._d=!0));return}else{n=32;let r=t._;!r&&!Zr(t)?t._ctx=Sn:r===3&&Sn&&(Sn.slots._===1?t._=1:(t._=2,e.patchFlag|=1024))}else h(t)?(t={default:t,_ctx:Sn},n=32):(t=String(t),r&64?(n=16,t=[Vi(t)]):n=8);e.children=t,e.shapeFlag|=n}function Ki(...e){let t={};for(let n=0;n<e.length;n++){let r=e[n];for(let e in r)if(e===`class`)t.class!==r.class&&(t.class=M([t.class,r.class]));else if(e===`style`)t.style=ce([t.style,r.style]);else if(a(e)){let n=t[e],i=r[e];i&&n!==i&&!(d(n)&&n.includes(i))&&(t[e]=n?[].concat(n,i):i)}else e!==``&&(t[e]=r[e])}return t}function qi(e,t,n,r=null){rn(e,t,7,[n,r])}var Ji=Er(),Yi=0;function Xi(e,n,r){let i=e.type,a=(n?n.appContext:e.appContext)||Ji,o={uid:Yi++,vnode:e,type:i,parent:n,appContext:a,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new xe(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:n?n.provides:Object.create(a.provides),ids:n?n.ids:[``,0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:ri(i,a),emitsOptions:Vr(i,a),emit:null,emitted:null,propsDefaults:t,inheritAttrs:i.inheritAttrs,ctx:t,data:t,props:t,attrs:t,slots:t,refs:t,setupState:t,setupContext:null,suspense:r,suspenseId:r?r.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return o.ctx={_:o},o.root=n?n.root:o,o.emit=zr.bind(null,o),e.ce&&e.ce(o),o}var Y=null,Zi=()=>Y||Sn,Qi,$i;{let e=se(),t=(t,n)=>{let r;return(r=e[t])||(r=e[t]=[]),r.push(n),e=>{r.length>1?r.forEach(t=>t(e)):r[0](e)}};Qi=t(`__VUE_INSTANCE_SETTERS__`,e=>Y=e),$i=t(`__VUE_SSR_SETTERS__`,e=>ra=e)}var ea=e=>{let t=Y;return Qi(e),e.scope.on(),()=>{e.scope.off(),Qi(t)}},ta=()=>{Y&&Y.scope.off(),Qi(null)};function na(e){return e.vnode.shapeFlag&4}var ra=!1;function ia(e,t=!1,n=!1){t&&$i(t);let{props:r,children:i}=e.vnode,a=na(e);Qr(e,r,a,t),di(e,i,n||t);let o=a?aa(e,t):void 0;return t&&$i(!1),o}function aa(e,t){let n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,ur);let{setup:r}=n;if(r){ze();let n=e.setupContext=r.length>1?da(e):null,i=ea(e),a=nn(r,e,0,[e.props,n]),o=y(a);if(Be(),i(),(o||e.sp)&&!Ln(e)&&Nn(e),o){if(a.then(ta,ta),t)return a.then(n=>{oa(e,n,t)}).catch(t=>{an(t,e,0)});e.asyncDep=a}else oa(e,a,t)}else la(e,t)}function oa(e,t,n){h(t)?e.type.__ssrInlineRender?e.ssrRender=t:e.render=t:v(t)&&(e.setupState=qt(t)),la(e,n)}var sa,ca;function la(e,t,n){let i=e.type;if(!e.render){if(!t&&sa&&!i.render){let t=i.template||_r(e).template;if(t){let{isCustomElement:n,compilerOptions:r}=e.appContext.config,{delimiters:a,compilerOptions:o}=i;i.render=sa(t,s(s({isCustomElement:n,delimiters:a},r),o))}}e.render=i.render||r,ca&&ca(e)}{let t=ea(e);ze();try{pr(e)}finally{Be(),t()}}}var ua={get(e,t){return I(e,`get`,``),e[t]}};function da(e){return{attrs:new Proxy(e.attrs,ua),slots:e.slots,emit:e.emit,expose:t=>{e.exposed=t||{}}}}function fa(e){return e.exposed?e.exposeProxy||=new Proxy(qt(zt(e.exposed)),{get(t,n){if(n in t)return t[n];if(n in cr)return cr[n](e)},has(e,t){return t in e||t in cr}}):e.proxy}function pa(e,t=!0){return h(e)?e.displayName||e.name:e.name||t&&e.__name}function ma(e){return h(e)&&`__vccOpts`in e}var ha=(e,t)=>Yt(e,t,ra);function ga(e,t,n){try{ji(-1);let r=arguments.length;return r===2?v(t)&&!d(t)?Pi(t)?q(e,null,[t]):q(e,t):q(e,null,t):(r>3?n=Array.prototype.slice.call(arguments,2):r===3&&Pi(n)&&(n=[n]),q(e,t,n))}finally{ji(1)}}function _a(e,t){let n=e.memo;if(n.length!=t.length)return!1;for(let e=0;e<n.length;e++)if(k(n[e],t[e]))return!1;return Ai>0&&U&&U.push(e),!0}var va=`3.5.25`,ya=void 0,ba=typeof window<`u`&&window.trustedTypes;if(ba)try{ya=ba.createPolicy(`vue`,{createHTML:e=>e})}catch{}var xa=ya?e=>ya.createHTML(e):e=>e,Sa=`http://www.w3.org/2000/svg`,Ca=`http://www.w3.org/1998/Math/MathML`,wa=typeof document<`u`?document:null,Ta=wa&&wa.createElement(`template`),Ea={insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{let t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,r)=>{let i=t===`svg`?wa.createElementNS(Sa,e):t===`mathml`?wa.createElementNS(Ca,e):n?wa.createElement(e,{is:n}):wa.createElement(e);return e===`select`&&r&&r.multiple!=null&&i.setAttribute(`multiple`,r.multiple),i},createText:e=>wa.createTextNode(e),createComment:e=>wa.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>wa.querySelector(e),setScopeId(e,t){e.setAttribute(t,``)},insertStaticContent(e,t,n,r,i,a){let o=n?n.previousSibling:t.lastChild;if(i&&(i===a||i.nextSibling))for(;t.insertBefore(i.cloneNode(!0),n),!(i===a||!(i=i.nextSibling)););else{Ta.innerHTML=xa(r===`svg`?`<svg>${e}</svg>`:r===`mathml`?`<math>${e}</math>`:e);let i=Ta.content;if(r===`svg`||r===`mathml`){let e=i.firstChild;for(;e.firstChild;)i.appendChild(e.firstChild);i.removeChild(e)}t.insertBefore(i,n)}return[o?o.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}},Da=Symbol(`_vtc`);function Oa(e,t,n){let r=e[Da];r&&(t=(t?[t,...r]:[...r]).join(` `)),t==null?e.removeAttribute(`class`):n?e.setAttribute(`class`,t):e.className=t}var ka=Symbol(`_vod`),Aa=Symbol(`_vsh`),ja=Symbol(``),Ma=/(?:^|;)\s*display\s*:/;function Na(e,t,n){let r=e.style,i=g(n),a=!1;if(n&&!i){if(t)if(g(t))for(let e of t.split(`;`)){let t=e.slice(0,e.indexOf(`:`)).trim();n[t]??Fa(r,t,``)}else for(let e in t)n[e]??Fa(r,e,``);for(let e in n)e===`display`&&(a=!0),Fa(r,e,n[e])}else if(i){if(t!==n){let e=r[ja];e&&(n+=`;`+e),r.cssText=n,a=Ma.test(n)}}else t&&e.removeAttribute(`style`);ka in e&&(e[ka]=a?r.display:``,e[Aa]&&(r.display=`none`))}var Pa=/\s*!important$/;function Fa(e,t,n){if(d(n))n.forEach(n=>Fa(e,t,n));else if(n??=``,t.startsWith(`--`))e.setProperty(t,n);else{let r=Ra(e,t);Pa.test(n)?e.setProperty(D(r),n.replace(Pa,``),`important`):e[r]=n}}var Ia=[`Webkit`,`Moz`,`ms`],La={};function Ra(e,t){let n=La[t];if(n)return n;let r=E(t);if(r!==`filter`&&r in e)return La[t]=r;r=O(r);for(let n=0;n<Ia.length;n++){let i=Ia[n]+r;if(i in e)return La[t]=i}return t}var za=`http://www.w3.org/1999/xlink`;function Ba(e,t,n,r,i,a=pe(t)){r&&t.startsWith(`xlink:`)?n==null?e.removeAttributeNS(za,t.slice(6,t.length)):e.setAttributeNS(za,t,n):n==null||a&&!me(n)?e.removeAttribute(t):e.setAttribute(t,a?``:_(n)?String(n):n)}function Va(e,t,n,r,i){if(t===`innerHTML`||t===`textContent`){n!=null&&(e[t]=t===`innerHTML`?xa(n):n);return}let a=e.tagName;if(t===`value`&&a!==`PROGRESS`&&!a.includes(`-`)){let r=a===`OPTION`?e.getAttribute(`value`)||``:e.value,i=n==null?e.type===`checkbox`?`on`:``:String(n);(r!==i||!(`_value`in e))&&(e.value=i),n??e.removeAttribute(t),e._value=n;return}let o=!1;if(n===``||n==null){let r=typeof e[t];r===`boolean`?n=me(n):n==null&&r===`string`?(n=``,o=!0):r===`number`&&(n=0,o=!0)}try{e[t]=n}catch{}o&&e.removeAttribute(i||t)}function Ha(e,t,n,r){e.addEventListener(t,n,r)}function Ua(e,t,n,r){e.removeEventListener(t,n,r)}var Wa=Symbol(`_vei`);function Ga(e,t,n,r,i=null){let a=e[Wa]||(e[Wa]={}),o=a[t];if(r&&o)o.value=r;else{let[n,s]=qa(t);r?Ha(e,n,a[t]=Za(r,i),s):o&&(Ua(e,n,o,s),a[t]=void 0)}}var Ka=/(?:Once|Passive|Capture)$/;function qa(e){let t;if(Ka.test(e)){t={};let n;for(;n=e.match(Ka);)e=e.slice(0,e.length-n[0].length),t[n[0].toLowerCase()]=!0}return[e[2]===`:`?e.slice(3):D(e.slice(2)),t]}var Ja=0,Ya=Promise.resolve(),Xa=()=>Ja||=(Ya.then(()=>Ja=0),Date.now());function Za(e,t){let n=e=>{if(!e._vts)e._vts=Date.now();else if(e._vts<=n.attached)return;rn(Qa(e,n.value),t,5,[e])};return n.value=e,n.attached=Xa(),n}function Qa(e,t){if(d(t)){let n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(e=>t=>!t._stopped&&e&&e(t))}else return t}var $a=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)>96&&e.charCodeAt(2)<123,eo=(e,t,n,r,i,s)=>{let c=i===`svg`;t===`class`?Oa(e,r,c):t===`style`?Na(e,n,r):a(t)?o(t)||Ga(e,t,n,r,s):(t[0]===`.`?(t=t.slice(1),!0):t[0]===`^`?(t=t.slice(1),!1):to(e,t,r,c))?(Va(e,t,r),!e.tagName.includes(`-`)&&(t===`value`||t===`checked`||t===`selected`)&&Ba(e,t,r,c,s,t!==`value`)):e._isVueCE&&(/[A-Z]/.test(t)||!g(r))?Va(e,E(t),r,s,t):(t===`true-value`?e._trueValue=r:t===`false-value`&&(e._falseValue=r),Ba(e,t,r,c))};function to(e,t,n,r){if(r)return!!(t===`innerHTML`||t===`textContent`||t in e&&$a(t)&&h(n));if(t===`spellcheck`||t===`draggable`||t===`translate`||t===`autocorrect`||t===`sandbox`&&e.tagName===`IFRAME`||t===`form`||t===`list`&&e.tagName===`INPUT`||t===`type`&&e.tagName===`TEXTAREA`)return!1;if(t===`width`||t===`height`){let t=e.tagName;if(t===`IMG`||t===`VIDEO`||t===`CANVAS`||t===`SOURCE`)return!1}return $a(t)&&g(n)?!1:t in e}var no=e=>{let t=e.props[`onUpdate:modelValue`]||!1;return d(t)?e=>ie(t,e):t};function ro(e){e.target.composing=!0}function io(e){let t=e.target;t.composing&&(t.composing=!1,t.dispatchEvent(new Event(`input`)))}var ao=Symbol(`_assign`);function oo(e,t,n){return t&&(e=e.trim()),n&&(e=ae(e)),e}var so={created(e,{modifiers:{lazy:t,trim:n,number:r}},i){e[ao]=no(i);let a=r||i.props&&i.props.type===`number`;Ha(e,t?`change`:`input`,t=>{t.target.composing||e[ao](oo(e.value,n,a))}),(n||a)&&Ha(e,`change`,()=>{e.value=oo(e.value,n,a)}),t||(Ha(e,`compositionstart`,ro),Ha(e,`compositionend`,io),Ha(e,`change`,io))},mounted(e,{value:t}){e.value=t??``},beforeUpdate(e,{value:t,oldValue:n,modifiers:{lazy:r,trim:i,number:a}},o){if(e[ao]=no(o),e.composing)return;let s=(a||e.type===`number`)&&!/^0\d/.test(e.value)?ae(e.value):e.value,c=t??``;s!==c&&(document.activeElement===e&&e.type!==`range`&&(r&&t===n||i&&e.value.trim()===c)||(e.value=c))}},co={deep:!0,created(e,{value:t,modifiers:{number:n}},r){let i=p(t);Ha(e,`change`,()=>{let t=Array.prototype.filter.call(e.options,e=>e.selected).map(e=>n?ae(uo(e)):uo(e));e[ao](e.multiple?i?new Set(t):t:t[0]),e._assigning=!0,pn(()=>{e._assigning=!1})}),e[ao]=no(r)},mounted(e,{value:t}){lo(e,t)},beforeUpdate(e,t,n){e[ao]=no(n)},updated(e,{value:t}){e._assigning||lo(e,t)}};function lo(e,t){let n=e.multiple,r=d(t);if(!(n&&!r&&!p(t))){for(let i=0,a=e.options.length;i<a;i++){let a=e.options[i],o=uo(a);if(n)if(r){let e=typeof o;e===`string`||e===`number`?a.selected=t.some(e=>String(e)===String(o)):a.selected=_e(t,o)>-1}else a.selected=t.has(o);else if(ge(uo(a),t)){e.selectedIndex!==i&&(e.selectedIndex=i);return}}!n&&e.selectedIndex!==-1&&(e.selectedIndex=-1)}}function uo(e){return`_value`in e?e._value:e.value}var fo=[`ctrl`,`shift`,`alt`,`meta`],po={stop:e=>e.stopPropagation(),prevent:e=>e.preventDefault(),self:e=>e.target!==e.currentTarget,ctrl:e=>!e.ctrlKey,shift:e=>!e.shiftKey,alt:e=>!e.altKey,meta:e=>!e.metaKey,left:e=>`button`in e&&e.button!==0,middle:e=>`button`in e&&e.button!==1,right:e=>`button`in e&&e.button!==2,exact:(e,t)=>fo.some(n=>e[`${n}Key`]&&!t.includes(n))},mo=(e,t)=>{let n=e._withMods||={},r=t.join(`.`);return n[r]||(n[r]=((n,...r)=>{for(let e=0;e<t.length;e++){let r=po[t[e]];if(r&&r(n,t))return}return e(n,...r)}))},ho={esc:`escape`,space:` `,up:`arrow-up`,left:`arrow-left`,right:`arrow-right`,down:`arrow-down`,delete:`backspace`},go=(e,t)=>{let n=e._withKeys||={},r=t.join(`.`);return n[r]||(n[r]=(n=>{if(!(`key`in n))return;let r=D(n.key);if(t.some(e=>e===r||ho[e]===r))return e(n)}))},_o=s({patchProp:eo},Ea),vo;function yo(){return vo||=mi(_o)}var bo=((...e)=>{let t=yo().createApp(...e),{mount:n}=t;return t.mount=e=>{let r=So(e);if(!r)return;let i=t._component;!h(i)&&!i.render&&!i.template&&(i.template=r.innerHTML),r.nodeType===1&&(r.textContent=``);let a=n(r,!1,xo(r));return r instanceof Element&&(r.removeAttribute(`v-cloak`),r.setAttribute(`data-v-app`,``)),a},t});function xo(e){if(e instanceof SVGElement)return`svg`;if(typeof MathMLElement==`function`&&e instanceof MathMLElement)return`mathml`}function So(e){return g(e)?document.querySelector(e):e}var Co={class:`app`},wo={class:`main`},To=Mn({__name:`App`,setup(e){return(e,t)=>{let n=nr(`router-view`);return W(),G(`div`,Co,[t[0]||=Hi(`<header class="header"><div class="header-right"><a href="https://github.com/Sheyiyuan/ShyeriMeme" target="_blank" class="github-link"><svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="currentColor"><path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"></path></svg></a></div></header>`,1),K(`main`,wo,[q(n)]),t[1]||=K(`footer`,{class:`footer`},[K(`p`,null,[K(`a`,{href:`https://github.com/Sheyiyuan/ShyeriMeme`},`Sheyiyuan - 橘雪莉表情包生成器`)])],-1)])}}}),Eo=typeof document<`u`;function Do(e){return typeof e==`object`||`displayName`in e||`props`in e||`__vccOpts`in e}function Oo(e){return e.__esModule||e[Symbol.toStringTag]===`Module`||e.default&&Do(e.default)}var X=Object.assign;function ko(e,t){let n={};for(let r in t){let i=t[r];n[r]=jo(i)?i.map(e):e(i)}return n}var Ao=()=>{},jo=Array.isArray;function Mo(e,t){let n={};for(let r in e)n[r]=r in t?t[r]:e[r];return n}var No=/#/g,Po=/&/g,Fo=/\//g,Io=/=/g,Lo=/\?/g,Ro=/\+/g,zo=/%5B/g,Bo=/%5D/g,Vo=/%5E/g,Ho=/%60/g,Uo=/%7B/g,Wo=/%7C/g,Go=/%7D/g,Ko=/%20/g;function qo(e){return e==null?``:encodeURI(``+e).replace(Wo,`|`).replace(zo,`[`).replace(Bo,`]`)}function Jo(e){return qo(e).replace(Uo,`{`).replace(Go,`}`).replace(Vo,`^`)}function Yo(e){return qo(e).replace(Ro,`%2B`).replace(Ko,`+`).replace(No,`%23`).replace(Po,`%26`).replace(Ho,"`").replace(Uo,`{`).replace(Go,`}`).replace(Vo,`^`)}function Xo(e){return Yo(e).replace(Io,`%3D`)}function Zo(e){return qo(e).replace(No,`%23`).replace(Lo,`%3F`)}function Qo(e){return Zo(e).replace(Fo,`%2F`)}function $o(e){if(e==null)return null;try{return decodeURIComponent(``+e)}catch{}return``+e}var es=/\/$/,ts=e=>e.replace(es,``);function ns(e,t,n=`/`){let r,i={},a=``,o=``,s=t.indexOf(`#`),c=t.indexOf(`?`);return c=s>=0&&c>s?-1:c,c>=0&&(r=t.slice(0,c),a=t.slice(c,s>0?s:t.length),i=e(a.slice(1))),s>=0&&(r||=t.slice(0,s),o=t.slice(s,t.length)),r=us(r??t,n),{fullPath:r+a+o,path:r,query:i,hash:$o(o)}}function rs(e,t){let n=t.query?e(t.query):``;return t.path+(n&&`?`)+n+(t.hash||``)}function is(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||`/`}function as(e,t,n){let r=t.matched.length-1,i=n.matched.length-1;return r>-1&&r===i&&os(t.matched[r],n.matched[i])&&ss(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function os(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function ss(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(let n in e)if(!cs(e[n],t[n]))return!1;return!0}function cs(e,t){return jo(e)?ls(e,t):jo(t)?ls(t,e):e===t}function ls(e,t){return jo(t)?e.length===t.length&&e.every((e,n)=>e===t[n]):e.length===1&&e[0]===t}function us(e,t){if(e.startsWith(`/`))return e;if(!e)return t;let n=t.split(`/`),r=e.split(`/`),i=r[r.length-1];(i===`..`||i===`.`)&&r.push(``);let a=n.length-1,o,s;for(o=0;o<r.length;o++)if(s=r[o],s!==`.`)if(s===`..`)a>1&&a--;else break;return n.slice(0,a).join(`/`)+`/`+r.slice(o).join(`/`)}var ds={path:`/`,name:void 0,params:{},query:{},hash:``,fullPath:`/`,matched:[],meta:{},redirectedFrom:void 0},fs=function(e){return e.pop=`pop`,e.push=`push`,e}({}),ps=function(e){return e.back=`back`,e.forward=`forward`,e.unknown=``,e}({});function ms(e){if(!e)if(Eo){let t=document.querySelector(`base`);e=t&&t.getAttribute(`href`)||`/`,e=e.replace(/^\w+:\/\/[^\/]+/,``)}else e=`/`;return e[0]!==`/`&&e[0]!==`#`&&(e=`/`+e),ts(e)}var hs=/^[^#]+#/;function gs(e,t){return e.replace(hs,`#`)+t}function _s(e,t){let n=document.documentElement.getBoundingClientRect(),r=e.getBoundingClientRect();return{behavior:t.behavior,left:r.left-n.left-(t.left||0),top:r.top-n.top-(t.top||0)}}var vs=()=>({left:window.scrollX,top:window.scrollY});function ys(e){let t;if(`el`in e){let n=e.el,r=typeof n==`string`&&n.startsWith(`#`),i=typeof n==`string`?r?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!i)return;t=_s(i,e)}else t=e;`scrollBehavior`in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left==null?window.scrollX:t.left,t.top==null?window.scrollY:t.top)}function bs(e,t){return(history.state?history.state.position-t:-1)+e}var xs=new Map;function Ss(e,t){xs.set(e,t)}function Cs(e){let t=xs.get(e);return xs.delete(e),t}function ws(e){return typeof e==`string`||e&&typeof e==`object`}function Ts(e){return typeof e==`string`||typeof e==`symbol`}var Z=function(e){return e[e.MATCHER_NOT_FOUND=1]=`MATCHER_NOT_FOUND`,e[e.NAVIGATION_GUARD_REDIRECT=2]=`NAVIGATION_GUARD_REDIRECT`,e[e.NAVIGATION_ABORTED=4]=`NAVIGATION_ABORTED`,e[e.NAVIGATION_CANCELLED=8]=`NAVIGATION_CANCELLED`,e[e.NAVIGATION_DUPLICATED=16]=`NAVIGATION_DUPLICATED`,e}({}),Es=Symbol(``);Z.MATCHER_NOT_FOUND,Z.NAVIGATION_GUARD_REDIRECT,Z.NAVIGATION_ABORTED,Z.NAVIGATION_CANCELLED,Z.NAVIGATION_DUPLICATED;function Ds(e,t){return X(Error(),{type:e,[Es]:!0},t)}function Os(e,t){return e instanceof Error&&Es in e&&(t==null||!!(e.type&t))}function ks(e){let t={};if(e===``||e===`?`)return t;let n=(e[0]===`?`?e.slice(1):e).split(`&`);for(let e=0;e<n.length;++e){let r=n[e].replace(Ro,` `),i=r.indexOf(`=`),a=$o(i<0?r:r.slice(0,i)),o=i<0?null:$o(r.slice(i+1));if(a in t){let e=t[a];jo(e)||(e=t[a]=[e]),e.push(o)}else t[a]=o}return t}function As(e){let t=``;for(let n in e){let r=e[n];if(n=Xo(n),r==null){r!==void 0&&(t+=(t.length?`&`:``)+n);continue}(jo(r)?r.map(e=>e&&Yo(e)):[r&&Yo(r)]).forEach(e=>{e!==void 0&&(t+=(t.length?`&`:``)+n,e!=null&&(t+=`=`+e))})}return t}function js(e){let t={};for(let n in e){let r=e[n];r!==void 0&&(t[n]=jo(r)?r.map(e=>e==null?null:``+e):r==null?r:``+r)}return t}var Ms=Symbol(``),Ns=Symbol(``),Ps=Symbol(``),Fs=Symbol(``),Is=Symbol(``);function Ls(){let e=[];function t(t){return e.push(t),()=>{let n=e.indexOf(t);n>-1&&e.splice(n,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Rs(e,t,n,r,i,a=e=>e()){let o=r&&(r.enterCallbacks[i]=r.enterCallbacks[i]||[]);return()=>new Promise((s,c)=>{let l=e=>{e===!1?c(Ds(Z.NAVIGATION_ABORTED,{from:n,to:t})):e instanceof Error?c(e):ws(e)?c(Ds(Z.NAVIGATION_GUARD_REDIRECT,{from:t,to:e})):(o&&r.enterCallbacks[i]===o&&typeof e==`function`&&o.push(e),s())},u=a(()=>e.call(r&&r.instances[i],t,n,l)),d=Promise.resolve(u);e.length<3&&(d=d.then(l)),d.catch(e=>c(e))})}function zs(e,t,n,r,i=e=>e()){let a=[];for(let o of e)for(let e in o.components){let s=o.components[e];if(!(t!==`beforeRouteEnter`&&!o.instances[e]))if(Do(s)){let c=(s.__vccOpts||s)[t];c&&a.push(Rs(c,n,r,o,e,i))}else{let c=s();a.push(()=>c.then(a=>{if(!a)throw Error(`Couldn't resolve component "${e}" at "${o.path}"`);let s=Oo(a)?a.default:a;o.mods[e]=a,o.components[e]=s;let c=(s.__vccOpts||s)[t];return c&&Rs(c,n,r,o,e,i)()}))}}return a}function Bs(e,t){let n=[],r=[],i=[],a=Math.max(t.matched.length,e.matched.length);for(let o=0;o<a;o++){let a=t.matched[o];a&&(e.matched.find(e=>os(e,a))?r.push(a):n.push(a));let s=e.matched[o];s&&(t.matched.find(e=>os(e,s))||i.push(s))}return[n,r,i]}var Vs=()=>location.protocol+`//`+location.host;function Hs(e,t){let{pathname:n,search:r,hash:i}=t,a=e.indexOf(`#`);if(a>-1){let t=i.includes(e.slice(a))?e.slice(a).length:1,n=i.slice(t);return n[0]!==`/`&&(n=`/`+n),is(n,``)}return is(n,e)+r+i}function Us(e,t,n,r){let i=[],a=[],o=null,s=({state:a})=>{let s=Hs(e,location),c=n.value,l=t.value,u=0;if(a){if(n.value=s,t.value=a,o&&o===c){o=null;return}u=l?a.position-l.position:0}else r(s);i.forEach(e=>{e(n.value,c,{delta:u,type:fs.pop,direction:u?u>0?ps.forward:ps.back:ps.unknown})})};function c(){o=n.value}function l(e){i.push(e);let t=()=>{let t=i.indexOf(e);t>-1&&i.splice(t,1)};return a.push(t),t}function u(){if(document.visibilityState===`hidden`){let{history:e}=window;if(!e.state)return;e.replaceState(X({},e.state,{scroll:vs()}),``)}}function d(){for(let e of a)e();a=[],window.removeEventListener(`popstate`,s),window.removeEventListener(`pagehide`,u),document.removeEventListener(`visibilitychange`,u)}return window.addEventListener(`popstate`,s),window.addEventListener(`pagehide`,u),document.addEventListener(`visibilitychange`,u),{pauseListeners:c,listen:l,destroy:d}}function Ws(e,t,n,r=!1,i=!1){return{back:e,current:t,forward:n,replaced:r,position:window.history.length,scroll:i?vs():null}}function Gs(e){let{history:t,location:n}=window,r={value:Hs(e,n)},i={value:t.state};i.value||a(r.value,{back:null,current:r.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function a(r,a,o){let s=e.indexOf(`#`),c=s>-1?(n.host&&document.querySelector(`base`)?e:e.slice(s))+r:Vs()+e+r;try{t[o?`replaceState`:`pushState`](a,``,c),i.value=a}catch(e){console.error(e),n[o?`replace`:`assign`](c)}}function o(e,n){a(e,X({},t.state,Ws(i.value.back,e,i.value.forward,!0),n,{position:i.value.position}),!0),r.value=e}function s(e,n){let o=X({},i.value,t.state,{forward:e,scroll:vs()});a(o.current,o,!0),a(e,X({},Ws(r.value,e,null),{position:o.position+1},n),!1),r.value=e}return{location:r,state:i,push:s,replace:o}}function Ks(e){e=ms(e);let t=Gs(e),n=Us(e,t.state,t.location,t.replace);function r(e,t=!0){t||n.pauseListeners(),history.go(e)}let i=X({location:``,base:e,go:r,createHref:gs.bind(null,e)},t,n);return Object.defineProperty(i,`location`,{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(i,`state`,{enumerable:!0,get:()=>t.state.value}),i}var qs=function(e){return e[e.Static=0]=`Static`,e[e.Param=1]=`Param`,e[e.Group=2]=`Group`,e}({}),Q=function(e){return e[e.Static=0]=`Static`,e[e.Param=1]=`Param`,e[e.ParamRegExp=2]=`ParamRegExp`,e[e.ParamRegExpEnd=3]=`ParamRegExpEnd`,e[e.EscapeNext=4]=`EscapeNext`,e}(Q||{}),Js={type:qs.Static,value:``},Ys=/[a-zA-Z0-9_]/;function Xs(e){if(!e)return[[]];if(e===`/`)return[[Js]];if(!e.startsWith(`/`))throw Error(`Invalid path "${e}"`);function t(e){throw Error(`ERR (${n})/"${l}": ${e}`)}let n=Q.Static,r=n,i=[],a;function o(){a&&i.push(a),a=[]}let s=0,c,l=``,u=``;function d(){l&&=(n===Q.Static?a.push({type:qs.Static,value:l}):n===Q.Param||n===Q.ParamRegExp||n===Q.ParamRegExpEnd?(a.length>1&&(c===`*`||c===`+`)&&t(`A repeatable param (${l}) must be alone in its segment. eg: '/:ids+.`),a.push({type:qs.Param,value:l,regexp:u,repeatable:c===`*`||c===`+`,optional:c===`*`||c===`?`})):t(`Invalid state to consume buffer`),``)}function f(){l+=c}for(;s<e.length;){if(c=e[s++],c===`\\`&&n!==Q.ParamRegExp){r=n,n=Q.EscapeNext;continue}switch(n){case Q.Static:c===`/`?(l&&d(),o()):c===`:`?(d(),n=Q.Param):f();break;case Q.EscapeNext:f(),n=r;break;case Q.Param:c===`(`?n=Q.ParamRegExp:Ys.test(c)?f():(d(),n=Q.Static,c!==`*`&&c!==`?`&&c!==`+`&&s--);break;case Q.ParamRegExp:c===`)`?u[u.length-1]==`\\`?u=u.slice(0,-1)+c:n=Q.ParamRegExpEnd:u+=c;break;case Q.ParamRegExpEnd:d(),n=Q.Static,c!==`*`&&c!==`?`&&c!==`+`&&s--,u=``;break;default:t(`Unknown state`);break}}return n===Q.ParamRegExp&&t(`Unfinished custom RegExp for param "${l}"`),d(),o(),i}var Zs=`[^/]+?`,Qs={sensitive:!1,strict:!1,start:!0,end:!0},$=function(e){return e[e._multiplier=10]=`_multiplier`,e[e.Root=90]=`Root`,e[e.Segment=40]=`Segment`,e[e.SubSegment=30]=`SubSegment`,e[e.Static=40]=`Static`,e[e.Dynamic=20]=`Dynamic`,e[e.BonusCustomRegExp=10]=`BonusCustomRegExp`,e[e.BonusWildcard=-50]=`BonusWildcard`,e[e.BonusRepeatable=-20]=`BonusRepeatable`,e[e.BonusOptional=-8]=`BonusOptional`,e[e.BonusStrict=.7000000000000001]=`BonusStrict`,e[e.BonusCaseSensitive=.25]=`BonusCaseSensitive`,e}($||{}),$s=/[.+*?^${}()[\]/\\]/g;function ec(e,t){let n=X({},Qs,t),r=[],i=n.start?`^`:``,a=[];for(let t of e){let e=t.length?[]:[$.Root];n.strict&&!t.length&&(i+=`/`);for(let r=0;r<t.length;r++){let o=t[r],s=$.Segment+(n.sensitive?$.BonusCaseSensitive:0);if(o.type===qs.Static)r||(i+=`/`),i+=o.value.replace($s,`\\$&`),s+=$.Static;else if(o.type===qs.Param){let{value:e,repeatable:n,optional:c,regexp:l}=o;a.push({name:e,repeatable:n,optional:c});let u=l||Zs;if(u!==Zs){s+=$.BonusCustomRegExp;try{`${u}`}catch(t){throw Error(`Invalid custom RegExp for param "${e}" (${u}): `+t.message)}}let d=n?`((?:${u})(?:/(?:${u}))*)`:`(${u})`;r||(d=c&&t.length<2?`(?:/${d})`:`/`+d),c&&(d+=`?`),i+=d,s+=$.Dynamic,c&&(s+=$.BonusOptional),n&&(s+=$.BonusRepeatable),u===`.*`&&(s+=$.BonusWildcard)}e.push(s)}r.push(e)}if(n.strict&&n.end){let e=r.length-1;r[e][r[e].length-1]+=$.BonusStrict}n.strict||(i+=`/?`),n.end?i+=`$`:n.strict&&!i.endsWith(`/`)&&(i+=`(?:/|$)`);let o=new RegExp(i,n.sensitive?``:`i`);function s(e){let t=e.match(o),n={};if(!t)return null;for(let e=1;e<t.length;e++){let r=t[e]||``,i=a[e-1];n[i.name]=r&&i.repeatable?r.split(`/`):r}return n}function c(t){let n=``,r=!1;for(let i of e){(!r||!n.endsWith(`/`))&&(n+=`/`),r=!1;for(let e of i)if(e.type===qs.Static)n+=e.value;else if(e.type===qs.Param){let{value:a,repeatable:o,optional:s}=e,c=a in t?t[a]:``;if(jo(c)&&!o)throw Error(`Provided param "${a}" is an array but it is not repeatable (* or + modifiers)`);let l=jo(c)?c.join(`/`):c;if(!l)if(s)i.length<2&&(n.endsWith(`/`)?n=n.slice(0,-1):r=!0);else throw Error(`Missing required param "${a}"`);n+=l}}return n||`/`}return{re:o,score:r,keys:a,parse:s,stringify:c}}function tc(e,t){let n=0;for(;n<e.length&&n<t.length;){let r=t[n]-e[n];if(r)return r;n++}return e.length<t.length?e.length===1&&e[0]===$.Static+$.Segment?-1:1:e.length>t.length?t.length===1&&t[0]===$.Static+$.Segment?1:-1:0}function nc(e,t){let n=0,r=e.score,i=t.score;for(;n<r.length&&n<i.length;){let e=tc(r[n],i[n]);if(e)return e;n++}if(Math.abs(i.length-r.length)===1){if(rc(r))return 1;if(rc(i))return-1}return i.length-r.length}function rc(e){let t=e[e.length-1];return e.length>0&&t[t.length-1]<0}var ic={strict:!1,end:!0,sensitive:!1};function ac(e,t,n){let r=X(ec(Xs(e.path),n),{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function oc(e,t){let n=[],r=new Map;t=Mo(ic,t);function i(e){return r.get(e)}function a(e,n,r){let i=!r,s=cc(e);s.aliasOf=r&&r.record;let l=Mo(t,e),u=[s];if(`alias`in e){let t=typeof e.alias==`string`?[e.alias]:e.alias;for(let e of t)u.push(cc(X({},s,{components:r?r.record.components:s.components,path:e,aliasOf:r?r.record:s})))}let d,f;for(let t of u){let{path:u}=t;if(n&&u[0]!==`/`){let e=n.record.path,r=e[e.length-1]===`/`?``:`/`;t.path=n.record.path+(u&&r+u)}if(d=ac(t,n,l),r?r.alias.push(d):(f||=d,f!==d&&f.alias.push(d),i&&e.name&&!uc(d)&&o(e.name)),mc(d)&&c(d),s.children){let e=s.children;for(let t=0;t<e.length;t++)a(e[t],d,r&&r.children[t])}r||=d}return f?()=>{o(f)}:Ao}function o(e){if(Ts(e)){let t=r.get(e);t&&(r.delete(e),n.splice(n.indexOf(t),1),t.children.forEach(o),t.alias.forEach(o))}else{let t=n.indexOf(e);t>-1&&(n.splice(t,1),e.record.name&&r.delete(e.record.name),e.children.forEach(o),e.alias.forEach(o))}}function s(){return n}function c(e){let t=fc(e,n);n.splice(t,0,e),e.record.name&&!uc(e)&&r.set(e.record.name,e)}function l(e,t){let i,a={},o,s;if(`name`in e&&e.name){if(i=r.get(e.name),!i)throw Ds(Z.MATCHER_NOT_FOUND,{location:e});s=i.record.name,a=X(sc(t.params,i.keys.filter(e=>!e.optional).concat(i.parent?i.parent.keys.filter(e=>e.optional):[]).map(e=>e.name)),e.params&&sc(e.params,i.keys.map(e=>e.name))),o=i.stringify(a)}else if(e.path!=null)o=e.path,i=n.find(e=>e.re.test(o)),i&&(a=i.parse(o),s=i.record.name);else{if(i=t.name?r.get(t.name):n.find(e=>e.re.test(t.path)),!i)throw Ds(Z.MATCHER_NOT_FOUND,{location:e,currentLocation:t});s=i.record.name,a=X({},t.params,e.params),o=i.stringify(a)}let c=[],l=i;for(;l;)c.unshift(l.record),l=l.parent;return{name:s,path:o,params:a,matched:c,meta:dc(c)}}e.forEach(e=>a(e));function u(){n.length=0,r.clear()}return{addRoute:a,resolve:l,removeRoute:o,clearRoutes:u,getRoutes:s,getRecordMatcher:i}}function sc(e,t){let n={};for(let r of t)r in e&&(n[r]=e[r]);return n}function cc(e){let t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:lc(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:`components`in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,`mods`,{value:{}}),t}function lc(e){let t={},n=e.props||!1;if(`component`in e)t.default=n;else for(let r in e.components)t[r]=typeof n==`object`?n[r]:n;return t}function uc(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function dc(e){return e.reduce((e,t)=>X(e,t.meta),{})}function fc(e,t){let n=0,r=t.length;for(;n!==r;){let i=n+r>>1;nc(e,t[i])<0?r=i:n=i+1}let i=pc(e);return i&&(r=t.lastIndexOf(i,r-1)),r}function pc(e){let t=e;for(;t=t.parent;)if(mc(t)&&nc(e,t)===0)return t}function mc({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function hc(e){let t=jr(Ps),n=jr(Fs),r=ha(()=>{let n=Gt(e.to);return t.resolve(n)}),i=ha(()=>{let{matched:e}=r.value,{length:t}=e,i=e[t-1],a=n.matched;if(!i||!a.length)return-1;let o=a.findIndex(os.bind(null,i));if(o>-1)return o;let s=bc(e[t-2]);return t>1&&bc(i)===s&&a[a.length-1].path!==s?a.findIndex(os.bind(null,e[t-2])):o}),a=ha(()=>i.value>-1&&yc(n.params,r.value.params)),o=ha(()=>i.value>-1&&i.value===n.matched.length-1&&ss(n.params,r.value.params));function s(n={}){if(vc(n)){let n=t[Gt(e.replace)?`replace`:`push`](Gt(e.to)).catch(Ao);return e.viewTransition&&typeof document<`u`&&`startViewTransition`in document&&document.startViewTransition(()=>n),n}return Promise.resolve()}return{route:r,href:ha(()=>r.value.href),isActive:a,isExactActive:o,navigate:s}}function gc(e){return e.length===1?e[0]:e}var _c=Mn({name:`RouterLink`,compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:`page`},viewTransition:Boolean},useLink:hc,setup(e,{slots:t}){let n=jt(hc(e)),{options:r}=jr(Ps),i=ha(()=>({[xc(e.activeClass,r.linkActiveClass,`router-link-active`)]:n.isActive,[xc(e.exactActiveClass,r.linkExactActiveClass,`router-link-exact-active`)]:n.isExactActive}));return()=>{let r=t.default&&gc(t.default(n));return e.custom?r:ga(`a`,{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:i.value},r)}}});function vc(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){let t=e.currentTarget.getAttribute(`target`);if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function yc(e,t){for(let n in t){let r=t[n],i=e[n];if(typeof r==`string`){if(r!==i)return!1}else if(!jo(i)||i.length!==r.length||r.some((e,t)=>e!==i[t]))return!1}return!0}function bc(e){return e?e.aliasOf?e.aliasOf.path:e.path:``}var xc=(e,t,n)=>e??t??n,Sc=Mn({name:`RouterView`,inheritAttrs:!1,props:{name:{type:String,default:`default`},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){let r=jr(Is),i=ha(()=>e.route||r.value),a=jr(Ns,0),o=ha(()=>{let e=Gt(a),{matched:t}=i.value,n;for(;(n=t[e])&&!n.components;)e++;return e}),s=ha(()=>i.value.matched[o.value]);Ar(Ns,ha(()=>o.value+1)),Ar(Ms,s),Ar(Is,i);let c=z();return Pr(()=>[c.value,s.value,e.name],([e,t,n],[r,i,a])=>{t&&(t.instances[n]=e,i&&i!==t&&e&&e===r&&(t.leaveGuards.size||(t.leaveGuards=i.leaveGuards),t.updateGuards.size||(t.updateGuards=i.updateGuards))),e&&t&&(!i||!os(t,i)||!r)&&(t.enterCallbacks[n]||[]).forEach(t=>t(e))},{flush:`post`}),()=>{let r=i.value,a=e.name,o=s.value,l=o&&o.components[a];if(!l)return Cc(n.default,{Component:l,route:r});let u=o.props[a],d=ga(l,X({},u?u===!0?r.params:typeof u==`function`?u(r):u:null,t,{onVnodeUnmounted:e=>{e.component.isUnmounted&&(o.instances[a]=null)},ref:c}));return Cc(n.default,{Component:d,route:r})||d}}});function Cc(e,t){if(!e)return null;let n=e(t);return n.length===1?n[0]:n}var wc=Sc;function Tc(e){let t=oc(e.routes,e),n=e.parseQuery||ks,r=e.stringifyQuery||As,i=e.history,a=Ls(),o=Ls(),s=Ls(),c=Ht(ds),l=ds;Eo&&e.scrollBehavior&&`scrollRestoration`in history&&(history.scrollRestoration=`manual`);let u=ko.bind(null,e=>``+e),d=ko.bind(null,Qo),f=ko.bind(null,$o);function p(e,n){let r,i;return Ts(e)?(r=t.getRecordMatcher(e),i=n):i=e,t.addRoute(i,r)}function m(e){let n=t.getRecordMatcher(e);n&&t.removeRoute(n)}function h(){return t.getRoutes().map(e=>e.record)}function g(e){return!!t.getRecordMatcher(e)}function _(e,a){if(a=X({},a||c.value),typeof e==`string`){let r=ns(n,e,a.path),o=t.resolve({path:r.path},a),s=i.createHref(r.fullPath);return X(r,o,{params:f(o.params),hash:$o(r.hash),redirectedFrom:void 0,href:s})}let o;if(e.path!=null)o=X({},e,{path:ns(n,e.path,a.path).path});else{let t=X({},e.params);for(let e in t)t[e]??delete t[e];o=X({},e,{params:d(t)}),a.params=d(a.params)}let s=t.resolve(o,a),l=e.hash||``;s.params=u(f(s.params));let p=rs(r,X({},e,{hash:Jo(l),path:s.path})),m=i.createHref(p);return X({fullPath:p,hash:l,query:r===As?js(e.query):e.query||{}},s,{redirectedFrom:void 0,href:m})}function v(e){return typeof e==`string`?ns(n,e,c.value.path):X({},e)}function y(e,t){if(l!==e)return Ds(Z.NAVIGATION_CANCELLED,{from:t,to:e})}function b(e){return C(e)}function x(e){return b(X(v(e),{replace:!0}))}function S(e,t){let n=e.matched[e.matched.length-1];if(n&&n.redirect){let{redirect:r}=n,i=typeof r==`function`?r(e,t):r;return typeof i==`string`&&(i=i.includes(`?`)||i.includes(`#`)?i=v(i):{path:i},i.params={}),X({query:e.query,hash:e.hash,params:i.path==null?e.params:{}},i)}}function C(e,t){let n=l=_(e),i=c.value,a=e.state,o=e.force,s=e.replace===!0,u=S(n,i);if(u)return C(X(v(u),{state:typeof u==`object`?X({},a,u.state):a,force:o,replace:s}),t||n);let d=n;d.redirectedFrom=t;let f;return!o&&as(r,i,n)&&(f=Ds(Z.NAVIGATION_DUPLICATED,{to:d,from:i}),oe(i,i,!0,!1)),(f?Promise.resolve(f):ee(d,i)).catch(e=>Os(e)?Os(e,Z.NAVIGATION_GUARD_REDIRECT)?e:ae(e):ie(e,d,i)).then(e=>{if(e){if(Os(e,Z.NAVIGATION_GUARD_REDIRECT))return C(X({replace:s},v(e.to),{state:typeof e.to==`object`?X({},a,e.to.state):a,force:o}),t||d)}else e=E(d,i,!0,s,a);return te(d,i,e),e})}function w(e,t){let n=y(e,t);return n?Promise.reject(n):Promise.resolve()}function T(e){let t=le.values().next().value;return t&&typeof t.runWithContext==`function`?t.runWithContext(e):e()}function ee(e,t){let n,[r,i,s]=Bs(e,t);n=zs(r.reverse(),`beforeRouteLeave`,e,t);for(let i of r)i.leaveGuards.forEach(r=>{n.push(Rs(r,e,t))});let c=w.bind(null,e,t);return n.push(c),j(n).then(()=>{n=[];for(let r of a.list())n.push(Rs(r,e,t));return n.push(c),j(n)}).then(()=>{n=zs(i,`beforeRouteUpdate`,e,t);for(let r of i)r.updateGuards.forEach(r=>{n.push(Rs(r,e,t))});return n.push(c),j(n)}).then(()=>{n=[];for(let r of s)if(r.beforeEnter)if(jo(r.beforeEnter))for(let i of r.beforeEnter)n.push(Rs(i,e,t));else n.push(Rs(r.beforeEnter,e,t));return n.push(c),j(n)}).then(()=>(e.matched.forEach(e=>e.enterCallbacks={}),n=zs(s,`beforeRouteEnter`,e,t,T),n.push(c),j(n))).then(()=>{n=[];for(let r of o.list())n.push(Rs(r,e,t));return n.push(c),j(n)}).catch(e=>Os(e,Z.NAVIGATION_CANCELLED)?e:Promise.reject(e))}function te(e,t,n){s.list().forEach(r=>T(()=>r(e,t,n)))}function E(e,t,n,r,a){let o=y(e,t);if(o)return o;let s=t===ds,l=Eo?history.state:{};n&&(r||s?i.replace(e.fullPath,X({scroll:s&&l&&l.scroll},a)):i.push(e.fullPath,a)),c.value=e,oe(e,t,n,s),ae()}let ne;function D(){ne||=i.listen((e,t,n)=>{if(!ue.listening)return;let r=_(e),a=S(r,ue.currentRoute.value);if(a){C(X(a,{replace:!0,force:!0}),r).catch(Ao);return}l=r;let o=c.value;Eo&&Ss(bs(o.fullPath,n.delta),vs()),ee(r,o).catch(e=>Os(e,Z.NAVIGATION_ABORTED|Z.NAVIGATION_CANCELLED)?e:Os(e,Z.NAVIGATION_GUARD_REDIRECT)?(C(X(v(e.to),{force:!0}),r).then(e=>{Os(e,Z.NAVIGATION_ABORTED|Z.NAVIGATION_DUPLICATED)&&!n.delta&&n.type===fs.pop&&i.go(-1,!1)}).catch(Ao),Promise.reject()):(n.delta&&i.go(-n.delta,!1),ie(e,r,o))).then(e=>{e||=E(r,o,!1),e&&(n.delta&&!Os(e,Z.NAVIGATION_CANCELLED)?i.go(-n.delta,!1):n.type===fs.pop&&Os(e,Z.NAVIGATION_ABORTED|Z.NAVIGATION_DUPLICATED)&&i.go(-1,!1)),te(r,o,e)}).catch(Ao)})}let O=Ls(),re=Ls(),k;function ie(e,t,n){ae(e);let r=re.list();return r.length?r.forEach(r=>r(e,t,n)):console.error(e),Promise.reject(e)}function A(){return k&&c.value!==ds?Promise.resolve():new Promise((e,t)=>{O.add([e,t])})}function ae(e){return k||(k=!e,D(),O.list().forEach(([t,n])=>e?n(e):t()),O.reset()),e}function oe(t,n,r,i){let{scrollBehavior:a}=e;if(!Eo||!a)return Promise.resolve();let o=!r&&Cs(bs(t.fullPath,0))||(i||!r)&&history.state&&history.state.scroll||null;return pn().then(()=>a(t,n,o)).then(e=>e&&ys(e)).catch(e=>ie(e,t,n))}let se=e=>i.go(e),ce,le=new Set,ue={currentRoute:c,listening:!0,addRoute:p,removeRoute:m,clearRoutes:t.clearRoutes,hasRoute:g,getRoutes:h,resolve:_,options:e,push:b,replace:x,go:se,back:()=>se(-1),forward:()=>se(1),beforeEach:a.add,beforeResolve:o.add,afterEach:s.add,onError:re.add,isReady:A,install(e){e.component(`RouterLink`,_c),e.component(`RouterView`,wc),e.config.globalProperties.$router=ue,Object.defineProperty(e.config.globalProperties,`$route`,{enumerable:!0,get:()=>Gt(c)}),Eo&&!ce&&c.value===ds&&(ce=!0,b(i.location).catch(e=>{}));let t={};for(let e in ds)Object.defineProperty(t,e,{get:()=>c.value[e],enumerable:!0});e.provide(Ps,ue),e.provide(Fs,Mt(t)),e.provide(Is,c);let n=e.unmount;le.add(e),e.unmount=function(){le.delete(e),le.size<1&&(l=ds,ne&&ne(),ne=null,c.value=ds,ce=!1,k=!1),n()}}};function j(e){return e.reduce((e,t)=>e.then(()=>T(t)),Promise.resolve())}return ue}var Ec={class:`admin-container`},Dc={class:`modal-content`},Oc={key:0,class:`modal-description`},kc={key:1,class:`form-group`},Ac={key:2,class:`form-group`},jc={key:3,class:`form-group`},Mc={key:0,class:`error-message`},Nc={class:`modal-actions`},Pc=[`disabled`],Fc=[`disabled`],Ic={key:4,class:`error-message`},Lc={class:`modal-content`},Rc={class:`form-group`},zc={class:`form-group`},Bc={class:`form-group`},Vc={key:0,class:`error-message`},Hc={class:`modal-actions`},Uc=[`disabled`],Wc={key:3,class:`main-content`},Gc={class:`left-panel`},Kc={key:0,class:`loading`},qc={key:1,class:`config-section`},Jc={class:`form-group`},Yc={class:`form-item`},Xc={class:`form-item`},Zc={class:`port-input-container`},Qc={class:`form-group`},$c={class:`form-item`},el={class:`action-buttons`},tl=[`disabled`],nl={class:`right-panel`},rl={class:`logs-section`},il={class:`logs-header`},al={class:`logs-header-actions`},ol=[`disabled`],sl={class:`logs-filter`},cl={class:`filter-item`},ll={class:`filter-item`},ul={class:`filter-item`},dl={class:`filter-stats`},fl={class:`logs-container`},pl={key:0,class:`loading`},ml={class:`log-timestamp`},hl={class:`log-level`},gl={class:`log-content`},_l={key:0,class:`loading-more`},vl={key:1,class:`no-more-logs`},yl={key:2,class:`placeholder`},bl=200,xl=Mn({__name:`AdminPage`,setup(e){let t=z(!1),n=z(!1),r=z(!1),i=z(!1),a=z(!1),o=z(``),s=z(``),c=z(``),l=z(``),u=z(``),d=z(``),f=z(``),p=z(``),m=z(!0),h=z(!1),g=z(``),_=z(`success`),v=z([]),y=z([]),b=z([]),x=z(0),S=z(!1),C=z(!1),w=z(null),T=z(),ee=z(1),te=z(!0),E=z(`INFO`),ne=z(``),D=z(!0),O=jt({name:``,work_dir:``,log:{log_level:`info`,output_path:`data/`,output_file:`log.txt`},api:{route_root:`/`,port:7210,host:`0.0.0.0`,token:``,domain:`www.example.com`},resource:{resource_paths:{},chinese_font_path:`resource/fonts/STHeitiMedium.ttc`,english_font_path:`resource/fonts/Times New Roman.ttf`},storage:{image_expiry_time:300},admin:{password_hash:``}}),re=e=>{let t=e.match(/^(\[?\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}[\.,]?\d*\]?)\s*(\[?(?:DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL)\]?)\s*(.*)$/i);if(t)return{timestamp:t[1]?.replace(/[\[\]]/g,``).trim(),level:t[2]?.replace(/[\[\]]/g,``).trim(),content:t[3]?.trim()};let n=e.match(/^(\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}[\.,]?\d*)\s*\[.*?\]\s*(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL):?\s*(.*)$/i);return n?{timestamp:n[1]?.trim(),level:n[2]?.trim(),content:n[3]?.trim()}:null},k=async()=>{try{if(ue(`admin_token`)){t.value=!0,await j();return}await j(),!O.admin||!O.admin.password_hash?n.value=!0:r.value=!0}catch(e){console.error(`检查认证状态失败:`,e),r.value=!0}},ie=async()=>{if(!c.value||!l.value||c.value!==l.value){o.value=`两次输入的密码不一致`;return}a.value=!0,o.value=``;try{let e=await(await fetch(`/admin/password/set`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({password:c.value})})).json();e.code===200?(n.value=!1,t.value=!0,be(`密码设置成功`,`success`),c.value=``,l.value=``,j(),fe()):o.value=e.message||`设置密码失败`}catch(e){console.error(`设置密码失败:`,e),o.value=`设置密码失败，请重试`}finally{a.value=!1}},A=async()=>{if(!s.value){o.value=`请输入密码`;return}a.value=!0,o.value=``;try{let e=await(await fetch(`/admin/password/verify`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({password:s.value})})).json();e.code===200?(le(`admin_token`,e.data.token,24),r.value=!1,t.value=!0,s.value=``,j(),fe()):e.code===401&&e.data?.need_setup?(r.value=!1,n.value=!0):o.value=e.message||`验证失败`}catch(e){console.error(`验证密码失败:`,e),o.value=`验证失败，请重试`}finally{a.value=!1}},ae=()=>{i.value=!0,u.value=``,d.value=``,f.value=``,p.value=``},oe=()=>{i.value=!1,u.value=``,d.value=``,f.value=``,p.value=``},se=async()=>{if(!u.value||!d.value||!f.value){p.value=`请填写所有密码字段`;return}if(d.value!==f.value){p.value=`新密码和确认密码不一致`;return}a.value=!0,p.value=``;try{let e=await(await fetch(`/admin/password/reset`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({old_password:u.value,new_password:d.value})})).json();e.code===200?(oe(),t.value=!1,r.value=!0,be(`密码重置成功，请重新登录`,`success`),le(`admin_token`,``,-1)):p.value=e.message||`重置密码失败`}catch(e){console.error(`重置密码失败:`,e),p.value=`重置密码失败，请重试`}finally{a.value=!1}},ce=()=>{t.value&&(n.value=!1,r.value=!1)},le=(e,t,n)=>{let r=new Date;r.setTime(r.getTime()+n*60*60*1e3),document.cookie=`${e}=${t};expires=${r.toUTCString()};path=/`},ue=e=>{if(!document.cookie)return``;let t=`${e}=`,n=document.cookie.split(`;`);for(let e=0;e<n.length;e++){let r=n[e]?.trim()||``;if(r.indexOf(t)===0)return r.substring(t.length,r.length)}return``},j=async()=>{m.value=!0;try{let e=await fetch(`/config`);if(e.ok){let t=await e.json();Object.assign(O,t)}else console.error(`配置加载失败`)}catch(e){console.error(`加载配置出错:`,e)}finally{m.value=!1}},de=async()=>{if(t.value){h.value=!0;try{let e=await fetch(`/config`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify(O)});if(e.ok){let t=await e.json();t.status===`success`?(be(`配置保存成功`,`success`),t.portChanged&&be(`端口已修改，需要重启服务才能生效`,`warning`)):be(`配置保存失败: ${t.message||`未知错误`}`,`error`)}else be(`配置保存失败`,`error`)}catch(e){console.error(`保存配置出错:`,e),be(`保存配置时发生错误`,`error`)}finally{h.value=!1}}},fe=async()=>{if(!t.value)return;let e=document.querySelector(`.logs-content`),n=0,r=!0;e&&(n=e.scrollTop,r=n<5),S.value=!0;try{let t=await fetch(`/logs`);t.ok?(v.value=(await t.json()).data.logs.split(`
+(function(){let e=document.createElement(`link`).relList;if(e&&e.supports&&e.supports(`modulepreload`))return;for(let e of document.querySelectorAll(`link[rel="modulepreload"]`))n(e);new MutationObserver(e=>{for(let t of e)if(t.type===`childList`)for(let e of t.addedNodes)e.tagName===`LINK`&&e.rel===`modulepreload`&&n(e)}).observe(document,{childList:!0,subtree:!0});function t(e){let t={};return e.integrity&&(t.integrity=e.integrity),e.referrerPolicy&&(t.referrerPolicy=e.referrerPolicy),e.crossOrigin===`use-credentials`?t.credentials=`include`:e.crossOrigin===`anonymous`?t.credentials=`omit`:t.credentials=`same-origin`,t}function n(e){if(e.ep)return;e.ep=!0;let n=t(e);fetch(e.href,n)}})();function e(e){let t=Object.create(null);for(let n of e.split(`,`))t[n]=1;return e=>e in t}var t={},n=[],r=()=>{},i=()=>!1,a=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&(e.charCodeAt(2)>122||e.charCodeAt(2)<97),o=e=>e.startsWith(`onUpdate:`),s=Object.assign,c=(e,t)=>{let n=e.indexOf(t);n>-1&&e.splice(n,1)},l=Object.prototype.hasOwnProperty,u=(e,t)=>l.call(e,t),d=Array.isArray,f=e=>x(e)===`[object Map]`,p=e=>x(e)===`[object Set]`,m=e=>x(e)===`[object Date]`,h=e=>typeof e==`function`,g=e=>typeof e==`string`,_=e=>typeof e==`symbol`,v=e=>typeof e==`object`&&!!e,y=e=>(v(e)||h(e))&&h(e.then)&&h(e.catch),b=Object.prototype.toString,x=e=>b.call(e),S=e=>x(e).slice(8,-1),C=e=>x(e)===`[object Object]`,w=e=>g(e)&&e!==`NaN`&&e[0]!==`-`&&``+parseInt(e,10)===e,T=e(`,key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted`),ee=e=>{let t=Object.create(null);return(n=>t[n]||(t[n]=e(n)))},te=/-\w/g,E=ee(e=>e.replace(te,e=>e.slice(1).toUpperCase())),ne=/\B([A-Z])/g,D=ee(e=>e.replace(ne,`-$1`).toLowerCase()),O=ee(e=>e.charAt(0).toUpperCase()+e.slice(1)),re=ee(e=>e?`on${O(e)}`:``),k=(e,t)=>!Object.is(e,t),ie=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},A=(e,t,n,r=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:r,value:n})},ae=e=>{let t=parseFloat(e);return isNaN(t)?e:t},oe,se=()=>oe||=typeof globalThis<`u`?globalThis:typeof self<`u`?self:typeof window<`u`?window:typeof global<`u`?global:{};function ce(e){if(d(e)){let t={};for(let n=0;n<e.length;n++){let r=e[n],i=g(r)?de(r):ce(r);if(i)for(let e in i)t[e]=i[e]}return t}else if(g(e)||v(e))return e}var le=/;(?![^(]*\))/g,ue=/:([^]+)/,j=/\/\*[^]*?\*\//g;function de(e){let t={};return e.replace(j,``).split(le).forEach(e=>{if(e){let n=e.split(ue);n.length>1&&(t[n[0].trim()]=n[1].trim())}}),t}function M(e){let t=``;if(g(e))t=e;else if(d(e))for(let n=0;n<e.length;n++){let r=M(e[n]);r&&(t+=r+` `)}else if(v(e))for(let n in e)e[n]&&(t+=n+` `);return t.trim()}var fe=`itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly`,pe=e(fe);fe+``;function me(e){return!!e||e===``}function he(e,t){if(e.length!==t.length)return!1;let n=!0;for(let r=0;n&&r<e.length;r++)n=ge(e[r],t[r]);return n}function ge(e,t){if(e===t)return!0;let n=m(e),r=m(t);if(n||r)return n&&r?e.getTime()===t.getTime():!1;if(n=_(e),r=_(t),n||r)return e===t;if(n=d(e),r=d(t),n||r)return n&&r?he(e,t):!1;if(n=v(e),r=v(t),n||r){if(!n||!r||Object.keys(e).length!==Object.keys(t).length)return!1;for(let n in e){let r=e.hasOwnProperty(n),i=t.hasOwnProperty(n);if(r&&!i||!r&&i||!ge(e[n],t[n]))return!1}}return String(e)===String(t)}function _e(e,t){return e.findIndex(e=>ge(e,t))}var ve=e=>!!(e&&e.__v_isRef===!0),N=e=>g(e)?e:e==null?``:d(e)||v(e)&&(e.toString===b||!h(e.toString))?ve(e)?N(e.value):JSON.stringify(e,ye,2):String(e),ye=(e,t)=>ve(t)?ye(e,t.value):f(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((e,[t,n],r)=>(e[be(t,r)+` =>`]=n,e),{})}:p(t)?{[`Set(${t.size})`]:[...t.values()].map(e=>be(e))}:_(t)?be(t):v(t)&&!d(t)&&!C(t)?String(t):t,be=(e,t=``)=>_(e)?`Symbol(${e.description??t})`:e,P,xe=class{constructor(e=!1){this.detached=e,this._active=!0,this._on=0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=P,!e&&P&&(this.index=(P.scopes||=[]).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let e,t;if(this.scopes)for(e=0,t=this.scopes.length;e<t;e++)this.scopes[e].pause();for(e=0,t=this.effects.length;e<t;e++)this.effects[e].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let e,t;if(this.scopes)for(e=0,t=this.scopes.length;e<t;e++)this.scopes[e].resume();for(e=0,t=this.effects.length;e<t;e++)this.effects[e].resume()}}run(e){if(this._active){let t=P;try{return P=this,e()}finally{P=t}}}on(){++this._on===1&&(this.prevScope=P,P=this)}off(){this._on>0&&--this._on===0&&(P=this.prevScope,this.prevScope=void 0)}stop(e){if(this._active){this._active=!1;let t,n;for(t=0,n=this.effects.length;t<n;t++)this.effects[t].stop();for(this.effects.length=0,t=0,n=this.cleanups.length;t<n;t++)this.cleanups[t]();if(this.cleanups.length=0,this.scopes){for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!e){let e=this.parent.scopes.pop();e&&e!==this&&(this.parent.scopes[this.index]=e,e.index=this.index)}this.parent=void 0}}};function Se(){return P}var F,Ce=new WeakSet,we=class{constructor(e){this.fn=e,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,P&&P.active&&P.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,Ce.has(this)&&(Ce.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||Oe(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,Ve(this),je(this);let e=F,t=Le;F=this,Le=!0;try{return this.fn()}finally{Me(this),F=e,Le=t,this.flags&=-3}}stop(){if(this.flags&1){for(let e=this.deps;e;e=e.nextDep)Fe(e);this.deps=this.depsTail=void 0,Ve(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?Ce.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){Ne(this)&&this.run()}get dirty(){return Ne(this)}},Te=0,Ee,De;function Oe(e,t=!1){if(e.flags|=8,t){e.next=De,De=e;return}e.next=Ee,Ee=e}function ke(){Te++}function Ae(){if(--Te>0)return;if(De){let e=De;for(De=void 0;e;){let t=e.next;e.next=void 0,e.flags&=-9,e=t}}let e;for(;Ee;){let t=Ee;for(Ee=void 0;t;){let n=t.next;if(t.next=void 0,t.flags&=-9,t.flags&1)try{t.trigger()}catch(t){e||=t}t=n}}if(e)throw e}function je(e){for(let t=e.deps;t;t=t.nextDep)t.version=-1,t.prevActiveLink=t.dep.activeLink,t.dep.activeLink=t}function Me(e){let t,n=e.depsTail,r=n;for(;r;){let e=r.prevDep;r.version===-1?(r===n&&(n=e),Fe(r),Ie(r)):t=r,r.dep.activeLink=r.prevActiveLink,r.prevActiveLink=void 0,r=e}e.deps=t,e.depsTail=n}function Ne(e){for(let t=e.deps;t;t=t.nextDep)if(t.dep.version!==t.version||t.dep.computed&&(Pe(t.dep.computed)||t.dep.version!==t.version))return!0;return!!e._dirty}function Pe(e){if(e.flags&4&&!(e.flags&16)||(e.flags&=-17,e.globalVersion===He)||(e.globalVersion=He,!e.isSSR&&e.flags&128&&(!e.deps&&!e._dirty||!Ne(e))))return;e.flags|=2;let t=e.dep,n=F,r=Le;F=e,Le=!0;try{je(e);let n=e.fn(e._value);(t.version===0||k(n,e._value))&&(e.flags|=128,e._value=n,t.version++)}catch(e){throw t.version++,e}finally{F=n,Le=r,Me(e),e.flags&=-3}}function Fe(e,t=!1){let{dep:n,prevSub:r,nextSub:i}=e;if(r&&(r.nextSub=i,e.prevSub=void 0),i&&(i.prevSub=r,e.nextSub=void 0),n.subs===e&&(n.subs=r,!r&&n.computed)){n.computed.flags&=-5;for(let e=n.computed.deps;e;e=e.nextDep)Fe(e,!0)}!t&&!--n.sc&&n.map&&n.map.delete(n.key)}function Ie(e){let{prevDep:t,nextDep:n}=e;t&&(t.nextDep=n,e.prevDep=void 0),n&&(n.prevDep=t,e.nextDep=void 0)}var Le=!0,Re=[];function ze(){Re.push(Le),Le=!1}function Be(){let e=Re.pop();Le=e===void 0?!0:e}function Ve(e){let{cleanup:t}=e;if(e.cleanup=void 0,t){let e=F;F=void 0;try{t()}finally{F=e}}}var He=0,Ue=class{constructor(e,t){this.sub=e,this.dep=t,this.version=t.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}},We=class{constructor(e){this.computed=e,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0,this.__v_skip=!0}track(e){if(!F||!Le||F===this.computed)return;let t=this.activeLink;if(t===void 0||t.sub!==F)t=this.activeLink=new Ue(F,this),F.deps?(t.prevDep=F.depsTail,F.depsTail.nextDep=t,F.depsTail=t):F.deps=F.depsTail=t,Ge(t);else if(t.version===-1&&(t.version=this.version,t.nextDep)){let e=t.nextDep;e.prevDep=t.prevDep,t.prevDep&&(t.prevDep.nextDep=e),t.prevDep=F.depsTail,t.nextDep=void 0,F.depsTail.nextDep=t,F.depsTail=t,F.deps===t&&(F.deps=e)}return t}trigger(e){this.version++,He++,this.notify(e)}notify(e){ke();try{for(let e=this.subs;e;e=e.prevSub)e.sub.notify()&&e.sub.dep.notify()}finally{Ae()}}};function Ge(e){if(e.dep.sc++,e.sub.flags&4){let t=e.dep.computed;if(t&&!e.dep.subs){t.flags|=20;for(let e=t.deps;e;e=e.nextDep)Ge(e)}let n=e.dep.subs;n!==e&&(e.prevSub=n,n&&(n.nextSub=e)),e.dep.subs=e}}var Ke=new WeakMap,qe=Symbol(``),Je=Symbol(``),Ye=Symbol(``);function I(e,t,n){if(Le&&F){let t=Ke.get(e);t||Ke.set(e,t=new Map);let r=t.get(n);r||(t.set(n,r=new We),r.map=t,r.key=n),r.track()}}function Xe(e,t,n,r,i,a){let o=Ke.get(e);if(!o){He++;return}let s=e=>{e&&e.trigger()};if(ke(),t===`clear`)o.forEach(s);else{let i=d(e),a=i&&w(n);if(i&&n===`length`){let e=Number(r);o.forEach((t,n)=>{(n===`length`||n===Ye||!_(n)&&n>=e)&&s(t)})}else switch((n!==void 0||o.has(void 0))&&s(o.get(n)),a&&s(o.get(Ye)),t){case`add`:i?a&&s(o.get(`length`)):(s(o.get(qe)),f(e)&&s(o.get(Je)));break;case`delete`:i||(s(o.get(qe)),f(e)&&s(o.get(Je)));break;case`set`:f(e)&&s(o.get(qe));break}}Ae()}function Ze(e){let t=L(e);return t===e?t:(I(t,`iterate`,Ye),Lt(e)?t:t.map(Bt))}function Qe(e){return I(e=L(e),`iterate`,Ye),e}function $e(e,t){return It(e)?Ft(e)?Vt(Bt(t)):Vt(t):Bt(t)}var et={__proto__:null,[Symbol.iterator](){return tt(this,Symbol.iterator,e=>$e(this,e))},concat(...e){return Ze(this).concat(...e.map(e=>d(e)?Ze(e):e))},entries(){return tt(this,`entries`,e=>(e[1]=$e(this,e[1]),e))},every(e,t){return rt(this,`every`,e,t,void 0,arguments)},filter(e,t){return rt(this,`filter`,e,t,e=>e.map(e=>$e(this,e)),arguments)},find(e,t){return rt(this,`find`,e,t,e=>$e(this,e),arguments)},findIndex(e,t){return rt(this,`findIndex`,e,t,void 0,arguments)},findLast(e,t){return rt(this,`findLast`,e,t,e=>$e(this,e),arguments)},findLastIndex(e,t){return rt(this,`findLastIndex`,e,t,void 0,arguments)},forEach(e,t){return rt(this,`forEach`,e,t,void 0,arguments)},includes(...e){return at(this,`includes`,e)},indexOf(...e){return at(this,`indexOf`,e)},join(e){return Ze(this).join(e)},lastIndexOf(...e){return at(this,`lastIndexOf`,e)},map(e,t){return rt(this,`map`,e,t,void 0,arguments)},pop(){return ot(this,`pop`)},push(...e){return ot(this,`push`,e)},reduce(e,...t){return it(this,`reduce`,e,t)},reduceRight(e,...t){return it(this,`reduceRight`,e,t)},shift(){return ot(this,`shift`)},some(e,t){return rt(this,`some`,e,t,void 0,arguments)},splice(...e){return ot(this,`splice`,e)},toReversed(){return Ze(this).toReversed()},toSorted(e){return Ze(this).toSorted(e)},toSpliced(...e){return Ze(this).toSpliced(...e)},unshift(...e){return ot(this,`unshift`,e)},values(){return tt(this,`values`,e=>$e(this,e))}};function tt(e,t,n){let r=Qe(e),i=r[t]();return r!==e&&!Lt(e)&&(i._next=i.next,i.next=()=>{let e=i._next();return e.done||(e.value=n(e.value)),e}),i}var nt=Array.prototype;function rt(e,t,n,r,i,a){let o=Qe(e),s=o!==e&&!Lt(e),c=o[t];if(c!==nt[t]){let t=c.apply(e,a);return s?Bt(t):t}let l=n;o!==e&&(s?l=function(t,r){return n.call(this,$e(e,t),r,e)}:n.length>2&&(l=function(t,r){return n.call(this,t,r,e)}));let u=c.call(o,l,r);return s&&i?i(u):u}function it(e,t,n,r){let i=Qe(e),a=n;return i!==e&&(Lt(e)?n.length>3&&(a=function(t,r,i){return n.call(this,t,r,i,e)}):a=function(t,r,i){return n.call(this,t,$e(e,r),i,e)}),i[t](a,...r)}function at(e,t,n){let r=L(e);I(r,`iterate`,Ye);let i=r[t](...n);return(i===-1||i===!1)&&Rt(n[0])?(n[0]=L(n[0]),r[t](...n)):i}function ot(e,t,n=[]){ze(),ke();let r=L(e)[t].apply(e,n);return Ae(),Be(),r}var st=e(`__proto__,__v_isRef,__isVue`),ct=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>e!==`arguments`&&e!==`caller`).map(e=>Symbol[e]).filter(_));function lt(e){_(e)||(e=String(e));let t=L(this);return I(t,`has`,e),t.hasOwnProperty(e)}var ut=class{constructor(e=!1,t=!1){this._isReadonly=e,this._isShallow=t}get(e,t,n){if(t===`__v_skip`)return e.__v_skip;let r=this._isReadonly,i=this._isShallow;if(t===`__v_isReactive`)return!r;if(t===`__v_isReadonly`)return r;if(t===`__v_isShallow`)return i;if(t===`__v_raw`)return n===(r?i?Ot:Dt:i?Et:Tt).get(e)||Object.getPrototypeOf(e)===Object.getPrototypeOf(n)?e:void 0;let a=d(e);if(!r){let e;if(a&&(e=et[t]))return e;if(t===`hasOwnProperty`)return lt}let o=Reflect.get(e,t,R(e)?e:n);if((_(t)?ct.has(t):st(t))||(r||I(e,`get`,t),i))return o;if(R(o)){let e=a&&w(t)?o:o.value;return r&&v(e)?Nt(e):e}return v(o)?r?Nt(o):jt(o):o}},dt=class extends ut{constructor(e=!1){super(!1,e)}set(e,t,n,r){let i=e[t],a=d(e)&&w(t);if(!this._isShallow){let e=It(i);if(!Lt(n)&&!It(n)&&(i=L(i),n=L(n)),!a&&R(i)&&!R(n))return e||(i.value=n),!0}let o=a?Number(t)<e.length:u(e,t),s=Reflect.set(e,t,n,R(e)?e:r);return e===L(r)&&(o?k(n,i)&&Xe(e,`set`,t,n,i):Xe(e,`add`,t,n)),s}deleteProperty(e,t){let n=u(e,t),r=e[t],i=Reflect.deleteProperty(e,t);return i&&n&&Xe(e,`delete`,t,void 0,r),i}has(e,t){let n=Reflect.has(e,t);return(!_(t)||!ct.has(t))&&I(e,`has`,t),n}ownKeys(e){return I(e,`iterate`,d(e)?`length`:qe),Reflect.ownKeys(e)}},ft=class extends ut{constructor(e=!1){super(!0,e)}set(e,t){return!0}deleteProperty(e,t){return!0}},pt=new dt,mt=new ft,ht=new dt(!0),gt=e=>e,_t=e=>Reflect.getPrototypeOf(e);function vt(e,t,n){return function(...r){let i=this.__v_raw,a=L(i),o=f(a),s=e===`entries`||e===Symbol.iterator&&o,c=e===`keys`&&o,l=i[e](...r),u=n?gt:t?Vt:Bt;return!t&&I(a,`iterate`,c?Je:qe),{next(){let{value:e,done:t}=l.next();return t?{value:e,done:t}:{value:s?[u(e[0]),u(e[1])]:u(e),done:t}},[Symbol.iterator](){return this}}}}function yt(e){return function(...t){return e===`delete`?!1:e===`clear`?void 0:this}}function bt(e,t){let n={get(n){let r=this.__v_raw,i=L(r),a=L(n);e||(k(n,a)&&I(i,`get`,n),I(i,`get`,a));let{has:o}=_t(i),s=t?gt:e?Vt:Bt;if(o.call(i,n))return s(r.get(n));if(o.call(i,a))return s(r.get(a));r!==i&&r.get(n)},get size(){let t=this.__v_raw;return!e&&I(L(t),`iterate`,qe),t.size},has(t){let n=this.__v_raw,r=L(n),i=L(t);return e||(k(t,i)&&I(r,`has`,t),I(r,`has`,i)),t===i?n.has(t):n.has(t)||n.has(i)},forEach(n,r){let i=this,a=i.__v_raw,o=L(a),s=t?gt:e?Vt:Bt;return!e&&I(o,`iterate`,qe),a.forEach((e,t)=>n.call(r,s(e),s(t),i))}};return s(n,e?{add:yt(`add`),set:yt(`set`),delete:yt(`delete`),clear:yt(`clear`)}:{add(e){!t&&!Lt(e)&&!It(e)&&(e=L(e));let n=L(this);return _t(n).has.call(n,e)||(n.add(e),Xe(n,`add`,e,e)),this},set(e,n){!t&&!Lt(n)&&!It(n)&&(n=L(n));let r=L(this),{has:i,get:a}=_t(r),o=i.call(r,e);o||=(e=L(e),i.call(r,e));let s=a.call(r,e);return r.set(e,n),o?k(n,s)&&Xe(r,`set`,e,n,s):Xe(r,`add`,e,n),this},delete(e){let t=L(this),{has:n,get:r}=_t(t),i=n.call(t,e);i||=(e=L(e),n.call(t,e));let a=r?r.call(t,e):void 0,o=t.delete(e);return i&&Xe(t,`delete`,e,void 0,a),o},clear(){let e=L(this),t=e.size!==0,n=e.clear();return t&&Xe(e,`clear`,void 0,void 0,void 0),n}}),[`keys`,`values`,`entries`,Symbol.iterator].forEach(r=>{n[r]=vt(r,e,t)}),n}function xt(e,t){let n=bt(e,t);return(t,r,i)=>r===`__v_isReactive`?!e:r===`__v_isReadonly`?e:r===`__v_raw`?t:Reflect.get(u(n,r)&&r in t?n:t,r,i)}var St={get:xt(!1,!1)},Ct={get:xt(!1,!0)},wt={get:xt(!0,!1)},Tt=new WeakMap,Et=new WeakMap,Dt=new WeakMap,Ot=new WeakMap;function kt(e){switch(e){case`Object`:case`Array`:return 1;case`Map`:case`Set`:case`WeakMap`:case`WeakSet`:return 2;default:return 0}}function At(e){return e.__v_skip||!Object.isExtensible(e)?0:kt(S(e))}function jt(e){return It(e)?e:Pt(e,!1,pt,St,Tt)}function Mt(e){return Pt(e,!1,ht,Ct,Et)}function Nt(e){return Pt(e,!0,mt,wt,Dt)}function Pt(e,t,n,r,i){if(!v(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;let a=At(e);if(a===0)return e;let o=i.get(e);if(o)return o;let s=new Proxy(e,a===2?r:n);return i.set(e,s),s}function Ft(e){return It(e)?Ft(e.__v_raw):!!(e&&e.__v_isReactive)}function It(e){return!!(e&&e.__v_isReadonly)}function Lt(e){return!!(e&&e.__v_isShallow)}function Rt(e){return e?!!e.__v_raw:!1}function L(e){let t=e&&e.__v_raw;return t?L(t):e}function zt(e){return!u(e,`__v_skip`)&&Object.isExtensible(e)&&A(e,`__v_skip`,!0),e}var Bt=e=>v(e)?jt(e):e,Vt=e=>v(e)?Nt(e):e;function R(e){return e?e.__v_isRef===!0:!1}function z(e){return Ut(e,!1)}function Ht(e){return Ut(e,!0)}function Ut(e,t){return R(e)?e:new Wt(e,t)}var Wt=class{constructor(e,t){this.dep=new We,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=t?e:L(e),this._value=t?e:Bt(e),this.__v_isShallow=t}get value(){return this.dep.track(),this._value}set value(e){let t=this._rawValue,n=this.__v_isShallow||Lt(e)||It(e);e=n?e:L(e),k(e,t)&&(this._rawValue=e,this._value=n?e:Bt(e),this.dep.trigger())}};function Gt(e){return R(e)?e.value:e}var Kt={get:(e,t,n)=>t===`__v_raw`?e:Gt(Reflect.get(e,t,n)),set:(e,t,n,r)=>{let i=e[t];return R(i)&&!R(n)?(i.value=n,!0):Reflect.set(e,t,n,r)}};function qt(e){return Ft(e)?e:new Proxy(e,Kt)}var Jt=class{constructor(e,t,n){this.fn=e,this.setter=t,this._value=void 0,this.dep=new We(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=He-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!t,this.isSSR=n}notify(){if(this.flags|=16,!(this.flags&8)&&F!==this)return Oe(this,!0),!0}get value(){let e=this.dep.track();return Pe(this),e&&(e.version=this.dep.version),this._value}set value(e){this.setter&&this.setter(e)}};function Yt(e,t,n=!1){let r,i;return h(e)?r=e:(r=e.get,i=e.set),new Jt(r,i,n)}var Xt={},Zt=new WeakMap,Qt=void 0;function $t(e,t=!1,n=Qt){if(n){let t=Zt.get(n);t||Zt.set(n,t=[]),t.push(e)}}function en(e,n,i=t){let{immediate:a,deep:o,once:s,scheduler:l,augmentJob:u,call:f}=i,p=e=>o?e:Lt(e)||o===!1||o===0?tn(e,1):tn(e),m,g,_,v,y=!1,b=!1;if(R(e)?(g=()=>e.value,y=Lt(e)):Ft(e)?(g=()=>p(e),y=!0):d(e)?(b=!0,y=e.some(e=>Ft(e)||Lt(e)),g=()=>e.map(e=>{if(R(e))return e.value;if(Ft(e))return p(e);if(h(e))return f?f(e,2):e()})):g=h(e)?n?f?()=>f(e,2):e:()=>{if(_){ze();try{_()}finally{Be()}}let t=Qt;Qt=m;try{return f?f(e,3,[v]):e(v)}finally{Qt=t}}:r,n&&o){let e=g,t=o===!0?1/0:o;g=()=>tn(e(),t)}let x=Se(),S=()=>{m.stop(),x&&x.active&&c(x.effects,m)};if(s&&n){let e=n;n=(...t)=>{e(...t),S()}}let C=b?Array(e.length).fill(Xt):Xt,w=e=>{if(!(!(m.flags&1)||!m.dirty&&!e))if(n){let e=m.run();if(o||y||(b?e.some((e,t)=>k(e,C[t])):k(e,C))){_&&_();let t=Qt;Qt=m;try{let t=[e,C===Xt?void 0:b&&C[0]===Xt?[]:C,v];C=e,f?f(n,3,t):n(...t)}finally{Qt=t}}}else m.run()};return u&&u(w),m=new we(g),m.scheduler=l?()=>l(w,!1):w,v=e=>$t(e,!1,m),_=m.onStop=()=>{let e=Zt.get(m);if(e){if(f)f(e,4);else for(let t of e)t();Zt.delete(m)}},n?a?w(!0):C=m.run():l?l(w.bind(null,!0),!0):m.run(),S.pause=m.pause.bind(m),S.resume=m.resume.bind(m),S.stop=S,S}function tn(e,t=1/0,n){if(t<=0||!v(e)||e.__v_skip||(n||=new Map,(n.get(e)||0)>=t))return e;if(n.set(e,t),t--,R(e))tn(e.value,t,n);else if(d(e))for(let r=0;r<e.length;r++)tn(e[r],t,n);else if(p(e)||f(e))e.forEach(e=>{tn(e,t,n)});else if(C(e)){for(let r in e)tn(e[r],t,n);for(let r of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,r)&&tn(e[r],t,n)}return e}function nn(e,t,n,r){try{return r?e(...r):e()}catch(e){an(e,t,n)}}function rn(e,t,n,r){if(h(e)){let i=nn(e,t,n,r);return i&&y(i)&&i.catch(e=>{an(e,t,n)}),i}if(d(e)){let i=[];for(let a=0;a<e.length;a++)i.push(rn(e[a],t,n,r));return i}}function an(e,n,r,i=!0){let a=n?n.vnode:null,{errorHandler:o,throwUnhandledErrorInProduction:s}=n&&n.appContext.config||t;if(n){let t=n.parent,i=n.proxy,a=`https://vuejs.org/error-reference/#runtime-${r}`;for(;t;){let n=t.ec;if(n){for(let t=0;t<n.length;t++)if(n[t](e,i,a)===!1)return}t=t.parent}if(o){ze(),nn(o,null,10,[e,i,a]),Be();return}}on(e,r,a,i,s)}function on(e,t,n,r=!0,i=!1){if(i)throw e;console.error(e)}var B=[],sn=-1,cn=[],ln=null,un=0,dn=Promise.resolve(),fn=null;function pn(e){let t=fn||dn;return e?t.then(this?e.bind(this):e):t}function mn(e){let t=sn+1,n=B.length;for(;t<n;){let r=t+n>>>1,i=B[r],a=bn(i);a<e||a===e&&i.flags&2?t=r+1:n=r}return t}function hn(e){if(!(e.flags&1)){let t=bn(e),n=B[B.length-1];!n||!(e.flags&2)&&t>=bn(n)?B.push(e):B.splice(mn(t),0,e),e.flags|=1,gn()}}function gn(){fn||=dn.then(xn)}function _n(e){d(e)?cn.push(...e):ln&&e.id===-1?ln.splice(un+1,0,e):e.flags&1||(cn.push(e),e.flags|=1),gn()}function vn(e,t,n=sn+1){for(;n<B.length;n++){let t=B[n];if(t&&t.flags&2){if(e&&t.id!==e.uid)continue;B.splice(n,1),n--,t.flags&4&&(t.flags&=-2),t(),t.flags&4||(t.flags&=-2)}}}function yn(e){if(cn.length){let e=[...new Set(cn)].sort((e,t)=>bn(e)-bn(t));if(cn.length=0,ln){ln.push(...e);return}for(ln=e,un=0;un<ln.length;un++){let e=ln[un];e.flags&4&&(e.flags&=-2),e.flags&8||e(),e.flags&=-2}ln=null,un=0}}var bn=e=>e.id==null?e.flags&2?-1:1/0:e.id;function xn(e){try{for(sn=0;sn<B.length;sn++){let e=B[sn];e&&!(e.flags&8)&&(e.flags&4&&(e.flags&=-2),nn(e,e.i,e.i?15:14),e.flags&4||(e.flags&=-2))}}finally{for(;sn<B.length;sn++){let e=B[sn];e&&(e.flags&=-2)}sn=-1,B.length=0,yn(e),fn=null,(B.length||cn.length)&&xn(e)}}var Sn=null,Cn=null;function wn(e){let t=Sn;return Sn=e,Cn=e&&e.type.__scopeId||null,t}function Tn(e,t=Sn,n){if(!t||e._n)return e;let r=(...n)=>{r._d&&ji(-1);let i=wn(t),a;try{a=e(...n)}finally{wn(i),r._d&&ji(1)}return a};return r._n=!0,r._c=!0,r._d=!0,r}function En(e,n){if(Sn===null)return e;let r=fa(Sn),i=e.dirs||=[];for(let e=0;e<n.length;e++){let[a,o,s,c=t]=n[e];a&&(h(a)&&(a={mounted:a,updated:a}),a.deep&&tn(o),i.push({dir:a,instance:r,value:o,oldValue:void 0,arg:s,modifiers:c}))}return e}function Dn(e,t,n,r){let i=e.dirs,a=t&&t.dirs;for(let o=0;o<i.length;o++){let s=i[o];a&&(s.oldValue=a[o].value);let c=s.dir[r];c&&(ze(),rn(c,n,8,[e.el,s,e,t]),Be())}}var On=Symbol(`_vte`),kn=e=>e.__isTeleport,An=Symbol(`_leaveCb`);function jn(e,t){e.shapeFlag&6&&e.component?(e.transition=t,jn(e.component.subTree,t)):e.shapeFlag&128?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function Mn(e,t){return h(e)?(()=>s({name:e.name},t,{setup:e}))():e}function Nn(e){e.ids=[e.ids[0]+ e.ids[2]+++`-`,0,0]}var Pn=new WeakMap;function Fn(e,n,r,a,o=!1){if(d(e)){e.forEach((e,t)=>Fn(e,n&&(d(n)?n[t]:n),r,a,o));return}if(Ln(a)&&!o){a.shapeFlag&512&&a.type.__asyncResolved&&a.component.subTree.component&&Fn(e,n,r,a.component.subTree);return}let s=a.shapeFlag&4?fa(a.component):a.el,l=o?null:s,{i:f,r:p}=e,m=n&&n.r,_=f.refs===t?f.refs={}:f.refs,v=f.setupState,y=L(v),b=v===t?i:e=>u(y,e),x=e=>!0;if(m!=null&&m!==p){if(In(n),g(m))_[m]=null,b(m)&&(v[m]=null);else if(R(m)){x(m)&&(m.value=null);let e=n;e.k&&(_[e.k]=null)}}if(h(p))nn(p,f,12,[l,_]);else{let t=g(p),n=R(p);if(t||n){let i=()=>{if(e.f){let n=t?b(p)?v[p]:_[p]:x(p)||!e.k?p.value:_[e.k];if(o)d(n)&&c(n,s);else if(d(n))n.includes(s)||n.push(s);else if(t)_[p]=[s],b(p)&&(v[p]=_[p]);else{let t=[s];x(p)&&(p.value=t),e.k&&(_[e.k]=t)}}else t?(_[p]=l,b(p)&&(v[p]=l)):n&&(x(p)&&(p.value=l),e.k&&(_[e.k]=l))};if(l){let t=()=>{i(),Pn.delete(e)};t.id=-1,Pn.set(e,t),pi(t,r)}else In(e),i()}}}function In(e){let t=Pn.get(e);t&&(t.flags|=8,Pn.delete(e))}se().requestIdleCallback,se().cancelIdleCallback;var Ln=e=>!!e.type.__asyncLoader,Rn=e=>e.type.__isKeepAlive;function zn(e,t){Vn(e,`a`,t)}function Bn(e,t){Vn(e,`da`,t)}function Vn(e,t,n=Y){let r=e.__wdc||=()=>{let t=n;for(;t;){if(t.isDeactivated)return;t=t.parent}return e()};if(Un(t,r,n),n){let e=n.parent;for(;e&&e.parent;)Rn(e.parent.vnode)&&Hn(r,t,n,e),e=e.parent}}function Hn(e,t,n,r){let i=Un(t,e,r,!0);Xn(()=>{c(r[t],i)},n)}function Un(e,t,n=Y,r=!1){if(n){let i=n[e]||(n[e]=[]),a=t.__weh||=(...r)=>{ze();let i=ea(n),a=rn(t,n,e,r);return i(),Be(),a};return r?i.unshift(a):i.push(a),a}}var Wn=e=>(t,n=Y)=>{(!ra||e===`sp`)&&Un(e,(...e)=>t(...e),n)},Gn=Wn(`bm`),Kn=Wn(`m`),qn=Wn(`bu`),Jn=Wn(`u`),Yn=Wn(`bum`),Xn=Wn(`um`),Zn=Wn(`sp`),Qn=Wn(`rtg`),$n=Wn(`rtc`);function er(e,t=Y){Un(`ec`,e,t)}var tr=`components`;function nr(e,t){return ir(tr,e,!0,t)||e}var rr=Symbol.for(`v-ndc`);function ir(e,t,n=!0,r=!1){let i=Sn||Y;if(i){let n=i.type;if(e===tr){let e=pa(n,!1);if(e&&(e===t||e===E(t)||e===O(E(t))))return n}let a=ar(i[e]||n[e],t)||ar(i.appContext[e],t);return!a&&r?n:a}}function ar(e,t){return e&&(e[t]||e[E(t)]||e[O(E(t))])}function or(e,t,n,r){let i,a=n&&n[r],o=d(e);if(o||g(e)){let n=o&&Ft(e),r=!1,s=!1;n&&(r=!Lt(e),s=It(e),e=Qe(e)),i=Array(e.length);for(let n=0,o=e.length;n<o;n++)i[n]=t(r?s?Vt(Bt(e[n])):Bt(e[n]):e[n],n,void 0,a&&a[n])}else if(typeof e==`number`){i=Array(e);for(let n=0;n<e;n++)i[n]=t(n+1,n,void 0,a&&a[n])}else if(v(e))if(e[Symbol.iterator])i=Array.from(e,(e,n)=>t(e,n,void 0,a&&a[n]));else{let n=Object.keys(e);i=Array(n.length);for(let r=0,o=n.length;r<o;r++){let o=n[r];i[r]=t(e[o],o,r,a&&a[r])}}else i=[];return n&&(n[r]=i),i}var sr=e=>e?na(e)?fa(e):sr(e.parent):null,cr=s(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>sr(e.parent),$root:e=>sr(e.root),$host:e=>e.ce,$emit:e=>e.emit,$options:e=>_r(e),$forceUpdate:e=>e.f||=()=>{hn(e.update)},$nextTick:e=>e.n||=pn.bind(e.proxy),$watch:e=>Ir.bind(e)}),lr=(e,n)=>e!==t&&!e.__isScriptSetup&&u(e,n),ur={get({_:e},n){if(n===`__v_skip`)return!0;let{ctx:r,setupState:i,data:a,props:o,accessCache:s,type:c,appContext:l}=e;if(n[0]!==`$`){let e=s[n];if(e!==void 0)switch(e){case 1:return i[n];case 2:return a[n];case 4:return r[n];case 3:return o[n]}else if(lr(i,n))return s[n]=1,i[n];else if(a!==t&&u(a,n))return s[n]=2,a[n];else if(u(o,n))return s[n]=3,o[n];else if(r!==t&&u(r,n))return s[n]=4,r[n];else fr&&(s[n]=0)}let d=cr[n],f,p;if(d)return n===`$attrs`&&I(e.attrs,`get`,``),d(e);if((f=c.__cssModules)&&(f=f[n]))return f;if(r!==t&&u(r,n))return s[n]=4,r[n];if(p=l.config.globalProperties,u(p,n))return p[n]},set({_:e},n,r){let{data:i,setupState:a,ctx:o}=e;return lr(a,n)?(a[n]=r,!0):i!==t&&u(i,n)?(i[n]=r,!0):u(e.props,n)||n[0]===`$`&&n.slice(1)in e?!1:(o[n]=r,!0)},has({_:{data:e,setupState:n,accessCache:r,ctx:i,appContext:a,props:o,type:s}},c){let l;return!!(r[c]||e!==t&&c[0]!==`$`&&u(e,c)||lr(n,c)||u(o,c)||u(i,c)||u(cr,c)||u(a.config.globalProperties,c)||(l=s.__cssModules)&&l[c])},defineProperty(e,t,n){return n.get==null?u(n,`value`)&&this.set(e,t,n.value,null):e._.accessCache[t]=0,Reflect.defineProperty(e,t,n)}};function dr(e){return d(e)?e.reduce((e,t)=>(e[t]=null,e),{}):e}var fr=!0;function pr(e){let t=_r(e),n=e.proxy,i=e.ctx;fr=!1,t.beforeCreate&&hr(t.beforeCreate,e,`bc`);let{data:a,computed:o,methods:s,watch:c,provide:l,inject:u,created:f,beforeMount:p,mounted:m,beforeUpdate:g,updated:_,activated:y,deactivated:b,beforeDestroy:x,beforeUnmount:S,destroyed:C,unmounted:w,render:T,renderTracked:ee,renderTriggered:te,errorCaptured:E,serverPrefetch:ne,expose:D,inheritAttrs:O,components:re,directives:k,filters:ie}=t;if(u&&mr(u,i,null),s)for(let e in s){let t=s[e];h(t)&&(i[e]=t.bind(n))}if(a){let t=a.call(n,n);v(t)&&(e.data=jt(t))}if(fr=!0,o)for(let e in o){let t=o[e],a=ha({get:h(t)?t.bind(n,n):h(t.get)?t.get.bind(n,n):r,set:!h(t)&&h(t.set)?t.set.bind(n):r});Object.defineProperty(i,e,{enumerable:!0,configurable:!0,get:()=>a.value,set:e=>a.value=e})}if(c)for(let e in c)gr(c[e],i,n,e);if(l){let e=h(l)?l.call(n):l;Reflect.ownKeys(e).forEach(t=>{Ar(t,e[t])})}f&&hr(f,e,`c`);function A(e,t){d(t)?t.forEach(t=>e(t.bind(n))):t&&e(t.bind(n))}if(A(Gn,p),A(Kn,m),A(qn,g),A(Jn,_),A(zn,y),A(Bn,b),A(er,E),A($n,ee),A(Qn,te),A(Yn,S),A(Xn,w),A(Zn,ne),d(D))if(D.length){let t=e.exposed||={};D.forEach(e=>{Object.defineProperty(t,e,{get:()=>n[e],set:t=>n[e]=t,enumerable:!0})})}else e.exposed||={};T&&e.render===r&&(e.render=T),O!=null&&(e.inheritAttrs=O),re&&(e.components=re),k&&(e.directives=k),ne&&Nn(e)}function mr(e,t,n=r){for(let n in d(e)&&(e=Sr(e)),e){let r=e[n],i;i=v(r)?`default`in r?jr(r.from||n,r.default,!0):jr(r.from||n):jr(r),R(i)?Object.defineProperty(t,n,{enumerable:!0,configurable:!0,get:()=>i.value,set:e=>i.value=e}):t[n]=i}}function hr(e,t,n){rn(d(e)?e.map(e=>e.bind(t.proxy)):e.bind(t.proxy),t,n)}function gr(e,t,n,r){let i=r.includes(`.`)?Lr(n,r):()=>n[r];if(g(e)){let n=t[e];h(n)&&Pr(i,n)}else if(h(e))Pr(i,e.bind(n));else if(v(e))if(d(e))e.forEach(e=>gr(e,t,n,r));else{let r=h(e.handler)?e.handler.bind(n):t[e.handler];h(r)&&Pr(i,r,e)}}function _r(e){let t=e.type,{mixins:n,extends:r}=t,{mixins:i,optionsCache:a,config:{optionMergeStrategies:o}}=e.appContext,s=a.get(t),c;return s?c=s:!i.length&&!n&&!r?c=t:(c={},i.length&&i.forEach(e=>vr(c,e,o,!0)),vr(c,t,o)),v(t)&&a.set(t,c),c}function vr(e,t,n,r=!1){let{mixins:i,extends:a}=t;for(let o in a&&vr(e,a,n,!0),i&&i.forEach(t=>vr(e,t,n,!0)),t)if(!(r&&o===`expose`)){let r=yr[o]||n&&n[o];e[o]=r?r(e[o],t[o]):t[o]}return e}var yr={data:br,props:wr,emits:wr,methods:Cr,computed:Cr,beforeCreate:V,created:V,beforeMount:V,mounted:V,beforeUpdate:V,updated:V,beforeDestroy:V,beforeUnmount:V,destroyed:V,unmounted:V,activated:V,deactivated:V,errorCaptured:V,serverPrefetch:V,components:Cr,directives:Cr,watch:Tr,provide:br,inject:xr};function br(e,t){return t?e?function(){return s(h(e)?e.call(this,this):e,h(t)?t.call(this,this):t)}:t:e}function xr(e,t){return Cr(Sr(e),Sr(t))}function Sr(e){if(d(e)){let t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function V(e,t){return e?[...new Set([].concat(e,t))]:t}function Cr(e,t){return e?s(Object.create(null),e,t):t}function wr(e,t){return e?d(e)&&d(t)?[...new Set([...e,...t])]:s(Object.create(null),dr(e),dr(t??{})):t}function Tr(e,t){if(!e)return t;if(!t)return e;let n=s(Object.create(null),e);for(let r in t)n[r]=V(e[r],t[r]);return n}function Er(){return{app:null,config:{isNativeTag:i,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}var Dr=0;function Or(e,t){return function(n,r=null){h(n)||(n=s({},n)),r!=null&&!v(r)&&(r=null);let i=Er(),a=new WeakSet,o=[],c=!1,l=i.app={_uid:Dr++,_component:n,_props:r,_container:null,_context:i,_instance:null,version:va,get config(){return i.config},set config(e){},use(e,...t){return a.has(e)||(e&&h(e.install)?(a.add(e),e.install(l,...t)):h(e)&&(a.add(e),e(l,...t))),l},mixin(e){return i.mixins.includes(e)||i.mixins.push(e),l},component(e,t){return t?(i.components[e]=t,l):i.components[e]},directive(e,t){return t?(i.directives[e]=t,l):i.directives[e]},mount(a,o,s){if(!c){let u=l._ceVNode||q(n,r);return u.appContext=i,s===!0?s=`svg`:s===!1&&(s=void 0),o&&t?t(u,a):e(u,a,s),c=!0,l._container=a,a.__vue_app__=l,fa(u.component)}},onUnmount(e){o.push(e)},unmount(){c&&(rn(o,l._instance,16),e(null,l._container),delete l._container.__vue_app__)},provide(e,t){return i.provides[e]=t,l},runWithContext(e){let t=kr;kr=l;try{return e()}finally{kr=t}}};return l}}var kr=null;function Ar(e,t){if(Y){let n=Y.provides,r=Y.parent&&Y.parent.provides;r===n&&(n=Y.provides=Object.create(r)),n[e]=t}}function jr(e,t,n=!1){let r=Zi();if(r||kr){let i=kr?kr._context.provides:r?r.parent==null||r.ce?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides:void 0;if(i&&e in i)return i[e];if(arguments.length>1)return n&&h(t)?t.call(r&&r.proxy):t}}var Mr=Symbol.for(`v-scx`),Nr=()=>jr(Mr);function Pr(e,t,n){return Fr(e,t,n)}function Fr(e,n,i=t){let{immediate:a,deep:o,flush:c,once:l}=i,u=s({},i),d=n&&a||!n&&c!==`post`,f;if(ra){if(c===`sync`){let e=Nr();f=e.__watcherHandles||=[]}else if(!d){let e=()=>{};return e.stop=r,e.resume=r,e.pause=r,e}}let p=Y;u.call=(e,t,n)=>rn(e,p,t,n);let m=!1;c===`post`?u.scheduler=e=>{pi(e,p&&p.suspense)}:c!==`sync`&&(m=!0,u.scheduler=(e,t)=>{t?e():hn(e)}),u.augmentJob=e=>{n&&(e.flags|=4),m&&(e.flags|=2,p&&(e.id=p.uid,e.i=p))};let h=en(e,n,u);return ra&&(f?f.push(h):d&&h()),h}function Ir(e,t,n){let r=this.proxy,i=g(e)?e.includes(`.`)?Lr(r,e):()=>r[e]:e.bind(r,r),a;h(t)?a=t:(a=t.handler,n=t);let o=ea(this),s=Fr(i,a.bind(r),n);return o(),s}function Lr(e,t){let n=t.split(`.`);return()=>{let t=e;for(let e=0;e<n.length&&t;e++)t=t[n[e]];return t}}var Rr=(e,t)=>t===`modelValue`||t===`model-value`?e.modelModifiers:e[`${t}Modifiers`]||e[`${E(t)}Modifiers`]||e[`${D(t)}Modifiers`];function zr(e,n,...r){if(e.isUnmounted)return;let i=e.vnode.props||t,a=r,o=n.startsWith(`update:`),s=o&&Rr(i,n.slice(7));s&&(s.trim&&(a=r.map(e=>g(e)?e.trim():e)),s.number&&(a=r.map(ae)));let c,l=i[c=re(n)]||i[c=re(E(n))];!l&&o&&(l=i[c=re(D(n))]),l&&rn(l,e,6,a);let u=i[c+`Once`];if(u){if(!e.emitted)e.emitted={};else if(e.emitted[c])return;e.emitted[c]=!0,rn(u,e,6,a)}}var Br=new WeakMap;function Vr(e,t,n=!1){let r=n?Br:t.emitsCache,i=r.get(e);if(i!==void 0)return i;let a=e.emits,o={},c=!1;if(!h(e)){let r=e=>{let n=Vr(e,t,!0);n&&(c=!0,s(o,n))};!n&&t.mixins.length&&t.mixins.forEach(r),e.extends&&r(e.extends),e.mixins&&e.mixins.forEach(r)}return!a&&!c?(v(e)&&r.set(e,null),null):(d(a)?a.forEach(e=>o[e]=null):s(o,a),v(e)&&r.set(e,o),o)}function Hr(e,t){return!e||!a(t)?!1:(t=t.slice(2).replace(/Once$/,``),u(e,t[0].toLowerCase()+t.slice(1))||u(e,D(t))||u(e,t))}function Ur(e){let{type:t,vnode:n,proxy:r,withProxy:i,propsOptions:[a],slots:s,attrs:c,emit:l,render:u,renderCache:d,props:f,data:p,setupState:m,ctx:h,inheritAttrs:g}=e,_=wn(e),v,y;try{if(n.shapeFlag&4){let e=i||r,t=e;v=Ui(u.call(t,e,d,f,m,p,h)),y=c}else{let e=t;v=Ui(e.length>1?e(f,{attrs:c,slots:s,emit:l}):e(f,null)),y=t.props?c:Wr(c)}}catch(t){Oi.length=0,an(t,e,1),v=q(Ei)}let b=v;if(y&&g!==!1){let e=Object.keys(y),{shapeFlag:t}=b;e.length&&t&7&&(a&&e.some(o)&&(y=Gr(y,a)),b=Bi(b,y,!1,!0))}return n.dirs&&(b=Bi(b,null,!1,!0),b.dirs=b.dirs?b.dirs.concat(n.dirs):n.dirs),n.transition&&jn(b,n.transition),v=b,wn(_),v}var Wr=e=>{let t;for(let n in e)(n===`class`||n===`style`||a(n))&&((t||={})[n]=e[n]);return t},Gr=(e,t)=>{let n={};for(let r in e)(!o(r)||!(r.slice(9)in t))&&(n[r]=e[r]);return n};function Kr(e,t,n){let{props:r,children:i,component:a}=e,{props:o,children:s,patchFlag:c}=t,l=a.emitsOptions;if(t.dirs||t.transition)return!0;if(n&&c>=0){if(c&1024)return!0;if(c&16)return r?qr(r,o,l):!!o;if(c&8){let e=t.dynamicProps;for(let t=0;t<e.length;t++){let n=e[t];if(o[n]!==r[n]&&!Hr(l,n))return!0}}}else return(i||s)&&(!s||!s.$stable)?!0:r===o?!1:r?o?qr(r,o,l):!0:!!o;return!1}function qr(e,t,n){let r=Object.keys(t);if(r.length!==Object.keys(e).length)return!0;for(let i=0;i<r.length;i++){let a=r[i];if(t[a]!==e[a]&&!Hr(n,a))return!0}return!1}function Jr({vnode:e,parent:t},n){for(;t;){let r=t.subTree;if(r.suspense&&r.suspense.activeBranch===e&&(r.el=e.el),r===e)(e=t.vnode).el=n,t=t.parent;else break}}var Yr={},Xr=()=>Object.create(Yr),Zr=e=>Object.getPrototypeOf(e)===Yr;function Qr(e,t,n,r=!1){let i={},a=Xr();for(let n in e.propsDefaults=Object.create(null),ei(e,t,i,a),e.propsOptions[0])n in i||(i[n]=void 0);n?e.props=r?i:Mt(i):e.type.props?e.props=i:e.props=a,e.attrs=a}function $r(e,t,n,r){let{props:i,attrs:a,vnode:{patchFlag:o}}=e,s=L(i),[c]=e.propsOptions,l=!1;if((r||o>0)&&!(o&16)){if(o&8){let n=e.vnode.dynamicProps;for(let r=0;r<n.length;r++){let o=n[r];if(Hr(e.emitsOptions,o))continue;let d=t[o];if(c)if(u(a,o))d!==a[o]&&(a[o]=d,l=!0);else{let t=E(o);i[t]=ti(c,s,t,d,e,!1)}else d!==a[o]&&(a[o]=d,l=!0)}}}else{ei(e,t,i,a)&&(l=!0);let r;for(let a in s)(!t||!u(t,a)&&((r=D(a))===a||!u(t,r)))&&(c?n&&(n[a]!==void 0||n[r]!==void 0)&&(i[a]=ti(c,s,a,void 0,e,!0)):delete i[a]);if(a!==s)for(let e in a)(!t||!u(t,e))&&(delete a[e],l=!0)}l&&Xe(e.attrs,`set`,``)}function ei(e,n,r,i){let[a,o]=e.propsOptions,s=!1,c;if(n)for(let t in n){if(T(t))continue;let l=n[t],d;a&&u(a,d=E(t))?!o||!o.includes(d)?r[d]=l:(c||={})[d]=l:Hr(e.emitsOptions,t)||(!(t in i)||l!==i[t])&&(i[t]=l,s=!0)}if(o){let n=L(r),i=c||t;for(let t=0;t<o.length;t++){let s=o[t];r[s]=ti(a,n,s,i[s],e,!u(i,s))}}return s}function ti(e,t,n,r,i,a){let o=e[n];if(o!=null){let e=u(o,`default`);if(e&&r===void 0){let e=o.default;if(o.type!==Function&&!o.skipFactory&&h(e)){let{propsDefaults:a}=i;if(n in a)r=a[n];else{let o=ea(i);r=a[n]=e.call(null,t),o()}}else r=e;i.ce&&i.ce._setProp(n,r)}o[0]&&(a&&!e?r=!1:o[1]&&(r===``||r===D(n))&&(r=!0))}return r}var ni=new WeakMap;function ri(e,r,i=!1){let a=i?ni:r.propsCache,o=a.get(e);if(o)return o;let c=e.props,l={},f=[],p=!1;if(!h(e)){let t=e=>{p=!0;let[t,n]=ri(e,r,!0);s(l,t),n&&f.push(...n)};!i&&r.mixins.length&&r.mixins.forEach(t),e.extends&&t(e.extends),e.mixins&&e.mixins.forEach(t)}if(!c&&!p)return v(e)&&a.set(e,n),n;if(d(c))for(let e=0;e<c.length;e++){let n=E(c[e]);ii(n)&&(l[n]=t)}else if(c)for(let e in c){let t=E(e);if(ii(t)){let n=c[e],r=l[t]=d(n)||h(n)?{type:n}:s({},n),i=r.type,a=!1,o=!0;if(d(i))for(let e=0;e<i.length;++e){let t=i[e],n=h(t)&&t.name;if(n===`Boolean`){a=!0;break}else n===`String`&&(o=!1)}else a=h(i)&&i.name===`Boolean`;r[0]=a,r[1]=o,(a||u(r,`default`))&&f.push(t)}}let m=[l,f];return v(e)&&a.set(e,m),m}function ii(e){return e[0]!==`$`&&!T(e)}var ai=e=>e===`_`||e===`_ctx`||e===`$stable`,oi=e=>d(e)?e.map(Ui):[Ui(e)],si=(e,t,n)=>{if(t._n)return t;let r=Tn((...e)=>oi(t(...e)),n);return r._c=!1,r},ci=(e,t,n)=>{let r=e._ctx;for(let n in e){if(ai(n))continue;let i=e[n];if(h(i))t[n]=si(n,i,r);else if(i!=null){let e=oi(i);t[n]=()=>e}}},li=(e,t)=>{let n=oi(t);e.slots.default=()=>n},ui=(e,t,n)=>{for(let r in t)(n||!ai(r))&&(e[r]=t[r])},di=(e,t,n)=>{let r=e.slots=Xr();if(e.vnode.shapeFlag&32){let e=t._;e?(ui(r,t,n),n&&A(r,`_`,e,!0)):ci(t,r)}else t&&li(e,t)},fi=(e,n,r)=>{let{vnode:i,slots:a}=e,o=!0,s=t;if(i.shapeFlag&32){let e=n._;e?r&&e===1?o=!1:ui(a,n,r):(o=!n.$stable,ci(n,a)),s=n}else n&&(li(e,n),s={default:1});if(o)for(let e in a)!ai(e)&&s[e]==null&&delete a[e]},pi=wi;function mi(e){return hi(e)}function hi(e,i){let a=se();a.__VUE__=!0;let{insert:o,remove:s,patchProp:c,createElement:l,createText:u,createComment:d,setText:f,setElementText:p,parentNode:m,nextSibling:h,setScopeId:g=r,insertStaticContent:_}=e,v=(e,t,n,r=null,i=null,a=null,o=void 0,s=null,c=!!t.dynamicChildren)=>{if(e===t)return;e&&!Fi(e,t)&&(r=ge(e),M(e,i,a,!0),e=null),t.patchFlag===-2&&(c=!1,t.dynamicChildren=null);let{type:l,ref:u,shapeFlag:d}=t;switch(l){case Ti:y(e,t,n,r);break;case Ei:b(e,t,n,r);break;case Di:e??x(t,n,r,o);break;case H:re(e,t,n,r,i,a,o,s,c);break;default:d&1?w(e,t,n,r,i,a,o,s,c):d&6?k(e,t,n,r,i,a,o,s,c):(d&64||d&128)&&l.process(e,t,n,r,i,a,o,s,c,N)}u!=null&&i?Fn(u,e&&e.ref,a,t||e,!t):u==null&&e&&e.ref!=null&&Fn(e.ref,null,a,e,!0)},y=(e,t,n,r)=>{if(e==null)o(t.el=u(t.children),n,r);else{let n=t.el=e.el;t.children!==e.children&&f(n,t.children)}},b=(e,t,n,r)=>{e==null?o(t.el=d(t.children||``),n,r):t.el=e.el},x=(e,t,n,r)=>{[e.el,e.anchor]=_(e.children,t,n,r,e.el,e.anchor)},S=({el:e,anchor:t},n,r)=>{let i;for(;e&&e!==t;)i=h(e),o(e,n,r),e=i;o(t,n,r)},C=({el:e,anchor:t})=>{let n;for(;e&&e!==t;)n=h(e),s(e),e=n;s(t)},w=(e,t,n,r,i,a,o,s,c)=>{if(t.type===`svg`?o=`svg`:t.type===`math`&&(o=`mathml`),e==null)ee(t,n,r,i,a,o,s,c);else{let n=e.el&&e.el._isVueCE?e.el:null;try{n&&n._beginPatch(),ne(e,t,i,a,o,s,c)}finally{n&&n._endPatch()}}},ee=(e,t,n,r,i,a,s,u)=>{let d,f,{props:m,shapeFlag:h,transition:g,dirs:_}=e;if(d=e.el=l(e.type,a,m&&m.is,m),h&8?p(d,e.children):h&16&&E(e.children,d,null,r,i,gi(e,a),s,u),_&&Dn(e,null,r,`created`),te(d,e,e.scopeId,s,r),m){for(let e in m)e!==`value`&&!T(e)&&c(d,e,null,m[e],a,r);`value`in m&&c(d,`value`,null,m.value,a),(f=m.onVnodeBeforeMount)&&qi(f,r,e)}_&&Dn(e,null,r,`beforeMount`);let v=vi(i,g);v&&g.beforeEnter(d),o(d,t,n),((f=m&&m.onVnodeMounted)||v||_)&&pi(()=>{f&&qi(f,r,e),v&&g.enter(d),_&&Dn(e,null,r,`mounted`)},i)},te=(e,t,n,r,i)=>{if(n&&g(e,n),r)for(let t=0;t<r.length;t++)g(e,r[t]);if(i){let n=i.subTree;if(t===n||Ci(n.type)&&(n.ssContent===t||n.ssFallback===t)){let t=i.vnode;te(e,t,t.scopeId,t.slotScopeIds,i.parent)}}},E=(e,t,n,r,i,a,o,s,c=0)=>{for(let l=c;l<e.length;l++)v(null,e[l]=s?Wi(e[l]):Ui(e[l]),t,n,r,i,a,o,s)},ne=(e,n,r,i,a,o,s)=>{let l=n.el=e.el,{patchFlag:u,dynamicChildren:d,dirs:f}=n;u|=e.patchFlag&16;let m=e.props||t,h=n.props||t,g;if(r&&_i(r,!1),(g=h.onVnodeBeforeUpdate)&&qi(g,r,n,e),f&&Dn(n,e,r,`beforeUpdate`),r&&_i(r,!0),(m.innerHTML&&h.innerHTML==null||m.textContent&&h.textContent==null)&&p(l,``),d?D(e.dynamicChildren,d,l,r,i,gi(n,a),o):s||le(e,n,l,null,r,i,gi(n,a),o,!1),u>0){if(u&16)O(l,m,h,r,a);else if(u&2&&m.class!==h.class&&c(l,`class`,null,h.class,a),u&4&&c(l,`style`,m.style,h.style,a),u&8){let e=n.dynamicProps;for(let t=0;t<e.length;t++){let n=e[t],i=m[n],o=h[n];(o!==i||n===`value`)&&c(l,n,i,o,a,r)}}u&1&&e.children!==n.children&&p(l,n.children)}else !s&&d==null&&O(l,m,h,r,a);((g=h.onVnodeUpdated)||f)&&pi(()=>{g&&qi(g,r,n,e),f&&Dn(n,e,r,`updated`)},i)},D=(e,t,n,r,i,a,o)=>{for(let s=0;s<t.length;s++){let c=e[s],l=t[s];v(c,l,c.el&&(c.type===H||!Fi(c,l)||c.shapeFlag&198)?m(c.el):n,null,r,i,a,o,!0)}},O=(e,n,r,i,a)=>{if(n!==r){if(n!==t)for(let t in n)!T(t)&&!(t in r)&&c(e,t,n[t],null,a,i);for(let t in r){if(T(t))continue;let o=r[t],s=n[t];o!==s&&t!==`value`&&c(e,t,s,o,a,i)}`value`in r&&c(e,`value`,n.value,r.value,a)}},re=(e,t,n,r,i,a,s,c,l)=>{let d=t.el=e?e.el:u(``),f=t.anchor=e?e.anchor:u(``),{patchFlag:p,dynamicChildren:m,slotScopeIds:h}=t;h&&(c=c?c.concat(h):h),e==null?(o(d,n,r),o(f,n,r),E(t.children||[],n,f,i,a,s,c,l)):p>0&&p&64&&m&&e.dynamicChildren?(D(e.dynamicChildren,m,n,i,a,s,c),(t.key!=null||i&&t===i.subTree)&&yi(e,t,!0)):le(e,t,n,f,i,a,s,c,l)},k=(e,t,n,r,i,a,o,s,c)=>{t.slotScopeIds=s,e==null?t.shapeFlag&512?i.ctx.activate(t,n,r,o,c):A(t,n,r,i,a,o,c):ae(e,t,c)},A=(e,t,n,r,i,a,o)=>{let s=e.component=Xi(e,r,i);if(Rn(e)&&(s.ctx.renderer=N),ia(s,!1,o),s.asyncDep){if(i&&i.registerDep(s,oe,o),!e.el){let r=s.subTree=q(Ei);b(null,r,t,n),e.placeholder=r.el}}else oe(s,e,t,n,i,a,o)},ae=(e,t,n)=>{let r=t.component=e.component;if(Kr(e,t,n))if(r.asyncDep&&!r.asyncResolved){ce(r,t,n);return}else r.next=t,r.update();else t.el=e.el,r.vnode=t},oe=(e,t,n,r,i,a,o)=>{let s=()=>{if(e.isMounted){let{next:t,bu:n,u:r,parent:c,vnode:l}=e;{let n=xi(e);if(n){t&&(t.el=l.el,ce(e,t,o)),n.asyncDep.then(()=>{e.isUnmounted||s()});return}}let u=t,d;_i(e,!1),t?(t.el=l.el,ce(e,t,o)):t=l,n&&ie(n),(d=t.props&&t.props.onVnodeBeforeUpdate)&&qi(d,c,t,l),_i(e,!0);let f=Ur(e),p=e.subTree;e.subTree=f,v(p,f,m(p.el),ge(p),e,i,a),t.el=f.el,u===null&&Jr(e,f.el),r&&pi(r,i),(d=t.props&&t.props.onVnodeUpdated)&&pi(()=>qi(d,c,t,l),i)}else{let o,{el:s,props:c}=t,{bm:l,m:u,parent:d,root:f,type:p}=e,m=Ln(t);if(_i(e,!1),l&&ie(l),!m&&(o=c&&c.onVnodeBeforeMount)&&qi(o,d,t),_i(e,!0),s&&be){let t=()=>{e.subTree=Ur(e),be(s,e.subTree,e,i,null)};m&&p.__asyncHydrate?p.__asyncHydrate(s,e,t):t()}else{f.ce&&f.ce._def.shadowRoot!==!1&&f.ce._injectChildStyle(p);let o=e.subTree=Ur(e);v(null,o,n,r,e,i,a),t.el=o.el}if(u&&pi(u,i),!m&&(o=c&&c.onVnodeMounted)){let e=t;pi(()=>qi(o,d,e),i)}(t.shapeFlag&256||d&&Ln(d.vnode)&&d.vnode.shapeFlag&256)&&e.a&&pi(e.a,i),e.isMounted=!0,t=n=r=null}};e.scope.on();let c=e.effect=new we(s);e.scope.off();let l=e.update=c.run.bind(c),u=e.job=c.runIfDirty.bind(c);u.i=e,u.id=e.uid,c.scheduler=()=>hn(u),_i(e,!0),l()},ce=(e,t,n)=>{t.component=e;let r=e.vnode.props;e.vnode=t,e.next=null,$r(e,t.props,r,n),fi(e,t.children,n),ze(),vn(e),Be()},le=(e,t,n,r,i,a,o,s,c=!1)=>{let l=e&&e.children,u=e?e.shapeFlag:0,d=t.children,{patchFlag:f,shapeFlag:m}=t;if(f>0){if(f&128){j(l,d,n,r,i,a,o,s,c);return}else if(f&256){ue(l,d,n,r,i,a,o,s,c);return}}m&8?(u&16&&he(l,i,a),d!==l&&p(n,d)):u&16?m&16?j(l,d,n,r,i,a,o,s,c):he(l,i,a,!0):(u&8&&p(n,``),m&16&&E(d,n,r,i,a,o,s,c))},ue=(e,t,r,i,a,o,s,c,l)=>{e||=n,t||=n;let u=e.length,d=t.length,f=Math.min(u,d),p;for(p=0;p<f;p++){let n=t[p]=l?Wi(t[p]):Ui(t[p]);v(e[p],n,r,null,a,o,s,c,l)}u>d?he(e,a,o,!0,!1,f):E(t,r,i,a,o,s,c,l,f)},j=(e,t,r,i,a,o,s,c,l)=>{let u=0,d=t.length,f=e.length-1,p=d-1;for(;u<=f&&u<=p;){let n=e[u],i=t[u]=l?Wi(t[u]):Ui(t[u]);if(Fi(n,i))v(n,i,r,null,a,o,s,c,l);else break;u++}for(;u<=f&&u<=p;){let n=e[f],i=t[p]=l?Wi(t[p]):Ui(t[p]);if(Fi(n,i))v(n,i,r,null,a,o,s,c,l);else break;f--,p--}if(u>f){if(u<=p){let e=p+1,n=e<d?t[e].el:i;for(;u<=p;)v(null,t[u]=l?Wi(t[u]):Ui(t[u]),r,n,a,o,s,c,l),u++}}else if(u>p)for(;u<=f;)M(e[u],a,o,!0),u++;else{let m=u,h=u,g=new Map;for(u=h;u<=p;u++){let e=t[u]=l?Wi(t[u]):Ui(t[u]);e.key!=null&&g.set(e.key,u)}let _,y=0,b=p-h+1,x=!1,S=0,C=Array(b);for(u=0;u<b;u++)C[u]=0;for(u=m;u<=f;u++){let n=e[u];if(y>=b){M(n,a,o,!0);continue}let i;if(n.key!=null)i=g.get(n.key);else for(_=h;_<=p;_++)if(C[_-h]===0&&Fi(n,t[_])){i=_;break}i===void 0?M(n,a,o,!0):(C[i-h]=u+1,i>=S?S=i:x=!0,v(n,t[i],r,null,a,o,s,c,l),y++)}let w=x?bi(C):n;for(_=w.length-1,u=b-1;u>=0;u--){let e=h+u,n=t[e],f=t[e+1],p=e+1<d?f.el||f.placeholder:i;C[u]===0?v(null,n,r,p,a,o,s,c,l):x&&(_<0||u!==w[_]?de(n,r,p,2):_--)}}},de=(e,t,n,r,i=null)=>{let{el:a,type:c,transition:l,children:u,shapeFlag:d}=e;if(d&6){de(e.component.subTree,t,n,r);return}if(d&128){e.suspense.move(t,n,r);return}if(d&64){c.move(e,t,n,N);return}if(c===H){o(a,t,n);for(let e=0;e<u.length;e++)de(u[e],t,n,r);o(e.anchor,t,n);return}if(c===Di){S(e,t,n);return}if(r!==2&&d&1&&l)if(r===0)l.beforeEnter(a),o(a,t,n),pi(()=>l.enter(a),i);else{let{leave:r,delayLeave:i,afterLeave:c}=l,u=()=>{e.ctx.isUnmounted?s(a):o(a,t,n)},d=()=>{a._isLeaving&&a[An](!0),r(a,()=>{u(),c&&c()})};i?i(a,u,d):d()}else o(a,t,n)},M=(e,t,n,r=!1,i=!1)=>{let{type:a,props:o,ref:s,children:c,dynamicChildren:l,shapeFlag:u,patchFlag:d,dirs:f,cacheIndex:p}=e;if(d===-2&&(i=!1),s!=null&&(ze(),Fn(s,null,n,e,!0),Be()),p!=null&&(t.renderCache[p]=void 0),u&256){t.ctx.deactivate(e);return}let m=u&1&&f,h=!Ln(e),g;if(h&&(g=o&&o.onVnodeBeforeUnmount)&&qi(g,t,e),u&6)me(e.component,n,r);else{if(u&128){e.suspense.unmount(n,r);return}m&&Dn(e,null,t,`beforeUnmount`),u&64?e.type.remove(e,t,n,N,r):l&&!l.hasOnce&&(a!==H||d>0&&d&64)?he(l,t,n,!1,!0):(a===H&&d&384||!i&&u&16)&&he(c,t,n),r&&fe(e)}(h&&(g=o&&o.onVnodeUnmounted)||m)&&pi(()=>{g&&qi(g,t,e),m&&Dn(e,null,t,`unmounted`)},n)},fe=e=>{let{type:t,el:n,anchor:r,transition:i}=e;if(t===H){pe(n,r);return}if(t===Di){C(e);return}let a=()=>{s(n),i&&!i.persisted&&i.afterLeave&&i.afterLeave()};if(e.shapeFlag&1&&i&&!i.persisted){let{leave:t,delayLeave:r}=i,o=()=>t(n,a);r?r(e.el,a,o):o()}else a()},pe=(e,t)=>{let n;for(;e!==t;)n=h(e),s(e),e=n;s(t)},me=(e,t,n)=>{let{bum:r,scope:i,job:a,subTree:o,um:s,m:c,a:l}=e;Si(c),Si(l),r&&ie(r),i.stop(),a&&(a.flags|=8,M(o,e,t,n)),s&&pi(s,t),pi(()=>{e.isUnmounted=!0},t)},he=(e,t,n,r=!1,i=!1,a=0)=>{for(let o=a;o<e.length;o++)M(e[o],t,n,r,i)},ge=e=>{if(e.shapeFlag&6)return ge(e.component.subTree);if(e.shapeFlag&128)return e.suspense.next();let t=h(e.anchor||e.el),n=t&&t[On];return n?h(n):t},_e=!1,ve=(e,t,n)=>{e==null?t._vnode&&M(t._vnode,null,null,!0):v(t._vnode||null,e,t,null,null,null,n),t._vnode=e,_e||=(_e=!0,vn(),yn(),!1)},N={p:v,um:M,m:de,r:fe,mt:A,mc:E,pc:le,pbc:D,n:ge,o:e},ye,be;return i&&([ye,be]=i(N)),{render:ve,hydrate:ye,createApp:Or(ve,ye)}}function gi({type:e,props:t},n){return n===`svg`&&e===`foreignObject`||n===`mathml`&&e===`annotation-xml`&&t&&t.encoding&&t.encoding.includes(`html`)?void 0:n}function _i({effect:e,job:t},n){n?(e.flags|=32,t.flags|=4):(e.flags&=-33,t.flags&=-5)}function vi(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function yi(e,t,n=!1){let r=e.children,i=t.children;if(d(r)&&d(i))for(let e=0;e<r.length;e++){let t=r[e],a=i[e];a.shapeFlag&1&&!a.dynamicChildren&&((a.patchFlag<=0||a.patchFlag===32)&&(a=i[e]=Wi(i[e]),a.el=t.el),!n&&a.patchFlag!==-2&&yi(t,a)),a.type===Ti&&a.patchFlag!==-1&&(a.el=t.el),a.type===Ei&&!a.el&&(a.el=t.el)}}function bi(e){let t=e.slice(),n=[0],r,i,a,o,s,c=e.length;for(r=0;r<c;r++){let c=e[r];if(c!==0){if(i=n[n.length-1],e[i]<c){t[r]=i,n.push(r);continue}for(a=0,o=n.length-1;a<o;)s=a+o>>1,e[n[s]]<c?a=s+1:o=s;c<e[n[a]]&&(a>0&&(t[r]=n[a-1]),n[a]=r)}}for(a=n.length,o=n[a-1];a-- >0;)n[a]=o,o=t[o];return n}function xi(e){let t=e.subTree.component;if(t)return t.asyncDep&&!t.asyncResolved?t:xi(t)}function Si(e){if(e)for(let t=0;t<e.length;t++)e[t].flags|=8}var Ci=e=>e.__isSuspense;function wi(e,t){t&&t.pendingBranch?d(e)?t.effects.push(...e):t.effects.push(e):_n(e)}var H=Symbol.for(`v-fgt`),Ti=Symbol.for(`v-txt`),Ei=Symbol.for(`v-cmt`),Di=Symbol.for(`v-stc`),Oi=[],U=null;function W(e=!1){Oi.push(U=e?null:[])}function ki(){Oi.pop(),U=Oi[Oi.length-1]||null}var Ai=1;function ji(e,t=!1){Ai+=e,e<0&&U&&t&&(U.hasOnce=!0)}function Mi(e){return e.dynamicChildren=Ai>0?U||n:null,ki(),Ai>0&&U&&U.push(e),e}function G(e,t,n,r,i,a){return Mi(K(e,t,n,r,i,a,!0))}function Ni(e,t,n,r,i){return Mi(q(e,t,n,r,i,!0))}function Pi(e){return e?e.__v_isVNode===!0:!1}function Fi(e,t){return e.type===t.type&&e.key===t.key}var Ii=({key:e})=>e??null,Li=({ref:e,ref_key:t,ref_for:n})=>(typeof e==`number`&&(e=``+e),e==null?null:g(e)||R(e)||h(e)?{i:Sn,r:e,k:t,f:!!n}:e);function K(e,t=null,n=null,r=0,i=null,a=e===H?0:1,o=!1,s=!1){let c={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&Ii(t),ref:t&&Li(t),scopeId:Cn,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:a,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null,ctx:Sn};return s?(Gi(c,n),a&128&&e.normalize(c)):n&&(c.shapeFlag|=g(n)?8:16),Ai>0&&!o&&U&&(c.patchFlag>0||a&6)&&c.patchFlag!==32&&U.push(c),c}var q=Ri;function Ri(e,t=null,n=null,r=0,i=null,a=!1){if((!e||e===rr)&&(e=Ei),Pi(e)){let r=Bi(e,t,!0);return n&&Gi(r,n),Ai>0&&!a&&U&&(r.shapeFlag&6?U[U.indexOf(e)]=r:U.push(r)),r.patchFlag=-2,r}if(ma(e)&&(e=e.__vccOpts),t){t=zi(t);let{class:e,style:n}=t;e&&!g(e)&&(t.class=M(e)),v(n)&&(Rt(n)&&!d(n)&&(n=s({},n)),t.style=ce(n))}let o=g(e)?1:Ci(e)?128:kn(e)?64:v(e)?4:h(e)?2:0;return K(e,t,n,r,i,o,a,!0)}function zi(e){return e?Rt(e)||Zr(e)?s({},e):e:null}function Bi(e,t,n=!1,r=!1){let{props:i,ref:a,patchFlag:o,children:s,transition:c}=e,l=t?Ki(i||{},t):i,u={__v_isVNode:!0,__v_skip:!0,type:e.type,props:l,key:l&&Ii(l),ref:t&&t.ref?n&&a?d(a)?a.concat(Li(t)):[a,Li(t)]:Li(t):a,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:s,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==H?o===-1?16:o|16:o,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:c,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&Bi(e.ssContent),ssFallback:e.ssFallback&&Bi(e.ssFallback),placeholder:e.placeholder,el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return c&&r&&jn(u,c.clone(u)),u}function Vi(e=` `,t=0){return q(Ti,null,e,t)}function Hi(e,t){let n=q(Di,null,e);return n.staticCount=t,n}function J(e=``,t=!1){return t?(W(),Ni(Ei,null,e)):q(Ei,null,e)}function Ui(e){return e==null||typeof e==`boolean`?q(Ei):d(e)?q(H,null,e.slice()):Pi(e)?Wi(e):q(Ti,null,String(e))}function Wi(e){return e.el===null&&e.patchFlag!==-1||e.memo?e:Bi(e)}function Gi(e,t){let n=0,{shapeFlag:r}=e;if(t==null)t=null;else if(d(t))n=16;else if(typeof t==`object`)if(r&65){let n=t.default;n&&(n._c&&(n._d=!1),Gi(e,n()),n._c&&(n._d=!0));return}else{n=32;let r=t._;!r&&!Zr(t)?t._ctx=Sn:r===3&&Sn&&(Sn.slots._===1?t._=1:(t._=2,e.patchFlag|=1024))}else h(t)?(t={default:t,_ctx:Sn},n=32):(t=String(t),r&64?(n=16,t=[Vi(t)]):n=8);e.children=t,e.shapeFlag|=n}function Ki(...e){let t={};for(let n=0;n<e.length;n++){let r=e[n];for(let e in r)if(e===`class`)t.class!==r.class&&(t.class=M([t.class,r.class]));else if(e===`style`)t.style=ce([t.style,r.style]);else if(a(e)){let n=t[e],i=r[e];i&&n!==i&&!(d(n)&&n.includes(i))&&(t[e]=n?[].concat(n,i):i)}else e!==``&&(t[e]=r[e])}return t}function qi(e,t,n,r=null){rn(e,t,7,[n,r])}var Ji=Er(),Yi=0;function Xi(e,n,r){let i=e.type,a=(n?n.appContext:e.appContext)||Ji,o={uid:Yi++,vnode:e,type:i,parent:n,appContext:a,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new xe(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:n?n.provides:Object.create(a.provides),ids:n?n.ids:[``,0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:ri(i,a),emitsOptions:Vr(i,a),emit:null,emitted:null,propsDefaults:t,inheritAttrs:i.inheritAttrs,ctx:t,data:t,props:t,attrs:t,slots:t,refs:t,setupState:t,setupContext:null,suspense:r,suspenseId:r?r.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return o.ctx={_:o},o.root=n?n.root:o,o.emit=zr.bind(null,o),e.ce&&e.ce(o),o}var Y=null,Zi=()=>Y||Sn,Qi,$i;{let e=se(),t=(t,n)=>{let r;return(r=e[t])||(r=e[t]=[]),r.push(n),e=>{r.length>1?r.forEach(t=>t(e)):r[0](e)}};Qi=t(`__VUE_INSTANCE_SETTERS__`,e=>Y=e),$i=t(`__VUE_SSR_SETTERS__`,e=>ra=e)}var ea=e=>{let t=Y;return Qi(e),e.scope.on(),()=>{e.scope.off(),Qi(t)}},ta=()=>{Y&&Y.scope.off(),Qi(null)};function na(e){return e.vnode.shapeFlag&4}var ra=!1;function ia(e,t=!1,n=!1){t&&$i(t);let{props:r,children:i}=e.vnode,a=na(e);Qr(e,r,a,t),di(e,i,n||t);let o=a?aa(e,t):void 0;return t&&$i(!1),o}function aa(e,t){let n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,ur);let{setup:r}=n;if(r){ze();let n=e.setupContext=r.length>1?da(e):null,i=ea(e),a=nn(r,e,0,[e.props,n]),o=y(a);if(Be(),i(),(o||e.sp)&&!Ln(e)&&Nn(e),o){if(a.then(ta,ta),t)return a.then(n=>{oa(e,n,t)}).catch(t=>{an(t,e,0)});e.asyncDep=a}else oa(e,a,t)}else la(e,t)}function oa(e,t,n){h(t)?e.type.__ssrInlineRender?e.ssrRender=t:e.render=t:v(t)&&(e.setupState=qt(t)),la(e,n)}var sa,ca;function la(e,t,n){let i=e.type;if(!e.render){if(!t&&sa&&!i.render){let t=i.template||_r(e).template;if(t){let{isCustomElement:n,compilerOptions:r}=e.appContext.config,{delimiters:a,compilerOptions:o}=i;i.render=sa(t,s(s({isCustomElement:n,delimiters:a},r),o))}}e.render=i.render||r,ca&&ca(e)}{let t=ea(e);ze();try{pr(e)}finally{Be(),t()}}}var ua={get(e,t){return I(e,`get`,``),e[t]}};function da(e){return{attrs:new Proxy(e.attrs,ua),slots:e.slots,emit:e.emit,expose:t=>{e.exposed=t||{}}}}function fa(e){return e.exposed?e.exposeProxy||=new Proxy(qt(zt(e.exposed)),{get(t,n){if(n in t)return t[n];if(n in cr)return cr[n](e)},has(e,t){return t in e||t in cr}}):e.proxy}function pa(e,t=!0){return h(e)?e.displayName||e.name:e.name||t&&e.__name}function ma(e){return h(e)&&`__vccOpts`in e}var ha=(e,t)=>Yt(e,t,ra);function ga(e,t,n){try{ji(-1);let r=arguments.length;return r===2?v(t)&&!d(t)?Pi(t)?q(e,null,[t]):q(e,t):q(e,null,t):(r>3?n=Array.prototype.slice.call(arguments,2):r===3&&Pi(n)&&(n=[n]),q(e,t,n))}finally{ji(1)}}function _a(e,t){let n=e.memo;if(n.length!=t.length)return!1;for(let e=0;e<n.length;e++)if(k(n[e],t[e]))return!1;return Ai>0&&U&&U.push(e),!0}var va=`3.5.25`,ya=void 0,ba=typeof window<`u`&&window.trustedTypes;if(ba)try{ya=ba.createPolicy(`vue`,{createHTML:e=>e})}catch{}var xa=ya?e=>ya.createHTML(e):e=>e,Sa=`http://www.w3.org/2000/svg`,Ca=`http://www.w3.org/1998/Math/MathML`,wa=typeof document<`u`?document:null,Ta=wa&&wa.createElement(`template`),Ea={insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{let t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,r)=>{let i=t===`svg`?wa.createElementNS(Sa,e):t===`mathml`?wa.createElementNS(Ca,e):n?wa.createElement(e,{is:n}):wa.createElement(e);return e===`select`&&r&&r.multiple!=null&&i.setAttribute(`multiple`,r.multiple),i},createText:e=>wa.createTextNode(e),createComment:e=>wa.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>wa.querySelector(e),setScopeId(e,t){e.setAttribute(t,``)},insertStaticContent(e,t,n,r,i,a){let o=n?n.previousSibling:t.lastChild;if(i&&(i===a||i.nextSibling))for(;t.insertBefore(i.cloneNode(!0),n),!(i===a||!(i=i.nextSibling)););else{Ta.innerHTML=xa(r===`svg`?`<svg>${e}</svg>`:r===`mathml`?`<math>${e}</math>`:e);let i=Ta.content;if(r===`svg`||r===`mathml`){let e=i.firstChild;for(;e.firstChild;)i.appendChild(e.firstChild);i.removeChild(e)}t.insertBefore(i,n)}return[o?o.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}},Da=Symbol(`_vtc`);function Oa(e,t,n){let r=e[Da];r&&(t=(t?[t,...r]:[...r]).join(` `)),t==null?e.removeAttribute(`class`):n?e.setAttribute(`class`,t):e.className=t}var ka=Symbol(`_vod`),Aa=Symbol(`_vsh`),ja=Symbol(``),Ma=/(?:^|;)\s*display\s*:/;function Na(e,t,n){let r=e.style,i=g(n),a=!1;if(n&&!i){if(t)if(g(t))for(let e of t.split(`;`)){let t=e.slice(0,e.indexOf(`:`)).trim();n[t]??Fa(r,t,``)}else for(let e in t)n[e]??Fa(r,e,``);for(let e in n)e===`display`&&(a=!0),Fa(r,e,n[e])}else if(i){if(t!==n){let e=r[ja];e&&(n+=`;`+e),r.cssText=n,a=Ma.test(n)}}else t&&e.removeAttribute(`style`);ka in e&&(e[ka]=a?r.display:``,e[Aa]&&(r.display=`none`))}var Pa=/\s*!important$/;function Fa(e,t,n){if(d(n))n.forEach(n=>Fa(e,t,n));else if(n??=``,t.startsWith(`--`))e.setProperty(t,n);else{let r=Ra(e,t);Pa.test(n)?e.setProperty(D(r),n.replace(Pa,``),`important`):e[r]=n}}var Ia=[`Webkit`,`Moz`,`ms`],La={};function Ra(e,t){let n=La[t];if(n)return n;let r=E(t);if(r!==`filter`&&r in e)return La[t]=r;r=O(r);for(let n=0;n<Ia.length;n++){let i=Ia[n]+r;if(i in e)return La[t]=i}return t}var za=`http://www.w3.org/1999/xlink`;function Ba(e,t,n,r,i,a=pe(t)){r&&t.startsWith(`xlink:`)?n==null?e.removeAttributeNS(za,t.slice(6,t.length)):e.setAttributeNS(za,t,n):n==null||a&&!me(n)?e.removeAttribute(t):e.setAttribute(t,a?``:_(n)?String(n):n)}function Va(e,t,n,r,i){if(t===`innerHTML`||t===`textContent`){n!=null&&(e[t]=t===`innerHTML`?xa(n):n);return}let a=e.tagName;if(t===`value`&&a!==`PROGRESS`&&!a.includes(`-`)){let r=a===`OPTION`?e.getAttribute(`value`)||``:e.value,i=n==null?e.type===`checkbox`?`on`:``:String(n);(r!==i||!(`_value`in e))&&(e.value=i),n??e.removeAttribute(t),e._value=n;return}let o=!1;if(n===``||n==null){let r=typeof e[t];r===`boolean`?n=me(n):n==null&&r===`string`?(n=``,o=!0):r===`number`&&(n=0,o=!0)}try{e[t]=n}catch{}o&&e.removeAttribute(i||t)}function Ha(e,t,n,r){e.addEventListener(t,n,r)}function Ua(e,t,n,r){e.removeEventListener(t,n,r)}var Wa=Symbol(`_vei`);function Ga(e,t,n,r,i=null){let a=e[Wa]||(e[Wa]={}),o=a[t];if(r&&o)o.value=r;else{let[n,s]=qa(t);r?Ha(e,n,a[t]=Za(r,i),s):o&&(Ua(e,n,o,s),a[t]=void 0)}}var Ka=/(?:Once|Passive|Capture)$/;function qa(e){let t;if(Ka.test(e)){t={};let n;for(;n=e.match(Ka);)e=e.slice(0,e.length-n[0].length),t[n[0].toLowerCase()]=!0}return[e[2]===`:`?e.slice(3):D(e.slice(2)),t]}var Ja=0,Ya=Promise.resolve(),Xa=()=>Ja||=(Ya.then(()=>Ja=0),Date.now());function Za(e,t){let n=e=>{if(!e._vts)e._vts=Date.now();else if(e._vts<=n.attached)return;rn(Qa(e,n.value),t,5,[e])};return n.value=e,n.attached=Xa(),n}function Qa(e,t){if(d(t)){let n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(e=>t=>!t._stopped&&e&&e(t))}else return t}var $a=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)>96&&e.charCodeAt(2)<123,eo=(e,t,n,r,i,s)=>{let c=i===`svg`;t===`class`?Oa(e,r,c):t===`style`?Na(e,n,r):a(t)?o(t)||Ga(e,t,n,r,s):(t[0]===`.`?(t=t.slice(1),!0):t[0]===`^`?(t=t.slice(1),!1):to(e,t,r,c))?(Va(e,t,r),!e.tagName.includes(`-`)&&(t===`value`||t===`checked`||t===`selected`)&&Ba(e,t,r,c,s,t!==`value`)):e._isVueCE&&(/[A-Z]/.test(t)||!g(r))?Va(e,E(t),r,s,t):(t===`true-value`?e._trueValue=r:t===`false-value`&&(e._falseValue=r),Ba(e,t,r,c))};function to(e,t,n,r){if(r)return!!(t===`innerHTML`||t===`textContent`||t in e&&$a(t)&&h(n));if(t===`spellcheck`||t===`draggable`||t===`translate`||t===`autocorrect`||t===`sandbox`&&e.tagName===`IFRAME`||t===`form`||t===`list`&&e.tagName===`INPUT`||t===`type`&&e.tagName===`TEXTAREA`)return!1;if(t===`width`||t===`height`){let t=e.tagName;if(t===`IMG`||t===`VIDEO`||t===`CANVAS`||t===`SOURCE`)return!1}return $a(t)&&g(n)?!1:t in e}var no=e=>{let t=e.props[`onUpdate:modelValue`]||!1;return d(t)?e=>ie(t,e):t};function ro(e){e.target.composing=!0}function io(e){let t=e.target;t.composing&&(t.composing=!1,t.dispatchEvent(new Event(`input`)))}var ao=Symbol(`_assign`);function oo(e,t,n){return t&&(e=e.trim()),n&&(e=ae(e)),e}var so={created(e,{modifiers:{lazy:t,trim:n,number:r}},i){e[ao]=no(i);let a=r||i.props&&i.props.type===`number`;Ha(e,t?`change`:`input`,t=>{t.target.composing||e[ao](oo(e.value,n,a))}),(n||a)&&Ha(e,`change`,()=>{e.value=oo(e.value,n,a)}),t||(Ha(e,`compositionstart`,ro),Ha(e,`compositionend`,io),Ha(e,`change`,io))},mounted(e,{value:t}){e.value=t??``},beforeUpdate(e,{value:t,oldValue:n,modifiers:{lazy:r,trim:i,number:a}},o){if(e[ao]=no(o),e.composing)return;let s=(a||e.type===`number`)&&!/^0\d/.test(e.value)?ae(e.value):e.value,c=t??``;s!==c&&(document.activeElement===e&&e.type!==`range`&&(r&&t===n||i&&e.value.trim()===c)||(e.value=c))}},co={deep:!0,created(e,{value:t,modifiers:{number:n}},r){let i=p(t);Ha(e,`change`,()=>{let t=Array.prototype.filter.call(e.options,e=>e.selected).map(e=>n?ae(uo(e)):uo(e));e[ao](e.multiple?i?new Set(t):t:t[0]),e._assigning=!0,pn(()=>{e._assigning=!1})}),e[ao]=no(r)},mounted(e,{value:t}){lo(e,t)},beforeUpdate(e,t,n){e[ao]=no(n)},updated(e,{value:t}){e._assigning||lo(e,t)}};function lo(e,t){let n=e.multiple,r=d(t);if(!(n&&!r&&!p(t))){for(let i=0,a=e.options.length;i<a;i++){let a=e.options[i],o=uo(a);if(n)if(r){let e=typeof o;e===`string`||e===`number`?a.selected=t.some(e=>String(e)===String(o)):a.selected=_e(t,o)>-1}else a.selected=t.has(o);else if(ge(uo(a),t)){e.selectedIndex!==i&&(e.selectedIndex=i);return}}!n&&e.selectedIndex!==-1&&(e.selectedIndex=-1)}}function uo(e){return`_value`in e?e._value:e.value}var fo=[`ctrl`,`shift`,`alt`,`meta`],po={stop:e=>e.stopPropagation(),prevent:e=>e.preventDefault(),self:e=>e.target!==e.currentTarget,ctrl:e=>!e.ctrlKey,shift:e=>!e.shiftKey,alt:e=>!e.altKey,meta:e=>!e.metaKey,left:e=>`button`in e&&e.button!==0,middle:e=>`button`in e&&e.button!==1,right:e=>`button`in e&&e.button!==2,exact:(e,t)=>fo.some(n=>e[`${n}Key`]&&!t.includes(n))},mo=(e,t)=>{let n=e._withMods||={},r=t.join(`.`);return n[r]||(n[r]=((n,...r)=>{for(let e=0;e<t.length;e++){let r=po[t[e]];if(r&&r(n,t))return}return e(n,...r)}))},ho={esc:`escape`,space:` `,up:`arrow-up`,left:`arrow-left`,right:`arrow-right`,down:`arrow-down`,delete:`backspace`},go=(e,t)=>{let n=e._withKeys||={},r=t.join(`.`);return n[r]||(n[r]=(n=>{if(!(`key`in n))return;let r=D(n.key);if(t.some(e=>e===r||ho[e]===r))return e(n)}))},_o=s({patchProp:eo},Ea),vo;function yo(){return vo||=mi(_o)}var bo=((...e)=>{let t=yo().createApp(...e),{mount:n}=t;return t.mount=e=>{let r=So(e);if(!r)return;let i=t._component;!h(i)&&!i.render&&!i.template&&(i.template=r.innerHTML),r.nodeType===1&&(r.textContent=``);let a=n(r,!1,xo(r));return r instanceof Element&&(r.removeAttribute(`v-cloak`),r.setAttribute(`data-v-app`,``)),a},t});function xo(e){if(e instanceof SVGElement)return`svg`;if(typeof MathMLElement==`function`&&e instanceof MathMLElement)return`mathml`}function So(e){return g(e)?document.querySelector(e):e}var Co={class:`app`},wo={class:`main`},To=Mn({__name:`App`,setup(e){return(e,t)=>{let n=nr(`router-view`);return W(),G(`div`,Co,[t[0]||=Hi(`<header class="header"><div class="header-right"><a href="https://github.com/Sheyiyuan/ShyeriMeme" target="_blank" class="github-link"><svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="currentColor"><path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"></path></svg></a></div></header>`,1),K(`main`,wo,[q(n)]),t[1]||=K(`footer`,{class:`footer`},[K(`p`,null,[K(`a`,{href:`https://github.com/Sheyiyuan/ShyeriMeme`},`Sheyiyuan - 橘雪莉表情包生成器`)])],-1)])}}}),Eo=typeof document<`u`;function Do(e){return typeof e==`object`||`displayName`in e||`props`in e||`__vccOpts`in e}function Oo(e){return e.__esModule||e[Symbol.toStringTag]===`Module`||e.default&&Do(e.default)}var X=Object.assign;function ko(e,t){let n={};for(let r in t){let i=t[r];n[r]=jo(i)?i.map(e):e(i)}return n}var Ao=()=>{},jo=Array.isArray;function Mo(e,t){let n={};for(let r in e)n[r]=r in t?t[r]:e[r];return n}var No=/#/g,Po=/&/g,Fo=/\//g,Io=/=/g,Lo=/\?/g,Ro=/\+/g,zo=/%5B/g,Bo=/%5D/g,Vo=/%5E/g,Ho=/%60/g,Uo=/%7B/g,Wo=/%7C/g,Go=/%7D/g,Ko=/%20/g;function qo(e){return e==null?``:encodeURI(``+e).replace(Wo,`|`).replace(zo,`[`).replace(Bo,`]`)}function Jo(e){return qo(e).replace(Uo,`{`).replace(Go,`}`).replace(Vo,`^`)}function Yo(e){return qo(e).replace(Ro,`%2B`).replace(Ko,`+`).replace(No,`%23`).replace(Po,`%26`).replace(Ho,"`").replace(Uo,`{`).replace(Go,`}`).replace(Vo,`^`)}function Xo(e){return Yo(e).replace(Io,`%3D`)}function Zo(e){return qo(e).replace(No,`%23`).replace(Lo,`%3F`)}function Qo(e){return Zo(e).replace(Fo,`%2F`)}function $o(e){if(e==null)return null;try{return decodeURIComponent(``+e)}catch{}return``+e}var es=/\/$/,ts=e=>e.replace(es,``);function ns(e,t,n=`/`){let r,i={},a=``,o=``,s=t.indexOf(`#`),c=t.indexOf(`?`);return c=s>=0&&c>s?-1:c,c>=0&&(r=t.slice(0,c),a=t.slice(c,s>0?s:t.length),i=e(a.slice(1))),s>=0&&(r||=t.slice(0,s),o=t.slice(s,t.length)),r=us(r??t,n),{fullPath:r+a+o,path:r,query:i,hash:$o(o)}}function rs(e,t){let n=t.query?e(t.query):``;return t.path+(n&&`?`)+n+(t.hash||``)}function is(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||`/`}function as(e,t,n){let r=t.matched.length-1,i=n.matched.length-1;return r>-1&&r===i&&os(t.matched[r],n.matched[i])&&ss(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function os(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function ss(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(let n in e)if(!cs(e[n],t[n]))return!1;return!0}function cs(e,t){return jo(e)?ls(e,t):jo(t)?ls(t,e):e===t}function ls(e,t){return jo(t)?e.length===t.length&&e.every((e,n)=>e===t[n]):e.length===1&&e[0]===t}function us(e,t){if(e.startsWith(`/`))return e;if(!e)return t;let n=t.split(`/`),r=e.split(`/`),i=r[r.length-1];(i===`..`||i===`.`)&&r.push(``);let a=n.length-1,o,s;for(o=0;o<r.length;o++)if(s=r[o],s!==`.`)if(s===`..`)a>1&&a--;else break;return n.slice(0,a).join(`/`)+`/`+r.slice(o).join(`/`)}var ds={path:`/`,name:void 0,params:{},query:{},hash:``,fullPath:`/`,matched:[],meta:{},redirectedFrom:void 0},fs=function(e){return e.pop=`pop`,e.push=`push`,e}({}),ps=function(e){return e.back=`back`,e.forward=`forward`,e.unknown=``,e}({});function ms(e){if(!e)if(Eo){let t=document.querySelector(`base`);e=t&&t.getAttribute(`href`)||`/`,e=e.replace(/^\w+:\/\/[^\/]+/,``)}else e=`/`;return e[0]!==`/`&&e[0]!==`#`&&(e=`/`+e),ts(e)}var hs=/^[^#]+#/;function gs(e,t){return e.replace(hs,`#`)+t}function _s(e,t){let n=document.documentElement.getBoundingClientRect(),r=e.getBoundingClientRect();return{behavior:t.behavior,left:r.left-n.left-(t.left||0),top:r.top-n.top-(t.top||0)}}var vs=()=>({left:window.scrollX,top:window.scrollY});function ys(e){let t;if(`el`in e){let n=e.el,r=typeof n==`string`&&n.startsWith(`#`),i=typeof n==`string`?r?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!i)return;t=_s(i,e)}else t=e;`scrollBehavior`in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left==null?window.scrollX:t.left,t.top==null?window.scrollY:t.top)}function bs(e,t){return(history.state?history.state.position-t:-1)+e}var xs=new Map;function Ss(e,t){xs.set(e,t)}function Cs(e){let t=xs.get(e);return xs.delete(e),t}function ws(e){return typeof e==`string`||e&&typeof e==`object`}function Ts(e){return typeof e==`string`||typeof e==`symbol`}var Z=function(e){return e[e.MATCHER_NOT_FOUND=1]=`MATCHER_NOT_FOUND`,e[e.NAVIGATION_GUARD_REDIRECT=2]=`NAVIGATION_GUARD_REDIRECT`,e[e.NAVIGATION_ABORTED=4]=`NAVIGATION_ABORTED`,e[e.NAVIGATION_CANCELLED=8]=`NAVIGATION_CANCELLED`,e[e.NAVIGATION_DUPLICATED=16]=`NAVIGATION_DUPLICATED`,e}({}),Es=Symbol(``);Z.MATCHER_NOT_FOUND,Z.NAVIGATION_GUARD_REDIRECT,Z.NAVIGATION_ABORTED,Z.NAVIGATION_CANCELLED,Z.NAVIGATION_DUPLICATED;function Ds(e,t){return X(Error(),{type:e,[Es]:!0},t)}function Os(e,t){return e instanceof Error&&Es in e&&(t==null||!!(e.type&t))}function ks(e){let t={};if(e===``||e===`?`)return t;let n=(e[0]===`?`?e.slice(1):e).split(`&`);for(let e=0;e<n.length;++e){let r=n[e].replace(Ro,` `),i=r.indexOf(`=`),a=$o(i<0?r:r.slice(0,i)),o=i<0?null:$o(r.slice(i+1));if(a in t){let e=t[a];jo(e)||(e=t[a]=[e]),e.push(o)}else t[a]=o}return t}function As(e){let t=``;for(let n in e){let r=e[n];if(n=Xo(n),r==null){r!==void 0&&(t+=(t.length?`&`:``)+n);continue}(jo(r)?r.map(e=>e&&Yo(e)):[r&&Yo(r)]).forEach(e=>{e!==void 0&&(t+=(t.length?`&`:``)+n,e!=null&&(t+=`=`+e))})}return t}function js(e){let t={};for(let n in e){let r=e[n];r!==void 0&&(t[n]=jo(r)?r.map(e=>e==null?null:``+e):r==null?r:``+r)}return t}var Ms=Symbol(``),Ns=Symbol(``),Ps=Symbol(``),Fs=Symbol(``),Is=Symbol(``);function Ls(){let e=[];function t(t){return e.push(t),()=>{let n=e.indexOf(t);n>-1&&e.splice(n,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Rs(e,t,n,r,i,a=e=>e()){let o=r&&(r.enterCallbacks[i]=r.enterCallbacks[i]||[]);return()=>new Promise((s,c)=>{let l=e=>{e===!1?c(Ds(Z.NAVIGATION_ABORTED,{from:n,to:t})):e instanceof Error?c(e):ws(e)?c(Ds(Z.NAVIGATION_GUARD_REDIRECT,{from:t,to:e})):(o&&r.enterCallbacks[i]===o&&typeof e==`function`&&o.push(e),s())},u=a(()=>e.call(r&&r.instances[i],t,n,l)),d=Promise.resolve(u);e.length<3&&(d=d.then(l)),d.catch(e=>c(e))})}function zs(e,t,n,r,i=e=>e()){let a=[];for(let o of e)for(let e in o.components){let s=o.components[e];if(!(t!==`beforeRouteEnter`&&!o.instances[e]))if(Do(s)){let c=(s.__vccOpts||s)[t];c&&a.push(Rs(c,n,r,o,e,i))}else{let c=s();a.push(()=>c.then(a=>{if(!a)throw Error(`Couldn't resolve component "${e}" at "${o.path}"`);let s=Oo(a)?a.default:a;o.mods[e]=a,o.components[e]=s;let c=(s.__vccOpts||s)[t];return c&&Rs(c,n,r,o,e,i)()}))}}return a}function Bs(e,t){let n=[],r=[],i=[],a=Math.max(t.matched.length,e.matched.length);for(let o=0;o<a;o++){let a=t.matched[o];a&&(e.matched.find(e=>os(e,a))?r.push(a):n.push(a));let s=e.matched[o];s&&(t.matched.find(e=>os(e,s))||i.push(s))}return[n,r,i]}var Vs=()=>location.protocol+`//`+location.host;function Hs(e,t){let{pathname:n,search:r,hash:i}=t,a=e.indexOf(`#`);if(a>-1){let t=i.includes(e.slice(a))?e.slice(a).length:1,n=i.slice(t);return n[0]!==`/`&&(n=`/`+n),is(n,``)}return is(n,e)+r+i}function Us(e,t,n,r){let i=[],a=[],o=null,s=({state:a})=>{let s=Hs(e,location),c=n.value,l=t.value,u=0;if(a){if(n.value=s,t.value=a,o&&o===c){o=null;return}u=l?a.position-l.position:0}else r(s);i.forEach(e=>{e(n.value,c,{delta:u,type:fs.pop,direction:u?u>0?ps.forward:ps.back:ps.unknown})})};function c(){o=n.value}function l(e){i.push(e);let t=()=>{let t=i.indexOf(e);t>-1&&i.splice(t,1)};return a.push(t),t}function u(){if(document.visibilityState===`hidden`){let{history:e}=window;if(!e.state)return;e.replaceState(X({},e.state,{scroll:vs()}),``)}}function d(){for(let e of a)e();a=[],window.removeEventListener(`popstate`,s),window.removeEventListener(`pagehide`,u),document.removeEventListener(`visibilitychange`,u)}return window.addEventListener(`popstate`,s),window.addEventListener(`pagehide`,u),document.addEventListener(`visibilitychange`,u),{pauseListeners:c,listen:l,destroy:d}}function Ws(e,t,n,r=!1,i=!1){return{back:e,current:t,forward:n,replaced:r,position:window.history.length,scroll:i?vs():null}}function Gs(e){let{history:t,location:n}=window,r={value:Hs(e,n)},i={value:t.state};i.value||a(r.value,{back:null,current:r.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function a(r,a,o){let s=e.indexOf(`#`),c=s>-1?(n.host&&document.querySelector(`base`)?e:e.slice(s))+r:Vs()+e+r;try{t[o?`replaceState`:`pushState`](a,``,c),i.value=a}catch(e){console.error(e),n[o?`replace`:`assign`](c)}}function o(e,n){a(e,X({},t.state,Ws(i.value.back,e,i.value.forward,!0),n,{position:i.value.position}),!0),r.value=e}function s(e,n){let o=X({},i.value,t.state,{forward:e,scroll:vs()});a(o.current,o,!0),a(e,X({},Ws(r.value,e,null),{position:o.position+1},n),!1),r.value=e}return{location:r,state:i,push:s,replace:o}}function Ks(e){e=ms(e);let t=Gs(e),n=Us(e,t.state,t.location,t.replace);function r(e,t=!0){t||n.pauseListeners(),history.go(e)}let i=X({location:``,base:e,go:r,createHref:gs.bind(null,e)},t,n);return Object.defineProperty(i,`location`,{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(i,`state`,{enumerable:!0,get:()=>t.state.value}),i}var qs=function(e){return e[e.Static=0]=`Static`,e[e.Param=1]=`Param`,e[e.Group=2]=`Group`,e}({}),Q=function(e){return e[e.Static=0]=`Static`,e[e.Param=1]=`Param`,e[e.ParamRegExp=2]=`ParamRegExp`,e[e.ParamRegExpEnd=3]=`ParamRegExpEnd`,e[e.EscapeNext=4]=`EscapeNext`,e}(Q||{}),Js={type:qs.Static,value:``},Ys=/[a-zA-Z0-9_]/;function Xs(e){if(!e)return[[]];if(e===`/`)return[[Js]];if(!e.startsWith(`/`))throw Error(`Invalid path "${e}"`);function t(e){throw Error(`ERR (${n})/"${l}": ${e}`)}let n=Q.Static,r=n,i=[],a;function o(){a&&i.push(a),a=[]}let s=0,c,l=``,u=``;function d(){l&&=(n===Q.Static?a.push({type:qs.Static,value:l}):n===Q.Param||n===Q.ParamRegExp||n===Q.ParamRegExpEnd?(a.length>1&&(c===`*`||c===`+`)&&t(`A repeatable param (${l}) must be alone in its segment. eg: '/:ids+.`),a.push({type:qs.Param,value:l,regexp:u,repeatable:c===`*`||c===`+`,optional:c===`*`||c===`?`})):t(`Invalid state to consume buffer`),``)}function f(){l+=c}for(;s<e.length;){if(c=e[s++],c===`\\`&&n!==Q.ParamRegExp){r=n,n=Q.EscapeNext;continue}switch(n){case Q.Static:c===`/`?(l&&d(),o()):c===`:`?(d(),n=Q.Param):f();break;case Q.EscapeNext:f(),n=r;break;case Q.Param:c===`(`?n=Q.ParamRegExp:Ys.test(c)?f():(d(),n=Q.Static,c!==`*`&&c!==`?`&&c!==`+`&&s--);break;case Q.ParamRegExp:c===`)`?u[u.length-1]==`\\`?u=u.slice(0,-1)+c:n=Q.ParamRegExpEnd:u+=c;break;case Q.ParamRegExpEnd:d(),n=Q.Static,c!==`*`&&c!==`?`&&c!==`+`&&s--,u=``;break;default:t(`Unknown state`);break}}return n===Q.ParamRegExp&&t(`Unfinished custom RegExp for param "${l}"`),d(),o(),i}var Zs=`[^/]+?`,Qs={sensitive:!1,strict:!1,start:!0,end:!0},$=function(e){return e[e._multiplier=10]=`_multiplier`,e[e.Root=90]=`Root`,e[e.Segment=40]=`Segment`,e[e.SubSegment=30]=`SubSegment`,e[e.Static=40]=`Static`,e[e.Dynamic=20]=`Dynamic`,e[e.BonusCustomRegExp=10]=`BonusCustomRegExp`,e[e.BonusWildcard=-50]=`BonusWildcard`,e[e.BonusRepeatable=-20]=`BonusRepeatable`,e[e.BonusOptional=-8]=`BonusOptional`,e[e.BonusStrict=.7000000000000001]=`BonusStrict`,e[e.BonusCaseSensitive=.25]=`BonusCaseSensitive`,e}($||{}),$s=/[.+*?^${}()[\]/\\]/g;function ec(e,t){let n=X({},Qs,t),r=[],i=n.start?`^`:``,a=[];for(let t of e){let e=t.length?[]:[$.Root];n.strict&&!t.length&&(i+=`/`);for(let r=0;r<t.length;r++){let o=t[r],s=$.Segment+(n.sensitive?$.BonusCaseSensitive:0);if(o.type===qs.Static)r||(i+=`/`),i+=o.value.replace($s,`\\$&`),s+=$.Static;else if(o.type===qs.Param){let{value:e,repeatable:n,optional:c,regexp:l}=o;a.push({name:e,repeatable:n,optional:c});let u=l||Zs;if(u!==Zs){s+=$.BonusCustomRegExp;try{`${u}`}catch(t){throw Error(`Invalid custom RegExp for param "${e}" (${u}): `+t.message)}}let d=n?`((?:${u})(?:/(?:${u}))*)`:`(${u})`;r||(d=c&&t.length<2?`(?:/${d})`:`/`+d),c&&(d+=`?`),i+=d,s+=$.Dynamic,c&&(s+=$.BonusOptional),n&&(s+=$.BonusRepeatable),u===`.*`&&(s+=$.BonusWildcard)}e.push(s)}r.push(e)}if(n.strict&&n.end){let e=r.length-1;r[e][r[e].length-1]+=$.BonusStrict}n.strict||(i+=`/?`),n.end?i+=`$`:n.strict&&!i.endsWith(`/`)&&(i+=`(?:/|$)`);let o=new RegExp(i,n.sensitive?``:`i`);function s(e){let t=e.match(o),n={};if(!t)return null;for(let e=1;e<t.length;e++){let r=t[e]||``,i=a[e-1];n[i.name]=r&&i.repeatable?r.split(`/`):r}return n}function c(t){let n=``,r=!1;for(let i of e){(!r||!n.endsWith(`/`))&&(n+=`/`),r=!1;for(let e of i)if(e.type===qs.Static)n+=e.value;else if(e.type===qs.Param){let{value:a,repeatable:o,optional:s}=e,c=a in t?t[a]:``;if(jo(c)&&!o)throw Error(`Provided param "${a}" is an array but it is not repeatable (* or + modifiers)`);let l=jo(c)?c.join(`/`):c;if(!l)if(s)i.length<2&&(n.endsWith(`/`)?n=n.slice(0,-1):r=!0);else throw Error(`Missing required param "${a}"`);n+=l}}return n||`/`}return{re:o,score:r,keys:a,parse:s,stringify:c}}function tc(e,t){let n=0;for(;n<e.length&&n<t.length;){let r=t[n]-e[n];if(r)return r;n++}return e.length<t.length?e.length===1&&e[0]===$.Static+$.Segment?-1:1:e.length>t.length?t.length===1&&t[0]===$.Static+$.Segment?1:-1:0}function nc(e,t){let n=0,r=e.score,i=t.score;for(;n<r.length&&n<i.length;){let e=tc(r[n],i[n]);if(e)return e;n++}if(Math.abs(i.length-r.length)===1){if(rc(r))return 1;if(rc(i))return-1}return i.length-r.length}function rc(e){let t=e[e.length-1];return e.length>0&&t[t.length-1]<0}var ic={strict:!1,end:!0,sensitive:!1};function ac(e,t,n){let r=X(ec(Xs(e.path),n),{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function oc(e,t){let n=[],r=new Map;t=Mo(ic,t);function i(e){return r.get(e)}function a(e,n,r){let i=!r,s=cc(e);s.aliasOf=r&&r.record;let l=Mo(t,e),u=[s];if(`alias`in e){let t=typeof e.alias==`string`?[e.alias]:e.alias;for(let e of t)u.push(cc(X({},s,{components:r?r.record.components:s.components,path:e,aliasOf:r?r.record:s})))}let d,f;for(let t of u){let{path:u}=t;if(n&&u[0]!==`/`){let e=n.record.path,r=e[e.length-1]===`/`?``:`/`;t.path=n.record.path+(u&&r+u)}if(d=ac(t,n,l),r?r.alias.push(d):(f||=d,f!==d&&f.alias.push(d),i&&e.name&&!uc(d)&&o(e.name)),mc(d)&&c(d),s.children){let e=s.children;for(let t=0;t<e.length;t++)a(e[t],d,r&&r.children[t])}r||=d}return f?()=>{o(f)}:Ao}function o(e){if(Ts(e)){let t=r.get(e);t&&(r.delete(e),n.splice(n.indexOf(t),1),t.children.forEach(o),t.alias.forEach(o))}else{let t=n.indexOf(e);t>-1&&(n.splice(t,1),e.record.name&&r.delete(e.record.name),e.children.forEach(o),e.alias.forEach(o))}}function s(){return n}function c(e){let t=fc(e,n);n.splice(t,0,e),e.record.name&&!uc(e)&&r.set(e.record.name,e)}function l(e,t){let i,a={},o,s;if(`name`in e&&e.name){if(i=r.get(e.name),!i)throw Ds(Z.MATCHER_NOT_FOUND,{location:e});s=i.record.name,a=X(sc(t.params,i.keys.filter(e=>!e.optional).concat(i.parent?i.parent.keys.filter(e=>e.optional):[]).map(e=>e.name)),e.params&&sc(e.params,i.keys.map(e=>e.name))),o=i.stringify(a)}else if(e.path!=null)o=e.path,i=n.find(e=>e.re.test(o)),i&&(a=i.parse(o),s=i.record.name);else{if(i=t.name?r.get(t.name):n.find(e=>e.re.test(t.path)),!i)throw Ds(Z.MATCHER_NOT_FOUND,{location:e,currentLocation:t});s=i.record.name,a=X({},t.params,e.params),o=i.stringify(a)}let c=[],l=i;for(;l;)c.unshift(l.record),l=l.parent;return{name:s,path:o,params:a,matched:c,meta:dc(c)}}e.forEach(e=>a(e));function u(){n.length=0,r.clear()}return{addRoute:a,resolve:l,removeRoute:o,clearRoutes:u,getRoutes:s,getRecordMatcher:i}}function sc(e,t){let n={};for(let r of t)r in e&&(n[r]=e[r]);return n}function cc(e){let t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:lc(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:`components`in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,`mods`,{value:{}}),t}function lc(e){let t={},n=e.props||!1;if(`component`in e)t.default=n;else for(let r in e.components)t[r]=typeof n==`object`?n[r]:n;return t}function uc(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function dc(e){return e.reduce((e,t)=>X(e,t.meta),{})}function fc(e,t){let n=0,r=t.length;for(;n!==r;){let i=n+r>>1;nc(e,t[i])<0?r=i:n=i+1}let i=pc(e);return i&&(r=t.lastIndexOf(i,r-1)),r}function pc(e){let t=e;for(;t=t.parent;)if(mc(t)&&nc(e,t)===0)return t}function mc({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function hc(e){let t=jr(Ps),n=jr(Fs),r=ha(()=>{let n=Gt(e.to);return t.resolve(n)}),i=ha(()=>{let{matched:e}=r.value,{length:t}=e,i=e[t-1],a=n.matched;if(!i||!a.length)return-1;let o=a.findIndex(os.bind(null,i));if(o>-1)return o;let s=bc(e[t-2]);return t>1&&bc(i)===s&&a[a.length-1].path!==s?a.findIndex(os.bind(null,e[t-2])):o}),a=ha(()=>i.value>-1&&yc(n.params,r.value.params)),o=ha(()=>i.value>-1&&i.value===n.matched.length-1&&ss(n.params,r.value.params));function s(n={}){if(vc(n)){let n=t[Gt(e.replace)?`replace`:`push`](Gt(e.to)).catch(Ao);return e.viewTransition&&typeof document<`u`&&`startViewTransition`in document&&document.startViewTransition(()=>n),n}return Promise.resolve()}return{route:r,href:ha(()=>r.value.href),isActive:a,isExactActive:o,navigate:s}}function gc(e){return e.length===1?e[0]:e}var _c=Mn({name:`RouterLink`,compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:`page`},viewTransition:Boolean},useLink:hc,setup(e,{slots:t}){let n=jt(hc(e)),{options:r}=jr(Ps),i=ha(()=>({[xc(e.activeClass,r.linkActiveClass,`router-link-active`)]:n.isActive,[xc(e.exactActiveClass,r.linkExactActiveClass,`router-link-exact-active`)]:n.isExactActive}));return()=>{let r=t.default&&gc(t.default(n));return e.custom?r:ga(`a`,{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:i.value},r)}}});function vc(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){let t=e.currentTarget.getAttribute(`target`);if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function yc(e,t){for(let n in t){let r=t[n],i=e[n];if(typeof r==`string`){if(r!==i)return!1}else if(!jo(i)||i.length!==r.length||r.some((e,t)=>e!==i[t]))return!1}return!0}function bc(e){return e?e.aliasOf?e.aliasOf.path:e.path:``}var xc=(e,t,n)=>e??t??n,Sc=Mn({name:`RouterView`,inheritAttrs:!1,props:{name:{type:String,default:`default`},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){let r=jr(Is),i=ha(()=>e.route||r.value),a=jr(Ns,0),o=ha(()=>{let e=Gt(a),{matched:t}=i.value,n;for(;(n=t[e])&&!n.components;)e++;return e}),s=ha(()=>i.value.matched[o.value]);Ar(Ns,ha(()=>o.value+1)),Ar(Ms,s),Ar(Is,i);let c=z();return Pr(()=>[c.value,s.value,e.name],([e,t,n],[r,i,a])=>{t&&(t.instances[n]=e,i&&i!==t&&e&&e===r&&(t.leaveGuards.size||(t.leaveGuards=i.leaveGuards),t.updateGuards.size||(t.updateGuards=i.updateGuards))),e&&t&&(!i||!os(t,i)||!r)&&(t.enterCallbacks[n]||[]).forEach(t=>t(e))},{flush:`post`}),()=>{let r=i.value,a=e.name,o=s.value,l=o&&o.components[a];if(!l)return Cc(n.default,{Component:l,route:r});let u=o.props[a],d=ga(l,X({},u?u===!0?r.params:typeof u==`function`?u(r):u:null,t,{onVnodeUnmounted:e=>{e.component.isUnmounted&&(o.instances[a]=null)},ref:c}));return Cc(n.default,{Component:d,route:r})||d}}});function Cc(e,t){if(!e)return null;let n=e(t);return n.length===1?n[0]:n}var wc=Sc;function Tc(e){let t=oc(e.routes,e),n=e.parseQuery||ks,r=e.stringifyQuery||As,i=e.history,a=Ls(),o=Ls(),s=Ls(),c=Ht(ds),l=ds;Eo&&e.scrollBehavior&&`scrollRestoration`in history&&(history.scrollRestoration=`manual`);let u=ko.bind(null,e=>``+e),d=ko.bind(null,Qo),f=ko.bind(null,$o);function p(e,n){let r,i;return Ts(e)?(r=t.getRecordMatcher(e),i=n):i=e,t.addRoute(i,r)}function m(e){let n=t.getRecordMatcher(e);n&&t.removeRoute(n)}function h(){return t.getRoutes().map(e=>e.record)}function g(e){return!!t.getRecordMatcher(e)}function _(e,a){if(a=X({},a||c.value),typeof e==`string`){let r=ns(n,e,a.path),o=t.resolve({path:r.path},a),s=i.createHref(r.fullPath);return X(r,o,{params:f(o.params),hash:$o(r.hash),redirectedFrom:void 0,href:s})}let o;if(e.path!=null)o=X({},e,{path:ns(n,e.path,a.path).path});else{let t=X({},e.params);for(let e in t)t[e]??delete t[e];o=X({},e,{params:d(t)}),a.params=d(a.params)}let s=t.resolve(o,a),l=e.hash||``;s.params=u(f(s.params));let p=rs(r,X({},e,{hash:Jo(l),path:s.path})),m=i.createHref(p);return X({fullPath:p,hash:l,query:r===As?js(e.query):e.query||{}},s,{redirectedFrom:void 0,href:m})}function v(e){return typeof e==`string`?ns(n,e,c.value.path):X({},e)}function y(e,t){if(l!==e)return Ds(Z.NAVIGATION_CANCELLED,{from:t,to:e})}function b(e){return C(e)}function x(e){return b(X(v(e),{replace:!0}))}function S(e,t){let n=e.matched[e.matched.length-1];if(n&&n.redirect){let{redirect:r}=n,i=typeof r==`function`?r(e,t):r;return typeof i==`string`&&(i=i.includes(`?`)||i.includes(`#`)?i=v(i):{path:i},i.params={}),X({query:e.query,hash:e.hash,params:i.path==null?e.params:{}},i)}}function C(e,t){let n=l=_(e),i=c.value,a=e.state,o=e.force,s=e.replace===!0,u=S(n,i);if(u)return C(X(v(u),{state:typeof u==`object`?X({},a,u.state):a,force:o,replace:s}),t||n);let d=n;d.redirectedFrom=t;let f;return!o&&as(r,i,n)&&(f=Ds(Z.NAVIGATION_DUPLICATED,{to:d,from:i}),oe(i,i,!0,!1)),(f?Promise.resolve(f):ee(d,i)).catch(e=>Os(e)?Os(e,Z.NAVIGATION_GUARD_REDIRECT)?e:ae(e):ie(e,d,i)).then(e=>{if(e){if(Os(e,Z.NAVIGATION_GUARD_REDIRECT))return C(X({replace:s},v(e.to),{state:typeof e.to==`object`?X({},a,e.to.state):a,force:o}),t||d)}else e=E(d,i,!0,s,a);return te(d,i,e),e})}function w(e,t){let n=y(e,t);return n?Promise.reject(n):Promise.resolve()}function T(e){let t=le.values().next().value;return t&&typeof t.runWithContext==`function`?t.runWithContext(e):e()}function ee(e,t){let n,[r,i,s]=Bs(e,t);n=zs(r.reverse(),`beforeRouteLeave`,e,t);for(let i of r)i.leaveGuards.forEach(r=>{n.push(Rs(r,e,t))});let c=w.bind(null,e,t);return n.push(c),j(n).then(()=>{n=[];for(let r of a.list())n.push(Rs(r,e,t));return n.push(c),j(n)}).then(()=>{n=zs(i,`beforeRouteUpdate`,e,t);for(let r of i)r.updateGuards.forEach(r=>{n.push(Rs(r,e,t))});return n.push(c),j(n)}).then(()=>{n=[];for(let r of s)if(r.beforeEnter)if(jo(r.beforeEnter))for(let i of r.beforeEnter)n.push(Rs(i,e,t));else n.push(Rs(r.beforeEnter,e,t));return n.push(c),j(n)}).then(()=>(e.matched.forEach(e=>e.enterCallbacks={}),n=zs(s,`beforeRouteEnter`,e,t,T),n.push(c),j(n))).then(()=>{n=[];for(let r of o.list())n.push(Rs(r,e,t));return n.push(c),j(n)}).catch(e=>Os(e,Z.NAVIGATION_CANCELLED)?e:Promise.reject(e))}function te(e,t,n){s.list().forEach(r=>T(()=>r(e,t,n)))}function E(e,t,n,r,a){let o=y(e,t);if(o)return o;let s=t===ds,l=Eo?history.state:{};n&&(r||s?i.replace(e.fullPath,X({scroll:s&&l&&l.scroll},a)):i.push(e.fullPath,a)),c.value=e,oe(e,t,n,s),ae()}let ne;function D(){ne||=i.listen((e,t,n)=>{if(!ue.listening)return;let r=_(e),a=S(r,ue.currentRoute.value);if(a){C(X(a,{replace:!0,force:!0}),r).catch(Ao);return}l=r;let o=c.value;Eo&&Ss(bs(o.fullPath,n.delta),vs()),ee(r,o).catch(e=>Os(e,Z.NAVIGATION_ABORTED|Z.NAVIGATION_CANCELLED)?e:Os(e,Z.NAVIGATION_GUARD_REDIRECT)?(C(X(v(e.to),{force:!0}),r).then(e=>{Os(e,Z.NAVIGATION_ABORTED|Z.NAVIGATION_DUPLICATED)&&!n.delta&&n.type===fs.pop&&i.go(-1,!1)}).catch(Ao),Promise.reject()):(n.delta&&i.go(-n.delta,!1),ie(e,r,o))).then(e=>{e||=E(r,o,!1),e&&(n.delta&&!Os(e,Z.NAVIGATION_CANCELLED)?i.go(-n.delta,!1):n.type===fs.pop&&Os(e,Z.NAVIGATION_ABORTED|Z.NAVIGATION_DUPLICATED)&&i.go(-1,!1)),te(r,o,e)}).catch(Ao)})}let O=Ls(),re=Ls(),k;function ie(e,t,n){ae(e);let r=re.list();return r.length?r.forEach(r=>r(e,t,n)):console.error(e),Promise.reject(e)}function A(){return k&&c.value!==ds?Promise.resolve():new Promise((e,t)=>{O.add([e,t])})}function ae(e){return k||(k=!e,D(),O.list().forEach(([t,n])=>e?n(e):t()),O.reset()),e}function oe(t,n,r,i){let{scrollBehavior:a}=e;if(!Eo||!a)return Promise.resolve();let o=!r&&Cs(bs(t.fullPath,0))||(i||!r)&&history.state&&history.state.scroll||null;return pn().then(()=>a(t,n,o)).then(e=>e&&ys(e)).catch(e=>ie(e,t,n))}let se=e=>i.go(e),ce,le=new Set,ue={currentRoute:c,listening:!0,addRoute:p,removeRoute:m,clearRoutes:t.clearRoutes,hasRoute:g,getRoutes:h,resolve:_,options:e,push:b,replace:x,go:se,back:()=>se(-1),forward:()=>se(1),beforeEach:a.add,beforeResolve:o.add,afterEach:s.add,onError:re.add,isReady:A,install(e){e.component(`RouterLink`,_c),e.component(`RouterView`,wc),e.config.globalProperties.$router=ue,Object.defineProperty(e.config.globalProperties,`$route`,{enumerable:!0,get:()=>Gt(c)}),Eo&&!ce&&c.value===ds&&(ce=!0,b(i.location).catch(e=>{}));let t={};for(let e in ds)Object.defineProperty(t,e,{get:()=>c.value[e],enumerable:!0});e.provide(Ps,ue),e.provide(Fs,Mt(t)),e.provide(Is,c);let n=e.unmount;le.add(e),e.unmount=function(){le.delete(e),le.size<1&&(l=ds,ne&&ne(),ne=null,c.value=ds,ce=!1,k=!1),n()}}};function j(e){return e.reduce((e,t)=>e.then(()=>T(t)),Promise.resolve())}return ue}var Ec={class:`admin-container`},Dc={class:`modal-content`},Oc={key:0,class:`modal-description`},kc={key:1,class:`form-group`},Ac={key:2,class:`form-group`},jc={key:3,class:`form-group`},Mc={key:0,class:`error-message`},Nc={class:`modal-actions`},Pc=[`disabled`],Fc=[`disabled`],Ic={key:4,class:`error-message`},Lc={class:`modal-content`},Rc={class:`form-group`},zc={class:`form-group`},Bc={class:`form-group`},Vc={key:0,class:`error-message`},Hc={class:`modal-actions`},Uc=[`disabled`],Wc={key:3,class:`main-content`},Gc={class:`left-panel`},Kc={key:0,class:`loading`},qc={key:1,class:`config-section`},Jc={class:`form-group`},Yc={class:`form-item`},Xc={class:`form-item`},Zc={class:`port-input-container`},Qc={class:`form-group`},$c={class:`form-item`},el={class:`action-buttons`},tl=[`disabled`],nl={class:`right-panel`},rl={class:`logs-section`},il={class:`logs-header`},al={class:`logs-header-actions`},ol=[`disabled`],sl={class:`logs-filter`},cl={class:`filter-item`},ll={class:`filter-item`},ul={class:`filter-item`},dl={class:`filter-stats`},fl={class:`logs-container`},pl={key:0,class:`loading`},ml={class:`log-timestamp`},hl={class:`log-level`},gl={class:`log-content`},_l={key:0,class:`loading-more`},vl={key:1,class:`no-more-logs`},yl={key:2,class:`placeholder`},bl=200,xl=Mn({__name:`AdminPage`,setup(e){let t=z(!1),n=z(!1),r=z(!1),i=z(!1),a=z(!1),o=z(``),s=z(``),c=z(``),l=z(``),u=z(``),d=z(``),f=z(``),p=z(``),m=z(!0),h=z(!1),g=z(``),_=z(`success`),v=z([]),y=z([]),b=z([]),x=z(0),S=z(!1),C=z(!1),w=z(null),T=z(),ee=z(1),te=z(!0),E=z(`INFO`),ne=z(``),D=z(!0),O=jt({name:``,work_dir:``,log:{log_level:`info`,output_path:`data/`,output_file:`log.txt`},api:{route_root:`/`,port:7210,host:`0.0.0.0`,token:``,domain:`www.example.com`},resource:{resource_paths:{},chinese_font_path:`resource/fonts/STHeitiMedium.ttc`,english_font_path:`resource/fonts/Times New Roman.ttf`},storage:{image_expiry_time:300},admin:{password_set:!1}}),re=e=>{let t=e.match(/^(\[?\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}[\.,]?\d*\]?)\s*(\[?(?:DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL)\]?)\s*(.*)$/i);if(t)return{timestamp:t[1]?.replace(/[\[\]]/g,``).trim(),level:t[2]?.replace(/[\[\]]/g,``).trim(),content:t[3]?.trim()};let n=e.match(/^(\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}[\.,]?\d*)\s*\[.*?\]\s*(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL):?\s*(.*)$/i);return n?{timestamp:n[1]?.trim(),level:n[2]?.trim(),content:n[3]?.trim()}:null},k=async()=>{try{if(ue(`admin_token`)){t.value=!0,await j();return}await j(),!O.admin||!O.admin.password_set?n.value=!0:r.value=!0}catch(e){console.error(`检查认证状态失败:`,e),r.value=!0}},ie=async()=>{if(!c.value||!l.value||c.value!==l.value){o.value=`两次输入的密码不一致`;return}a.value=!0,o.value=``;try{let e=await(await fetch(`/admin/password/set`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({password:c.value})})).json();e.code===200?(n.value=!1,t.value=!0,be(`密码设置成功`,`success`),c.value=``,l.value=``,j(),fe()):o.value=e.message||`设置密码失败`}catch(e){console.error(`设置密码失败:`,e),o.value=`设置密码失败，请重试`}finally{a.value=!1}},A=async()=>{if(!s.value){o.value=`请输入密码`;return}a.value=!0,o.value=``;try{let e=await(await fetch(`/admin/password/verify`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({password:s.value})})).json();e.code===200?(le(`admin_token`,e.data.token,24),r.value=!1,t.value=!0,s.value=``,j(),fe()):e.code===401&&e.data?.need_setup?(r.value=!1,n.value=!0):o.value=e.message||`验证失败`}catch(e){console.error(`验证密码失败:`,e),o.value=`验证失败，请重试`}finally{a.value=!1}},ae=()=>{i.value=!0,u.value=``,d.value=``,f.value=``,p.value=``},oe=()=>{i.value=!1,u.value=``,d.value=``,f.value=``,p.value=``},se=async()=>{if(!u.value||!d.value||!f.value){p.value=`请填写所有密码字段`;return}if(d.value!==f.value){p.value=`新密码和确认密码不一致`;return}a.value=!0,p.value=``;try{let e=await(await fetch(`/admin/password/reset`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({old_password:u.value,new_password:d.value})})).json();e.code===200?(oe(),t.value=!1,r.value=!0,be(`密码重置成功，请重新登录`,`success`),le(`admin_token`,``,-1)):p.value=e.message||`重置密码失败`}catch(e){console.error(`重置密码失败:`,e),p.value=`重置密码失败，请重试`}finally{a.value=!1}},ce=()=>{t.value&&(n.value=!1,r.value=!1)},le=(e,t,n)=>{let r=new Date;r.setTime(r.getTime()+n*60*60*1e3),document.cookie=`${e}=${t};expires=${r.toUTCString()};path=/`},ue=e=>{if(!document.cookie)return``;let t=`${e}=`,n=document.cookie.split(`;`);for(let e=0;e<n.length;e++){let r=n[e]?.trim()||``;if(r.indexOf(t)===0)return r.substring(t.length,r.length)}return``},j=async()=>{m.value=!0;try{let e=await fetch(`/config`);if(e.ok){let t=await e.json();Object.assign(O,t)}else console.error(`配置加载失败`)}catch(e){console.error(`加载配置出错:`,e)}finally{m.value=!1}},de=async()=>{if(t.value){h.value=!0;try{let e=await fetch(`/config`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify(O)});if(e.ok){let t=await e.json();t.status===`success`?(be(`配置保存成功`,`success`),t.portChanged&&be(`端口已修改，需要重启服务才能生效`,`warning`)):be(`配置保存失败: ${t.message||`未知错误`}`,`error`)}else be(`配置保存失败`,`error`)}catch(e){console.error(`保存配置出错:`,e),be(`保存配置时发生错误`,`error`)}finally{h.value=!1}}},fe=async()=>{if(!t.value)return;let e=document.querySelector(`.logs-content`),n=0,r=!0;e&&(n=e.scrollTop,r=n<5),S.value=!0;try{let t=await fetch(`/logs`);t.ok?(v.value=(await t.json()).data.logs.split(`
 `).filter(e=>e.trim()).reverse(),ee.value=1,x.value=v.value.length,ge(),await pn(),e&&(r?e.scrollTop=0:e.scrollTop=n)):console.error(`加载日志失败`)}catch(e){console.error(`加载日志出错:`,e)}finally{S.value=!1}},pe=async()=>{if(!(!t.value||C.value||!te.value)){C.value=!0;try{let e=ee.value+1,t=(e-1)*bl,n=Math.min(e*bl,y.value.length);if(t>=y.value.length){te.value=!1;return}let r=y.value.slice(t,n),i=T.value,a=i?.scrollHeight||0;if(b.value=[...b.value,...r],ee.value=e,n>=y.value.length&&(te.value=!1),await pn(),i){let e=i.scrollHeight-a;i.scrollTop+=e}}catch(e){console.error(`加载更多日志出错:`,e)}finally{C.value=!1}}},me={DEBUG:1,INFO:2,WARNING:3,ERROR:4,CRITICAL:5},he=e=>e.includes(`ERROR`)||e.includes(`ERROR -`)?`ERROR`:e.includes(`WARNING`)||e.includes(`WARNING -`)?`WARNING`:e.includes(`INFO`)||e.includes(`INFO -`)?`INFO`:e.includes(`DEBUG`)||e.includes(`DEBUG -`)?`DEBUG`:e.includes(`CRITICAL`)||e.includes(`CRITICAL -`)?`CRITICAL`:`DEBUG`,ge=()=>{if(!t.value)return;let e=[...v.value];if(E.value){let t=me[E.value];e=e.filter(e=>me[he(e)]>=t)}if(ne.value.trim()){let t=ne.value.trim().toLowerCase();e=e.filter(e=>e.toLowerCase().includes(t))}y.value=D.value?e:[...e].reverse(),ee.value=1,te.value=y.value.length>bl,b.value=y.value.slice(0,bl),pn(()=>{let e=T.value;e&&(e.scrollTop=0)})},_e=()=>{if(!t.value)return;let e=T.value;if(!e||C.value||!te.value)return;let{scrollTop:n,clientHeight:r,scrollHeight:i}=e;i-n-r<50&&pe()},ve=e=>{let t=re(e);if(t){let e=t.level?.toUpperCase()||``;if(e===`ERROR`)return`log-error`;if(e===`WARNING`)return`log-warning`;if(e===`INFO`)return`log-info`;if(e===`DEBUG`)return`log-debug`;if(e===`CRITICAL`)return`log-error`}return e.includes(`ERROR`)||e.includes(`ERROR -`)?`log-error`:e.includes(`WARNING`)||e.includes(`WARNING -`)?`log-warning`:e.includes(`INFO`)||e.includes(`INFO -`)?`log-info`:e.includes(`DEBUG`)||e.includes(`DEBUG -`)?`log-debug`:`log-default`},ye=()=>{fe()},be=(e,t)=>{g.value=e,_.value=t,setTimeout(()=>{g.value=``},3e3)},P=()=>{D.value=!D.value,ge()};Pr([E,ne,D],()=>{te.value=b.value.length<y.value.length}),Kn(()=>{k()}),Xn(()=>{w.value&&clearInterval(w.value)});let xe=()=>{window.location.href=`/webui`};return(e,v)=>(W(),G(`div`,Ec,[n.value||r.value?(W(),G(`div`,{key:0,class:`modal-overlay`,onClick:mo(ce,[`self`])},[K(`div`,Dc,[K(`h2`,null,N(n.value?`设置管理员密码`:`管理员登录`),1),n.value?(W(),G(`p`,Oc,`首次访问，请设置一个管理员密码以保护您的配置页面`)):J(``,!0),n.value?J(``,!0):(W(),G(`div`,kc,[v[13]||=K(`label`,{class:`form-label`},`密码：`,-1),En(K(`input`,{"onUpdate:modelValue":v[0]||=e=>s.value=e,type:`password`,class:`gray-input`,placeholder:`请输入密码`,onKeyup:go(A,[`enter`])},null,544),[[so,s.value]])])),n.value?(W(),G(`div`,Ac,[v[14]||=K(`label`,{class:`form-label`},`设置密码：`,-1),En(K(`input`,{"onUpdate:modelValue":v[1]||=e=>c.value=e,type:`password`,class:`gray-input`,placeholder:`请设置密码`},null,512),[[so,c.value]])])):J(``,!0),n.value?(W(),G(`div`,jc,[v[15]||=K(`label`,{class:`form-label`},`确认密码：`,-1),En(K(`input`,{"onUpdate:modelValue":v[2]||=e=>l.value=e,type:`password`,class:`gray-input`,placeholder:`请再次输入密码`,onKeyup:go(ie,[`enter`])},null,544),[[so,l.value]]),c.value&&l.value&&c.value!==l.value?(W(),G(`div`,Mc,` 两次输入的密码不一致 `)):J(``,!0)])):J(``,!0),K(`div`,Nc,[n.value?(W(),G(`button`,{key:0,onClick:ie,disabled:!c.value||!l.value||c.value!==l.value||a.value,class:`primary-button`},N(a.value?`设置中...`:`确认设置`),9,Pc)):(W(),G(`button`,{key:1,onClick:A,disabled:!s.value||a.value,class:`primary-button`},N(a.value?`登录中...`:`登录`),9,Fc))]),o.value?(W(),G(`div`,Ic,N(o.value),1)):J(``,!0)])])):J(``,!0),i.value?(W(),G(`div`,{key:1,class:`modal-overlay`,onClick:mo(oe,[`self`])},[K(`div`,Lc,[v[19]||=K(`h2`,null,`重置管理员密码`,-1),K(`div`,Rc,[v[16]||=K(`label`,{class:`form-label`},`旧密码：`,-1),En(K(`input`,{"onUpdate:modelValue":v[3]||=e=>u.value=e,type:`password`,class:`gray-input`,placeholder:`请输入旧密码`},null,512),[[so,u.value]])]),K(`div`,zc,[v[17]||=K(`label`,{class:`form-label`},`新密码：`,-1),En(K(`input`,{"onUpdate:modelValue":v[4]||=e=>d.value=e,type:`password`,class:`gray-input`,placeholder:`请输入新密码`},null,512),[[so,d.value]])]),K(`div`,Bc,[v[18]||=K(`label`,{class:`form-label`},`确认新密码：`,-1),En(K(`input`,{"onUpdate:modelValue":v[5]||=e=>f.value=e,type:`password`,class:`gray-input`,placeholder:`请再次输入新密码`,onKeyup:go(se,[`enter`])},null,544),[[so,f.value]])]),p.value?(W(),G(`div`,Vc,N(p.value),1)):J(``,!0),K(`div`,Hc,[K(`button`,{onClick:se,disabled:!u.value||!d.value||!f.value||a.value,class:`primary-button`},N(a.value?`重置中...`:`确认重置`),9,Uc),K(`button`,{onClick:oe,class:`secondary-button`},`取消`)])])])):J(``,!0),v[30]||=K(`h1`,{class:`main-title`},[K(`span`,{class:`first-char`},`橘`),Vi(`雪莉 `),K(`span`,{class:`subtitle`},`表情包管理页面`)],-1),g.value?(W(),G(`div`,{key:2,class:M([`toast`,_.value])},N(g.value),3)):J(``,!0),t.value?(W(),G(`div`,Wc,[K(`div`,Gc,[m.value?(W(),G(`div`,Kc,`加载配置中...`)):(W(),G(`div`,qc,[K(`div`,Jc,[v[23]||=K(`h2`,null,`API 配置`,-1),K(`div`,Yc,[v[20]||=K(`label`,{class:`form-label`},`域名：`,-1),En(K(`input`,{"onUpdate:modelValue":v[6]||=e=>O.api.domain=e,type:`text`,class:`gray-input`,placeholder:`请输入域名`},null,512),[[so,O.api.domain]])]),K(`div`,Xc,[v[22]||=K(`label`,{class:`form-label`},`端口：`,-1),K(`div`,Zc,[En(K(`input`,{"onUpdate:modelValue":v[7]||=e=>O.api.port=e,type:`number`,class:`gray-input`,placeholder:`请输入端口`},null,512),[[so,O.api.port,void 0,{number:!0}]]),v[21]||=K(`div`,{class:`port-tip`},`修改端口需要重启服务`,-1)])])]),K(`div`,Qc,[v[25]||=K(`h2`,null,`存储配置`,-1),K(`div`,$c,[v[24]||=K(`label`,{class:`form-label`},`图片过期时间（秒）：`,-1),En(K(`input`,{"onUpdate:modelValue":v[8]||=e=>O.storage.image_expiry_time=e,type:`number`,class:`gray-input`,placeholder:`请输入过期时间`},null,512),[[so,O.storage.image_expiry_time,void 0,{number:!0}]])])]),K(`div`,el,[K(`button`,{onClick:de,disabled:h.value,class:`primary-button`},N(h.value?`保存中...`:`保存配置`),9,tl),K(`button`,{onClick:j,class:`secondary-button`},`重新加载`),K(`button`,{onClick:xe,class:`primary-button generate-btn`},` 前往表情包生成页面 `)])]))]),K(`div`,nl,[K(`div`,rl,[K(`div`,il,[v[26]||=K(`h3`,null,`实时日志`,-1),K(`div`,al,[K(`button`,{onClick:ae,class:`secondary-button reset-password-btn`},` 重置密码 `),K(`button`,{onClick:ye,disabled:S.value||C.value,class:`refresh-button`},N(S.value?`刷新中...`:C.value?`加载中...`:`刷新日志`),9,ol)])]),K(`div`,sl,[K(`div`,cl,[v[28]||=K(`label`,{class:`filter-label`},`日志级别：`,-1),En(K(`select`,{"onUpdate:modelValue":v[9]||=e=>E.value=e,onChange:ge,class:`filter-select gray-input`},[...v[27]||=[Hi(`<option value="" data-v-f23d9670>全部</option><option value="DEBUG" data-v-f23d9670>Debug</option><option value="INFO" data-v-f23d9670>Info</option><option value="WARNING" data-v-f23d9670>Warning</option><option value="ERROR" data-v-f23d9670>Error</option>`,5)]],544),[[co,E.value]])]),K(`div`,ll,[v[29]||=K(`label`,{class:`filter-label`},`搜索关键词：`,-1),En(K(`input`,{"onUpdate:modelValue":v[10]||=e=>ne.value=e,onInput:ge,type:`text`,class:`filter-input gray-input`,placeholder:`输入关键词搜索`},null,544),[[so,ne.value]])]),K(`div`,ul,[K(`button`,{onClick:P,class:`sort-button gray-input`},N(D.value?`排序：倒序`:`排序：顺序`),1)]),K(`div`,dl,` 显示 `+N(b.value.length)+`/`+N(x.value)+` 条日志 `,1)]),K(`div`,fl,[S.value&&!b.value.length?(W(),G(`div`,pl,`加载日志中...`)):b.value.length>0?(W(),G(`div`,{key:1,class:`logs-content`,onScroll:_e,ref_key:`logsContainerRef`,ref:T},[(W(!0),G(H,null,or(b.value,(e,t,n,r)=>{let i=[e];if(r&&r.key===t&&_a(r,i))return r;let a=(W(),G(`div`,{key:t,class:M([`log-entry`,ve(e)])},[re(e)?(W(),G(H,{key:0},[K(`span`,ml,N(re(e)?.timestamp),1),K(`span`,hl,N(re(e)?.level),1),K(`span`,gl,N(re(e)?.content),1)],64)):(W(),G(H,{key:1},[Vi(N(e),1)],64))],2));return a.memo=i,a},v,11),128)),C.value?(W(),G(`div`,_l,`加载更多日志...`)):J(``,!0),!te.value&&b.value.length>0?(W(),G(`div`,vl,`已经到顶啦！>_<`)):J(``,!0)],544)):(W(),G(`div`,yl,N(x.value>0?`没有符合条件的日志`:`暂无日志内容`),1))])])])])):J(``,!0)]))}}),Sl=(e,t)=>{let n=e.__vccOpts||e;for(let[e,r]of t)n[e]=r;return n},Cl=Sl(xl,[[`__scopeId`,`data-v-f23d9670`]]),wl={class:`webui-container`},Tl={key:0,class:`generated-section mobile-only`},El={class:`result-container`},Dl={key:0,class:`loading`},Ol=[`src`],kl={class:`actions`},Al=[`disabled`],jl={class:`main-content`},Ml={class:`left-panel`},Nl={class:`input-section`},Pl={class:`form-group`},Fl={class:`background-buttons`},Il=[`onClick`,`disabled`],Ll={class:`integrated-preview`},Rl={key:0,class:`loading`},zl=[`src`],Bl={key:2,class:`placeholder`},Vl={class:`form-group`},Hl={class:`input-header`},Ul=[`disabled`],Wl=[`disabled`],Gl={class:`right-panel desktop-only`},Kl={class:`generated-section enhanced`},ql={class:`result-container`},Jl={key:0,class:`loading`},Yl=[`src`],Xl={key:2,class:`placeholder`},Zl={class:`actions`},Ql=[`disabled`],$l=[{path:`/`,redirect:`/webui`},{path:`/admin`,name:`Admin`,component:Cl},{path:`/webui`,name:`WebUI`,component:Sl(Mn({__name:`WebUIPage`,setup(e){let t=z([]),n=z(``),r=z(``),i=z(!1),a=z(``),o=z(``),s=z(``),c=z(`success`),l=z(!1),u=async()=>{try{let e=await fetch(`/list`);e.ok?(t.value=(await e.json()).data.background_list,t.value.length>0&&t.value[0]&&(n.value=t.value[0],p())):(h(`获取背景列表失败`,`error`),t.value=[`哭`,`慌张`,`点赞`,`震惊`,`惊讶`,`灵机一动`,`好吃`,`愣住`,`恍悟`,`得意`],t.value.length>0&&t.value[0]&&(n.value=t.value[0],p()))}catch(e){console.error(`获取背景列表出错:`,e),h(`获取背景列表时发生错误`,`error`),t.value=[`哭`,`慌张`,`点赞`,`震惊`,`惊讶`,`灵机一动`,`好吃`,`愣住`,`恍悟`,`得意`],t.value.length>0&&t.value[0]&&(n.value=t.value[0],p())}},d=e=>{n.value=e,p()},f=async()=>{if(!r.value.trim()){h(`请输入文字内容`,`error`);return}i.value=!0;try{let e=await fetch(`/`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({background:n.value,text:r.value.trim()})});e.ok?(o.value=(await e.json()).data.img_url,h(`表情包生成成功！`,`success`)):h(`表情包生成失败，请重试`,`error`)}catch(e){console.error(`生成表情包出错:`,e),h(`生成表情包时发生错误`,`error`)}finally{i.value=!1}},p=async()=>{if(n.value)try{a.value=`/background/${n.value}`}catch(e){console.error(`更新预览出错:`,e),a.value=`https://picsum.photos/400/600?random=${Math.random()}`}},m=()=>{r.value=``,o.value=``,h(`已清除内容`,`success`)},h=(e,t)=>{s.value=e,c.value=t,l.value=!0,setTimeout(()=>{l.value=!1},3e3)};Kn(()=>{u()});let g=async()=>{if(!r.value.trim()||!n.value){h(`请先生成表情包`,`error`);return}i.value=!0;try{let e=await fetch(`/`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({background:n.value,text:r.value.trim()})});if(e.ok){let t=(await e.json()).data.img_url,n=await(await fetch(t)).blob(),r=document.createElement(`a`);r.href=window.URL.createObjectURL(n),r.download=`橘雪莉表情包_${Date.now()}.jpg`,document.body.appendChild(r),r.click(),setTimeout(()=>{document.body.removeChild(r),window.URL.revokeObjectURL(r.href)},100),h(`表情包下载成功！`,`success`)}else h(`获取下载链接失败`,`error`)}catch(e){console.error(`下载表情包出错:`,e),h(`表情包下载失败，请重试`,`error`)}finally{i.value=!1}};return(e,u)=>(W(),G(`div`,wl,[u[5]||=K(`h1`,{class:`main-title`},[K(`span`,{class:`first-char`},`橘`),Vi(`雪莉 `),K(`span`,{class:`subtitle`},`表情包生成器`)],-1),o.value||i.value?(W(),G(`div`,Tl,[u[1]||=K(`h3`,null,`生成结果`,-1),K(`div`,El,[i.value?(W(),G(`div`,Dl,`生成中...`)):(W(),G(`img`,{key:1,src:o.value,alt:`生成的表情包`},null,8,Ol))]),K(`div`,kl,[K(`button`,{onClick:g,class:M([`primary-button download-button`,{disabled:!o.value}]),disabled:!o.value},` 下载图片 `,10,Al)])])):J(``,!0),K(`div`,jl,[K(`div`,Ml,[K(`div`,Nl,[K(`div`,Pl,[u[2]||=K(`label`,{class:`form-label`},`选择表情：`,-1),K(`div`,Fl,[(W(!0),G(H,null,or(t.value,e=>(W(),G(`button`,{key:e,class:M([`bg-button`,{active:n.value===e}]),onClick:t=>d(e),disabled:i.value},N(e),11,Il))),128))]),K(`div`,Ll,[i.value?(W(),G(`div`,Rl,`加载中...`)):a.value?(W(),G(`img`,{key:1,src:a.value,alt:`表情包预览`},null,8,zl)):(W(),G(`div`,Bl,`请选择表情`))])]),K(`div`,Vl,[K(`div`,Hl,[u[3]||=K(`label`,{class:`form-label highlight-text`},`表情包显示文字：`,-1),K(`button`,{class:M([`clear-btn`,{active:r.value.trim()||o.value}]),onClick:m,disabled:!r.value.trim()&&!o.value},` 清除 `,10,Ul)]),En(K(`textarea`,{"onUpdate:modelValue":u[0]||=e=>r.value=e,placeholder:`请输入要添加的文字（不支持换行）`,onInput:p,rows:`4`,class:`gray-input`},null,544),[[so,r.value]])]),K(`button`,{onClick:f,disabled:i.value,class:`primary-button generate-btn`},N(i.value?`生成中...`:`立即生成表情包`),9,Wl)])]),K(`div`,Gl,[K(`div`,Kl,[u[4]||=K(`h3`,null,`表情包生成结果`,-1),K(`div`,ql,[i.value?(W(),G(`div`,Jl,`正在生成表情包，请稍候...`)):o.value?(W(),G(`img`,{key:1,src:o.value,alt:`生成的表情包`},null,8,Yl)):(W(),G(`div`,Xl,`点击左侧【立即生成表情包】按钮开始创作`))]),K(`div`,Zl,[K(`button`,{onClick:g,class:M([`primary-button download-button`,{disabled:!o.value}]),disabled:!o.value},` 下载表情包 `,10,Ql)])])])]),l.value?(W(),G(`div`,{key:1,class:M([`toast`,c.value])},N(s.value),3)):J(``,!0)]))}}),[[`__scopeId`,`data-v-e9209f20`]])}],eu=Tc({history:Ks(),routes:$l}),tu=bo(To);tu.use(eu),tu.mount(`#app`);
\ No newline at end of file